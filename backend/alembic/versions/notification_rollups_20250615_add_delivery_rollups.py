@@ -0,0 +1,164 @@
+"""add_notification_delivery_rollups
+
+Revision ID: notification_rollups_20250615
+Revises: f3c4a20601b2
+Create Date: 2025-06-15 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "notification_rollups_20250615"
+down_revision: str | None = "f3c4a20601b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - add per-minute notification delivery rollups, backfilled from logs."""
+    op.create_table(
+        "notification_delivery_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False, comment="Primary key"),
+        sa.Column(
+            "bucket_start",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Start of the one-minute bucket",
+        ),
+        sa.Column("channel", sa.String(length=50), nullable=False, comment="Delivery channel"),
+        sa.Column(
+            "notification_type",
+            sa.String(length=50),
+            nullable=False,
+            comment="Type of notification",
+        ),
+        sa.Column(
+            "total_count", sa.Integer(), nullable=False, comment="Delivery attempts in bucket"
+        ),
+        sa.Column(
+            "delivered_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Successful deliveries in bucket",
+        ),
+        sa.Column(
+            "failed_count", sa.Integer(), nullable=False, comment="Failed deliveries in bucket"
+        ),
+        sa.Column(
+            "retry_count", sa.Integer(), nullable=False, comment="Sum of retry attempts in bucket"
+        ),
+        sa.Column(
+            "delivery_time_total_ms",
+            sa.Integer(),
+            nullable=False,
+            comment="Sum of delivery times in milliseconds",
+        ),
+        sa.Column(
+            "delivery_time_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Deliveries with a recorded delivery time",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="Record creation timestamp",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+            comment="Record last update timestamp",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "bucket_start", "channel", "notification_type", name="uq_delivery_rollups_bucket"
+        ),
+    )
+    op.create_index(
+        "idx_delivery_rollups_bucket",
+        "notification_delivery_rollups",
+        ["bucket_start"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_delivery_rollups_channel",
+        "notification_delivery_rollups",
+        ["channel", "bucket_start"],
+        unique=False,
+    )
+    _backfill_rollups()
+
+
+def _backfill_rollups() -> None:
+    """Aggregate existing delivery logs into rollups so history keeps reporting."""
+    logs = sa.table(
+        "notification_delivery_logs",
+        sa.column("created_at", sa.String),
+        sa.column("channel", sa.String),
+        sa.column("notification_type", sa.String),
+        sa.column("status", sa.String),
+        sa.column("retry_count", sa.Integer),
+        sa.column("delivery_time_ms", sa.Integer),
+    )
+    rollups = sa.table(
+        "notification_delivery_rollups",
+        sa.column("bucket_start", sa.String),
+        sa.column("channel", sa.String),
+        sa.column("notification_type", sa.String),
+        sa.column("total_count", sa.Integer),
+        sa.column("delivered_count", sa.Integer),
+        sa.column("failed_count", sa.Integer),
+        sa.column("retry_count", sa.Integer),
+        sa.column("delivery_time_total_ms", sa.Integer),
+        sa.column("delivery_time_count", sa.Integer),
+    )
+
+    # Same text format SQLAlchemy's SQLite DateTime writes, truncated to the minute
+    bucket = sa.func.strftime("%Y-%m-%d %H:%M:00.000000", logs.c.created_at)
+
+    def count_status(status: str) -> sa.ColumnElement:
+        return sa.func.coalesce(sa.func.sum(sa.case((logs.c.status == status, 1), else_=0)), 0)
+
+    aggregate = sa.select(
+        bucket,
+        logs.c.channel,
+        logs.c.notification_type,
+        sa.func.count(),
+        count_status("delivered"),
+        count_status("failed"),
+        sa.func.coalesce(sa.func.sum(logs.c.retry_count), 0),
+        sa.func.coalesce(sa.func.sum(logs.c.delivery_time_ms), 0),
+        sa.func.count(logs.c.delivery_time_ms),
+    ).group_by(bucket, logs.c.channel, logs.c.notification_type)
+
+    op.execute(
+        rollups.insert().from_select(
+            [
+                "bucket_start",
+                "channel",
+                "notification_type",
+                "total_count",
+                "delivered_count",
+                "failed_count",
+                "retry_count",
+                "delivery_time_total_ms",
+                "delivery_time_count",
+            ],
+            aggregate,
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema - remove notification delivery rollups."""
+    op.drop_index("idx_delivery_rollups_channel", table_name="notification_delivery_rollups")
+    op.drop_index("idx_delivery_rollups_bucket", table_name="notification_delivery_rollups")
+    op.drop_table("notification_delivery_rollups")
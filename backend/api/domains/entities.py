@@ -14,7 +14,7 @@ This router integrates with existing EntityService but provides v2 API patterns.
 import logging
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from backend.api.domains import register_domain_router
@@ -99,6 +99,48 @@ class EntityCollectionV2(BaseModel):
     filters_applied: dict[str, Any] = Field(default_factory=dict, description="Applied filters")
 
 
+class EntityChangesV2(BaseModel):
+    """Delta-sync response listing entities changed since a version"""
+
+    epoch: str = Field(..., description="Version epoch; pass as `epoch` with `since` next time")
+    version: int = Field(..., description="Current entity version; pass as `since` next time")
+    since: int = Field(..., description="Version the changes are relative to")
+    reset: bool = Field(
+        False, description="True when the client must replace its entity set with `entities`"
+    )
+    entities: list[EntitySchemaV2] = Field(..., description="Entities changed since `since`")
+    removed: list[str] = Field(default_factory=list, description="Entity IDs removed since `since`")
+
+
+def _to_entity_schema_v2(entity_id: str, entity_data: dict[str, Any]) -> EntitySchemaV2:
+    """Convert an entity state dictionary to the v2 schema"""
+    return EntitySchemaV2(
+        entity_id=entity_id,
+        name=entity_data.get("friendly_name", entity_data.get("name", entity_id)),
+        device_type=entity_data.get("device_type", "unknown"),
+        protocol=entity_data.get("protocol", "rvc"),
+        state=entity_data.get("raw", {}),
+        area=entity_data.get("suggested_area"),
+        last_updated=entity_data.get("last_updated", "2025-01-11T00:00:00Z"),
+        available=entity_data.get("available", True),
+    )
+
+
+def _entities_etag(epoch: str, version: int) -> str:
+    """Weak ETag for entity listings; any entity change or restart changes it"""
+    return f'W/"entities-{epoch}-{version}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
 # Query parameters
 class EntitiesQueryParamsV2(BaseModel):
     """Query parameters for entity filtering and pagination"""
@@ -169,6 +211,7 @@ def create_entities_router() -> APIRouter:
                     "total_count": len(await entity_service.list_entities()),
                     "emergency_stop_active": safety_status.get("emergency_stop_active", False),
                     "pending_operations": safety_status.get("pending_operations_count", 0),
+                    "history_memory": await entity_service.get_entity_memory_stats(),
                 },
                 # Feature Status (all enabled per CLAUDE.md)
                 "features": {
@@ -198,6 +241,7 @@ def create_entities_router() -> APIRouter:
             "OperationResult": OperationResultV2.model_json_schema(),
             "BulkOperationResult": BulkOperationResultV2.model_json_schema(),
             "EntityCollection": EntityCollectionV2.model_json_schema(),
+            "EntityChanges": EntityChangesV2.model_json_schema(),
         }
 
     @router.get("/debug/system-info")
@@ -298,49 +342,45 @@ def create_entities_router() -> APIRouter:
     @router.get("", response_model=EntityCollectionV2)
     async def get_entities(
         request: Request,
+        response: Response,
         entity_service: Annotated[Any, Depends(get_entity_service)],
         device_type: str | None = Query(None, description="Filter by device type"),
         area: str | None = Query(None, description="Filter by area"),
         protocol: str | None = Query(None, description="Filter by protocol"),
         page: int = Query(1, ge=1, description="Page number"),
         page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    ) -> EntityCollectionV2:
-        """Get entities with filtering and pagination (v2) - optimized for Pi deployment"""
+    ) -> EntityCollectionV2 | Response:
+        """Get entities with filtering and pagination (v2) - optimized for Pi deployment
+
+        Responses carry an ETag derived from the version epoch and global entity
+        version; clients sending a matching If-None-Match get 304 without the
+        body being built.
+        """
 
         try:
-            # Get all entities from legacy service
-            all_entities = await entity_service.list_entities()
+            etag = _entities_etag(
+                await entity_service.get_entities_epoch(),
+                await entity_service.get_entities_version(),
+            )
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
 
-            # Convert to v2 format and apply filters
-            entities_v2 = []
-            for entity_id, entity_data in all_entities.items():
-                # Convert legacy entity to v2 schema
-                entity_v2 = EntitySchemaV2(
-                    entity_id=entity_id,
-                    name=entity_data.get("friendly_name", entity_data.get("name", entity_id)),
-                    device_type=entity_data.get("device_type", "unknown"),
-                    protocol=entity_data.get("protocol", "rvc"),
-                    state=entity_data.get("raw", {}),
-                    area=entity_data.get("suggested_area"),
-                    last_updated=entity_data.get("last_updated", "2025-01-11T00:00:00Z"),
-                    available=entity_data.get("available", True),
-                )
-
-                # Apply filters
-                if device_type and entity_v2.device_type != device_type:
-                    continue
-                if area and entity_v2.area != area:
-                    continue
-                if protocol and entity_v2.protocol != protocol:
-                    continue
-
-                entities_v2.append(entity_v2)
-
-            # Apply pagination
-            total_count = len(entities_v2)
+            # Filter through the entity indexes and only materialize the requested page
             start_idx = (page - 1) * page_size
+            page_entities, total_count = await entity_service.list_entities_page(
+                device_type=device_type,
+                area=area,
+                protocol=protocol,
+                offset=start_idx,
+                limit=page_size,
+            )
             end_idx = start_idx + page_size
-            paginated_entities = entities_v2[start_idx:end_idx]
+
+            paginated_entities = [
+                _to_entity_schema_v2(entity_id, entity_data)
+                for entity_id, entity_data in page_entities.items()
+            ]
 
             return EntityCollectionV2(
                 entities=paginated_entities,
@@ -359,6 +399,39 @@ def create_entities_router() -> APIRouter:
             logger.error(f"Failed to get entities: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to retrieve entities: {e!s}")
 
+    @router.get("/changes", response_model=EntityChangesV2)
+    async def get_entity_changes(
+        request: Request,
+        entity_service: Annotated[Any, Depends(get_entity_service)],
+        since: int = Query(0, ge=0, description="Entity version from a previous response"),
+        epoch: str | None = Query(None, description="Version epoch from a previous response"),
+    ) -> EntityChangesV2:
+        """Get entities changed since a version (v2 delta sync)
+
+        Poll with the `version` and `epoch` from the previous response as
+        `since` and `epoch`. Versions restart with the server, so a cursor
+        without the current epoch gets a full resync. When `reset` is true the
+        client should replace its entity set entirely.
+        """
+
+        try:
+            # A missing epoch never matches, so pre-restart cursors cannot get a delta
+            changes = await entity_service.list_entity_changes(since, epoch or "")
+            return EntityChangesV2(
+                epoch=changes["epoch"],
+                version=changes["version"],
+                since=since,
+                reset=changes["reset"],
+                entities=[
+                    _to_entity_schema_v2(entity_id, entity_data)
+                    for entity_id, entity_data in changes["entities"].items()
+                ],
+                removed=changes["removed"],
+            )
+        except Exception as e:
+            logger.error(f"Failed to get entity changes: {e}")
+            raise HTTPException(status_code=500, detail=f"Failed to get entity changes: {e!s}")
+
     @router.get("/safety-status")
     async def get_safety_status(
         request: Request, domain_service: Annotated[Any, Depends(get_entity_domain_service)]
@@ -469,17 +542,7 @@ def create_entities_router() -> APIRouter:
             if entity_id not in all_entities:
                 raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
 
-            entity_data = all_entities[entity_id]
-            return EntitySchemaV2(
-                entity_id=entity_id,
-                name=entity_data.get("friendly_name", entity_data.get("name", entity_id)),
-                device_type=entity_data.get("device_type", "unknown"),
-                protocol=entity_data.get("protocol", "rvc"),
-                state=entity_data.get("raw", {}),
-                area=entity_data.get("suggested_area"),
-                last_updated=entity_data.get("last_updated", "2025-01-11T00:00:00Z"),
-                available=entity_data.get("available", True),
-            )
+            return _to_entity_schema_v2(entity_id, all_entities[entity_id])
 
         except HTTPException:
             raise
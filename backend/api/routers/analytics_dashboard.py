@@ -13,7 +13,6 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from backend.core.dependencies import get_analytics_dashboard_service
-from backend.services.analytics_dashboard_service import AnalyticsDashboardService
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +85,7 @@ class MetricsAggregationParams(BaseModel):
     response_description="Performance trend data with analysis and insights",
 )
 async def get_performance_trends(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
     time_window_hours: int = Query(24, ge=1, le=168, description="Time window in hours"),
     metrics: str | None = Query(None, description="Comma-separated list of metrics"),
     resolution: str = Query("1h", regex=r"^(1m|5m|15m|1h|6h|1d)$", description="Data resolution"),
@@ -142,7 +141,7 @@ async def get_performance_trends(
     response_description="System insights with actionable recommendations",
 )
 async def get_system_insights(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
     categories: str | None = Query(None, description="Comma-separated list of categories"),
     min_severity: str = Query(
         "low",
@@ -198,7 +197,7 @@ async def get_system_insights(
     response_description="Historical analysis results with patterns and predictions",
 )
 async def get_historical_analysis(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
     analysis_type: str = Query(
         "pattern_detection",
         regex=r"^(pattern_detection|anomaly_detection|correlation|all)$",
@@ -256,7 +255,7 @@ async def get_historical_analysis(
     response_description="Aggregated metrics with KPIs and benchmarks",
 )
 async def get_metrics_aggregation(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
     aggregation_windows: str | None = Query(
         None, description="Comma-separated aggregation windows"
     ),
@@ -317,7 +316,7 @@ async def get_metrics_aggregation(
 )
 async def record_custom_metric(
     metric_request: CustomMetricRequest,
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
 ) -> dict[str, bool]:
     """
     Record a custom metric for analytics.
@@ -369,7 +368,7 @@ async def record_custom_metric(
     response_description="Analytics dashboard status and configuration",
 )
 async def get_analytics_status(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
 ) -> dict[str, Any]:
     """
     Get analytics dashboard status and configuration.
@@ -434,7 +433,7 @@ async def get_analytics_status(
     response_description="Health status of analytics components",
 )
 async def analytics_health_check(
-    service: Annotated[AnalyticsDashboardService, Depends(get_analytics_dashboard_service)],
+    service: Annotated[Any, Depends(get_analytics_dashboard_service)],
 ) -> dict[str, Any]:
     """
     Analytics dashboard health check.
@@ -14,6 +14,7 @@ Routes:
 - WebSocket /ws/can/scan: Real-time CAN scan results
 """
 
+import functools
 import logging
 import platform
 from typing import Annotated, Any
@@ -36,17 +37,22 @@ from backend.integrations.can.manager import buses
 # Import models from the new backend structure
 from backend.models.can import AllCANStats, CANInterfaceStats
 
-# Conditionally import pyroute2 only on Linux systems
-# This allows development on macOS without pyroute2 installed
+# pyroute2 is only available/useful on Linux and is expensive to import,
+# so it is loaded on the first /can/status request rather than at boot
 CAN_SUPPORTED = platform.system() == "Linux"
-if CAN_SUPPORTED:
+
+
+@functools.cache
+def _get_iproute_class() -> Any | None:
+    """Import pyroute2's IPRoute on first use, or return None if unavailable."""
+    if not CAN_SUPPORTED:
+        return None
     try:
         from pyroute2 import IPRoute  # type: ignore
     except ImportError:
-        IPRoute = None
-        CAN_SUPPORTED = False
-else:
-    IPRoute = None
+        return None
+    return IPRoute
+
 
 logger = logging.getLogger(__name__)
 
@@ -642,7 +648,8 @@ async def get_can_status(
     is_virtual = settings.can.bustype == "virtual"
 
     # Handle non-Linux platforms or missing pyroute2
-    if not CAN_SUPPORTED or IPRoute is None:
+    iproute_cls = _get_iproute_class()
+    if iproute_cls is None:
         platform_name = platform.system()
 
         # For virtual CAN, we can still provide meaningful status
@@ -685,7 +692,7 @@ async def get_can_status(
     # Linux platform with pyroute2 available
     try:
         pyroute2_stats = {}
-        with IPRoute() as ipr:
+        with iproute_cls() as ipr:
             can_links = ipr.get_links(kind="can")
             logger.debug(f"Found {len(can_links)} CAN links via pyroute2")
             for link in can_links:
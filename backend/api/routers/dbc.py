@@ -10,19 +10,22 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import cantools.database
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 
-from backend.integrations.can.dbc_handler import get_dbc_manager
-from backend.integrations.can.dbc_rvc_converter import RVCtoDBCConverter
-
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/dbc", tags=["dbc"])
 
 
+def _get_dbc_manager() -> Any:
+    """Get the DBC manager, importing cantools on first use rather than at boot."""
+    from backend.integrations.can.dbc_handler import get_dbc_manager
+
+    return get_dbc_manager()
+
+
 class DBCUploadResponse(BaseModel):
     """Response for DBC file upload."""
 
@@ -84,7 +87,7 @@ async def upload_dbc(file: UploadFile = File(...), name: str | None = None) -> D
             temp_path = Path(temp_file.name)
 
         # Load into DBC manager
-        manager = get_dbc_manager()
+        manager = _get_dbc_manager()
         await manager.load_dbc(dbc_name, temp_path)
 
         # Get statistics
@@ -120,7 +123,7 @@ async def list_dbcs() -> DBCListResponse:
     Returns:
         List of loaded DBCs and active DBC
     """
-    manager = get_dbc_manager()
+    manager = _get_dbc_manager()
     return DBCListResponse(loaded_dbcs=list(manager.databases.keys()), active_dbc=manager.active_db)
 
 
@@ -136,7 +139,7 @@ async def set_active_dbc(name: str) -> dict[str, str]:
         Success message
     """
     try:
-        manager = get_dbc_manager()
+        manager = _get_dbc_manager()
         manager.set_active(name)
         return {"message": f"Set active DBC to '{name}'"}
     except KeyError:
@@ -154,7 +157,7 @@ async def get_dbc_messages(name: str) -> list[DBCMessageInfo]:
     Returns:
         List of messages with signals
     """
-    manager = get_dbc_manager()
+    manager = _get_dbc_manager()
     db = manager.get(name)
 
     if not db:
@@ -189,7 +192,7 @@ async def export_dbc(name: str) -> FileResponse:
     Returns:
         DBC file download
     """
-    manager = get_dbc_manager()
+    manager = _get_dbc_manager()
     db = manager.get(name)
 
     if not db:
@@ -198,6 +201,8 @@ async def export_dbc(name: str) -> FileResponse:
     if not db.db:
         raise HTTPException(status_code=500, detail="DBC not properly loaded")
 
+    import cantools.database
+
     try:
         # Export to temporary file
         with tempfile.NamedTemporaryFile(suffix=f"_{name}.dbc", delete=False) as temp_file:
@@ -222,6 +227,9 @@ async def convert_rvc_to_dbc() -> Response:
     """
     try:
         # Load current RV-C configuration
+        import cantools.database
+
+        from backend.integrations.can.dbc_rvc_converter import RVCtoDBCConverter
         from backend.integrations.rvc import load_config_data_v2
 
         rvc_config_obj = load_config_data_v2()
@@ -277,6 +285,10 @@ async def convert_dbc_to_rvc(file: UploadFile = File(...)) -> dict[str, Any]:
             temp_path = Path(temp_file.name)
 
         # Load DBC
+        import cantools.database
+
+        from backend.integrations.can.dbc_rvc_converter import RVCtoDBCConverter
+
         db = cantools.database.load_file(str(temp_path))
 
         # Convert to RV-C
@@ -304,7 +316,7 @@ async def search_signal(signal_name: str) -> list[dict[str, Any]]:
     Returns:
         List of matches with DBC and message info
     """
-    manager = get_dbc_manager()
+    manager = _get_dbc_manager()
     results = []
 
     for dbc_name, db in manager.databases.items():
@@ -11,10 +11,10 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from backend.core.dependencies import create_service_dependency
+from backend.core.dependencies import create_lazy_service_dependency
 
 # Create device discovery service dependency
-get_device_discovery_service = create_service_dependency("device_discovery_service")
+get_device_discovery_service = create_lazy_service_dependency("device_discovery_service")
 from backend.services.device_discovery_service import DeviceDiscoveryService
 
 logger = logging.getLogger(__name__)
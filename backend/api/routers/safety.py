@@ -233,6 +233,7 @@ async def get_audit_log(
     safety_service: Annotated[Any, Depends(get_safety_service)],
     admin_user: Annotated[dict, Depends(get_authenticated_admin)],  # noqa: ARG001
     max_entries: int = 100,
+    offset: int = 0,
 ) -> dict[str, Any]:
     """
     Get safety audit log entries.
@@ -245,14 +246,17 @@ async def get_audit_log(
 
     Args:
         max_entries: Maximum number of entries to return (default: 100)
+        offset: Number of most recent entries to skip, for paging back (default: 0)
     """
     try:
         max_audit_entries = 1000
         if max_entries < 1 or max_entries > max_audit_entries:
             raise HTTPException(status_code=400, detail="max_entries must be between 1 and 1000")
+        if offset < 0:
+            raise HTTPException(status_code=400, detail="offset must not be negative")
 
-        entries = safety_service.get_audit_log(max_entries)
-        return {"total_entries": len(entries), "entries": entries}
+        entries = safety_service.get_audit_log(max_entries, offset)
+        return {"total_entries": len(entries), "offset": offset, "entries": entries}
     except HTTPException:
         raise
     except Exception as e:
@@ -317,8 +317,18 @@ class RVCSettings(BaseSettings):
     coach_model: str | None = Field(
         default=None, description="Coach model to use for mapping selection"
     )
+    compiled_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse the precompiled RV-C configuration when source files are unchanged",
+    )
+    compiled_cache_dir: Path | None = Field(
+        default=None,
+        description="Precompiled RV-C configuration directory (default: <data_dir>/cache/rvc)",
+    )
 
-    @field_validator("config_dir", "spec_path", "coach_mapping_path", mode="before")
+    @field_validator(
+        "config_dir", "spec_path", "coach_mapping_path", "compiled_cache_dir", mode="before"
+    )
     @classmethod
     def parse_path(cls, v):
         """Parse path from string."""
@@ -802,6 +812,17 @@ class AuthenticationSettings(BaseSettings):
         default=3, description="Successful logins needed to reset lockout escalation"
     )
 
+    # Password hashing / MFA executor settings
+    crypto_max_workers: int = Field(
+        default=2, description="Worker threads for bcrypt and QR code generation", ge=1, le=8
+    )
+    crypto_max_pending: int = Field(
+        default=16,
+        description="Maximum queued password hash/verify jobs before rejecting logins",
+        ge=0,
+        le=256,
+    )
+
     # Multi-Factor Authentication (MFA) settings
     enable_mfa: bool = Field(default=False, description="Enable multi-factor authentication")
     mfa_totp_issuer: str = Field(default="CoachIQ", description="TOTP issuer name")
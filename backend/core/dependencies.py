@@ -103,6 +103,28 @@ def create_optional_service_dependency(service_name: str):
     return dependency
 
 
+def create_lazy_service_dependency(service_name: str):
+    """
+    Factory function to create dependencies for lazily activated services.
+
+    The returned async dependency activates the service on the first request
+    that needs it, so optional subsystems cost nothing until a client uses them.
+
+    Args:
+        service_name: Name of the service in ServiceRegistry
+
+    Returns:
+        An async FastAPI dependency function
+    """
+
+    async def dependency() -> Any:
+        service_registry = get_service_registry()
+        return await service_registry.get_service_async(service_name)
+
+    dependency.__name__ = f"get_lazy_{service_name}"
+    return dependency
+
+
 # ==================================================================================
 # MODERN SERVICE DEPENDENCIES
 # ==================================================================================
@@ -287,7 +309,7 @@ def get_system_state_repository() -> Any:
     return create_service_dependency("system_state_repository")()
 
 
-def get_analytics_dashboard_service() -> Any:
+async def get_analytics_dashboard_service() -> Any:
     """
     Get the analytics dashboard service from ServiceRegistry.
 
@@ -295,10 +317,12 @@ def get_analytics_dashboard_service() -> Any:
     performance trends, system insights, historical data analysis, and intelligent
     recommendations for business intelligence and operational insights.
 
+    The service is lazily activated on the first request that needs it.
+
     Returns:
         The analytics dashboard service instance
     """
-    return create_service_dependency("analytics_dashboard_service")()
+    return await create_lazy_service_dependency("analytics_dashboard_service")()
 
 
 def get_edge_proxy_monitor_service() -> Any:
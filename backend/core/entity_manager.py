@@ -8,6 +8,7 @@ single entity registry that serves as the source of truth.
 
 import logging
 import time
+import uuid
 from collections.abc import Callable
 from typing import Any
 
@@ -37,8 +38,76 @@ class EntityManager:
         self.protocol_entities: dict[str, set[str]] = {}  # protocol -> entity_ids
         self.physical_id_map: dict[str, str] = {}  # physical_id -> entity_id
 
+        # Secondary indexes maintained on register/remove so filters avoid full scans
+        self._device_type_index: dict[str, set[str]] = {}  # device_type -> entity_ids
+        self._area_index: dict[str, set[str]] = {}  # suggested_area -> entity_ids
+        self._registration_order: dict[str, int] = {}  # entity_id -> registration sequence
+        self._registration_counter = 0
+
+        # Monotonic version bumped on every entity registration, config or state change
+        self._version = 0
+        # Versions restart with the process; the epoch tells cursors from different boots apart
+        self._epoch = uuid.uuid4().hex[:16]
+        # Version at which the registry was last rebuilt; older cursors must resync
+        self._reset_version = 0
+        # Tombstones for delta sync: entity_id -> version at removal
+        self._removed_entities: dict[str, int] = {}
+        # Bumped when entities are added, removed or reloaded (not on state changes)
+        self._registry_generation = 0
+
         # State change listeners for observer pattern
         self._state_change_listeners: list[Callable[[str], None]] = []
+        # Listeners for status frames that repeat an entity's current state
+        self._state_confirmed_listeners: list[Callable[[str], None]] = []
+
+    def _next_version(self) -> int:
+        """Advance and return the global entity version."""
+        self._version += 1
+        return self._version
+
+    @property
+    def version(self) -> int:
+        """Current global entity version; changes whenever any entity changes."""
+        return self._version
+
+    @property
+    def epoch(self) -> str:
+        """Identifier of this process's version sequence; changes on every restart."""
+        return self._epoch
+
+    @property
+    def registry_generation(self) -> int:
+        """Counter that changes whenever the set of registered entities changes."""
+        return self._registry_generation
+
+    def _index_entity(self, entity_id: str, config: EntityConfig) -> None:
+        """Add an entity to the device type and area indexes."""
+        self._device_type_index.setdefault(config.get("device_type", "unknown"), set()).add(
+            entity_id
+        )
+        self._area_index.setdefault(config.get("suggested_area", "Unknown"), set()).add(entity_id)
+        self._registration_counter += 1
+        self._registration_order[entity_id] = self._registration_counter
+
+    def _unindex_entity(self, entity_id: str, config: EntityConfig) -> None:
+        """Remove an entity from the physical ID map, light list and all secondary indexes."""
+        physical_id = config.get("physical_id")
+        if physical_id and self.physical_id_map.get(physical_id) == entity_id:
+            del self.physical_id_map[physical_id]
+        if entity_id in self.light_entity_ids:
+            self.light_entity_ids.remove(entity_id)
+        for index, key in (
+            (self._device_type_index, config.get("device_type", "unknown")),
+            (self._area_index, config.get("suggested_area", "Unknown")),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(entity_id)
+                if not ids:
+                    del index[key]
+        for ids in self.protocol_entities.values():
+            ids.discard(entity_id)
+        self._registration_order.pop(entity_id, None)
 
     def register_entity(
         self, entity_id: str, config: EntityConfig, protocol: str = "rvc"
@@ -86,14 +155,26 @@ class EntityManager:
             # Track protocol ownership
             if protocol not in self.protocol_entities:
                 self.protocol_entities[protocol] = set()
-            self.protocol_entities[protocol].add(existing_entity_id)
+            if existing_entity_id not in self.protocol_entities[protocol]:
+                self.protocol_entities[protocol].add(existing_entity_id)
+                existing_entity.bump_version()
 
             return existing_entity
 
-        # Register new entity
-        entity = Entity(entity_id=entity_id, config=config)
+        # Register new entity, replacing any entity already registered under this ID
+        previous = self.entities.get(entity_id)
+        if previous is not None:
+            previous_order = self._registration_order.get(entity_id)
+            self._unindex_entity(entity_id, previous.config)
+        self._removed_entities.pop(entity_id, None)
+        entity = Entity(entity_id=entity_id, config=config, next_version=self._next_version)
         self.entities[entity_id] = entity
         self.physical_id_map[physical_id] = entity_id
+        self._registry_generation += 1
+        self._index_entity(entity_id, config)
+        if previous is not None and previous_order is not None:
+            # The entity keeps its slot in self.entities, so keep its filter order too
+            self._registration_order[entity_id] = previous_order
 
         # Track protocol ownership
         entity_protocol = config.get("protocol", protocol)
@@ -140,6 +221,62 @@ class EntityManager:
         """
         return list(self.entities.keys())
 
+    def remove_entity(self, entity_id: str) -> Entity | None:
+        """
+        Remove an entity and drop it from all indexes.
+
+        Args:
+            entity_id: ID of the entity to remove
+
+        Returns:
+            The removed Entity if found, None otherwise
+        """
+        entity = self.entities.pop(entity_id, None)
+        if entity is None:
+            return None
+
+        self._unindex_entity(entity_id, entity.config)
+        self._removed_entities[entity_id] = self._next_version()
+        self._registry_generation += 1
+
+        logger.debug(f"Removed entity: {entity_id}")
+        return entity
+
+    def _matching_entity_ids(
+        self,
+        device_type: str | None = None,
+        area: str | None = None,
+        protocol: str | None = None,
+    ) -> list[str]:
+        """
+        Resolve filters against the secondary indexes.
+
+        Args:
+            device_type: Optional device type to filter by
+            area: Optional area to filter by
+            protocol: Optional protocol to filter by (primary or secondary)
+
+        Returns:
+            Matching entity IDs in registration order
+        """
+        candidates: list[set[str]] = []
+        if device_type is not None:
+            candidates.append(self._device_type_index.get(device_type, set()))
+        if area is not None:
+            candidates.append(self._area_index.get(area, set()))
+        if protocol is not None:
+            candidates.append(self.protocol_entities.get(protocol, set()))
+
+        if not candidates:
+            return list(self.entities)
+
+        candidates.sort(key=len)
+        matched = set(candidates[0]).intersection(*candidates[1:])
+        order = self._registration_order
+        return sorted(
+            (eid for eid in matched if eid in self.entities), key=lambda eid: order.get(eid, 0)
+        )
+
     def filter_entities(
         self,
         device_type: str | None = None,
@@ -157,26 +294,95 @@ class EntityManager:
         Returns:
             Dictionary of filtered entities
         """
-        result = {}
-        for entity_id, entity in self.entities.items():
-            matches = True
+        return {
+            entity_id: self.entities[entity_id]
+            for entity_id in self._matching_entity_ids(device_type, area, protocol)
+        }
+
+    def get_entities_page(
+        self,
+        device_type: str | None = None,
+        area: str | None = None,
+        protocol: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[Entity], int]:
+        """
+        Get one page of filtered entities without touching the rest.
+
+        Args:
+            device_type: Optional device type to filter by
+            area: Optional area to filter by
+            protocol: Optional protocol to filter by (primary or secondary)
+            offset: Number of matching entities to skip
+            limit: Maximum number of entities to return
 
-            if device_type is not None and entity.config.get("device_type") != device_type:
-                matches = False
+        Returns:
+            Tuple of (entities on the page, total number of matching entities)
+        """
+        entity_ids = self._matching_entity_ids(device_type, area, protocol)
+        end = None if limit is None else offset + limit
+        return [self.entities[eid] for eid in entity_ids[offset:end]], len(entity_ids)
+
+    def get_changes_since(
+        self, since: int, epoch: str | None = None
+    ) -> tuple[list[Entity], list[str], bool]:
+        """
+        Get entities changed after a version, for delta sync.
+
+        A cursor from before the last bulk reload, from another epoch (the
+        counter restarts with the process), or from the future cannot be
+        answered incrementally; in that case every entity is returned and the
+        reset flag is set.
 
-            if area is not None and entity.config.get("suggested_area") != area:
-                matches = False
+        Args:
+            since: Version the client last saw
+            epoch: Epoch the cursor was issued in (None for in-process callers
+                that cannot have seen another epoch)
 
-            if protocol is not None:
-                entity_protocol = entity.config.get("protocol", "rvc")
-                secondary_protocols = entity.config.get("secondary_protocols", [])
-                if protocol != entity_protocol and protocol not in secondary_protocols:
-                    matches = False
+        Returns:
+            Tuple of (changed entities ordered by version, removed entity IDs,
+            whether the client must replace its entire entity set)
+        """
+        stale_epoch = since > 0 and epoch is not None and epoch != self._epoch
+        if stale_epoch or since < self._reset_version or since > self._version:
+            return list(self.entities.values()), [], True
+
+        changed = sorted(
+            (entity for entity in self.entities.values() if entity.version > since),
+            key=lambda entity: entity.version,
+        )
+        removed = [eid for eid, version in self._removed_entities.items() if version > since]
+        return changed, removed, False
 
-            if matches:
-                result[entity_id] = entity
+    def get_memory_stats(self) -> dict[str, Any]:
+        """
+        Get approximate memory used by entity state history.
 
-        return result
+        Returns:
+            Dictionary with history entry counts, byte totals, and the entity
+            holding the most history
+        """
+        history_entries = 0
+        history_bytes = 0
+        largest_id = None
+        largest_bytes = 0
+        for entity_id, entity in self.entities.items():
+            history_entries += len(entity.history)
+            entity_bytes = entity.history_memory_bytes()
+            history_bytes += entity_bytes
+            if entity_bytes > largest_bytes:
+                largest_id, largest_bytes = entity_id, entity_bytes
+
+        entity_count = len(self.entities)
+        return {
+            "entity_count": entity_count,
+            "history_entries": history_entries,
+            "history_bytes": history_bytes,
+            "avg_history_bytes_per_entity": (history_bytes // entity_count if entity_count else 0),
+            "largest_history_entity": largest_id,
+            "largest_history_bytes": largest_bytes,
+        }
 
     def get_entities_by_protocol(self, protocol: str) -> dict[str, Entity]:
         """
@@ -232,6 +438,27 @@ class EntityManager:
             return entity
         return None
 
+    def confirm_entity_state(self, entity_id: str, timestamp: float | None = None) -> Entity | None:
+        """
+        Record a status update that repeats an entity's current state.
+
+        The entity is touched without a state change, history entry or version
+        bump, and only state-confirmed listeners are notified.
+
+        Args:
+            entity_id: ID of the entity that reported its state
+            timestamp: When the status was seen (defaults to now)
+
+        Returns:
+            The Entity if found, None otherwise
+        """
+        entity = self.get_entity(entity_id)
+        if entity:
+            entity.touch(timestamp)
+            self._notify_listeners(self._state_confirmed_listeners, entity_id)
+            return entity
+        return None
+
     def bulk_load_entities(self, entity_configs: dict[str, EntityConfig]) -> None:
         """
         Bulk load entities from configuration.
@@ -242,6 +469,14 @@ class EntityManager:
         logger.info(f"Bulk loading {len(entity_configs)} entities")
         self.entities = {}
         self.light_entity_ids = []
+        self.protocol_entities = {}
+        self.physical_id_map = {}
+        self._device_type_index = {}
+        self._area_index = {}
+        self._registration_order = {}
+        self._removed_entities = {}
+        self._reset_version = self._next_version()
+        self._registry_generation += 1
 
         for entity_id, config in entity_configs.items():
             self.register_entity(entity_id, config)
@@ -332,6 +567,28 @@ class EntityManager:
             self._state_change_listeners.remove(listener)
             logger.debug(f"Unregistered state change listener: {listener}")
 
+    def register_state_confirmed_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Register a listener for status updates that repeat an entity's current state.
+
+        Args:
+            listener: Function to call with the entity_id when its state is confirmed
+        """
+        if listener not in self._state_confirmed_listeners:
+            self._state_confirmed_listeners.append(listener)
+            logger.debug(f"Registered state confirmed listener: {listener}")
+
+    def unregister_state_confirmed_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Unregister a state confirmed listener.
+
+        Args:
+            listener: Function to remove from listeners list
+        """
+        if listener in self._state_confirmed_listeners:
+            self._state_confirmed_listeners.remove(listener)
+            logger.debug(f"Unregistered state confirmed listener: {listener}")
+
     def _notify_state_change(self, entity_id: str) -> None:
         """
         Notify all registered listeners of an entity state change.
@@ -339,7 +596,12 @@ class EntityManager:
         Args:
             entity_id: ID of the entity whose state changed
         """
-        for listener in self._state_change_listeners:
+        self._notify_listeners(self._state_change_listeners, entity_id)
+
+    @staticmethod
+    def _notify_listeners(listeners: list[Callable[[str], None]], entity_id: str) -> None:
+        """Call each listener with the entity ID, logging listener errors."""
+        for listener in listeners:
             try:
                 listener(entity_id)
             except Exception as e:
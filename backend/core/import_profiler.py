@@ -0,0 +1,222 @@
+"""
+Import-time profiler for backend boot.
+
+Runs a fresh interpreter with ``-X importtime`` and aggregates the raw per-module
+timings into per-package totals, so heavy dependencies pulled in at boot (and
+the backend module that pulled them in) are easy to spot.
+
+Usage:
+    python -m backend.core.import_profiler
+    python -m backend.core.import_profiler --module backend.main --top 25
+    python -m backend.core.import_profiler --budget-ms 1500 --json
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportRecord:
+    """A single module entry from ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: str | None = None
+
+
+@dataclass
+class PackageCost:
+    """Aggregated import cost for a package."""
+
+    package: str
+    self_us: int = 0
+    module_count: int = 0
+    imported_by: str | None = None
+    modules: list[str] = field(default_factory=list)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Parse ``-X importtime`` stderr output into records with parent links.
+
+    importtime prints modules in post-order: children appear before their
+    parent, one indent level deeper.
+
+    Args:
+        output: Raw stderr from ``python -X importtime``
+
+    Returns:
+        List of import records in output order
+    """
+    records: list[ImportRecord] = []
+    pending: list[ImportRecord] = []
+
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        record = ImportRecord(
+            module=match.group(4),
+            self_us=int(match.group(1)),
+            cumulative_us=int(match.group(2)),
+            depth=len(match.group(3)) // 2,
+        )
+        while pending and pending[-1].depth > record.depth:
+            pending.pop().parent = record.module
+        pending.append(record)
+        records.append(record)
+
+    return records
+
+
+def _package_key(module: str, backend_depth: int) -> str:
+    """Group third-party modules by top-level package and backend modules deeper."""
+    parts = module.split(".")
+    if parts[0] == "backend":
+        return ".".join(parts[:backend_depth])
+    return parts[0]
+
+
+def aggregate_by_package(
+    records: list[ImportRecord], backend_depth: int = 3
+) -> list[PackageCost]:
+    """
+    Aggregate self time per package and find the backend module that imported it.
+
+    Args:
+        records: Parsed import records
+        backend_depth: Number of dotted components used to group backend modules
+
+    Returns:
+        Package costs sorted by total self time, most expensive first
+    """
+    by_module = {record.module: record for record in records}
+    packages: dict[str, PackageCost] = {}
+
+    for record in records:
+        key = _package_key(record.module, backend_depth)
+        cost = packages.setdefault(key, PackageCost(package=key))
+        cost.self_us += record.self_us
+        cost.module_count += 1
+        cost.modules.append(record.module)
+
+        if cost.imported_by is None and not key.startswith("backend"):
+            # Walk up to the first backend module responsible for this import
+            parent = record.parent
+            seen = set()
+            while parent and parent not in seen and not parent.startswith("backend"):
+                seen.add(parent)
+                parent = by_module[parent].parent if parent in by_module else None
+            if parent and parent.startswith("backend"):
+                cost.imported_by = parent
+
+    return sorted(packages.values(), key=lambda c: c.self_us, reverse=True)
+
+
+def profile_imports(module: str = "backend.main") -> tuple[float, list[ImportRecord]]:
+    """
+    Import a module in a fresh interpreter and collect importtime records.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Tuple of (total import time in ms, parsed records)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-10:])
+        msg = f"Importing {module} failed:\n{tail}"
+        raise RuntimeError(msg)
+
+    records = parse_importtime(result.stderr)
+    total_us = sum(record.self_us for record in records)
+    return total_us / 1000, records
+
+
+def build_report(
+    module: str, total_ms: float, packages: list[PackageCost], top: int
+) -> dict[str, Any]:
+    """Build a JSON-serializable import report."""
+    return {
+        "module": module,
+        "total_ms": round(total_ms, 1),
+        "packages": [
+            {
+                "package": cost.package,
+                "self_ms": round(cost.self_us / 1000, 1),
+                "percent": round(cost.self_us / 10 / total_ms, 1) if total_ms else 0.0,
+                "modules": cost.module_count,
+                "imported_by": cost.imported_by,
+            }
+            for cost in packages[:top]
+        ],
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    """Print a human-readable report table."""
+    print(f"Import profile for {report['module']}: {report['total_ms']:.1f} ms total\n")
+    print(f"{'package':<45} {'ms':>8} {'%':>6} {'mods':>5}  imported by")
+    print("-" * 100)
+    for row in report["packages"]:
+        print(
+            f"{row['package']:<45} {row['self_ms']:>8.1f} {row['percent']:>6.1f} "
+            f"{row['modules']:>5}  {row['imported_by'] or ''}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Profile backend import time by package.")
+    parser.add_argument("--module", default="backend.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=30, help="Number of packages to show")
+    parser.add_argument(
+        "--backend-depth",
+        type=int,
+        default=3,
+        help="Dotted components used to group backend modules (default: 3)",
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, help="Exit non-zero if total import time exceeds this"
+    )
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    total_ms, records = profile_imports(args.module)
+    packages = aggregate_by_package(records, backend_depth=args.backend_depth)
+    report = build_report(args.module, total_ms, packages, args.top)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(
+            f"\nImport budget exceeded: {total_ms:.1f} ms > {args.budget_ms:.1f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
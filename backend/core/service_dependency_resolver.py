@@ -315,6 +315,35 @@ class ServiceDependencyResolver:
             order.extend(sorted(self._stages[stage_num]))
         return order
 
+    def get_startup_dependencies(self, service_name: str) -> set[str]:
+        """
+        Get the services that must finish starting before a service can start.
+
+        Includes required dependencies (with fallbacks applied) plus optional
+        dependencies resolved into an earlier stage, so optional injection
+        behaves the same as with stage-by-stage startup.
+
+        Args:
+            service_name: Name of the service
+
+        Returns:
+            Set of service names to wait for
+        """
+        node = self._nodes.get(service_name)
+        if node is None:
+            return set()
+
+        deps = {
+            dep for dep in self._dependency_graph.get(service_name, set()) if dep in self._nodes
+        }
+        for dep in node.dependencies:
+            if dep.type != DependencyType.OPTIONAL or dep.name not in self._nodes:
+                continue
+            dep_stage = self._nodes[dep.name].stage
+            if dep_stage is not None and node.stage is not None and dep_stage < node.stage:
+                deps.add(dep.name)
+        return deps
+
     def validate_runtime_dependencies(self, available_services: set[str]) -> dict[str, list[str]]:
         """
         Validate runtime dependencies are satisfied.
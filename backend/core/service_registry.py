@@ -247,12 +247,18 @@ class ServiceDefinition:
         tags: set[str] | None = None,
         description: str | None = None,
         health_check: Callable[[], bool] | None = None,
+        lazy: bool = False,
+        idle_timeout: float | None = None,
     ):
         self.name = name
         self.init_func = init_func
         self.tags = tags or set()
         self.description = description
         self.health_check = health_check
+        # Lazy services are started on first use instead of at boot
+        self.lazy = lazy
+        # Seconds without access before an idle lazy service is stopped (None = never)
+        self.idle_timeout = idle_timeout
 
         # Convert simple string dependencies to ServiceDependency objects
         self.dependencies: list[ServiceDependency] = []
@@ -274,6 +280,7 @@ class EnhancedServiceRegistry(ServiceRegistry):
     - Dependency visualization and reporting
     - Runtime dependency validation
     - Service tagging and categorization
+    - Lazy, on-demand activation with idle shutdown for optional services
     """
 
     def __init__(self):
@@ -284,6 +291,16 @@ class EnhancedServiceRegistry(ServiceRegistry):
         self._dependency_report: str | None = None
         self._lifecycle_manager = ServiceLifecycleManager()
         self._service_timings: dict[str, float] = {}  # Track individual service startup times
+        # Start/finish offsets (ms since startup_all began) for critical-path analysis
+        self._service_start_offsets: dict[str, float] = {}
+        self._service_finish_offsets: dict[str, float] = {}
+        self._startup_dependencies: dict[str, set[str]] = {}
+        # Lazy activation state
+        self._service_background_task: dict[str, asyncio.Task] = {}
+        self._activation_locks: dict[str, asyncio.Lock] = {}
+        self._lazy_last_used: dict[str, float] = {}
+        self._lazy_activations: dict[str, dict[str, Any]] = {}
+        self._idle_reaper_task: asyncio.Task | None = None
 
     def register_service(
         self,
@@ -293,6 +310,8 @@ class EnhancedServiceRegistry(ServiceRegistry):
         tags: set[str] | None = None,
         description: str | None = None,
         health_check: Callable[[], bool] | None = None,
+        lazy: bool = False,
+        idle_timeout: float | None = None,
     ) -> None:
         """
         Register a service with enhanced metadata.
@@ -304,6 +323,9 @@ class EnhancedServiceRegistry(ServiceRegistry):
             tags: Service tags for categorization
             description: Human-readable service description
             health_check: Optional health check function
+            lazy: Defer construction until first get_service_async()/activate_service().
+                Ignored if an eagerly started service depends on this one.
+            idle_timeout: Stop a lazy service after this many seconds without access
         """
         definition = ServiceDefinition(
             name=name,
@@ -312,6 +334,8 @@ class EnhancedServiceRegistry(ServiceRegistry):
             tags=tags,
             description=description,
             health_check=health_check,
+            lazy=lazy,
+            idle_timeout=idle_timeout,
         )
 
         self._service_definitions[name] = definition
@@ -336,6 +360,8 @@ class EnhancedServiceRegistry(ServiceRegistry):
                 tags=service.tags,
                 description=service.description,
                 health_check=service.health_check,
+                lazy=service.lazy,
+                idle_timeout=service.idle_timeout,
             )
 
     async def startup_all(self) -> None:
@@ -361,11 +387,14 @@ class EnhancedServiceRegistry(ServiceRegistry):
                     logger.info(f"  {line}")
 
             total_services = len(self._service_definitions)
-            logger.info(f"Initializing {total_services} services across {len(stages)} stages")
+            logger.info(
+                f"Initializing {total_services} services "
+                f"({len(stages)} dependency levels, dependency-graph scheduling)"
+            )
 
-            # Execute stages
-            for stage_num in sorted(stages.keys()):
-                await self._execute_enhanced_stage(stage_num, stages[stage_num])
+            # Start each service as soon as its own dependencies are ready
+            await self._execute_dependency_graph(start_time)
+            self._start_idle_reaper()
 
             self._startup_time = time.perf_counter() - start_time
             logger.info(
@@ -385,29 +414,66 @@ class EnhancedServiceRegistry(ServiceRegistry):
             await self._emergency_cleanup()
             raise
 
-    async def _execute_enhanced_stage(self, stage_num: int, service_names: list[str]) -> None:
-        """Execute a startup stage with enhanced error handling."""
-        logger.info(f"--- Stage {stage_num}: {len(service_names)} services ---")
-        logger.info(f"    Services: {', '.join(sorted(service_names))}")
-
-        # Start services in parallel
-        tasks = []
-        for name in service_names:
-            if name in self._service_definitions:
-                definition = self._service_definitions[name]
-                task = self._start_service_enhanced(name, definition)
-                tasks.append(task)
-
-        # Wait for all services in stage to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Check for failures
-        failures = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                service_name = service_names[i]
-                self._startup_errors[service_name] = result
-                failures.append((service_name, result))
+    async def _execute_dependency_graph(self, start_time: float) -> None:
+        """
+        Start services in dependency-graph order with maximum overlap.
+
+        Unlike stage-by-stage startup, a service starts the moment the services
+        it depends on are ready, so one slow service only delays its own
+        dependents. On failure no new services are started; services already
+        starting are allowed to finish before the failure is reported.
+
+        Args:
+            start_time: perf_counter() value when startup_all began
+        """
+        graph: dict[str, set[str]] = {}
+        for name in self._service_definitions:
+            deps = self._resolver.get_startup_dependencies(name)
+            graph[name] = {dep for dep in deps if dep in self._service_definitions}
+        self._startup_dependencies = graph
+
+        # Lazy services are skipped unless an eager service needs them at boot
+        boot_set: set[str] = set()
+        pending = [n for n, d in self._service_definitions.items() if not d.lazy]
+        while pending:
+            name = pending.pop()
+            if name not in boot_set:
+                boot_set.add(name)
+                pending.extend(graph[name])
+        deferred = sorted(set(graph) - boot_set)
+        if deferred:
+            logger.info(f"Deferring {len(deferred)} lazy services: {', '.join(deferred)}")
+        graph = {name: deps for name, deps in graph.items() if name in boot_set}
+
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+
+        running: dict[asyncio.Task, str] = {}
+        failures: list[tuple[str, Exception]] = []
+
+        while sorter.is_active():
+            if not failures:
+                for name in sorter.get_ready():
+                    self._service_start_offsets[name] = (time.perf_counter() - start_time) * 1000
+                    task = asyncio.create_task(
+                        self._start_service_enhanced(name, self._service_definitions[name]),
+                        name=f"startup_{name}",
+                    )
+                    running[task] = name
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                self._service_finish_offsets[name] = (time.perf_counter() - start_time) * 1000
+                error = task.exception()
+                if error is not None:
+                    self._startup_errors[name] = error
+                    failures.append((name, error))
+                else:
+                    sorter.done(name)
 
         if failures:
             # Generate detailed error report
@@ -424,6 +490,46 @@ class EnhancedServiceRegistry(ServiceRegistry):
             logger.error(error_message)
             raise RuntimeError(error_message)
 
+    def _calculate_critical_path(self) -> list[dict[str, Any]]:
+        """
+        Calculate the critical path of the last startup.
+
+        Walks back from the service that finished last, following at each step
+        the dependency that finished last (the one that actually gated it).
+
+        Returns:
+            Ordered list of critical-path entries from first to last service
+        """
+        if not self._service_finish_offsets:
+            return []
+
+        path: list[dict[str, Any]] = []
+        current: str | None = max(
+            self._service_finish_offsets, key=lambda n: self._service_finish_offsets[n]
+        )
+        while current is not None:
+            start_ms = self._service_start_offsets.get(current, 0.0)
+            finish_ms = self._service_finish_offsets.get(current, start_ms)
+            deps = [
+                dep
+                for dep in self._startup_dependencies.get(current, set())
+                if dep in self._service_finish_offsets
+            ]
+            gating = max(deps, key=lambda d: self._service_finish_offsets[d]) if deps else None
+            path.append(
+                {
+                    "service": current,
+                    "start_ms": start_ms,
+                    "finish_ms": finish_ms,
+                    "duration_ms": finish_ms - start_ms,
+                    "waited_on": gating,
+                }
+            )
+            current = gating
+
+        path.reverse()
+        return path
+
     async def _start_service_enhanced(self, name: str, definition: ServiceDefinition) -> None:
         """Start a service with enhanced error context and performance monitoring."""
         service_start_time = time.time()
@@ -507,6 +613,7 @@ class EnhancedServiceRegistry(ServiceRegistry):
                 )
                 self._background_tasks.add(task)
                 task.add_done_callback(self._background_tasks.discard)
+                self._service_background_task[name] = task
 
             # Call startup method if available
             if hasattr(service, "startup"):
@@ -564,6 +671,175 @@ class EnhancedServiceRegistry(ServiceRegistry):
 
             raise
 
+    # ------------------------------------------------------------------
+    # Lazy activation
+    # ------------------------------------------------------------------
+
+    def is_lazy_service(self, name: str) -> bool:
+        """Check whether a service is registered for lazy activation."""
+        definition = self._service_definitions.get(name)
+        return definition is not None and definition.lazy
+
+    def get_service(self, service_name: str) -> Any:
+        """
+        Get a service by name.
+
+        Lazy services that have not been activated yet cannot be constructed
+        synchronously; activation is scheduled in the background and the call
+        raises. Use get_service_async() to wait for activation instead.
+        """
+        if not self.is_lazy_service(service_name):
+            return super().get_service(service_name)
+
+        if self.has_service(service_name):
+            self._lazy_last_used[service_name] = time.monotonic()
+        else:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None and self._service_status.get(service_name) != (
+                ServiceStatus.STARTING
+            ):
+                task = loop.create_task(
+                    self.activate_service(service_name), name=f"activate_{service_name}"
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            raise RuntimeError(f"Service '{service_name}' is activating, retry shortly")
+
+        return super().get_service(service_name)
+
+    async def get_service_async(self, service_name: str) -> Any:
+        """
+        Get a service by name, activating it first if it is lazy.
+
+        Args:
+            service_name: Service name
+
+        Returns:
+            The service instance
+        """
+        if not self.has_service(service_name) and self.is_lazy_service(service_name):
+            await self.activate_service(service_name)
+        return self.get_service(service_name)
+
+    async def activate_service(self, name: str) -> None:
+        """
+        Construct and start a lazy service and any inactive lazy dependencies.
+
+        Concurrent callers share a single activation.
+
+        Args:
+            name: Service name
+
+        Raises:
+            ValueError: If the service is not registered
+            Exception: Re-raises initialization errors
+        """
+        if name not in self._service_definitions:
+            raise ValueError(f"Unknown service: {name}")
+        if self.has_service(name):
+            return
+
+        lock = self._activation_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if self.has_service(name):
+                return
+
+            definition = self._service_definitions[name]
+            for dep_name in sorted(self._resolver.get_startup_dependencies(name)):
+                if not self.has_service(dep_name) and self.is_lazy_service(dep_name):
+                    await self.activate_service(dep_name)
+
+            activation_start = time.perf_counter()
+            await self._start_service_enhanced(name, definition)
+            activation_ms = (time.perf_counter() - activation_start) * 1000
+
+            stats = self._lazy_activations.setdefault(name, {"activation_count": 0})
+            stats["activation_count"] += 1
+            stats["last_activation_ms"] = activation_ms
+            stats["last_activated_at"] = time.time()
+            self._lazy_last_used[name] = time.monotonic()
+            logger.info(f"Lazily activated service '{name}' in {activation_ms:.1f}ms")
+
+    def _start_idle_reaper(self) -> None:
+        """Start the idle-shutdown loop if any lazy service has an idle timeout."""
+        timeouts = [
+            d.idle_timeout for d in self._service_definitions.values() if d.lazy and d.idle_timeout
+        ]
+        if not timeouts or self._idle_reaper_task is not None:
+            return
+
+        interval = min(max(min(timeouts) / 2, 1.0), 60.0)
+        self._idle_reaper_task = asyncio.create_task(
+            self._idle_reaper_loop(interval), name="lazy_service_idle_reaper"
+        )
+
+    async def _idle_reaper_loop(self, interval: float) -> None:
+        """Periodically stop lazy services that have been idle past their timeout."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._stop_idle_services()
+            except Exception as e:
+                logger.warning(f"Idle service reaper error: {e}")
+
+    async def _stop_idle_services(self) -> list[str]:
+        """
+        Stop active lazy services idle past their timeout.
+
+        Services with an active dependent are kept running.
+
+        Returns:
+            Names of the services that were stopped
+        """
+        now = time.monotonic()
+        stopped = []
+        for name, definition in self._service_definitions.items():
+            if not (definition.lazy and definition.idle_timeout and name in self._services):
+                continue
+            if now - self._lazy_last_used.get(name, now) < definition.idle_timeout:
+                continue
+            if any(dep in self._services for dep in self._resolver.get_impacted_services(name)):
+                continue
+
+            logger.info(
+                f"Stopping idle lazy service '{name}' (unused for {definition.idle_timeout:.0f}s)"
+            )
+            await self.stop_service(name)
+            self._lazy_last_used.pop(name, None)
+            stopped.append(name)
+        return stopped
+
+    def get_lazy_service_status(self) -> dict[str, dict[str, Any]]:
+        """
+        Get activation state for all lazy services.
+
+        Returns:
+            Dictionary mapping lazy service names to activation details
+        """
+        now = time.monotonic()
+        status = {}
+        for name, definition in self._service_definitions.items():
+            if not definition.lazy:
+                continue
+            last_used = self._lazy_last_used.get(name)
+            status[name] = {
+                "active": self.has_service(name),
+                "idle_timeout": definition.idle_timeout,
+                "idle_seconds": now - last_used if last_used is not None else None,
+                **self._lazy_activations.get(name, {"activation_count": 0}),
+            }
+        return status
+
+    async def shutdown(self):
+        """Stop the idle reaper, then shut down services."""
+        if self._idle_reaper_task is not None:
+            self._idle_reaper_task.cancel()
+            self._idle_reaper_task = None
+        await super().shutdown()
+
     def _validate_runtime_dependencies(self) -> None:
         """Validate runtime dependencies after startup."""
         available = set(self._services.keys())
@@ -625,9 +901,16 @@ class EnhancedServiceRegistry(ServiceRegistry):
         """
         total_time = sum(self._service_timings.values())
         service_count = len(self._service_timings)
+        critical_path = self._calculate_critical_path()
+        wall_time_ms = critical_path[-1]["finish_ms"] if critical_path else 0.0
 
         metrics = {
             "total_startup_time_ms": total_time,
+            "startup_wall_time_ms": wall_time_ms,
+            "parallelism": total_time / wall_time_ms if wall_time_ms > 0 else 0,
+            "critical_path": [entry["service"] for entry in critical_path],
+            "critical_path_ms": sum(entry["duration_ms"] for entry in critical_path),
+            "critical_path_details": critical_path,
             "service_count": service_count,
             "average_service_time_ms": total_time / service_count if service_count > 0 else 0,
             "slowest_services": sorted(
@@ -635,6 +918,7 @@ class EnhancedServiceRegistry(ServiceRegistry):
             )[:5],
             "service_timings": self._service_timings.copy(),
             "startup_errors": {name: str(error) for name, error in self._startup_errors.items()},
+            "lazy_services": self.get_lazy_service_status(),
         }
 
         return metrics
@@ -706,6 +990,8 @@ class EnhancedServiceRegistry(ServiceRegistry):
             "dependencies": dep_info,
             "impacted_services": impacted,
             "has_health_check": definition.health_check is not None,
+            "lazy": definition.lazy,
+            "idle_timeout": definition.idle_timeout,
             "startup_error": str(self._startup_errors.get(name))
             if name in self._startup_errors
             else None,
@@ -828,6 +1114,11 @@ class EnhancedServiceRegistry(ServiceRegistry):
                 metadata={"status": self._service_status.get(name, ServiceStatus.PENDING).value},
             )
 
+            # Cancel the service's background task loop if one was started
+            background_task = self._service_background_task.pop(name, None)
+            if background_task and not background_task.done():
+                background_task.cancel()
+
             # Shutdown the service if it has a shutdown method
             service = self._services.get(name)
             if service and hasattr(service, "shutdown"):
@@ -0,0 +1,192 @@
+"""
+Arbitration-ID dispatch cache for RV-C ingest.
+
+Resolving a received frame to its decoder, device mapping and entity used to
+build ``(dgn_hex.upper(), str(instance))`` string keys for every frame. The
+cache keys on the integer arbitration ID (and decoded instance) instead, so
+each ID/instance pair is resolved against the lookup tables once. Unknown IDs
+and unmapped instances are cached as negative entries, and everything is
+dropped when the RV-C mapping is reloaded.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+# Unknown arbitration IDs are cached negatively; bound the set so a noisy bus
+# cannot grow it without limit
+MAX_NEGATIVE_ENTRIES = 4096
+
+_UNKNOWN_DGN = "unknown"
+
+
+@dataclass
+class DeviceRoute:
+    """Device mapping resolved for one DGN/instance pair."""
+
+    device_config: dict[str, Any]
+    entity_id: str | None
+
+
+@dataclass
+class DecodePlan:
+    """Decoder entry for one arbitration ID, with per-instance device routes."""
+
+    entry: dict[str, Any]
+    dgn_hex: str | None
+    routes: dict[Any, DeviceRoute | None] = field(default_factory=dict)
+
+
+class RVCDispatchCache:
+    """
+    Cache from arbitration ID (and instance) to decode plan, device and entity.
+    """
+
+    def __init__(self, max_negative_entries: int = MAX_NEGATIVE_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_negative_entries: Unknown arbitration IDs remembered before the
+                negative cache is cleared
+        """
+        self.max_negative_entries = max_negative_entries
+        self._decoder_map: dict[int, dict] = {}
+        self._device_lookup: dict[tuple[str, str], dict] = {}
+        self._plans: dict[int, DecodePlan] = {}
+        self._unknown_ids: set[int] = set()
+        self._entities: dict[str, tuple[Any, int, Any]] = {}
+        self._counters: dict[str, list[int]] = {}
+        self._invalidations = 0
+
+    def load(
+        self, decoder_map: dict[int, dict], device_lookup: dict[tuple[str, str], dict]
+    ) -> None:
+        """
+        Point the cache at new lookup tables and drop every cached resolution.
+
+        Args:
+            decoder_map: Arbitration ID to decoder entry
+            device_lookup: ``(DGN hex, instance)`` to device config
+        """
+        self._decoder_map = decoder_map
+        self._device_lookup = device_lookup
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop all cached plans, routes, negative entries and entity handles."""
+        self._plans.clear()
+        self._unknown_ids.clear()
+        self._entities.clear()
+        self._invalidations += 1
+
+    def _count(self, dgn_hex: str, hit: bool) -> None:
+        counters = self._counters.get(dgn_hex)
+        if counters is None:
+            counters = self._counters[dgn_hex] = [0, 0]
+        counters[0 if hit else 1] += 1
+
+    def plan(self, arbitration_id: int) -> DecodePlan | None:
+        """
+        Resolve the decode plan for an arbitration ID.
+
+        Args:
+            arbitration_id: CAN arbitration ID
+
+        Returns:
+            Decode plan, or None if no decoder handles this ID
+        """
+        plan = self._plans.get(arbitration_id)
+        if plan is not None:
+            self._count(plan.dgn_hex or _UNKNOWN_DGN, True)
+            return plan
+        if arbitration_id in self._unknown_ids:
+            self._count(_UNKNOWN_DGN, True)
+            return None
+
+        entry = self._decoder_map.get(arbitration_id)
+        if entry is None:
+            if len(self._unknown_ids) >= self.max_negative_entries:
+                self._unknown_ids.clear()
+            self._unknown_ids.add(arbitration_id)
+            self._count(_UNKNOWN_DGN, False)
+            return None
+
+        dgn_hex = entry.get("dgn_hex")
+        plan = DecodePlan(entry=entry, dgn_hex=dgn_hex.upper() if dgn_hex else None)
+        self._plans[arbitration_id] = plan
+        self._count(plan.dgn_hex or _UNKNOWN_DGN, False)
+        return plan
+
+    def route(self, plan: DecodePlan, instance: Any) -> DeviceRoute | None:
+        """
+        Resolve the device mapping for a decoded instance.
+
+        Args:
+            plan: Decode plan returned by :meth:`plan`
+            instance: Instance decoded from the payload
+
+        Returns:
+            Device route, or None if the DGN/instance pair is unmapped
+        """
+        try:
+            return plan.routes[instance]
+        except KeyError:
+            pass
+
+        route = None
+        if plan.dgn_hex:
+            device_config = self._device_lookup.get((plan.dgn_hex, str(instance)))
+            if device_config:
+                route = DeviceRoute(device_config, device_config.get("entity_id"))
+        plan.routes[instance] = route
+        return route
+
+    def entity(self, entity_id: str, entity_manager: Any) -> Any:
+        """
+        Resolve an entity handle, re-resolving after entity registrations or removals.
+
+        Args:
+            entity_id: Entity ID
+            entity_manager: EntityManager holding the entity
+
+        Returns:
+            Entity, or None if it is not registered
+        """
+        generation = getattr(entity_manager, "registry_generation", None)
+        cached = self._entities.get(entity_id)
+        if (
+            cached is not None
+            and generation is not None
+            and cached[0] is entity_manager
+            and cached[1] == generation
+        ):
+            return cached[2]
+
+        entity = entity_manager.get_entity(entity_id)
+        if generation is not None:
+            self._entities[entity_id] = (entity_manager, generation, entity)
+        return entity
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            Cache sizes, invalidation count and hit/miss counters per DGN
+        """
+        hits = sum(c[0] for c in self._counters.values())
+        misses = sum(c[1] for c in self._counters.values())
+        return {
+            "plans": len(self._plans),
+            "routes": sum(len(p.routes) for p in self._plans.values()),
+            "negative_entries": len(self._unknown_ids),
+            "entity_handles": len(self._entities),
+            "invalidations": self._invalidations,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "by_dgn": {
+                dgn: {"hits": counters[0], "misses": counters[1]}
+                for dgn, counters in self._counters.items()
+            },
+        }
@@ -3,7 +3,7 @@ Manages CAN bus communication for the CoachIQ daemon.
 
 This module is responsible for:
 - Initializing and managing CAN bus listener threads for specified interfaces.
-- Providing a writer task to send messages from an asynchronous queue to the CAN bus.
+- Providing a writer task that feeds queued messages to the per-interface TX scheduler.
 - Constructing RV-C specific CAN messages (e.g., for light control).
 - Storing and providing access to active CAN bus interface objects.
 """
@@ -19,147 +19,174 @@ from can.exceptions import CanInterfaceNotImplementedError
 
 from backend.core.config import get_settings
 from backend.core.metrics import get_can_tx_queue_length
+from backend.integrations.can.tx_scheduler import CANTxScheduler, TxPriority
 
 logger = logging.getLogger(__name__)
 
-can_tx_queue: asyncio.Queue[tuple[can.Message, str]] = asyncio.Queue()
+can_tx_queue: asyncio.Queue[Any] = asyncio.Queue()
 buses: dict[str, BusABC] = {}
 
+_tx_scheduler: CANTxScheduler | None = None
+
+
+def _get_or_open_bus(interface_name: str) -> BusABC | None:
+    """
+    Get the bus for an interface, opening it with the configured bustype if needed.
+
+    Args:
+        interface_name: CAN interface name
+
+    Returns:
+        The bus, or None if it could not be opened
+    """
+    bus = buses.get(interface_name)
+    if bus:
+        return bus
+
+    default_bustype = get_settings().can.bustype
+    logger.warning(
+        "CAN writer: Bus for interface '%s' not pre-initialized. "
+        "Attempting to open with bustype '%s'.",
+        interface_name,
+        default_bustype,
+    )
+    try:
+        bus = can.interface.Bus(channel=interface_name, bustype=default_bustype)
+    except CanInterfaceNotImplementedError as e:
+        logger.error(
+            "CAN writer: CAN interface '%s' (%s) "
+            "is not implemented or configuration is missing: %s",
+            interface_name,
+            default_bustype,
+            e,
+        )
+        return None
+    except Exception as e:
+        logger.error(
+            "CAN writer: Failed to initialize CAN bus '%s' (%s): %s",
+            interface_name,
+            default_bustype,
+            e,
+        )
+        return None
+
+    buses[interface_name] = bus
+    logger.info("CAN writer: Successfully opened and registered bus for '%s'.", interface_name)
+    return bus
+
+
+def _set_queue_length_metric(depth: int) -> None:
+    try:
+        get_can_tx_queue_length().set(depth + can_tx_queue.qsize())
+    except RuntimeError as e:
+        logger.warning("Failed to update queue length metric: %s", e)
+
+
+def get_tx_scheduler() -> CANTxScheduler:
+    """Get the shared CAN transmit scheduler, creating it on first use."""
+    global _tx_scheduler
+    if _tx_scheduler is None:
+        _tx_scheduler = CANTxScheduler(
+            get_bus=_get_or_open_bus, on_depth_change=_set_queue_length_metric
+        )
+    return _tx_scheduler
+
+
+def _record_tx(
+    msg: can.Message,
+    interface_name: str,
+    can_tracking_repository: Any,
+    system_state_repository: Any,
+) -> None:
+    """Log a transmitted message to the CAN sniffer and pending-command tracking."""
+    # Note: Decoder functionality moved to RVC integration feature
+    # For now, we'll log without decoding to maintain functionality
+    source_addr = msg.arbitration_id & 0xFF
+    # Get controller source address from repository
+    controller_addr = 0x7F  # Default fallback
+    if system_state_repository:
+        try:
+            controller_addr = system_state_repository.get_controller_source_addr()
+        except Exception as e:
+            logger.warning("Failed to get controller source address: %s", e)
+
+    origin = "self" if source_addr == controller_addr else "other"
+    sniffer_entry = {
+        "timestamp": time.time(),
+        "direction": "tx",
+        "arbitration_id": msg.arbitration_id,
+        "data": msg.data.hex().upper(),
+        "decoded": None,
+        "raw": None,
+        "iface": interface_name,
+        "pgn": None,
+        "dgn_hex": None,
+        "name": None,
+        "instance": None,
+        "source_addr": source_addr,
+        "origin": origin,
+    }
+    # Add to CAN tracking repository
+    if can_tracking_repository:
+        can_tracking_repository.add_can_sniffer_entry(sniffer_entry)
+        can_tracking_repository.add_pending_command(sniffer_entry)
+    else:
+        logger.warning("CAN tracking repository not available for sniffer/command tracking")
+
+
+def _unpack_queue_item(item: Any) -> tuple[can.Message, str, TxPriority, bool]:
+    """
+    Accept ``message`` or ``(message, interface[, priority[, repeat]])``.
+
+    A bare message, or an interface of None, is sent on the first configured
+    interface. Priority defaults to ``TxPriority.NORMAL`` and repeat to True.
+    """
+    if isinstance(item, can.Message):
+        item = (item,)
+    msg, *rest = item
+    interface_name = rest[0] if rest else None
+    priority = TxPriority(rest[1]) if len(rest) > 1 else TxPriority.NORMAL
+    repeat = bool(rest[2]) if len(rest) > 2 else True
+    if interface_name is None:
+        interface_name = get_settings().can.all_interfaces[0]
+    return msg, interface_name, priority, repeat
+
 
 async def can_writer(
-    can_tracking_repository: Any = None, system_state_repository: Any = None
+    can_tracking_repository: Any = None,
+    system_state_repository: Any = None,
+    scheduler: CANTxScheduler | None = None,
 ) -> None:
     """
-    Continuously dequeues messages from can_tx_queue and sends them over the CAN bus.
-    Handles sending each message twice as per RV-C specification.
-    Attempts to initialize a bus if not already available in the 'buses' dictionary.
+    Move messages from can_tx_queue onto the CAN transmit scheduler.
+
+    The scheduler sends on each interface independently, highest priority
+    first, repeats each message once after 50 ms as per the RV-C
+    specification, and keeps blocking ``bus.send`` calls off the event loop.
+    Items are ``(message, interface[, TxPriority[, repeat]])``; control commands
+    use the emergency/safety/normal lanes and polling traffic the bulk lane.
 
     Args:
         can_tracking_repository: Repository for CAN tracking operations
         system_state_repository: Repository for system state operations
+        scheduler: Scheduler to feed (defaults to the shared scheduler)
     """
-    settings = get_settings()
-    default_bustype = settings.can.bustype
+    scheduler = scheduler or get_tx_scheduler()
+    scheduler.on_sent = lambda msg, interface_name: _record_tx(
+        msg, interface_name, can_tracking_repository, system_state_repository
+    )
+    scheduler.start()
     try:
         while True:
-            msg, interface_name = await can_tx_queue.get()
-            try:
-                get_can_tx_queue_length().set(can_tx_queue.qsize())
-            except RuntimeError as e:
-                logger.warning("Failed to update queue length metric: %s", e)
+            item = await can_tx_queue.get()
             try:
-                bus = buses.get(interface_name)
-                if not bus:
-                    logger.warning(
-                        "CAN writer: Bus for interface '%s' not pre-initialized. "
-                        "Attempting to open with bustype '%s'.",
-                        interface_name,
-                        default_bustype,
-                    )
-                    try:
-                        bus = can.interface.Bus(channel=interface_name, bustype=default_bustype)
-                        buses[interface_name] = bus
-                        logger.info(
-                            "CAN writer: Successfully opened and registered bus for '%s'.",
-                            interface_name,
-                        )
-                    except CanInterfaceNotImplementedError as e:
-                        logger.error(
-                            "CAN writer: CAN interface '%s' (%s) "
-                            "is not implemented or configuration is missing: %s",
-                            interface_name,
-                            default_bustype,
-                            e,
-                        )
-                        can_tx_queue.task_done()
-                        continue
-                    except Exception as e:
-                        logger.error(
-                            "CAN writer: Failed to initialize CAN bus '%s' (%s): %s",
-                            interface_name,
-                            default_bustype,
-                            e,
-                        )
-                        can_tx_queue.task_done()
-                        continue
-                try:
-                    bus.send(msg)
-                    logger.info(
-                        "CAN TX (1/2): %s ID: %08X Data: %s",
-                        interface_name,
-                        msg.arbitration_id,
-                        msg.data.hex().upper(),
-                    )
-                    # --- CAN Sniffer Logging (TX, ALL messages) ---
-                    now = time.time()
-                    # Note: Decoder functionality moved to RVC integration feature
-                    # For now, we'll log without decoding to maintain functionality
-                    entry = None
-                    instance = None
-                    decoded = None
-                    raw = None
-                    source_addr = msg.arbitration_id & 0xFF
-                    # Get controller source address from repository
-                    controller_addr = 0x7F  # Default fallback
-                    if system_state_repository:
-                        try:
-                            controller_addr = system_state_repository.get_controller_source_addr()
-                        except Exception as e:
-                            logger.warning("Failed to get controller source address: %s", e)
-
-                    origin = "self" if source_addr == controller_addr else "other"
-                    sniffer_entry = {
-                        "timestamp": now,
-                        "direction": "tx",
-                        "arbitration_id": msg.arbitration_id,
-                        "data": msg.data.hex().upper(),
-                        "decoded": decoded,
-                        "raw": raw,
-                        "iface": interface_name,
-                        "pgn": entry.get("pgn") if entry else None,
-                        "dgn_hex": entry.get("dgn_hex") if entry else None,
-                        "name": entry.get("name") if entry else None,
-                        "instance": instance,
-                        "source_addr": source_addr,
-                        "origin": origin,
-                    }
-                    # Add to CAN tracking repository
-                    if can_tracking_repository:
-                        can_tracking_repository.add_can_sniffer_entry(sniffer_entry)
-                        can_tracking_repository.add_pending_command(sniffer_entry)
-                    else:
-                        logger.warning(
-                            "CAN tracking repository not available for sniffer/command tracking"
-                        )
-                    await asyncio.sleep(0.05)  # RV-C spec: send commands twice
-                    bus.send(msg)
-                    logger.info(
-                        "CAN TX (2/2): %s ID: %08X Data: %s",
-                        interface_name,
-                        msg.arbitration_id,
-                        msg.data.hex().upper(),
-                    )
-                except can.exceptions.CanError as e:
-                    logger.error("CAN writer failed to send message on %s: %s", interface_name, e)
-                except Exception as e:
-                    logger.error(
-                        "CAN writer encountered an unexpected error during send on %s: %s",
-                        interface_name,
-                        e,
-                    )
+                msg, interface_name, priority, repeat = _unpack_queue_item(item)
+                scheduler.submit(msg, interface_name, priority, repeat)
             except Exception as e:
-                logger.error(
-                    "CAN writer encountered a critical unexpected error for %s: %s",
-                    interface_name,
-                    e,
-                    exc_info=True,
-                )
+                logger.error("CAN writer failed to schedule %r: %s", item, e, exc_info=True)
             finally:
                 can_tx_queue.task_done()
-                try:
-                    get_can_tx_queue_length().set(can_tx_queue.qsize())
-                except RuntimeError as e:
-                    logger.warning("Failed to update queue length metric: %s", e)
     except asyncio.CancelledError:
         logger.info("CAN writer task cancelled, shutting down gracefully")
+        await scheduler.stop()
         return
@@ -0,0 +1,291 @@
+"""
+CAN transmit scheduler.
+
+Each interface gets its own prioritized queue and worker task, so a burst of
+commands for one bus (or a slow bus) does not delay another. ``bus.send`` runs
+in a small thread pool instead of on the event loop, and the RV-C duplicate
+send is scheduled with a timer rather than an ``asyncio.sleep`` inside the
+worker, so other queued messages go out during the gap.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+import can
+
+logger = logging.getLogger(__name__)
+
+# RV-C: commands are sent twice
+DEFAULT_REPEAT_DELAY = 0.05
+
+# Number of recent samples kept for latency statistics
+_SAMPLE_WINDOW = 1000
+
+
+class TxPriority(IntEnum):
+    """Transmit lanes, drained lowest value first."""
+
+    EMERGENCY = 0
+    SAFETY = 1
+    NORMAL = 2
+    BULK = 3
+
+
+@dataclass
+class TxRequest:
+    """A message waiting to be sent."""
+
+    message: can.Message
+    interface: str
+    priority: TxPriority = TxPriority.NORMAL
+    repeat: bool = True
+    is_repeat: bool = False
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+def _latency_summary(samples: deque[float]) -> dict[str, float]:
+    """Summarize latency samples (seconds) in milliseconds."""
+    if not samples:
+        return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    return {
+        "avg_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+class _InterfaceLane:
+    """Priority queues, worker task and counters for one interface."""
+
+    def __init__(self, interface: str):
+        self.interface = interface
+        self.queues: dict[TxPriority, deque[TxRequest]] = {p: deque() for p in TxPriority}
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+        self.sent = 0
+        self.repeats_sent = 0
+        self.failed = 0
+
+    def depth(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+    def pop(self) -> TxRequest | None:
+        for priority in TxPriority:
+            queue = self.queues[priority]
+            if queue:
+                return queue.popleft()
+        return None
+
+
+class CANTxScheduler:
+    """
+    Per-interface, prioritized CAN transmit scheduler.
+    """
+
+    def __init__(
+        self,
+        get_bus: Callable[[str], Any],
+        repeat_delay: float = DEFAULT_REPEAT_DELAY,
+        max_workers: int = 2,
+        on_sent: Callable[[can.Message, str], None] | None = None,
+        on_depth_change: Callable[[int], None] | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            get_bus: Returns the bus for an interface name, or None if unavailable
+            repeat_delay: Seconds between the first and duplicate send
+            max_workers: Threads used for blocking ``bus.send`` calls
+            on_sent: Called after the first send of each message (not the repeat)
+            on_depth_change: Called with the total queue depth when it changes
+        """
+        self._get_bus = get_bus
+        self.repeat_delay = repeat_delay
+        self.on_sent = on_sent
+        self._on_depth_change = on_depth_change
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lanes: dict[str, _InterfaceLane] = {}
+        self._repeat_handles: set[asyncio.TimerHandle] = set()
+        self._running = False
+
+        self._queue_wait: deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._send_latency: deque[float] = deque(maxlen=_SAMPLE_WINDOW)
+        self._sent_by_priority: dict[str, int] = {p.name.lower(): 0 for p in TxPriority}
+
+    @property
+    def running(self) -> bool:
+        """Whether worker tasks are accepting messages."""
+        return self._running
+
+    def start(self) -> None:
+        """Start accepting messages. Worker tasks are created per interface on demand."""
+        if self._running:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="can-tx"
+        )
+        self._running = True
+
+    async def stop(self) -> None:
+        """Stop workers, cancel pending repeats and shut down the send threads."""
+        if not self._running:
+            return
+        self._running = False
+        for handle in self._repeat_handles:
+            handle.cancel()
+        self._repeat_handles.clear()
+        tasks = [lane.task for lane in self._lanes.values() if lane.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._lanes.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def submit(
+        self,
+        message: can.Message,
+        interface: str,
+        priority: TxPriority = TxPriority.NORMAL,
+        repeat: bool = True,
+    ) -> None:
+        """
+        Queue a message for transmission.
+
+        Args:
+            message: CAN message
+            interface: Interface name to send on
+            priority: Transmit lane
+            repeat: Send a duplicate after ``repeat_delay`` (RV-C commands)
+
+        Raises:
+            RuntimeError: If the scheduler is not running
+        """
+        if not self._running:
+            msg = "CAN TX scheduler is not running"
+            raise RuntimeError(msg)
+        self._enqueue(TxRequest(message, interface, TxPriority(priority), repeat))
+
+    def _enqueue(self, request: TxRequest) -> None:
+        if not self._running:
+            return
+        lane = self._lanes.get(request.interface)
+        if lane is None:
+            lane = self._lanes[request.interface] = _InterfaceLane(request.interface)
+            lane.task = asyncio.create_task(self._run_lane(lane))
+        lane.queues[request.priority].append(request)
+        lane.wakeup.set()
+        self._report_depth()
+
+    def _schedule_repeat(self, request: TxRequest) -> None:
+        repeat = TxRequest(
+            request.message, request.interface, request.priority, repeat=False, is_repeat=True
+        )
+        loop = asyncio.get_running_loop()
+        handle: asyncio.TimerHandle
+
+        def fire() -> None:
+            self._repeat_handles.discard(handle)
+            repeat.enqueued_at = time.perf_counter()
+            self._enqueue(repeat)
+
+        handle = loop.call_later(self.repeat_delay, fire)
+        self._repeat_handles.add(handle)
+
+    async def _run_lane(self, lane: _InterfaceLane) -> None:
+        loop = asyncio.get_running_loop()
+        while self._running:
+            request = lane.pop()
+            if request is None:
+                lane.wakeup.clear()
+                await lane.wakeup.wait()
+                continue
+
+            self._report_depth()
+            started = time.perf_counter()
+            self._queue_wait.append(started - request.enqueued_at)
+            try:
+                bus = self._get_bus(lane.interface)
+                if bus is None:
+                    lane.failed += 1
+                    continue
+                await loop.run_in_executor(self._executor, bus.send, request.message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                lane.failed += 1
+                logger.error("CAN TX failed on %s: %s", lane.interface, e)
+                continue
+
+            self._send_latency.append(time.perf_counter() - started)
+            self._sent_by_priority[request.priority.name.lower()] += 1
+            if request.is_repeat:
+                lane.repeats_sent += 1
+                logger.debug(
+                    "CAN TX (2/2): %s ID: %08X", lane.interface, request.message.arbitration_id
+                )
+                continue
+
+            lane.sent += 1
+            logger.info(
+                "CAN TX (1/2): %s ID: %08X Data: %s",
+                lane.interface,
+                request.message.arbitration_id,
+                request.message.data.hex().upper(),
+            )
+            if request.repeat:
+                self._schedule_repeat(request)
+            if self.on_sent:
+                try:
+                    self.on_sent(request.message, lane.interface)
+                except Exception as e:
+                    logger.warning("CAN TX sent-callback failed: %s", e)
+
+    def _report_depth(self) -> None:
+        if self._on_depth_change:
+            try:
+                self._on_depth_change(self.queue_depth)
+            except Exception as e:
+                logger.debug("Failed to report CAN TX queue depth: %s", e)
+
+    @property
+    def queue_depth(self) -> int:
+        """Total messages waiting across all interfaces (excluding timed repeats)."""
+        return sum(lane.depth() for lane in self._lanes.values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get scheduler metrics.
+
+        Returns:
+            Queue depths, send counts, queue wait and send latency summaries
+        """
+        return {
+            "running": self._running,
+            "queue_depth": self.queue_depth,
+            "pending_repeats": len(self._repeat_handles),
+            "interfaces": {
+                name: {
+                    "queue_depth": lane.depth(),
+                    "queued_by_priority": {p.name.lower(): len(q) for p, q in lane.queues.items()},
+                    "sent": lane.sent,
+                    "repeats_sent": lane.repeats_sent,
+                    "failed": lane.failed,
+                }
+                for name, lane in self._lanes.items()
+            },
+            "sent_by_priority": dict(self._sent_by_priority),
+            "queue_wait": _latency_summary(self._queue_wait),
+            "send_latency": _latency_summary(self._send_latency),
+        }
@@ -66,6 +66,13 @@ class AdvancedDiagnosticsSettings(BaseSettings):
         le=1000,
     )
 
+    component_history_limit: int = Field(
+        default=500,
+        description="Performance samples kept per component for trend analysis",
+        ge=10,
+        le=10000,
+    )
+
     # Severity Thresholds
     critical_dtc_codes: list[int] = Field(
         default=[], description="List of DTC codes that should always be classified as critical"
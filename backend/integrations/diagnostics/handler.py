@@ -7,9 +7,11 @@ RV-C, J1939, and OEM-specific diagnostic capabilities.
 """
 
 import asyncio
+import bisect
+import itertools
 import logging
 import time
-from collections import deque
+from collections import defaultdict, deque
 from typing import Any
 
 from backend.core.config import Settings
@@ -25,6 +27,46 @@ from backend.integrations.diagnostics.models import (
 
 logger = logging.getLogger(__name__)
 
+# Pairs of systems whose faults are treated as related (e.g. engine and transmission)
+RELATED_SYSTEM_PAIRS = (
+    (SystemType.ENGINE, SystemType.TRANSMISSION),
+    (SystemType.BRAKES, SystemType.SAFETY),
+    (SystemType.ELECTRICAL, SystemType.POWER),
+    (SystemType.SUSPENSION, SystemType.LEVELING),
+)
+
+
+def _build_related_systems() -> dict[SystemType, frozenset[SystemType]]:
+    """Map each system to itself and the systems it is paired with."""
+    related = {system: {system} for system in SystemType}
+    for first, second in RELATED_SYSTEM_PAIRS:
+        related[first].add(second)
+        related[second].add(first)
+    return {system: frozenset(systems) for system, systems in related.items()}
+
+
+RELATED_SYSTEMS = _build_related_systems()
+
+DTCKey = tuple[int, ProtocolType, int]
+
+# Active DTC ordering: most severe first, then oldest
+SEVERITY_ORDER = {
+    DTCSeverity.CRITICAL: 0,
+    DTCSeverity.HIGH: 1,
+    DTCSeverity.MEDIUM: 2,
+    DTCSeverity.LOW: 3,
+    DTCSeverity.INFORMATIONAL: 4,
+}
+
+# Health score deducted per active DTC
+SEVERITY_HEALTH_WEIGHTS = {
+    DTCSeverity.CRITICAL: 0.5,
+    DTCSeverity.HIGH: 0.3,
+    DTCSeverity.MEDIUM: 0.15,
+    DTCSeverity.LOW: 0.05,
+    DTCSeverity.INFORMATIONAL: 0.01,
+}
+
 
 class DiagnosticHandler:
     """
@@ -49,18 +91,34 @@ class DiagnosticHandler:
         self._historical_dtcs: list[DiagnosticTroubleCode] = []
         self._dtc_history: deque = deque(maxlen=10000)  # Recent DTC events
 
+        # Active DTC indexes; entries are (severity rank, first occurrence, sequence, DTC)
+        # kept sorted on insert and resolve
+        self._active_sorted: list[tuple] = []
+        self._active_by_system: dict[SystemType, list[tuple]] = defaultdict(list)
+        self._active_by_severity: dict[DTCSeverity, list[tuple]] = defaultdict(list)
+        self._active_by_protocol: dict[ProtocolType, list[tuple]] = defaultdict(list)
+        self._index_entries: dict[DTCKey, tuple] = {}
+        self._index_sequence = itertools.count()
+
         # System health tracking
         self._system_health: dict[SystemType, SystemHealthStatus] = {}
+        self._health_penalty: dict[SystemType, float] = defaultdict(float)
         self._initialize_system_health()
 
-        # Correlation analysis
-        self._correlation_buffer: deque = deque(maxlen=1000)  # Recent events for correlation
+        # Correlation analysis: DTCs seen within the correlation window, bucketed by
+        # system and ordered by last occurrence
+        self._recent_by_system: dict[SystemType, dict[DTCKey, DiagnosticTroubleCode]] = defaultdict(
+            dict
+        )
+        # Primary DTC -> DTCs correlated with it, as last emitted
+        self._correlation_members: dict[DTCKey, dict[DTCKey, DiagnosticTroubleCode]] = {}
         self._correlation_cache: dict[str, FaultCorrelation] = {}
 
         # Performance tracking
         self._processing_stats = {
             "dtcs_processed": 0,
             "correlations_found": 0,
+            "correlation_comparisons": 0,
             "predictions_made": 0,
             "processing_time_ms": 0.0,
         }
@@ -89,11 +147,7 @@ class DiagnosticHandler:
 
         self._running = True
 
-        # Start background correlation analysis
-        correlation_task = asyncio.create_task(self._correlation_analysis_loop())
-        self._background_tasks.append(correlation_task)
-
-        # Start health assessment
+        # Start health assessment (fault correlation runs incrementally in process_dtc)
         health_task = asyncio.create_task(self._health_assessment_loop())
         self._background_tasks.append(health_task)
 
@@ -179,21 +233,21 @@ class DiagnosticHandler:
                 dtc.possible_causes = self._get_possible_causes(code, protocol, system_type)
                 dtc.recommended_actions = self._get_recommended_actions(code, protocol, system_type)
 
-                # Store active DTC
+                # Store and index active DTC
                 self._active_dtcs[dtc_key] = dtc
+                self._index_dtc(dtc_key, dtc)
+                self._update_system_health(dtc)
                 logger.info(
                     f"New DTC {code} from {protocol.value} system {system_type.value} (severity: {dtc.severity.value})"
                 )
 
-            # Add to correlation buffer for analysis
-            self._correlation_buffer.append(dtc)
+            # Correlate against recent DTCs in related systems
+            if self.diag_settings.enable_fault_correlation:
+                self._correlate_dtc(dtc_key, dtc)
 
             # Add to history
             self._dtc_history.append((time.time(), dtc))
 
-            # Update system health
-            self._update_system_health(dtc)
-
             # Update processing stats
             self._processing_stats["dtcs_processed"] += 1
             processing_time = (time.perf_counter() - start_time) * 1000
@@ -233,6 +287,9 @@ class DiagnosticHandler:
             # Move to historical storage
             self._historical_dtcs.append(dtc)
             del self._active_dtcs[dtc_key]
+            self._unindex_dtc(dtc_key)
+            self._remove_from_system_health(dtc)
+            self._recent_by_system[dtc.system_type].pop(dtc_key, None)
 
             logger.info(f"Resolved DTC {code} from {protocol.value}")
             return True
@@ -254,29 +311,27 @@ class DiagnosticHandler:
             protocol: Filter by protocol
 
         Returns:
-            List of matching active DTCs
+            List of matching active DTCs, sorted by severity and first occurrence
         """
-        dtcs = list(self._active_dtcs.values())
-
-        if system_type:
-            dtcs = [dtc for dtc in dtcs if dtc.system_type == system_type]
-
-        if severity:
-            dtcs = [dtc for dtc in dtcs if dtc.severity == severity]
-
-        if protocol:
-            dtcs = [dtc for dtc in dtcs if dtc.protocol == protocol]
-
-        # Sort by severity and occurrence time
-        severity_order = {
-            DTCSeverity.CRITICAL: 0,
-            DTCSeverity.HIGH: 1,
-            DTCSeverity.MEDIUM: 2,
-            DTCSeverity.LOW: 3,
-            DTCSeverity.INFORMATIONAL: 4,
-        }
-
-        return sorted(dtcs, key=lambda d: (severity_order[d.severity], d.first_occurrence))
+        # Walk the smallest applicable index; each is already in result order
+        entries = self._active_sorted
+        for index, value in (
+            (self._active_by_system, system_type),
+            (self._active_by_severity, severity),
+            (self._active_by_protocol, protocol),
+        ):
+            if value is not None:
+                candidate = index.get(value, [])
+                if len(candidate) < len(entries):
+                    entries = candidate
+
+        return [
+            dtc
+            for *_, dtc in entries
+            if (system_type is None or dtc.system_type == system_type)
+            and (severity is None or dtc.severity == severity)
+            and (protocol is None or dtc.protocol == protocol)
+        ]
 
     def get_system_health(self, system_type: SystemType | None = None) -> dict[str, Any]:
         """
@@ -432,6 +487,39 @@ class DiagnosticHandler:
 
         return actions
 
+    def _index_dtc(self, dtc_key: DTCKey, dtc: DiagnosticTroubleCode) -> None:
+        """Insert a new active DTC into the sorted indexes."""
+        entry = (
+            SEVERITY_ORDER.get(dtc.severity, len(SEVERITY_ORDER)),
+            dtc.first_occurrence,
+            next(self._index_sequence),
+            dtc,
+        )
+        self._index_entries[dtc_key] = entry
+        for entries in (
+            self._active_sorted,
+            self._active_by_system[dtc.system_type],
+            self._active_by_severity[dtc.severity],
+            self._active_by_protocol[dtc.protocol],
+        ):
+            bisect.insort(entries, entry)
+
+    def _unindex_dtc(self, dtc_key: DTCKey) -> None:
+        """Remove a resolved DTC from the sorted indexes."""
+        entry = self._index_entries.pop(dtc_key, None)
+        if entry is None:
+            return
+        dtc = entry[-1]
+        for entries in (
+            self._active_sorted,
+            self._active_by_system[dtc.system_type],
+            self._active_by_severity[dtc.severity],
+            self._active_by_protocol[dtc.protocol],
+        ):
+            position = bisect.bisect_left(entries, entry)
+            if position < len(entries) and entries[position] is entry:
+                del entries[position]
+
     def _update_system_health(self, dtc: DiagnosticTroubleCode) -> None:
         """Update system health based on new DTC."""
         system_health = self._system_health.get(dtc.system_type)
@@ -439,52 +527,28 @@ class DiagnosticHandler:
             return
 
         # Add DTC to system health
-        if dtc not in system_health.active_dtcs:
-            system_health.active_dtcs.append(dtc)
+        system_health.active_dtcs.append(dtc)
+        self._health_penalty[dtc.system_type] += SEVERITY_HEALTH_WEIGHTS.get(dtc.severity, 0.1)
+        system_health.update_health_score(self._calculate_health_score(dtc.system_type))
 
-        # Recalculate health score
-        health_score = self._calculate_health_score(dtc.system_type)
-        system_health.update_health_score(health_score)
-
-    def _calculate_health_score(self, system_type: SystemType) -> float:
-        """Calculate health score for a system based on active DTCs."""
-        system_health = self._system_health.get(system_type)
+    def _remove_from_system_health(self, dtc: DiagnosticTroubleCode) -> None:
+        """Update system health after a DTC is resolved."""
+        system_health = self._system_health.get(dtc.system_type)
         if not system_health:
-            return 1.0
-
-        if not system_health.active_dtcs:
-            return 1.0
-
-        # Calculate score based on DTC severity and count
-        score = 1.0
-        severity_weights = {
-            DTCSeverity.CRITICAL: 0.5,
-            DTCSeverity.HIGH: 0.3,
-            DTCSeverity.MEDIUM: 0.15,
-            DTCSeverity.LOW: 0.05,
-            DTCSeverity.INFORMATIONAL: 0.01,
-        }
-
-        for dtc in system_health.active_dtcs:
-            weight = severity_weights.get(dtc.severity, 0.1)
-            score -= weight
-
-        return max(0.0, score)
-
-    async def _correlation_analysis_loop(self) -> None:
-        """Background task for fault correlation analysis."""
-        while self._running:
-            try:
-                if self.diag_settings.enable_fault_correlation:
-                    await self._analyze_correlations()
+            return
 
-                await asyncio.sleep(self.diag_settings.correlation_time_window_seconds)
+        system_health.active_dtcs = [d for d in system_health.active_dtcs if d is not dtc]
+        if system_health.active_dtcs:
+            self._health_penalty[dtc.system_type] -= SEVERITY_HEALTH_WEIGHTS.get(dtc.severity, 0.1)
+        else:
+            # Reset rather than subtract so rounding error cannot accumulate
+            self._health_penalty[dtc.system_type] = 0.0
+        system_health.update_health_score(self._calculate_health_score(dtc.system_type))
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in correlation analysis: {e}")
-                await asyncio.sleep(5.0)
+    def _calculate_health_score(self, system_type: SystemType) -> float:
+        """Calculate health score for a system based on active DTCs."""
+        # Maintained incrementally as DTCs become active and are resolved
+        return max(0.0, 1.0 - self._health_penalty.get(system_type, 0.0))
 
     async def _health_assessment_loop(self) -> None:
         """Background task for system health assessment."""
@@ -499,72 +563,82 @@ class DiagnosticHandler:
                 logger.error(f"Error in health assessment: {e}")
                 await asyncio.sleep(5.0)
 
-    async def _analyze_correlations(self) -> None:
-        """Analyze fault correlations in the correlation buffer."""
-        if len(self._correlation_buffer) < 2:
-            return
-
-        # Analyze DTCs within time window
-        current_time = time.time()
-        time_window = self.diag_settings.correlation_time_window_seconds
-
-        recent_dtcs = [
-            dtc
-            for dtc in self._correlation_buffer
-            if current_time - dtc.last_occurrence <= time_window
-        ]
+    def _correlate_dtc(self, dtc_key: DTCKey, dtc: DiagnosticTroubleCode) -> None:
+        """
+        Correlate a newly admitted or recurring DTC with recent DTCs.
 
-        if len(recent_dtcs) < 2:
-            return
+        Only the buckets of related systems are scanned, and each bucket holds
+        one entry per distinct DTC, so the cost does not grow with the rate at
+        which a failing ECU repeats its codes. Each earlier DTC's correlation is
+        emitted again only when its set of related DTCs changes.
+        """
+        cutoff = dtc.last_occurrence - self.diag_settings.correlation_time_window_seconds
+        changed: list[tuple[DTCKey, DiagnosticTroubleCode]] = []
+
+        for system_type in RELATED_SYSTEMS[dtc.system_type]:
+            bucket = self._recent_by_system.get(system_type)
+            if not bucket:
+                continue
+            self._expire_recent(bucket, cutoff)
+
+            for other_key, other in bucket.items():
+                if other_key == dtc_key:
+                    continue
+                self._processing_stats["correlation_comparisons"] += 1
+                members = self._correlation_members.setdefault(other_key, {})
+                if dtc_key not in members:
+                    members[dtc_key] = dtc
+                    changed.append((other_key, other))
+
+        # Move the DTC to the newest end of its bucket
+        bucket = self._recent_by_system[dtc.system_type]
+        bucket.pop(dtc_key, None)
+        bucket[dtc_key] = dtc
+
+        for primary_key, primary_dtc in changed:
+            self._emit_correlation(primary_key, primary_dtc, cutoff)
+
+    @staticmethod
+    def _expire_recent(bucket: dict[DTCKey, DiagnosticTroubleCode], cutoff: float) -> None:
+        """Drop DTCs last seen before the cutoff from the front of a bucket."""
+        while bucket:
+            oldest_key = next(iter(bucket))
+            if bucket[oldest_key].last_occurrence >= cutoff:
+                break
+            del bucket[oldest_key]
+
+    def _emit_correlation(
+        self, primary_key: DTCKey, primary_dtc: DiagnosticTroubleCode, cutoff: float
+    ) -> None:
+        """Rebuild and record the correlation for a primary DTC after it changed."""
+        members = self._correlation_members[primary_key]
+        # Members that fell out of the window are no longer part of the correlation
+        for member_key in [key for key, dtc in members.items() if dtc.last_occurrence < cutoff]:
+            del members[member_key]
+        related_dtcs = list(members.values())
 
-        # Look for correlations
-        for i, primary_dtc in enumerate(recent_dtcs[:-1]):
-            related_dtcs = []
-
-            for secondary_dtc in recent_dtcs[i + 1 :]:
-                # Check for correlation criteria
-                if self._dtcs_correlated(primary_dtc, secondary_dtc):
-                    related_dtcs.append(secondary_dtc)
-
-            if related_dtcs:
-                correlation = FaultCorrelation(
-                    primary_dtc=primary_dtc,
-                    related_dtcs=related_dtcs,
-                    correlation_confidence=self._calculate_correlation_confidence(
-                        primary_dtc, related_dtcs
-                    ),
-                    correlation_type=self._determine_correlation_type(primary_dtc, related_dtcs),
-                    time_window_seconds=time_window,
-                )
+        time_window = self.diag_settings.correlation_time_window_seconds
+        correlation = FaultCorrelation(
+            primary_dtc=primary_dtc,
+            related_dtcs=related_dtcs,
+            correlation_confidence=self._calculate_correlation_confidence(
+                primary_dtc, related_dtcs
+            ),
+            correlation_type=self._determine_correlation_type(primary_dtc, related_dtcs),
+            time_window_seconds=time_window,
+        )
 
-                correlation_key = (
-                    f"{primary_dtc.code}_{primary_dtc.protocol.value}_{len(related_dtcs)}"
-                )
-                self._correlation_cache[correlation_key] = correlation
+        code, protocol, source_address = primary_key
+        self._correlation_cache[f"{code}_{protocol.value}_{source_address}"] = correlation
 
-                logger.info(
-                    f"Found fault correlation: primary DTC {primary_dtc.code}, {len(related_dtcs)} related DTCs"
-                )
-                self._processing_stats["correlations_found"] += 1
+        logger.info(
+            f"Found fault correlation: primary DTC {primary_dtc.code}, {len(related_dtcs)} related DTCs"
+        )
+        self._processing_stats["correlations_found"] += 1
 
     def _dtcs_correlated(self, dtc1: DiagnosticTroubleCode, dtc2: DiagnosticTroubleCode) -> bool:
-        """Determine if two DTCs are correlated."""
-        # Same system type
-        if dtc1.system_type == dtc2.system_type:
-            return True
-
-        # Related systems (e.g., engine and transmission)
-        related_systems = {
-            (SystemType.ENGINE, SystemType.TRANSMISSION),
-            (SystemType.BRAKES, SystemType.SAFETY),
-            (SystemType.ELECTRICAL, SystemType.POWER),
-            (SystemType.SUSPENSION, SystemType.LEVELING),
-        }
-
-        system_pair = (dtc1.system_type, dtc2.system_type)
-        return bool(
-            system_pair in related_systems or (system_pair[1], system_pair[0]) in related_systems
-        )
+        """Determine if two DTCs are correlated (same or related systems)."""
+        return dtc2.system_type in RELATED_SYSTEMS[dtc1.system_type]
 
     def _calculate_correlation_confidence(
         self, primary_dtc: DiagnosticTroubleCode, related_dtcs: list[DiagnosticTroubleCode]
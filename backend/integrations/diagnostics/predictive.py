@@ -6,6 +6,7 @@ performance patterns, and machine learning approaches for RV systems.
 """
 
 import logging
+import math
 import statistics
 import time
 from collections import defaultdict, deque
@@ -22,6 +23,94 @@ from backend.integrations.diagnostics.models import (
 logger = logging.getLogger(__name__)
 
 
+class MetricTrendAccumulator:
+    """
+    Sliding-window trend statistics for one component metric.
+
+    Running sums over the last ``window`` samples make the regression slope,
+    mean and sample variance O(1) to update and read. Samples are indexed by
+    their position in the window, as in a regression over the window's values.
+    The sums are rebuilt from the window once per full turnover so
+    floating-point drift from subtracting evicted samples cannot accumulate.
+    """
+
+    __slots__ = ("_evictions", "_sum", "_sum_sq", "_sum_xy", "_values")
+
+    def __init__(self, window: int):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            window: Number of most recent samples the statistics cover
+        """
+        self._values: deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._sum_xy = 0.0
+        self._evictions = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        values = self._values
+        position = len(values)
+        if position == values.maxlen:
+            oldest = values[0]
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+            # The oldest sample sat at position 0; every other one moves down by one
+            self._sum_xy -= self._sum
+            position -= 1
+            self._evictions += 1
+
+        values.append(value)
+        self._sum += value
+        self._sum_sq += value * value
+        self._sum_xy += position * value
+
+        if self._evictions >= values.maxlen:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._sum = math.fsum(self._values)
+        self._sum_sq = math.fsum(v * v for v in self._values)
+        self._sum_xy = math.fsum(x * v for x, v in enumerate(self._values))
+        self._evictions = 0
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._values)
+
+    @property
+    def last(self) -> float:
+        """Most recent sample."""
+        return self._values[-1]
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window."""
+        return self._sum / len(self._values) if self._values else 0.0
+
+    @property
+    def slope(self) -> float:
+        """Least-squares slope per sample over the window."""
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        # Positions are 0..n-1, so their sums have closed forms
+        sum_x = n * (n - 1) / 2
+        sxx = n * (n * n - 1) / 12
+        return (self._sum_xy - sum_x * self._sum / n) / sxx
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the window."""
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        return max(0.0, (self._sum_sq - self._sum * self._sum / n) / (n - 1))
+
+
 class PredictiveMaintenanceEngine:
     """
     Predictive maintenance engine for RV systems.
@@ -34,11 +123,13 @@ class PredictiveMaintenanceEngine:
         """Initialize predictive maintenance engine."""
         self.settings = settings
 
-        # Performance data storage
-        self._performance_history: dict[SystemType, deque] = defaultdict(lambda: deque(maxlen=1000))
+        # Performance data storage, bounded per component
+        self._performance_history: dict[SystemType, dict[str, deque]] = defaultdict(dict)
 
         # Component tracking
         self._component_health: dict[str, dict[str, Any]] = {}
+        # Component key -> metric -> streaming trend statistics
+        self._metric_trends: dict[str, dict[str, MetricTrendAccumulator]] = {}
         self._failure_patterns: dict[SystemType, list[dict[str, Any]]] = defaultdict(list)
 
         # Prediction cache
@@ -72,10 +163,23 @@ class PredictiveMaintenanceEngine:
             "metrics": metrics.copy(),
         }
 
-        self._performance_history[system_type].append(performance_data)
+        history_limit = self.settings.component_history_limit
+        component_history = self._performance_history[system_type].get(component_name)
+        if component_history is None:
+            component_history = self._performance_history[system_type][component_name] = deque(
+                maxlen=history_limit
+            )
+        component_history.append(performance_data)
 
-        # Update component health tracking
         component_key = f"{system_type.value}_{component_name}"
+        trends = self._metric_trends.setdefault(component_key, {})
+        for metric, value in metrics.items():
+            trend = trends.get(metric)
+            if trend is None:
+                trend = trends[metric] = MetricTrendAccumulator(history_limit)
+            trend.add(value)
+
+        # Update component health tracking
         if component_key not in self._component_health:
             self._component_health[component_key] = {
                 "first_seen": timestamp,
@@ -158,11 +262,7 @@ class PredictiveMaintenanceEngine:
             }
 
         # Get recent performance data
-        recent_data = [
-            data
-            for data in self._performance_history[system_type]
-            if data["component"] == component_name
-        ]
+        recent_data = self._performance_history[system_type].get(component_name, ())
 
         if len(recent_data) < self.settings.trend_analysis_minimum_samples:
             return {"status": "insufficient_recent_data"}
@@ -185,24 +285,23 @@ class PredictiveMaintenanceEngine:
 
             # Analyze each metric
             baseline_metrics = health_data.get("baseline_metrics", {})
-            for metric in baseline_metrics:
-                metric_values = [
-                    data["metrics"].get(metric, 0)
-                    for data in recent_data
-                    if metric in data["metrics"]
-                ]
-
-                if len(metric_values) >= self.settings.trend_analysis_minimum_samples:
-                    trend_analysis = self._analyze_metric_trend(
-                        metric, metric_values, baseline_metrics[metric]
+            trends = self._metric_trends.get(component_key, {})
+            for metric, baseline in baseline_metrics.items():
+                trend = trends.get(metric)
+                if trend is None or trend.count < self.settings.trend_analysis_minimum_samples:
+                    continue
+
+                # The baseline is a list of samples until ten have been collected
+                if isinstance(baseline, list):
+                    baseline = statistics.mean(baseline)
+                trend_analysis = self._analyze_metric_trend(metric, trend, baseline)
+                wear_analysis["trends"][metric] = trend_analysis
+
+                # Check for wear indicators
+                if trend_analysis["degradation_percentage"] > 10.0:
+                    wear_analysis["wear_indicators"].append(
+                        f"{metric}: {trend_analysis['degradation_percentage']:.1f}% degradation"
                     )
-                    wear_analysis["trends"][metric] = trend_analysis
-
-                    # Check for wear indicators
-                    if trend_analysis["degradation_percentage"] > 10.0:
-                        wear_analysis["wear_indicators"].append(
-                            f"{metric}: {trend_analysis['degradation_percentage']:.1f}% degradation"
-                        )
 
             # Calculate overall degradation rate
             degradation_rates = [
@@ -359,7 +458,9 @@ class PredictiveMaintenanceEngine:
                 len(patterns) for patterns in self._failure_patterns.values()
             ),
             "performance_data_points": sum(
-                len(history) for history in self._performance_history.values()
+                len(history)
+                for components in self._performance_history.values()
+                for history in components.values()
             ),
             "last_analysis_time": self._last_analysis_time,
         }
@@ -367,10 +468,10 @@ class PredictiveMaintenanceEngine:
     # Internal helper methods
 
     def _analyze_metric_trend(
-        self, metric_name: str, values: list[float], baseline: float
+        self, metric_name: str, trend_data: MetricTrendAccumulator, baseline: float
     ) -> dict[str, Any]:
-        """Analyze trend for a specific metric."""
-        if not values or baseline == 0:
+        """Analyze trend for a specific metric from its streaming statistics."""
+        if not trend_data.count or baseline == 0:
             return {
                 "metric": metric_name,
                 "trend": "stable",
@@ -379,21 +480,12 @@ class PredictiveMaintenanceEngine:
                 "confidence": 0.0,
             }
 
-        # Calculate linear regression for trend
-        n = len(values)
-        x_values = list(range(n))
-
-        # Simple linear regression
-        x_mean = statistics.mean(x_values)
-        y_mean = statistics.mean(values)
-
-        numerator = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_values, values, strict=False))
-        denominator = sum((x - x_mean) ** 2 for x in x_values)
-
-        slope = numerator / denominator if denominator != 0 else 0.0
+        n = trend_data.count
+        y_mean = trend_data.mean
+        slope = trend_data.slope
 
         # Calculate trend direction
-        current_value = values[-1]
+        current_value = trend_data.last
         degradation_percentage = abs(current_value - baseline) / baseline * 100
 
         trend = "stable"
@@ -408,8 +500,8 @@ class PredictiveMaintenanceEngine:
                 trend = "improving"
 
         # Calculate confidence based on data consistency
-        variance = statistics.variance(values) if len(values) > 1 else 0
-        confidence = max(0.0, min(1.0, 1.0 - (variance / (y_mean**2))))
+        variance = trend_data.variance
+        confidence = max(0.0, min(1.0, 1.0 - (variance / (y_mean**2)))) if y_mean else 0.0
 
         return {
             "metric": metric_name,
@@ -0,0 +1,108 @@
+"""
+Active DTC Index Tests
+
+Tests for the sorted active DTC indexes and incremental health scores in
+the diagnostic handler.
+"""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from backend.core.config import Settings
+from backend.integrations.diagnostics.config import AdvancedDiagnosticsSettings
+from backend.integrations.diagnostics.handler import SEVERITY_ORDER, DiagnosticHandler
+from backend.integrations.diagnostics.models import DTCSeverity, ProtocolType, SystemType
+
+SYSTEMS = [SystemType.ENGINE, SystemType.BRAKES, SystemType.LIGHTING, SystemType.TANKS]
+
+
+@pytest.fixture
+def handler():
+    """Diagnostic handler with fault correlation disabled."""
+    settings = Mock(spec=Settings)
+    settings.advanced_diagnostics = AdvancedDiagnosticsSettings(
+        enabled=True, enable_fault_correlation=False
+    )
+    return DiagnosticHandler(settings)
+
+
+@pytest.fixture
+def populated(handler):
+    """Handler with a mix of active and resolved DTCs."""
+    rng = random.Random(7)
+    for code in range(200):
+        handler.process_dtc(
+            code,
+            rng.choice(list(ProtocolType)),
+            rng.choice(SYSTEMS),
+            source_address=code % 5,
+            severity=rng.choice(list(DTCSeverity)),
+        )
+    for code in range(0, 200, 3):
+        dtc = next(d for d in handler._active_dtcs.values() if d.code == code)
+        handler.resolve_dtc(code, dtc.protocol, dtc.source_address)
+    return handler
+
+
+def _expected(handler, **filters):
+    dtcs = [
+        dtc
+        for dtc in handler._active_dtcs.values()
+        if all(getattr(dtc, name) == value for name, value in filters.items())
+    ]
+    return sorted(dtcs, key=lambda d: (SEVERITY_ORDER[d.severity], d.first_occurrence))
+
+
+class TestActiveDTCIndex:
+    """Test indexed active DTC queries."""
+
+    def test_queries_match_filter_and_sort(self, populated):
+        """Every filter combination should match a full filter and sort."""
+        assert populated.get_active_dtcs() == _expected(populated)
+        for system_type in SYSTEMS:
+            for severity in DTCSeverity:
+                assert populated.get_active_dtcs(
+                    system_type=system_type, severity=severity
+                ) == _expected(populated, system_type=system_type, severity=severity)
+        for protocol in ProtocolType:
+            assert populated.get_active_dtcs(protocol=protocol) == _expected(
+                populated, protocol=protocol
+            )
+
+    def test_recurrence_does_not_duplicate(self, handler):
+        """A recurring DTC should stay indexed once."""
+        for _ in range(3):
+            handler.process_dtc(10, ProtocolType.J1939, SystemType.ENGINE)
+
+        assert len(handler.get_active_dtcs()) == 1
+        assert len(handler.get_active_dtcs(system_type=SystemType.ENGINE)) == 1
+
+
+class TestIncrementalHealth:
+    """Test health scores maintained on insert and resolve."""
+
+    def test_score_recovers_on_resolve(self, handler):
+        """Resolving DTCs should restore the system health score."""
+        handler.process_dtc(1, ProtocolType.J1939, SystemType.ENGINE, severity=DTCSeverity.CRITICAL)
+        handler.process_dtc(2, ProtocolType.J1939, SystemType.ENGINE, severity=DTCSeverity.LOW)
+        health = handler._system_health[SystemType.ENGINE]
+        assert health.health_score == pytest.approx(0.45)
+
+        handler.resolve_dtc(1, ProtocolType.J1939)
+        assert health.health_score == pytest.approx(0.95)
+        assert [dtc.code for dtc in health.active_dtcs] == [2]
+
+        handler.resolve_dtc(2, ProtocolType.J1939)
+        assert health.health_score == 1.0
+        assert health.status == "excellent"
+
+    def test_recurrence_does_not_change_score(self, handler):
+        """Repeated occurrences should neither lower the score nor grow its history."""
+        for _ in range(50):
+            handler.process_dtc(1, ProtocolType.J1939, SystemType.BRAKES, severity=DTCSeverity.HIGH)
+
+        health = handler._system_health[SystemType.BRAKES]
+        assert health.health_score == pytest.approx(0.7)
+        assert len(health.health_history) == 1
@@ -0,0 +1,84 @@
+"""
+Fault Correlation Tests
+
+Tests for incremental fault correlation in the diagnostic handler.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from backend.core.config import Settings
+from backend.integrations.diagnostics.config import AdvancedDiagnosticsSettings
+from backend.integrations.diagnostics.handler import DiagnosticHandler
+from backend.integrations.diagnostics.models import ProtocolType, SystemType
+
+
+@pytest.fixture
+def handler():
+    """Diagnostic handler with fault correlation enabled."""
+    settings = Mock(spec=Settings)
+    settings.advanced_diagnostics = AdvancedDiagnosticsSettings(
+        enabled=True, enable_fault_correlation=True, correlation_time_window_seconds=60.0
+    )
+    return DiagnosticHandler(settings)
+
+
+class TestIncrementalCorrelation:
+    """Test correlation on DTC admission."""
+
+    def test_related_systems_correlate(self, handler):
+        """A DTC in a related system should correlate with the earlier one."""
+        handler.process_dtc(100, ProtocolType.J1939, SystemType.ENGINE, source_address=0)
+        handler.process_dtc(200, ProtocolType.J1939, SystemType.TRANSMISSION, source_address=3)
+        handler.process_dtc(300, ProtocolType.RVC, SystemType.LIGHTING, source_address=9)
+
+        correlations = handler.get_fault_correlations()
+
+        assert len(correlations) == 1
+        assert correlations[0].primary_dtc.code == 100
+        assert [dtc.code for dtc in correlations[0].related_dtcs] == [200]
+
+    def test_dtc_storm_emits_once(self, handler):
+        """A repeating DTC should not re-emit or grow the comparison cost."""
+        handler.process_dtc(100, ProtocolType.J1939, SystemType.ENGINE)
+        handler.process_dtc(101, ProtocolType.J1939, SystemType.ENGINE)
+        stats = handler._processing_stats
+        assert stats["correlations_found"] == 1
+
+        for _ in range(500):
+            handler.process_dtc(101, ProtocolType.J1939, SystemType.ENGINE)
+
+        assert stats["correlations_found"] == 1
+        # One comparison per admission against the single other recent DTC
+        assert stats["correlation_comparisons"] == 501
+        assert len(handler._recent_by_system[SystemType.ENGINE]) == 2
+
+    def test_new_member_re_emits(self, handler):
+        """A correlation should be emitted again when another DTC joins it."""
+        handler.process_dtc(100, ProtocolType.J1939, SystemType.BRAKES)
+        handler.process_dtc(200, ProtocolType.J1939, SystemType.SAFETY)
+        handler.process_dtc(201, ProtocolType.J1939, SystemType.SAFETY)
+
+        correlation = handler._correlation_cache["100_j1939_0"]
+        assert sorted(dtc.code for dtc in correlation.related_dtcs) == [200, 201]
+        assert handler._processing_stats["correlations_found"] == 3
+
+    def test_expired_dtcs_are_not_correlated(self, handler):
+        """DTCs last seen outside the window should drop out of the buckets."""
+        old = handler.process_dtc(100, ProtocolType.J1939, SystemType.ENGINE)
+        old.last_occurrence -= 120
+
+        handler.process_dtc(101, ProtocolType.J1939, SystemType.ENGINE)
+
+        assert handler.get_fault_correlations() == []
+        assert list(handler._recent_by_system[SystemType.ENGINE]) == [(101, ProtocolType.J1939, 0)]
+
+    def test_resolved_dtc_leaves_bucket(self, handler):
+        """Resolving a DTC should stop it correlating with later ones."""
+        handler.process_dtc(100, ProtocolType.J1939, SystemType.ENGINE)
+        handler.resolve_dtc(100, ProtocolType.J1939)
+
+        handler.process_dtc(101, ProtocolType.J1939, SystemType.ENGINE)
+
+        assert handler.get_fault_correlations() == []
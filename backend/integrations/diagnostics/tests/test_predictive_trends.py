@@ -0,0 +1,106 @@
+"""
+Predictive Maintenance Trend Tests
+
+Tests for the streaming per-component trend statistics used by the
+predictive maintenance engine.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from backend.integrations.diagnostics.config import AdvancedDiagnosticsSettings
+from backend.integrations.diagnostics.models import SystemType
+from backend.integrations.diagnostics.predictive import (
+    MetricTrendAccumulator,
+    PredictiveMaintenanceEngine,
+)
+
+
+def _regression_slope(values: list[float]) -> float:
+    x_mean = (len(values) - 1) / 2
+    y_mean = statistics.mean(values)
+    numerator = sum((x - x_mean) * (y - y_mean) for x, y in enumerate(values))
+    return numerator / sum((x - x_mean) ** 2 for x in range(len(values)))
+
+
+@pytest.fixture
+def engine():
+    """Engine with a small per-component history."""
+    return PredictiveMaintenanceEngine(
+        AdvancedDiagnosticsSettings(trend_analysis_minimum_samples=3, component_history_limit=50)
+    )
+
+
+class TestMetricTrendAccumulator:
+    """Test streaming regression and variance."""
+
+    def test_matches_full_recomputation_across_evictions(self):
+        """Statistics should equal a recomputation over the current window."""
+        rng = random.Random(42)
+        accumulator = MetricTrendAccumulator(window=20)
+        window: list[float] = []
+
+        for i in range(137):
+            value = 80.0 + 0.3 * i + rng.uniform(-2, 2)
+            accumulator.add(value)
+            window = [*window, value][-20:]
+
+            if len(window) >= 2:
+                assert accumulator.slope == pytest.approx(_regression_slope(window))
+                assert accumulator.variance == pytest.approx(statistics.variance(window))
+                assert accumulator.mean == pytest.approx(statistics.mean(window))
+        assert accumulator.count == 20
+        assert accumulator.last == window[-1]
+
+    def test_single_sample(self):
+        """One sample has no slope or variance."""
+        accumulator = MetricTrendAccumulator(window=5)
+        accumulator.add(12.5)
+
+        assert accumulator.slope == 0.0
+        assert accumulator.variance == 0.0
+        assert accumulator.mean == 12.5
+
+
+class TestPredictiveEngineTrends:
+    """Test the engine's use of per-component history and trends."""
+
+    def test_history_is_bounded_per_component(self, engine):
+        """A chatty component should not evict another component's history."""
+        engine.record_performance_data(SystemType.ENGINE, "coolant_pump", {"temperature": 80.0})
+        for i in range(200):
+            engine.record_performance_data(SystemType.ENGINE, "oil_pump", {"temperature": 80.0 + i})
+
+        history = engine._performance_history[SystemType.ENGINE]
+        assert len(history["oil_pump"]) == 50
+        assert len(history["coolant_pump"]) == 1
+        assert engine.get_prediction_statistics()["performance_data_points"] == 51
+
+    def test_wear_analysis_uses_window_trend(self, engine):
+        """Trend, slope and degradation should come from the windowed statistics."""
+        for i in range(80):
+            engine.record_performance_data(
+                SystemType.ENGINE, "oil_pump", {"temperature": 80.0 + i * 0.5}
+            )
+
+        analysis = engine.analyze_component_wear(SystemType.ENGINE, "oil_pump")
+        trend = analysis["trends"]["temperature"]
+
+        assert analysis["data_points"] == 50
+        assert trend["trend"] == "degrading"
+        assert trend["slope"] == pytest.approx(0.5)
+        baseline = statistics.mean(80.0 + i * 0.5 for i in range(10))
+        assert trend["degradation_percentage"] == pytest.approx(
+            abs(80.0 + 79 * 0.5 - baseline) / baseline * 100
+        )
+
+    def test_wear_analysis_before_baseline_is_complete(self, engine):
+        """Analysis should work before the ten-sample baseline is averaged."""
+        for i in range(5):
+            engine.record_performance_data(SystemType.BRAKES, "pads", {"temperature": 50.0 + i})
+
+        analysis = engine.analyze_component_wear(SystemType.BRAKES, "pads")
+
+        assert analysis["trends"]["temperature"]["baseline_value"] == 52.0
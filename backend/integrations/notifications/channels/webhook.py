@@ -154,8 +154,9 @@ class WebhookNotificationChannel:
         # Rate limiting
         self._request_timestamps: list[float] = []
 
-        # HTTP session
+        # HTTP session; not owned (and never closed here) when supplied via use_session()
         self._session: aiohttp.ClientSession | None = None
+        self._owns_session = True
 
         # Statistics
         self.stats = {
@@ -197,9 +198,24 @@ class WebhookNotificationChannel:
         except Exception as e:
             self.logger.error(f"Failed to load webhook targets: {e}")
 
+    def use_session(self, session: aiohttp.ClientSession | None) -> None:
+        """
+        Deliver through a caller-owned, long-lived session.
+
+        The session stays open across deliveries so connections are kept
+        alive between notifications. Pass None to go back to a session
+        managed by the channel.
+
+        Args:
+            session: Shared client session, or None
+        """
+        self._session = session
+        self._owns_session = session is None
+
     async def _ensure_session(self) -> None:
         """Ensure HTTP session is available."""
         if self._session is None or self._session.closed:
+            self._owns_session = True
             timeout = aiohttp.ClientTimeout(total=self.default_timeout)
             connector = aiohttp.TCPConnector(verify_ssl=self.verify_ssl)
             self._session = aiohttp.ClientSession(
@@ -212,7 +228,7 @@ class WebhookNotificationChannel:
 
     async def _close_session(self) -> None:
         """Close HTTP session."""
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
             self._session = None
 
@@ -120,6 +120,9 @@ class NotificationFeature(Feature):
                     batch_size=self.config.get("dispatch_batch_size", 10),
                     max_concurrent_batches=self.config.get("max_concurrent_batches", 3),
                     processing_interval=self.config.get("processing_interval", 1.0),
+                    max_concurrent_per_channel=self.config.get("max_concurrent_per_channel", 4),
+                    circuit_failure_threshold=self.config.get("circuit_failure_threshold", 5),
+                    circuit_recovery_timeout=self.config.get("circuit_recovery_timeout", 60.0),
                 )
 
                 # Start background dispatcher
@@ -0,0 +1,271 @@
+"""
+Precompiled RV-C configuration cache.
+
+Parsing and validating ``rvc.json`` and the coach mapping YAML, then building
+the lookup tables in :func:`load_config_data_v2`, happens on every process
+start. This module stores the fully processed :class:`RVCConfiguration` on
+disk, keyed by a hash of the source file contents, and reloads it with a
+single ``marshal.loads`` over a memory-mapped file while the sources are
+unchanged.
+
+The cache is rebuilt automatically when a source file changes. It can also be
+prebuilt, e.g. when building a Pi image::
+
+    python -m backend.integrations.rvc.config_cache
+    python -m backend.integrations.rvc.config_cache --mapping config/2021_Entegra_Aspire_44R.yml
+"""
+
+import argparse
+import hashlib
+import logging
+import marshal
+import mmap
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from backend.models.common import CoachInfo
+from backend.models.rvc_config import RVCConfiguration, RVCSpecMeta
+
+logger = logging.getLogger(__name__)
+
+# Bump when the processed configuration layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Cache files kept per directory (one per spec/mapping pair); older ones are pruned
+MAX_CACHE_FILES = 8
+
+_MAGIC = b"CQRVC"
+
+
+def compute_cache_key(spec_path: str | Path, mapping_path: str | Path) -> str:
+    """
+    Hash the source files into a cache key.
+
+    The mapping file name is included because coach info may be parsed from it.
+    The Python version is included because the marshal format is not stable
+    across releases.
+
+    Args:
+        spec_path: RVC spec JSON path
+        mapping_path: Coach mapping YAML path
+
+    Returns:
+        Hex digest identifying this spec/mapping pair
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{CACHE_FORMAT_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}:"
+        f"{marshal.version}:{Path(mapping_path).name}".encode()
+    )
+    for path in (spec_path, mapping_path):
+        digest.update(b"\0")
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def get_cache_dir() -> Path | None:
+    """
+    Resolve the cache directory from settings.
+
+    Returns:
+        Cache directory, or None if the cache is disabled or unavailable
+    """
+    try:
+        from backend.core.config import get_settings
+
+        settings = get_settings()
+    except Exception as e:
+        logger.debug(f"RV-C config cache unavailable: {e}")
+        return None
+
+    if not settings.rvc.compiled_cache_enabled:
+        return None
+    if settings.rvc.compiled_cache_dir:
+        return settings.rvc.compiled_cache_dir
+    # Don't create the data directory just for the cache
+    if not settings.persistence.data_dir.is_dir():
+        return None
+    return settings.persistence.data_dir / "cache" / "rvc"
+
+
+def cache_file_path(cache_dir: Path, cache_key: str) -> Path:
+    """Return the cache file for a key."""
+    return cache_dir / f"rvc-config-{cache_key[:16]}.bin"
+
+
+def _to_plain(config: RVCConfiguration) -> dict[str, Any]:
+    """Convert a configuration to marshal-compatible builtins."""
+    return {
+        "dgn_dict": config.dgn_dict,
+        "spec_meta": config.spec_meta.model_dump(),
+        "mapping_dict": config.mapping_dict,
+        "entity_map": config.entity_map,
+        "entity_ids": config.entity_ids,
+        "inst_map": config.inst_map,
+        "unique_instances": config.unique_instances,
+        "pgn_hex_to_name_map": config.pgn_hex_to_name_map,
+        "dgn_pairs": config.dgn_pairs,
+        "coach_info": config.coach_info.model_dump(),
+    }
+
+
+def _from_plain(data: dict[str, Any]) -> RVCConfiguration:
+    """Rebuild a configuration without re-validating already processed data."""
+    return RVCConfiguration.model_construct(
+        **{
+            **data,
+            "spec_meta": RVCSpecMeta(**data["spec_meta"]),
+            "coach_info": CoachInfo(**data["coach_info"]),
+        }
+    )
+
+
+def load_cached_config(
+    spec_path: str | Path, mapping_path: str | Path, cache_dir: Path | None = None
+) -> RVCConfiguration | None:
+    """
+    Load a precompiled configuration if one matches the current source files.
+
+    Args:
+        spec_path: RVC spec JSON path
+        mapping_path: Coach mapping YAML path
+        cache_dir: Cache directory (defaults to :func:`get_cache_dir`)
+
+    Returns:
+        Cached configuration, or None on a miss or unreadable cache
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    try:
+        cache_key = compute_cache_key(spec_path, mapping_path)
+        path = cache_file_path(cache_dir, cache_key)
+        if not path.is_file():
+            return None
+
+        header = _MAGIC + cache_key.encode()
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[: len(header)] != header:
+                logger.debug(f"Ignoring stale RV-C config cache {path}")
+                return None
+            with memoryview(mm) as view:
+                # Only files this module wrote are read, named by the content hash
+                # of their sources and checked against the header above
+                data = marshal.loads(view[len(header) :])  # noqa: S302
+        return _from_plain(data)
+    except Exception as e:
+        logger.warning(f"Failed to read RV-C config cache: {e}")
+        return None
+
+
+def store_config(
+    config: RVCConfiguration,
+    spec_path: str | Path,
+    mapping_path: str | Path,
+    cache_dir: Path | None = None,
+) -> Path | None:
+    """
+    Write a processed configuration to the cache.
+
+    Args:
+        config: Processed configuration
+        spec_path: RVC spec JSON path it was built from
+        mapping_path: Coach mapping YAML path it was built from
+        cache_dir: Cache directory (defaults to :func:`get_cache_dir`)
+
+    Returns:
+        Path of the written cache file, or None if it could not be written
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    try:
+        cache_key = compute_cache_key(spec_path, mapping_path)
+        payload = _MAGIC + cache_key.encode() + marshal.dumps(_to_plain(config))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_file_path(cache_dir, cache_key)
+
+        # Write atomically so a concurrent reader never sees a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=".rvc-config-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        _prune(cache_dir)
+    except Exception as e:
+        logger.warning(f"Failed to write RV-C config cache: {e}")
+        return None
+
+    logger.debug(f"Wrote RV-C config cache {path} ({len(payload)} bytes)")
+    return path
+
+
+def _prune(cache_dir: Path) -> None:
+    """Remove the least recently written cache files beyond MAX_CACHE_FILES."""
+    files = sorted(
+        cache_dir.glob("rvc-config-*.bin"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    for stale in files[MAX_CACHE_FILES:]:
+        stale.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point: prebuild the cache for the configured or given files."""
+    parser = argparse.ArgumentParser(description="Prebuild the RV-C configuration cache")
+    parser.add_argument("--spec", help="RVC spec JSON (default: configured spec)")
+    parser.add_argument(
+        "--mapping",
+        action="append",
+        help="Coach mapping YAML; repeat to prebuild several (default: configured mapping)",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Cache directory (default: from settings)")
+    args = parser.parse_args(argv)
+
+    from backend.integrations.rvc.config_loader import get_default_paths
+    from backend.integrations.rvc.decode import build_rvc_configuration
+
+    # Command-line tool: results are reported with print rather than logging
+    cache_dir = args.cache_dir or get_cache_dir()
+    if cache_dir is None:
+        print(  # noqa: T201
+            "RV-C config cache is disabled or the data directory does not exist; pass --cache-dir",
+            file=sys.stderr,
+        )
+        return 1
+
+    spec_path, mapping_paths = args.spec, args.mapping
+    if not (spec_path and mapping_paths):
+        default_spec, default_mapping = get_default_paths()
+        spec_path = spec_path or default_spec
+        mapping_paths = mapping_paths or [default_mapping]
+
+    status = 0
+    for mapping_path in mapping_paths:
+        started = time.perf_counter()
+        config = build_rvc_configuration(spec_path, mapping_path)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        path = store_config(config, spec_path, mapping_path, cache_dir)
+        if path is None:
+            print(f"Failed to write cache for {mapping_path}", file=sys.stderr)  # noqa: T201
+            status = 1
+            continue
+
+        started = time.perf_counter()
+        load_cached_config(spec_path, mapping_path, cache_dir)
+        load_ms = (time.perf_counter() - started) * 1000
+        print(f"{mapping_path} -> {path} (build {build_ms:.1f} ms, cached load {load_ms:.1f} ms)")  # noqa: T201
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
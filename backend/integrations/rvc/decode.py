@@ -46,6 +46,7 @@ decode_payload = _decode_payload
 
 # Re-export missing DGN functions for backward compatibility
 __all__ = [
+    "build_rvc_configuration",
     "clear_config_cache",
     "clear_missing_dgns",
     "decode_payload",
@@ -282,10 +283,42 @@ def load_config_data_v2(
     instead of a complex tuple. It provides the same functionality with better
     type safety and easier access patterns.
 
+    The processed configuration is reused from the precompiled cache (see
+    ``config_cache``) when the source files are unchanged.
+
     Args:
         rvc_spec_path_override: Optional path override for RVC spec JSON
         device_mapping_path_override: Optional path override for device mapping YAML
 
+    Returns:
+        RVCConfiguration object containing all loaded configuration data
+    """
+    from backend.integrations.rvc import config_cache
+
+    rvc_spec_path, device_mapping_path = rvc_spec_path_override, device_mapping_path_override
+    if not (rvc_spec_path and device_mapping_path):
+        default_spec_path, default_mapping_path = get_default_paths()
+        rvc_spec_path = rvc_spec_path or default_spec_path
+        device_mapping_path = device_mapping_path or default_mapping_path
+
+    cached = config_cache.load_cached_config(rvc_spec_path, device_mapping_path)
+    if cached is not None:
+        logger.debug("Loaded precompiled RV-C configuration for %s", device_mapping_path)
+        return cached
+
+    config = build_rvc_configuration(rvc_spec_path, device_mapping_path)
+    config_cache.store_config(config, rvc_spec_path, device_mapping_path)
+    return config
+
+
+def build_rvc_configuration(rvc_spec_path: str, device_mapping_path: str) -> RVCConfiguration:
+    """
+    Parse the RVC spec and device mapping files into an RVCConfiguration.
+
+    Args:
+        rvc_spec_path: Path to the RVC spec JSON
+        device_mapping_path: Path to the device mapping YAML
+
     Returns:
         RVCConfiguration object containing all loaded configuration data
     """
@@ -301,7 +334,7 @@ def load_config_data_v2(
         pgn_hex_to_name_map,
         dgn_pairs,
         coach_info,
-    ) = load_config_data(rvc_spec_path_override, device_mapping_path_override)
+    ) = load_config_data(rvc_spec_path, device_mapping_path)
 
     # Convert inst_map to use RVCEntityMapping objects
     inst_map_structured = {}
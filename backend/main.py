@@ -70,9 +70,13 @@ from backend.repositories.security_event_repository import (
     SecurityEventRepository,
     SecurityListenerRepository,
 )
-from backend.services.analytics_dashboard_service import AnalyticsDashboardService
 
 # Phase 4 service imports
+from backend.services.auth_crypto_executor import (
+    RETRY_AFTER_SECONDS,
+    CryptoExecutor,
+    CryptoExecutorSaturatedError,
+)
 from backend.services.auth_manager import AccountLockedError
 from backend.services.auth_service import AuthService
 
@@ -248,6 +252,8 @@ async def _configure_service_startup_stages(service_registry):
         description="RV-C device discovery and network scanning",
         tags={"discovery", "rvc", "network"},
         health_check=lambda dds: {"healthy": dds is not None, "discovery_active": True},
+        # Discovery is technician-driven; construct on first API use
+        lazy=True,
     )
 
     # Register all Group 2 services and repositories (Phase 3 - moved from service_registry_update_v2.py)
@@ -842,15 +848,30 @@ def _register_group2_services(service_registry: SafetyServiceRegistry) -> None:
         health_check=lambda s: {"healthy": s is not None, "active_sessions": s.get_active_count()},
     )
 
+    # One bounded bcrypt/QR executor shared by login and MFA so the queue limit is global
+    service_registry.register_service(
+        name="crypto_executor",
+        init_func=lambda app_settings: CryptoExecutor(
+            max_workers=app_settings.auth.crypto_max_workers,
+            max_pending=app_settings.auth.crypto_max_pending,
+        ),
+        dependencies=[ServiceDependency("app_settings", DependencyType.REQUIRED)],
+        description="Bounded executor for password hashing and MFA crypto work",
+        tags={"service", "auth", "security"},
+        health_check=lambda s: {"healthy": s is not None, **s.get_metrics()},
+    )
+
     service_registry.register_service(
         name="mfa_service",
-        init_func=lambda mfa_repository, performance_monitor: MfaService(
+        init_func=lambda mfa_repository, performance_monitor, crypto_executor: MfaService(
             mfa_repository=mfa_repository,
             performance_monitor=performance_monitor,
+            crypto_executor=crypto_executor,
         ),
         dependencies=[
             ServiceDependency("mfa_repository", DependencyType.REQUIRED),
             ServiceDependency("performance_monitor", DependencyType.REQUIRED),
+            ServiceDependency("crypto_executor", DependencyType.REQUIRED),
         ],
         description="Service for TOTP and backup code operations",
         tags={"service", "auth", "mfa", "security"},
@@ -1095,6 +1116,8 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
             watchdog_timeout=15.0,  # Watchdog timeout at 15 seconds
             pin_manager=pin_manager,
             security_audit_service=security_audit_service,
+            # Persist the safety audit trail across restarts and power loss
+            audit_journal_path=get_settings().persistence.get_logs_dir() / "safety_audit.jsonl",
         )
         await service.start_monitoring()
         logger.info("SafetyService started - will set service_registry after registration")
@@ -1175,6 +1198,7 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
         mfa_service,
         lockout_service,
         security_config_service,
+        crypto_executor,
         notification_service=None,
     ):
         # Create legacy AuthRepository for backward compatibility
@@ -1198,6 +1222,7 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
             mfa_service=mfa_service,
             lockout_service=lockout_service,
             auth_config=auth_config,
+            crypto_executor=crypto_executor,
         )
         await service.start()
         return service
@@ -1221,6 +1246,7 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
             ServiceDependency("mfa_service", DependencyType.OPTIONAL),
             ServiceDependency("lockout_service", DependencyType.REQUIRED),
             ServiceDependency("security_config_service", DependencyType.REQUIRED),
+            ServiceDependency("crypto_executor", DependencyType.REQUIRED),
         ],
         description="Authentication service with JWT, magic links, and MFA",
         tags={"service", "auth", "security"},
@@ -1507,6 +1533,8 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
         performance_monitor=None, database_manager=None, analytics_repository=None
     ):
         """Initialize AnalyticsDashboardService with direct dependencies."""
+        from backend.services.analytics_dashboard_service import AnalyticsDashboardService
+
         return AnalyticsDashboardService(
             performance_monitor=performance_monitor,
             database_manager=database_manager,
@@ -1536,6 +1564,9 @@ def _register_phase4_services(service_registry: SafetyServiceRegistry) -> None:
             "healthy": s is not None,
             "running": s._running if hasattr(s, "_running") else False,
         },
+        # Only constructed when a client first hits the analytics API
+        lazy=True,
+        idle_timeout=1800,
     )
 
     # DashboardService - Frontend dashboard aggregation service
@@ -1624,7 +1655,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         settings = service_registry.get_service("app_settings")
         rvc_config_provider = service_registry.get_service("rvc_config")
         security_event_manager = service_registry.get_service("security_event_manager")
-        device_discovery_service = service_registry.get_service("device_discovery_service")
         persistence_service = service_registry.get_service("persistence_service")
         database_manager = service_registry.get_service("database_manager")
 
@@ -1853,6 +1883,20 @@ def create_app() -> FastAPI:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Saturated bcrypt executor: the request was never evaluated, so ask the client to retry
+    @app.exception_handler(CryptoExecutorSaturatedError)
+    async def crypto_saturated_exception_handler(
+        request: Request, exc: CryptoExecutorSaturatedError
+    ):
+        logger = logging.getLogger(__name__)
+        logger.warning("Authentication crypto executor saturated: %s", exc)
+
+        return JSONResponse(
+            status_code=503,  # Service Unavailable
+            content={"error": "authentication_busy", "message": str(exc)},
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
     # Add exception handler for ServiceNotAvailableError
     @app.exception_handler(ServiceNotAvailableError)
     async def service_not_available_handler(request: Request, exc: ServiceNotAvailableError):
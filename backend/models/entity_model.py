@@ -6,8 +6,10 @@ for all entities in the system. It provides a unified approach to entity managem
 with proper typing and validation.
 """
 
+import sys
 import time
 from collections import deque
+from collections.abc import Callable
 from typing import Any, TypedDict
 
 from pydantic import BaseModel, Field
@@ -65,6 +67,237 @@ class EntityState(BaseModel):
     )
 
 
+# Marks a key that was present in the previous value/raw dict but dropped
+_REMOVED = object()
+
+# Seconds between age-based history prunes
+_PRUNE_INTERVAL = 60.0
+
+# Payload keys that never make an update a real change
+_UNTRACKED_STATE_KEYS = frozenset({"entity_id", "timestamp"})
+
+_MISSING = object()
+
+
+class _Replaced:
+    """Change set for a value that is not a dict, replacing the previous value wholesale."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def _copy_value(value: Any) -> Any:
+    """Shallow-copy dict values; other values are stored as-is."""
+    return dict(value) if isinstance(value, dict) else value
+
+
+def _diff_values(previous: Any, current: Any) -> dict[str, Any] | _Replaced | None:
+    """
+    Return the keys of ``current`` that differ from ``previous`` (None if identical).
+
+    Values that are not dicts (e.g. an optimistic integer ``raw``) cannot be
+    diffed per key and are recorded as a full replacement.
+    """
+    if current is previous:
+        return None
+    if not isinstance(current, dict) or not isinstance(previous, dict):
+        return None if previous == current else _Replaced(_copy_value(current))
+    changes = {
+        key: value
+        for key, value in current.items()
+        if key not in previous or previous[key] != value
+    }
+    for key in previous.keys() - current.keys():
+        changes[key] = _REMOVED
+    return changes or None
+
+
+def _apply_changes(target: Any, changes: dict[str, Any] | _Replaced | None) -> Any:
+    """
+    Apply a change set produced by ``_diff_values``.
+
+    Dict targets are updated in place; the (possibly replaced) value is returned.
+    """
+    if not changes:
+        return target
+    if isinstance(changes, _Replaced):
+        return _copy_value(changes.value)
+    for key, value in changes.items():
+        if value is _REMOVED:
+            target.pop(key, None)
+        else:
+            target[key] = value
+    return target
+
+
+class EntityHistory:
+    """
+    Compact ring buffer of an entity's state changes.
+
+    Each entry stores a timestamp, an interned state code, and only the keys of
+    ``value``/``raw`` that changed since the previous entry. The oldest entry's
+    full values are kept as a base, so any entry can be rebuilt by replaying
+    changes. Configuration fields are not stored per entry.
+    """
+
+    def __init__(self, max_length: int):
+        """
+        Initialize an empty history buffer.
+
+        Args:
+            max_length: Maximum number of entries to keep
+        """
+        self.max_length = max(1, max_length)
+        self._timestamps: deque[float] = deque()
+        self._state_codes: deque[int] = deque()
+        self._value_changes: deque[dict[str, Any] | _Replaced | None] = deque()
+        self._raw_changes: deque[dict[str, Any] | _Replaced | None] = deque()
+        # Full values as of the oldest retained entry
+        self._base_value: Any = {}
+        self._base_raw: Any = {}
+        # Full values as of the newest entry, for diffing the next append
+        self._last_value: Any = {}
+        self._last_raw: Any = {}
+        self._state_names: list[str] = []
+        self._state_lookup: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of retained entries."""
+        return len(self._timestamps)
+
+    def _state_code(self, state: str) -> int:
+        """Intern a state string."""
+        code = self._state_lookup.get(state)
+        if code is None:
+            code = self._state_lookup[state] = len(self._state_names)
+            self._state_names.append(state)
+        return code
+
+    def append(self, timestamp: float, state: str, value: Any, raw: Any) -> None:
+        """
+        Record a state change.
+
+        Args:
+            timestamp: When the change happened
+            state: Human-readable state
+            value: Full decoded value dictionary
+            raw: Full raw value dictionary (non-dict values are stored whole)
+        """
+        if len(self._timestamps) >= self.max_length:
+            self.popleft()
+
+        if self._timestamps:
+            value_changes = _diff_values(self._last_value, value)
+            raw_changes = _diff_values(self._last_raw, raw)
+        else:
+            self._base_value = _copy_value(value)
+            self._base_raw = _copy_value(raw)
+            value_changes = raw_changes = None
+
+        self._timestamps.append(timestamp)
+        self._state_codes.append(self._state_code(state))
+        self._value_changes.append(value_changes)
+        self._raw_changes.append(raw_changes)
+        # Shallow copies so in-place edits by callers don't corrupt the next diff
+        self._last_value = _copy_value(value)
+        self._last_raw = _copy_value(raw)
+
+    def popleft(self) -> None:
+        """Drop the oldest entry, folding the next entry's changes into the base."""
+        if not self._timestamps:
+            return
+
+        self._timestamps.popleft()
+        self._state_codes.popleft()
+        self._value_changes.popleft()
+        self._raw_changes.popleft()
+
+        if self._timestamps:
+            self._base_value = _apply_changes(self._base_value, self._value_changes[0])
+            self._base_raw = _apply_changes(self._base_raw, self._raw_changes[0])
+            self._value_changes[0] = None
+            self._raw_changes[0] = None
+        else:
+            self._base_value = {}
+            self._base_raw = {}
+
+    def prune_before(self, cutoff: float) -> None:
+        """
+        Drop entries older than a cutoff timestamp.
+
+        Args:
+            cutoff: Entries with a timestamp before this are removed
+        """
+        while self._timestamps and self._timestamps[0] < cutoff:
+            self.popleft()
+
+    def entries(
+        self, count: int | None = None, since: float | None = None
+    ) -> list[tuple[float, str, Any, Any]]:
+        """
+        Rebuild history entries.
+
+        Args:
+            count: Maximum number of (most recent) entries to return
+            since: Return only entries at or after this timestamp
+
+        Returns:
+            List of (timestamp, state, value, raw) tuples, oldest first
+        """
+        total = len(self._timestamps)
+        first = 0
+        if since is not None:
+            while first < total and self._timestamps[first] < since:
+                first += 1
+        if count is not None:
+            first = max(first, total - count)
+
+        value = _copy_value(self._base_value)
+        raw = _copy_value(self._base_raw)
+        result = []
+        for index in range(total):
+            value = _apply_changes(value, self._value_changes[index])
+            raw = _apply_changes(raw, self._raw_changes[index])
+            if index >= first:
+                result.append(
+                    (
+                        self._timestamps[index],
+                        self._state_names[self._state_codes[index]],
+                        _copy_value(value),
+                        _copy_value(raw),
+                    )
+                )
+        return result
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory held by the buffer.
+
+        Returns:
+            Shallow size in bytes of the buffer containers and stored change sets
+        """
+        size = sum(
+            sys.getsizeof(container)
+            for container in (
+                self._timestamps,
+                self._state_codes,
+                self._value_changes,
+                self._raw_changes,
+                self._base_value,
+                self._base_raw,
+                self._state_names,
+                self._state_lookup,
+            )
+        )
+        size += 24 * len(self._timestamps)  # float objects
+        for changes in (*self._value_changes, *self._raw_changes):
+            if changes:
+                size += sys.getsizeof(changes)
+        return size
+
+
 class Entity:
     """
     Unified entity model that combines configuration and runtime state.
@@ -80,6 +313,7 @@ class Entity:
         config: EntityConfig,
         max_history_length: int = 1000,
         history_duration: int = 24 * 3600,  # 24 hours in seconds
+        next_version: Callable[[], int] | None = None,
     ):
         """
         Initialize a new entity with the given ID and configuration.
@@ -89,12 +323,19 @@ class Entity:
             config: Entity configuration from device mapping
             max_history_length: Maximum number of history entries to keep
             history_duration: Maximum age of history entries in seconds
+            next_version: Callable returning the next global version number. When
+                omitted the entity keeps its own counter.
         """
         self.entity_id = entity_id
         self.config = config
         self.max_history_length = max_history_length
         self.history_duration = history_duration
-        self.history: deque[EntityState] = deque(maxlen=max_history_length)
+        self.history = EntityHistory(max_history_length)
+        self._next_prune = 0.0
+
+        # Version of the last change to this entity (config or state)
+        self._next_version = next_version
+        self.version = next_version() if next_version else 0
 
         # Initialize with default state
         self.current_state = EntityState(
@@ -112,7 +353,10 @@ class Entity:
         )
 
         # Add initial state to history
-        self.history.append(self.current_state)
+        self._record_history(self.current_state)
+
+        # Last time a status for this entity was received, changed or not
+        self.last_seen = self.current_state.timestamp
 
         # Additional properties specific to entity types
         self.last_known_brightness: int | None = None
@@ -130,24 +374,70 @@ class Entity:
 
         # Update current state
         self.current_state = updated_state
+        self.last_seen = updated_state.timestamp
 
         # Add to history
-        self.history.append(updated_state)
+        self._record_history(updated_state)
 
-        # Prune old history entries
-        self._prune_history()
+        # Prune old history entries (age-based pruning is amortized)
+        now = time.time()
+        if now >= self._next_prune:
+            self._prune_history(now)
 
         # Update type-specific properties
         if self.config.get("device_type") == "light" and "brightness" in new_state:
             self.last_known_brightness = new_state["brightness"]
 
-    def _prune_history(self) -> None:
-        """Remove history entries older than history_duration."""
-        current_time = time.time()
-        cutoff = current_time - self.history_duration
+        self.bump_version()
 
-        while self.history and self.history[0].timestamp < cutoff:
-            self.history.popleft()
+    def is_unchanged(self, new_state: dict[str, Any]) -> bool:
+        """
+        Check whether applying a state update would change anything.
+
+        Timestamps and the entity ID are ignored.
+
+        Args:
+            new_state: State data that would be passed to update_state
+
+        Returns:
+            True if every field in the update already has the given value
+        """
+        current = self.current_state
+        for key, value in new_state.items():
+            if key in _UNTRACKED_STATE_KEYS:
+                continue
+            if getattr(current, key, _MISSING) != value:
+                return False
+        return True
+
+    def touch(self, timestamp: float | None = None) -> None:
+        """
+        Record that the entity was seen without changing its state or history.
+
+        Args:
+            timestamp: When the entity was seen (defaults to now)
+        """
+        self.last_seen = time.time() if timestamp is None else timestamp
+
+    def bump_version(self) -> int:
+        """
+        Record a change to this entity.
+
+        Returns:
+            The entity's new version number
+        """
+        self.version = self._next_version() if self._next_version else self.version + 1
+        return self.version
+
+    def _record_history(self, state: EntityState) -> None:
+        """Append the dynamic fields of a state to the compact history."""
+        self.history.append(state.timestamp, state.state, state.value, state.raw)
+
+    def _prune_history(self, now: float | None = None) -> None:
+        """Remove history entries older than history_duration."""
+        current_time = time.time() if now is None else now
+        self.history.prune_before(current_time - self.history_duration)
+        self._next_prune = current_time + _PRUNE_INTERVAL
 
     def get_state(self) -> EntityState:
         """Get the current state of the entity."""
@@ -166,15 +456,19 @@ class Entity:
         Returns:
             List of historical entity states
         """
-        history_data = list(self.history)
-
-        if since is not None:
-            history_data = [state for state in history_data if state.timestamp >= since]
-
-        if count is not None:
-            history_data = history_data[-count:]
+        self._prune_history()
 
-        return history_data
+        # Configuration fields are taken from the current state
+        return [
+            self.current_state.model_copy(
+                update={"timestamp": timestamp, "state": state, "value": value, "raw": raw}
+            )
+            for timestamp, state, value, raw in self.history.entries(count=count, since=since)
+        ]
+
+    def history_memory_bytes(self) -> int:
+        """Approximate memory used by this entity's state history."""
+        return self.history.memory_bytes()
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -10,7 +10,17 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.models.database import Base, TimestampMixin
@@ -169,6 +179,65 @@ class NotificationDeliveryLog(Base, TimestampMixin):
     )
 
 
+class NotificationDeliveryRollup(Base, TimestampMixin):
+    """
+    SQLAlchemy model for per-minute delivery rollups.
+
+    Maintained incrementally as delivery logs are flushed, so dashboard
+    metrics can be read from a small pre-aggregated table instead of
+    scanning the raw delivery log table.
+    """
+
+    __tablename__ = "notification_delivery_rollups"
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True, comment="Primary key"
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="Start of the one-minute bucket"
+    )
+
+    channel: Mapped[str] = mapped_column(String(50), nullable=False, comment="Delivery channel")
+
+    notification_type: Mapped[str] = mapped_column(
+        String(50), nullable=False, comment="Type of notification"
+    )
+
+    total_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Delivery attempts in bucket"
+    )
+
+    delivered_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Successful deliveries in bucket"
+    )
+
+    failed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Failed deliveries in bucket"
+    )
+
+    retry_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Sum of retry attempts in bucket"
+    )
+
+    delivery_time_total_ms: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Sum of delivery times in milliseconds"
+    )
+
+    delivery_time_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Deliveries with a recorded delivery time"
+    )
+
+    # Define table constraints and indexes
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket_start", "channel", "notification_type", name="uq_delivery_rollups_bucket"
+        ),
+        Index("idx_delivery_rollups_bucket", "bucket_start"),
+        Index("idx_delivery_rollups_channel", "channel", "bucket_start"),
+    )
+
+
 class NotificationMetricAggregate(Base, TimestampMixin):
     """
     SQLAlchemy model for aggregated notification metrics.
@@ -100,6 +100,64 @@ class EntityStateRepository:
         """Get all entity states."""
         return self.entity_manager.to_api_response()
 
+    def get_entity_states_page(
+        self,
+        device_type: str | None = None,
+        area: str | None = None,
+        protocol: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Get one page of filtered entity states.
+
+        Only the entities on the returned page are serialized.
+
+        Args:
+            device_type: Optional device type filter
+            area: Optional suggested area filter
+            protocol: Optional protocol filter (primary or secondary)
+            offset: Number of matching entities to skip
+            limit: Maximum number of entities to return
+
+        Returns:
+            Tuple of (entity_id to state dictionary, total matching entities)
+        """
+        entities, total = self.entity_manager.get_entities_page(
+            device_type=device_type, area=area, protocol=protocol, offset=offset, limit=limit
+        )
+        return {entity.entity_id: entity.to_dict() for entity in entities}, total
+
+    def get_version(self) -> int:
+        """Get the global entity version, which changes whenever any entity changes."""
+        return self.entity_manager.version
+
+    def get_epoch(self) -> str:
+        """Get the entity version epoch, which changes whenever the process restarts."""
+        return self.entity_manager.epoch
+
+    def get_entity_changes(self, since: int, epoch: str | None = None) -> dict[str, Any]:
+        """
+        Get entity states changed after a version.
+
+        Args:
+            since: Version the client last saw
+            epoch: Epoch the client's version belongs to
+
+        Returns:
+            Dictionary with the current epoch and version, changed entity
+            states, removed entity IDs, and whether the client must fully resync
+        """
+        version = self.entity_manager.version
+        changed, removed, reset = self.entity_manager.get_changes_since(since, epoch)
+        return {
+            "epoch": self.entity_manager.epoch,
+            "version": version,
+            "entities": {entity.entity_id: entity.to_dict() for entity in changed},
+            "removed": removed,
+            "reset": reset,
+        }
+
     def get_entity_history(self, entity_id: str, count: int | None = None) -> list:
         """
         Get historical data for an entity.
@@ -137,8 +195,18 @@ class EntityStateRepository:
             "entity_count": self.get_entity_count(),
             "light_count": self.get_light_entity_count(),
             "entity_manager_healthy": True,  # Could add actual health check
+            "memory": self.get_memory_stats(),
         }
 
+    def get_memory_stats(self) -> dict[str, Any]:
+        """
+        Get approximate memory used by entity state history.
+
+        Returns:
+            Memory statistics from the entity manager
+        """
+        return self.entity_manager.get_memory_stats()
+
     def set_entity(self, entity_id: str, entity: Any) -> None:
         """
         Set/store an entity for testing purposes.
@@ -5,12 +5,15 @@ using the repository pattern.
 """
 
 import asyncio
+import contextlib
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.performance import PerformanceMonitor
@@ -19,6 +22,7 @@ from backend.models.notification_analytics import (
     AggregationPeriod,
     MetricType,
     NotificationDeliveryLog,
+    NotificationDeliveryRollup,
     NotificationErrorAnalysis,
     NotificationMetricAggregate,
     NotificationQueueHealth,
@@ -35,21 +39,126 @@ logger = logging.getLogger(__name__)
 class NotificationAnalyticsRepository(MonitoredRepository):
     """Repository for notification analytics and metrics."""
 
-    def __init__(self, database_manager: DatabaseManager, performance_monitor: PerformanceMonitor):
+    def __init__(
+        self,
+        database_manager: DatabaseManager,
+        performance_monitor: PerformanceMonitor,
+        flush_batch_size: int = 500,
+        flush_interval: float = 5.0,
+        max_buffer_size: int = 10000,
+    ):
         """Initialize notification analytics repository.
 
         Args:
             database_manager: Database manager for persistence
             performance_monitor: Performance monitoring instance
+            flush_batch_size: Buffered logs that trigger an immediate flush
+            flush_interval: Maximum seconds a buffered log waits before flushing
+            max_buffer_size: Buffered logs retained when flushes fail; oldest dropped
         """
         super().__init__(database_manager, performance_monitor)
         self.db_manager = database_manager
         self._metric_buffer: list[NotificationDeliveryLog] = []
         self._buffer_lock = asyncio.Lock()
 
+        # Background flusher
+        self._flush_batch_size = max(1, flush_batch_size)
+        self._flush_interval = flush_interval
+        self._max_buffer_size = max(self._flush_batch_size, max_buffer_size)
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher_task: asyncio.Task | None = None
+
+        # Flush statistics
+        self._flush_count = 0
+        self._flushed_logs = 0
+        self._failed_flushes = 0
+        self._dropped_logs = 0
+        self._size_triggered_flushes = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    @staticmethod
+    def _minute_bucket(timestamp: datetime) -> datetime:
+        """Truncate a timestamp to the start of its minute."""
+        return timestamp.replace(second=0, microsecond=0)
+
+    @staticmethod
+    def _log_to_row(log: NotificationDeliveryLog, now: datetime) -> dict[str, Any]:
+        """Convert a delivery log object into a plain row for executemany inserts."""
+        metadata = log.delivery_metadata
+        if metadata is None:
+            # The ingestion service passes ``metadata=`` which lands on the instance
+            extra = vars(log).get("metadata")
+            metadata = extra if isinstance(extra, dict) else None
+
+        created_at = log.created_at or now
+        return {
+            "notification_id": log.notification_id,
+            "channel": log.channel,
+            "notification_type": log.notification_type,
+            "status": log.status,
+            "recipient": log.recipient,
+            "delivered_at": log.delivered_at,
+            "delivery_time_ms": log.delivery_time_ms,
+            "retry_count": log.retry_count or 0,
+            "error_message": log.error_message,
+            "error_code": log.error_code,
+            "delivery_metadata": metadata,
+            "opened_at": log.opened_at,
+            "clicked_at": log.clicked_at,
+            "dismissed_at": log.dismissed_at,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    @classmethod
+    def _build_rollup_rows(cls, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fold delivery log rows into per-minute rollup increments.
+
+        Args:
+            rows: Delivery log rows being inserted
+
+        Returns:
+            One increment row per (minute, channel, notification type)
+        """
+        rollups: dict[tuple[datetime, str, str], dict[str, Any]] = {}
+        for row in rows:
+            bucket = cls._minute_bucket(row["created_at"])
+            key = (bucket, row["channel"], row["notification_type"])
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = {
+                    "bucket_start": bucket,
+                    "channel": row["channel"],
+                    "notification_type": row["notification_type"],
+                    "total_count": 0,
+                    "delivered_count": 0,
+                    "failed_count": 0,
+                    "retry_count": 0,
+                    "delivery_time_total_ms": 0,
+                    "delivery_time_count": 0,
+                }
+
+            rollup["total_count"] += 1
+            rollup["retry_count"] += row["retry_count"]
+            if row["status"] == NotificationStatus.DELIVERED.value:
+                rollup["delivered_count"] += 1
+            elif row["status"] == NotificationStatus.FAILED.value:
+                rollup["failed_count"] += 1
+            if row["delivery_time_ms"] is not None:
+                rollup["delivery_time_total_ms"] += row["delivery_time_ms"]
+                rollup["delivery_time_count"] += 1
+
+        return list(rollups.values())
+
     @MonitoredRepository._monitored_operation("save_delivery_logs")
     async def save_delivery_logs(self, logs: list[NotificationDeliveryLog]) -> bool:
-        """Save notification delivery logs.
+        """Save notification delivery logs and update per-minute rollups.
+
+        Logs are written with a single executemany insert, and the matching
+        rollup rows are upserted in the same transaction so the rollups never
+        drift from the raw log table.
 
         Args:
             logs: List of delivery logs to save
@@ -57,9 +166,35 @@ class NotificationAnalyticsRepository(MonitoredRepository):
         Returns:
             True if successful
         """
+        if not logs:
+            return True
+
+        now = datetime.now(UTC)
+        rows = [self._log_to_row(log, now) for log in logs]
+        rollup_rows = self._build_rollup_rows(rows)
+
         try:
             async with self.db_manager.get_session() as session:
-                session.add_all(logs)
+                await session.execute(insert(NotificationDeliveryLog), rows)
+
+                stmt = sqlite_insert(NotificationDeliveryRollup)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["bucket_start", "channel", "notification_type"],
+                    set_={
+                        column: getattr(NotificationDeliveryRollup, column)
+                        + getattr(stmt.excluded, column)
+                        for column in (
+                            "total_count",
+                            "delivered_count",
+                            "failed_count",
+                            "retry_count",
+                            "delivery_time_total_ms",
+                            "delivery_time_count",
+                        )
+                    }
+                    | {"updated_at": stmt.excluded.updated_at},
+                )
+                await session.execute(stmt, rollup_rows)
                 await session.commit()
             return True
         except Exception as e:
@@ -127,35 +262,26 @@ class NotificationAnalyticsRepository(MonitoredRepository):
             start_date = end_date - timedelta(days=7)
 
         async with self.db_manager.get_session() as session:
-            # Build base query
+            # Read from per-minute rollups rather than scanning delivery logs
             query = select(
-                NotificationDeliveryLog.channel,
-                func.count().label("total"),
-                func.sum(
-                    func.cast(
-                        NotificationDeliveryLog.status == NotificationStatus.DELIVERED.value,
-                        func.Integer,
-                    )
-                ).label("delivered"),
-                func.sum(
-                    func.cast(
-                        NotificationDeliveryLog.status == NotificationStatus.FAILED.value,
-                        func.Integer,
-                    )
-                ).label("failed"),
-                func.sum(NotificationDeliveryLog.retry_count).label("retries"),
-                func.avg(NotificationDeliveryLog.delivery_time_ms).label("avg_delivery_time"),
+                NotificationDeliveryRollup.channel,
+                func.sum(NotificationDeliveryRollup.total_count).label("total"),
+                func.sum(NotificationDeliveryRollup.delivered_count).label("delivered"),
+                func.sum(NotificationDeliveryRollup.failed_count).label("failed"),
+                func.sum(NotificationDeliveryRollup.retry_count).label("retries"),
+                func.sum(NotificationDeliveryRollup.delivery_time_total_ms).label("time_total"),
+                func.sum(NotificationDeliveryRollup.delivery_time_count).label("time_count"),
             ).where(
                 and_(
-                    NotificationDeliveryLog.created_at >= start_date,
-                    NotificationDeliveryLog.created_at <= end_date,
+                    NotificationDeliveryRollup.bucket_start >= self._minute_bucket(start_date),
+                    NotificationDeliveryRollup.bucket_start < end_date,
                 )
             )
 
             if channel:
-                query = query.where(NotificationDeliveryLog.channel == channel)
+                query = query.where(NotificationDeliveryRollup.channel == channel)
 
-            query = query.group_by(NotificationDeliveryLog.channel)
+            query = query.group_by(NotificationDeliveryRollup.channel)
 
             result = await session.execute(query)
             rows = result.all()
@@ -167,7 +293,9 @@ class NotificationAnalyticsRepository(MonitoredRepository):
                     "delivered": row.delivered or 0,
                     "failed": row.failed or 0,
                     "retries": row.retries or 0,
-                    "avg_delivery_time": row.avg_delivery_time,
+                    "avg_delivery_time": (
+                        row.time_total / row.time_count if row.time_count else None
+                    ),
                 }
                 for row in rows
             ]
@@ -354,56 +482,30 @@ class NotificationAnalyticsRepository(MonitoredRepository):
             Calculated metric value
         """
         async with self.db_manager.get_session() as session:
+            in_period = and_(
+                NotificationDeliveryRollup.bucket_start >= start,
+                NotificationDeliveryRollup.bucket_start < end,
+            )
+
             if metric_type == MetricType.DELIVERY_COUNT:
-                stmt = (
-                    select(func.count())
-                    .select_from(NotificationDeliveryLog)
-                    .where(
-                        and_(
-                            NotificationDeliveryLog.created_at >= start,
-                            NotificationDeliveryLog.created_at < end,
-                        )
-                    )
-                )
+                stmt = select(func.sum(NotificationDeliveryRollup.total_count)).where(in_period)
                 return float(await session.scalar(stmt) or 0)
 
             if metric_type == MetricType.SUCCESS_RATE:
-                total_stmt = (
-                    select(func.count())
-                    .select_from(NotificationDeliveryLog)
-                    .where(
-                        and_(
-                            NotificationDeliveryLog.created_at >= start,
-                            NotificationDeliveryLog.created_at < end,
-                        )
-                    )
-                )
-                total = await session.scalar(total_stmt) or 0
-
-                success_stmt = (
-                    select(func.count())
-                    .select_from(NotificationDeliveryLog)
-                    .where(
-                        and_(
-                            NotificationDeliveryLog.created_at >= start,
-                            NotificationDeliveryLog.created_at < end,
-                            NotificationDeliveryLog.status == NotificationStatus.DELIVERED.value,
-                        )
-                    )
-                )
-                success = await session.scalar(success_stmt) or 0
-
-                return success / max(total, 1)
+                stmt = select(
+                    func.sum(NotificationDeliveryRollup.total_count),
+                    func.sum(NotificationDeliveryRollup.delivered_count),
+                ).where(in_period)
+                total, success = (await session.execute(stmt)).one()
+                return (success or 0) / max(total or 0, 1)
 
             if metric_type == MetricType.AVERAGE_DELIVERY_TIME:
-                avg_stmt = select(func.avg(NotificationDeliveryLog.delivery_time_ms)).where(
-                    and_(
-                        NotificationDeliveryLog.created_at >= start,
-                        NotificationDeliveryLog.created_at < end,
-                        NotificationDeliveryLog.delivery_time_ms.isnot(None),
-                    )
-                )
-                return float(await session.scalar(avg_stmt) or 0.0)
+                stmt = select(
+                    func.sum(NotificationDeliveryRollup.delivery_time_total_ms),
+                    func.sum(NotificationDeliveryRollup.delivery_time_count),
+                ).where(in_period)
+                total_ms, count = (await session.execute(stmt)).one()
+                return float(total_ms or 0) / count if count else 0.0
 
             return 0.0
 
@@ -464,33 +566,18 @@ class NotificationAnalyticsRepository(MonitoredRepository):
             )
             pending_count = await session.scalar(pending_stmt) or 0
 
-            # Count processed
-            processed_stmt = (
-                select(func.count())
-                .select_from(NotificationDeliveryLog)
-                .where(
-                    and_(
-                        NotificationDeliveryLog.created_at >= since,
-                        NotificationDeliveryLog.status.in_(
-                            [NotificationStatus.DELIVERED.value, NotificationStatus.FAILED.value]
-                        ),
-                    )
-                )
-            )
-            processed_count = await session.scalar(processed_stmt) or 0
-
-            # Count successful
-            success_stmt = (
-                select(func.count())
-                .select_from(NotificationDeliveryLog)
-                .where(
-                    and_(
-                        NotificationDeliveryLog.created_at >= since,
-                        NotificationDeliveryLog.status == NotificationStatus.DELIVERED.value,
-                    )
-                )
-            )
-            success_count = await session.scalar(success_stmt) or 0
+            # Processed, successful, and delivery-time totals from the rollups in one query
+            rollup_stmt = select(
+                func.sum(NotificationDeliveryRollup.delivered_count),
+                func.sum(NotificationDeliveryRollup.failed_count),
+                func.sum(NotificationDeliveryRollup.delivery_time_total_ms),
+                func.sum(NotificationDeliveryRollup.delivery_time_count),
+            ).where(NotificationDeliveryRollup.bucket_start >= self._minute_bucket(since))
+            delivered, failed, time_total_ms, time_count = (
+                await session.execute(rollup_stmt)
+            ).one()
+            success_count = delivered or 0
+            processed_count = success_count + (failed or 0)
 
             # Average wait time
             avg_wait_stmt = select(
@@ -509,13 +596,7 @@ class NotificationAnalyticsRepository(MonitoredRepository):
             avg_wait_time = await session.scalar(avg_wait_stmt) or 0.0
 
             # Average processing time
-            avg_processing_stmt = select(func.avg(NotificationDeliveryLog.delivery_time_ms)).where(
-                and_(
-                    NotificationDeliveryLog.created_at >= since,
-                    NotificationDeliveryLog.delivery_time_ms.isnot(None),
-                )
-            )
-            avg_processing_time = (await session.scalar(avg_processing_stmt) or 0.0) / 1000.0
+            avg_processing_time = (time_total_ms or 0) / time_count / 1000.0 if time_count else 0.0
 
             return {
                 "pending_count": pending_count,
@@ -528,11 +609,29 @@ class NotificationAnalyticsRepository(MonitoredRepository):
     async def add_to_buffer(self, log_entry: NotificationDeliveryLog) -> None:
         """Add a log entry to the buffer.
 
+        Wakes the background flusher once the buffer reaches the flush batch size.
+
         Args:
             log_entry: Log entry to buffer
         """
+        await self.buffer_delivery_logs([log_entry])
+
+    async def buffer_delivery_logs(self, logs: list[NotificationDeliveryLog]) -> None:
+        """Add several log entries to the buffer.
+
+        Args:
+            logs: Log entries to buffer
+        """
         async with self._buffer_lock:
-            self._metric_buffer.append(log_entry)
+            self._metric_buffer.extend(logs)
+            overflow = len(self._metric_buffer) - self._max_buffer_size
+            if overflow > 0:
+                # Flushes are failing; keep the newest entries
+                del self._metric_buffer[:overflow]
+                self._dropped_logs += overflow
+                logger.warning(f"Delivery log buffer full, dropped {overflow} oldest entries")
+            if len(self._metric_buffer) >= self._flush_batch_size:
+                self._flush_event.set()
 
     async def flush_buffer(self) -> list[NotificationDeliveryLog]:
         """Flush and return the buffer contents.
@@ -552,3 +651,101 @@ class NotificationAnalyticsRepository(MonitoredRepository):
             Number of entries in buffer
         """
         return len(self._metric_buffer)
+
+    async def flush_pending(self) -> int:
+        """Persist all buffered delivery logs in executemany batches.
+
+        Failed batches are returned to the front of the buffer for the next flush.
+
+        Returns:
+            Number of log entries written
+        """
+        async with self._flush_lock:
+            pending = await self.flush_buffer()
+            written = 0
+
+            for offset in range(0, len(pending), self._flush_batch_size):
+                batch = pending[offset : offset + self._flush_batch_size]
+                start = time.perf_counter()
+                success = await self.save_delivery_logs(batch)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+
+                if not success:
+                    self._failed_flushes += 1
+                    await self._requeue_front(pending[offset:])
+                    break
+
+                written += len(batch)
+                self._flush_count += 1
+                self._flushed_logs += len(batch)
+                self._last_flush_ms = elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+
+            return written
+
+    async def _requeue_front(self, logs: list[NotificationDeliveryLog]) -> None:
+        """Return unflushed log entries to the front of the buffer.
+
+        Args:
+            logs: Log entries that failed to flush, oldest first
+        """
+        async with self._buffer_lock:
+            self._metric_buffer[:0] = logs
+            overflow = len(self._metric_buffer) - self._max_buffer_size
+            if overflow > 0:
+                del self._metric_buffer[:overflow]
+                self._dropped_logs += overflow
+
+    def start_flusher(self) -> None:
+        """Start the background flusher task."""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(
+                self._flush_loop(), name="notification-delivery-log-flusher"
+            )
+
+    async def stop_flusher(self) -> None:
+        """Stop the background flusher and write any remaining buffered logs."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher_task
+            self._flusher_task = None
+
+        await self.flush_pending()
+
+    async def _flush_loop(self) -> None:
+        """Flush on a size trigger or after the flush interval, whichever comes first."""
+        while True:
+            try:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._flush_event.wait(), timeout=self._flush_interval)
+                    self._size_triggered_flushes += 1
+                self._flush_event.clear()
+
+                if self._metric_buffer:
+                    await self.flush_pending()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error flushing delivery logs: {e}", exc_info=True)
+                await asyncio.sleep(self._flush_interval)
+
+    def get_flush_stats(self) -> dict[str, Any]:
+        """Get background flusher statistics.
+
+        Returns:
+            Buffer depth, flush counts, and flush timings
+        """
+        return {
+            "buffer_size": len(self._metric_buffer),
+            "flush_batch_size": self._flush_batch_size,
+            "flush_interval": self._flush_interval,
+            "flusher_running": self._flusher_task is not None and not self._flusher_task.done(),
+            "flush_count": self._flush_count,
+            "size_triggered_flushes": self._size_triggered_flushes,
+            "flushed_logs": self._flushed_logs,
+            "failed_flushes": self._failed_flushes,
+            "dropped_logs": self._dropped_logs,
+            "last_flush_ms": self._last_flush_ms,
+            "max_flush_ms": self._max_flush_ms,
+        }
@@ -11,6 +11,7 @@ Key Features:
 - Exponential backoff retry logic with jitter
 - Dead letter queue handling for permanent failures
 - Batch processing for efficiency
+- Long-lived per-channel clients with concurrency limits and circuit breakers
 - Real-time metrics and health monitoring
 - Graceful shutdown and error recovery
 
@@ -41,6 +42,10 @@ from backend.models.notification import (
     NotificationChannel,
     NotificationPayload,
 )
+from backend.services.notification_channel_clients import (
+    CircuitOpenError,
+    NotificationChannelClients,
+)
 from backend.services.notification_manager import NotificationManager
 from backend.services.notification_queue import NotificationQueue
 
@@ -63,6 +68,9 @@ class AsyncNotificationDispatcher:
         max_concurrent_batches: int = 3,
         processing_interval: float = 1.0,
         health_check_interval: float = 30.0,
+        max_concurrent_per_channel: int = 4,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_timeout: float = 60.0,
     ):
         """
         Initialize notification dispatcher.
@@ -75,6 +83,9 @@ class AsyncNotificationDispatcher:
             max_concurrent_batches: Maximum concurrent processing batches
             processing_interval: Seconds between queue polling
             health_check_interval: Seconds between health checks
+            max_concurrent_per_channel: Maximum concurrent deliveries per channel
+            circuit_failure_threshold: Consecutive failures that open a channel's circuit
+            circuit_recovery_timeout: Seconds an open circuit rejects deliveries
         """
         self.queue = queue
         self.notification_manager = notification_manager
@@ -93,6 +104,13 @@ class AsyncNotificationDispatcher:
         self._active_batches: set[asyncio.Task] = set()
         self._shutdown_event = asyncio.Event()
 
+        # Pooled delivery clients, kept open across notifications
+        self.channel_clients = NotificationChannelClients(
+            max_concurrency=max_concurrent_per_channel,
+            failure_threshold=circuit_failure_threshold,
+            recovery_timeout=circuit_recovery_timeout,
+        )
+
         # Performance metrics
         self.metrics = {
             "total_processed": 0,
@@ -199,8 +217,19 @@ class AsyncNotificationDispatcher:
             self.logger.error(f"Error during dispatcher shutdown: {e}")
 
         finally:
+            await self._close_channel_clients()
             self.health_status["status"] = "stopped"
 
+    async def _close_channel_clients(self) -> None:
+        """Detach the shared session from the webhook channel and close pooled clients."""
+        try:
+            from backend.integrations.notifications.channels.webhook import webhook_channel
+
+            webhook_channel.use_session(None)
+        except Exception as e:
+            self.logger.debug(f"Webhook channel unavailable during shutdown: {e}")
+        await self.channel_clients.close()
+
     async def _worker_loop(self) -> None:
         """Main worker loop that processes notification batches."""
         self.logger.info("Notification dispatcher worker started")
@@ -311,14 +340,16 @@ class AsyncNotificationDispatcher:
             start_time = time.time()
 
             # Determine delivery method based on channels
-            success = False
-
             if NotificationChannel.SMTP in notification.channels:
-                success = await self._send_email(notification)
+                channel, send = NotificationChannel.SMTP.value, self._send_email
             elif NotificationChannel.WEBHOOK in notification.channels:
-                success = await self._send_webhook_notification(notification)
+                channel, send = NotificationChannel.WEBHOOK.value, self._send_webhook_notification
+            elif NotificationChannel.PUSHOVER in notification.channels:
+                channel, send = NotificationChannel.PUSHOVER.value, self._send_apprise_notification
             else:
-                success = await self._send_apprise_notification(notification)
+                channel, send = "apprise", self._send_apprise_notification
+
+            success = await self.channel_clients.deliver(channel, lambda: send(notification))
 
             processing_time = time.time() - start_time
 
@@ -331,6 +362,11 @@ class AsyncNotificationDispatcher:
             await self.queue.mark_failed(notification.id, "Delivery failed", should_retry=True)
             return False
 
+        except CircuitOpenError as e:
+            self.logger.debug(f"Deferred notification {notification.id}: {e}")
+            await self.queue.mark_failed(notification.id, str(e), should_retry=True)
+            return False
+
         except Exception as e:
             error_msg = f"Processing error: {e!s}"
             self.logger.error(f"Failed to process notification {notification.id}: {error_msg}")
@@ -401,11 +437,9 @@ class AsyncNotificationDispatcher:
             if self.config and hasattr(self.config, "pushover") and self.config.pushover.enabled:
                 pushover_url = self._build_pushover_url(notification)
 
-                # Create temporary Apprise instance for Pushover
-                if APPRISE_AVAILABLE:
-                    pushover_apprise = apprise.Apprise()
-                    pushover_apprise.add(pushover_url)
-
+                # Reuse the pooled Apprise instance for this URL
+                pushover_apprise = self.channel_clients.get_apprise(pushover_url)
+                if pushover_apprise is not None:
                     # Map notification level to Pushover priority
                     notify_type = self._map_to_apprise_type(notification.level.value)
 
@@ -448,9 +482,16 @@ class AsyncNotificationDispatcher:
             # Import webhook channel here to avoid circular imports
             from backend.integrations.notifications.channels.webhook import (
                 send_webhook_notification,
+                webhook_channel,
             )
 
-            # Send via webhook channel
+            # Deliver over the pooled keep-alive session rather than a per-call one
+            session = await self.channel_clients.get_http_session(
+                verify_ssl=webhook_channel.verify_ssl, timeout=webhook_channel.default_timeout
+            )
+            if session is not None:
+                webhook_channel.use_session(session)
+
             success = await send_webhook_notification(notification)
 
             if success:
@@ -594,6 +635,9 @@ class AsyncNotificationDispatcher:
         # Add current status
         metrics.update(self.health_status)
 
+        # Client reuse, per-channel latency and circuit state
+        metrics["channel_clients"] = self.channel_clients.get_stats()
+
         return metrics
 
     def get_health_status(self) -> dict[str, Any]:
@@ -0,0 +1,180 @@
+"""
+Bounded executor for CPU-heavy authentication work.
+
+bcrypt hashing/verification and QR code rendering take 100-300 ms each on a
+Raspberry Pi. Running them inline inside async handlers blocks the event loop,
+which stalls CAN ingest and WebSocket fan-out for the duration of every login.
+
+This module provides a small thread pool with:
+- A concurrency cap (never more jobs running than worker threads)
+- A bounded wait queue so a login burst is rejected instead of piling up
+- Queue-wait and run-time metrics for monitoring
+
+Example:
+    >>> executor = CryptoExecutor(max_workers=2, max_pending=16)
+    >>> password_hash = await executor.run("hash", pwd_context.hash, password)
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds a client is told to wait before retrying a rejected job
+RETRY_AFTER_SECONDS = 1
+
+
+class CryptoExecutorSaturatedError(RuntimeError):
+    """Raised when the executor wait queue is full."""
+
+
+class CryptoExecutor:
+    """
+    Thread pool executor with a concurrency cap and queue-time metrics.
+
+    Jobs wait on an asyncio semaphore rather than in the thread pool's internal
+    queue, so the time spent waiting for a worker can be measured and the
+    number of waiters can be bounded.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        thread_name_prefix: str = "auth-crypto",
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of jobs running concurrently
+            max_pending: Maximum number of jobs waiting for a worker
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+        self._waiting = 0
+        self._running = 0
+        self._shutdown = False
+
+        # Metrics
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self._total_run_time = 0.0
+        self._max_run_time = 0.0
+        self._operation_counts: dict[str, int] = {}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Create the semaphore lazily so it binds to the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        return self._semaphore
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function in the executor.
+
+        Args:
+            operation: Short operation name used for metrics (e.g. "bcrypt_verify")
+            func: Blocking callable to execute
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The return value of func
+
+        Raises:
+            CryptoExecutorSaturatedError: If too many jobs are already waiting
+            RuntimeError: If the executor has been shut down
+        """
+        if self._shutdown:
+            msg = "Crypto executor has been shut down"
+            raise RuntimeError(msg)
+
+        semaphore = self._get_semaphore()
+        if semaphore.locked() and self._waiting >= self.max_pending:
+            self._rejected += 1
+            logger.warning(
+                f"Crypto executor saturated, rejecting {operation} "
+                f"({self._waiting} waiting, {self._running} running)"
+            )
+            msg = "Authentication service is busy, please retry"
+            raise CryptoExecutorSaturatedError(msg)
+
+        enqueued_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started_at = time.perf_counter()
+        queue_wait = started_at - enqueued_at
+        self._total_queue_wait += queue_wait
+        self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+        self._running += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+            self._completed += 1
+            return result
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            run_time = time.perf_counter() - started_at
+            self._total_run_time += run_time
+            self._max_run_time = max(self._max_run_time, run_time)
+            self._operation_counts[operation] = self._operation_counts.get(operation, 0) + 1
+            self._running -= 1
+            semaphore.release()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get executor metrics.
+
+        Returns:
+            dict[str, Any]: Concurrency, queue-wait and run-time statistics
+        """
+        finished = self._completed + self._failed
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "running": self._running,
+            "waiting": self._waiting,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_queue_wait_ms": (self._total_queue_wait / finished * 1000) if finished else 0.0,
+            "max_queue_wait_ms": self._max_queue_wait * 1000,
+            "avg_run_time_ms": (self._total_run_time / finished * 1000) if finished else 0.0,
+            "max_run_time_ms": self._max_run_time * 1000,
+            "operations": dict(self._operation_counts),
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Shut down the worker threads.
+
+        Args:
+            wait: Whether to block until running jobs complete
+        """
+        self._shutdown = True
+        self._executor.shutdown(wait=wait, cancel_futures=True)
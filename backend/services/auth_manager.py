@@ -41,6 +41,7 @@ except ImportError as e:
     logging.error(f"Authentication dependencies missing: {e}. Please install with: poetry install")
 
 from backend.core.config import AuthenticationSettings
+from backend.services.auth_crypto_executor import CryptoExecutor, CryptoExecutorSaturatedError
 
 if TYPE_CHECKING:
     from backend.services.auth_repository import AuthRepository
@@ -66,6 +67,15 @@ class UserNotFoundError(AuthenticationError):
     """Raised when a user cannot be found."""
 
 
+class AuthenticationBusyError(CryptoExecutorSaturatedError):
+    """
+    Raised when too many password hashing jobs are already queued.
+
+    Deliberately not an AuthenticationError: the credentials were never
+    checked, so callers must not turn this into a 401.
+    """
+
+
 class AccountLockedError(AuthenticationError):
     """Raised when an account is locked due to too many failed attempts."""
 
@@ -95,6 +105,7 @@ class AuthManager:
         mfa_service: Any | None = None,
         lockout_service: Any | None = None,
         credential_repository: Any | None = None,
+        crypto_executor: CryptoExecutor | None = None,
     ):
         """
         Initialize the authentication manager.
@@ -108,6 +119,7 @@ class AuthManager:
             mfa_service: Optional pre-configured MFA service
             lockout_service: Optional pre-configured lockout service
             credential_repository: Optional pre-configured credential repository
+            crypto_executor: Optional shared executor for bcrypt and QR code work
         """
         self.logger = logging.getLogger(__name__)
 
@@ -155,6 +167,13 @@ class AuthManager:
             msg = "Authentication dependencies missing. Please install with: poetry install"
             raise RuntimeError(msg)
 
+        # Bounded executor for bcrypt and QR code work so logins never block the event loop
+        self._owns_crypto_executor = crypto_executor is None
+        self._crypto_executor = crypto_executor or CryptoExecutor(
+            max_workers=getattr(self.settings, "crypto_max_workers", 2),
+            max_pending=getattr(self.settings, "crypto_max_pending", 16),
+        )
+
         # Determine authentication mode
         self.auth_mode = self._detect_auth_mode()
         self.logger.info(f"Authentication mode detected: {self.auth_mode}")
@@ -216,8 +235,45 @@ class AuthManager:
 
     async def shutdown(self) -> None:
         """Cleanup authentication manager on shutdown."""
+        if self._owns_crypto_executor:
+            self._crypto_executor.shutdown(wait=False)
         self.logger.info("Authentication manager stopped")
 
+    async def _run_crypto(self, operation: str, func: Any, *args: Any) -> Any:
+        """
+        Run CPU-heavy authentication work in the bounded crypto executor.
+
+        Args:
+            operation: Operation name for metrics
+            func: Blocking callable to execute
+            *args: Arguments for func
+
+        Returns:
+            The return value of func
+
+        Raises:
+            AuthenticationBusyError: If the executor queue is full
+        """
+        try:
+            return await self._crypto_executor.run(operation, func, *args)
+        except CryptoExecutorSaturatedError as e:
+            raise AuthenticationBusyError(str(e)) from e
+
+    async def _hash_password(self, password: str) -> str:
+        """Hash a password with bcrypt off the event loop."""
+        if not self.pwd_context:
+            msg = "Password context not available"
+            raise RuntimeError(msg)
+        return await self._run_crypto("bcrypt_hash", self.pwd_context.hash, password)
+
+    async def _verify_password(self, password: str, password_hash: str) -> bool:
+        """Verify a password against a bcrypt hash off the event loop."""
+        if not self.pwd_context:
+            return False
+        return await self._run_crypto(
+            "bcrypt_verify", self.pwd_context.verify, password, password_hash
+        )
+
     def _detect_auth_mode(self) -> AuthMode:
         """
         Detect the authentication mode based on configuration.
@@ -270,10 +326,7 @@ class AuthManager:
             )
 
         # Hash the password using bcrypt (dependencies are guaranteed to be available)
-        if not self.pwd_context:
-            msg = "Password context not available"
-            raise RuntimeError(msg)
-        password_hash = self.pwd_context.hash(password)
+        password_hash = await self._hash_password(password)
         auto_generated = not bool(self.settings.admin_password)
 
         # Store in repository (fail-fast if this fails)
@@ -741,9 +794,7 @@ class AuthManager:
             return None
 
         # Verify password using bcrypt
-        if not self.pwd_context or not self.pwd_context.verify(
-            password, admin_credentials["password_hash"]
-        ):
+        if not await self._verify_password(password, admin_credentials["password_hash"]):
             self.logger.warning("Invalid admin password")
             await self.record_failed_attempt(username)
             return None
@@ -878,9 +929,7 @@ class AuthManager:
             return None
 
         # Verify password using bcrypt
-        if not self.pwd_context or not self.pwd_context.verify(
-            password, admin_credentials["password_hash"]
-        ):
+        if not await self._verify_password(password, admin_credentials["password_hash"]):
             self.logger.warning("Invalid admin password")
             await self.record_failed_attempt(username)
             return None
@@ -1116,6 +1165,7 @@ class AuthManager:
                 bool(admin_credentials) if self.auth_mode == AuthMode.SINGLE_USER else None
             ),
             "has_generated_credentials": await self.has_generated_credentials(),
+            "crypto_executor": self._crypto_executor.get_metrics(),
         }
 
         if self.auth_mode == AuthMode.SINGLE_USER and admin_credentials:
@@ -1164,7 +1214,7 @@ class AuthManager:
         provisioning_uri = totp.provisioning_uri(name=user_id, issuer_name=issuer)
 
         # Generate QR code image
-        qr_code_data = self._generate_qr_code(provisioning_uri)
+        qr_code_data = await self._run_crypto("qr_code", self._generate_qr_code, provisioning_uri)
 
         # Generate backup codes
         backup_codes = self._generate_backup_codes()
@@ -14,6 +14,7 @@ from backend.repositories.auth_repository import (
     MfaRepository,
     SessionRepository,
 )
+from backend.services.auth_crypto_executor import CryptoExecutor
 from backend.services.auth_manager import AuthManager
 from backend.services.auth_services import (
     LockoutService,
@@ -47,6 +48,7 @@ class AuthService:
         mfa_service: MfaService | None = None,
         lockout_service: LockoutService | None = None,
         auth_config: dict[str, Any] | None = None,
+        crypto_executor: CryptoExecutor | None = None,
     ):
         """
         Initialize the authentication service with repository dependencies and sub-services.
@@ -64,6 +66,7 @@ class AuthService:
             mfa_service: Optional injected MfaService instance
             lockout_service: Injected LockoutService instance
             auth_config: Authentication configuration from SecurityConfigService
+            crypto_executor: Optional executor shared with MfaService for bcrypt work
         """
         self._credential_repository = credential_repository
         self._session_repository = session_repository
@@ -79,6 +82,7 @@ class AuthService:
         self._mfa_service = mfa_service
         self._lockout_service = lockout_service
         self._auth_config = auth_config or {}
+        self._crypto_executor = crypto_executor
 
         self._running = False
         self._auth_manager: AuthManager | None = None
@@ -138,6 +142,7 @@ class AuthService:
                 mfa_service=self._mfa_service,
                 lockout_service=self._lockout_service,
                 credential_repository=self._credential_repository,
+                crypto_executor=self._crypto_executor,
             )
 
             # Add defensive logging as recommended by Zen
@@ -22,10 +22,19 @@ from backend.repositories.auth_repository import (
     MfaRepository,
     SessionRepository,
 )
+from backend.services.auth_crypto_executor import CryptoExecutor
 
 logger = logging.getLogger(__name__)
 
 
+def _find_matching_hash(code: str, code_hashes: list[str]) -> str | None:
+    """Return the first bcrypt hash matching code, or None."""
+    for code_hash in code_hashes:
+        if bcrypt.verify(code, code_hash):
+            return code_hash
+    return None
+
+
 class TokenService:
     """Service for JWT token operations (stateless)."""
 
@@ -320,6 +329,7 @@ class MfaService:
         performance_monitor: PerformanceMonitor,
         issuer_name: str = "RV-C System",
         backup_codes_count: int = 8,
+        crypto_executor: CryptoExecutor | None = None,
     ):
         """Initialize the MFA service.
 
@@ -328,11 +338,13 @@ class MfaService:
             performance_monitor: Performance monitoring instance
             issuer_name: TOTP issuer name
             backup_codes_count: Number of backup codes to generate
+            crypto_executor: Executor for bcrypt work (created if not provided)
         """
         self._mfa_repo = mfa_repository
         self._monitor = performance_monitor
         self._issuer_name = issuer_name
         self._backup_codes_count = backup_codes_count
+        self._crypto = crypto_executor or CryptoExecutor(thread_name_prefix="mfa-crypto")
 
         # Apply performance monitoring
         self._apply_monitoring()
@@ -353,6 +365,27 @@ class MfaService:
             "MfaService", "verify_mfa_code"
         )(self.verify_mfa_code)
 
+    async def _hash_backup_codes(self, backup_codes: list[str]) -> list[str]:
+        """Hash backup codes with bcrypt in the crypto executor.
+
+        Args:
+            backup_codes: Plaintext backup codes
+
+        Returns:
+            bcrypt hashes in the same order
+        """
+        return await self._crypto.run(
+            "bcrypt_hash_batch", lambda codes: [bcrypt.hash(c) for c in codes], backup_codes
+        )
+
+    def get_crypto_metrics(self) -> dict[str, Any]:
+        """Get bcrypt executor metrics.
+
+        Returns:
+            Queue wait and run time statistics
+        """
+        return self._crypto.get_metrics()
+
     async def generate_mfa_setup(self, user_id: str, username: str) -> dict[str, Any]:
         """Generate MFA setup data.
 
@@ -370,7 +403,7 @@ class MfaService:
         backup_codes = [secrets.token_hex(4).upper() for _ in range(self._backup_codes_count)]
 
         # Hash backup codes for storage
-        backup_codes_hash = [bcrypt.hash(code) for code in backup_codes]
+        backup_codes_hash = await self._hash_backup_codes(backup_codes)
 
         # Create MFA config
         await self._mfa_repo.create_user_mfa(user_id, secret, backup_codes_hash)
@@ -440,13 +473,18 @@ class MfaService:
             logger.debug(f"Valid TOTP code for user {user_id}")
             return True
 
-        # Try backup codes
-        for code_hash in config.get("backup_codes_hash", []):
-            if bcrypt.verify(code, code_hash):
-                # Mark backup code as used
-                if await self._mfa_repo.mark_backup_code_used(user_id, code_hash):
-                    logger.info(f"Backup code used for user {user_id}")
-                    return True
+        # Try backup codes (all bcrypt checks run as a single executor job)
+        code_hash = await self._crypto.run(
+            "bcrypt_verify_batch",
+            _find_matching_hash,
+            code,
+            list(config.get("backup_codes_hash", [])),
+        )
+        if code_hash:
+            # Mark backup code as used
+            if await self._mfa_repo.mark_backup_code_used(user_id, code_hash):
+                logger.info(f"Backup code used for user {user_id}")
+                return True
 
         logger.warning(f"Invalid MFA code for user {user_id}")
         return False
@@ -480,7 +518,7 @@ class MfaService:
         backup_codes = [secrets.token_hex(4).upper() for _ in range(self._backup_codes_count)]
 
         # Hash for storage
-        backup_codes_hash = [bcrypt.hash(code) for code in backup_codes]
+        backup_codes_hash = await self._hash_backup_codes(backup_codes)
 
         # Create new config with same secret
         await self._mfa_repo.create_user_mfa(user_id, config["secret"], backup_codes_hash)
@@ -18,6 +18,7 @@ from backend.core.safety_interfaces import (
     SafetyClassification,
     SafetyStatus,
 )
+from backend.integrations.can.dispatch_cache import RVCDispatchCache
 from backend.integrations.rvc import BAMHandler, decode_payload, decode_product_id
 from backend.repositories.can_tracking_repository import CANTrackingRepository
 from backend.repositories.system_state_repository import SystemStateRepository
@@ -80,6 +81,9 @@ class CANBusService(SafetyAware):
         self.raw_device_mapping: dict = {}
         self.entity_id_lookup: dict[str, dict] = {}
 
+        # Arbitration ID -> decode plan/device/entity, rebuilt when the mapping reloads
+        self._dispatch_cache = RVCDispatchCache()
+
         # BAM handler for multi-packet messages
         self.bam_handler: BAMHandler | None = None
 
@@ -89,6 +93,10 @@ class CANBusService(SafetyAware):
         # Anomaly detector for security monitoring (injected)
         self.anomaly_detector = can_anomaly_detector
 
+        # CAN-driven entity updates that changed state vs. repeated status frames
+        self._entity_updates_applied = 0
+        self._entity_updates_suppressed = 0
+
         logger.info("CANBusService initialized with repositories")
 
     async def start(self) -> None:
@@ -227,6 +235,9 @@ class CANBusService(SafetyAware):
                     "interfaces": self.config["interfaces"],
                     "decoders_loaded": len(self.decoder_map),
                     "device_mappings": len(self.device_lookup),
+                    "entity_updates": self.get_entity_update_stats(),
+                    "dispatch_cache": self.get_dispatch_stats(),
+                    "tx_scheduler": self._get_tx_scheduler_stats(),
                 }
             return {
                 "service": "CANBusService",
@@ -243,6 +254,37 @@ class CANBusService(SafetyAware):
                 "error": str(e),
             }
 
+    def _get_tx_scheduler_stats(self) -> dict[str, Any] | None:
+        """Get CAN TX scheduler metrics if the writer is running."""
+        if not self._task:
+            return None
+        from backend.integrations.can.manager import get_tx_scheduler
+
+        return get_tx_scheduler().get_stats()
+
+    def get_entity_update_stats(self) -> dict[str, Any]:
+        """
+        Get counts of applied and suppressed CAN-driven entity updates.
+
+        Returns:
+            Applied/suppressed counts and the suppression ratio
+        """
+        total = self._entity_updates_applied + self._entity_updates_suppressed
+        return {
+            "applied": self._entity_updates_applied,
+            "suppressed": self._entity_updates_suppressed,
+            "suppression_ratio": self._entity_updates_suppressed / total if total else 0.0,
+        }
+
+    def get_dispatch_stats(self) -> dict[str, Any]:
+        """
+        Get arbitration-ID dispatch cache metrics.
+
+        Returns:
+            Cache sizes and hit/miss counters per DGN
+        """
+        return self._dispatch_cache.get_stats()
+
     async def get_service_info(self) -> dict[str, Any]:
         """
         Get service information and current status.
@@ -298,18 +340,25 @@ class CANBusService(SafetyAware):
 
             # Extract additional lookup tables from mapping dict
             # This is needed for device and status lookups
+            device_lookup: dict[tuple[str, str], dict] = {}
             for (dgn_hex, instance), device_config in rvc_config.mapping_dict.items():
-                self.device_lookup[(dgn_hex.upper(), str(instance))] = device_config
+                device_lookup[(dgn_hex.upper(), str(instance))] = device_config
 
             # Copy entity map to device lookup for compatibility
             for (dgn_hex, instance), device_config in rvc_config.entity_map.items():
-                self.device_lookup[(dgn_hex.upper(), str(instance))] = device_config
+                device_lookup[(dgn_hex.upper(), str(instance))] = device_config
 
             # Build status lookup from device lookup for devices with status_dgn
-            for (_dgn_hex, instance), device_config in self.device_lookup.items():
+            status_lookup: dict[tuple[str, str], dict] = {}
+            for (_dgn_hex, instance), device_config in device_lookup.items():
                 status_dgn = device_config.get("status_dgn")
                 if status_dgn:
-                    self.status_lookup[(status_dgn.upper(), str(instance))] = device_config
+                    status_lookup[(status_dgn.upper(), str(instance))] = device_config
+
+            # Replace (not merge) so a reload drops stale mappings
+            self.device_lookup = device_lookup
+            self.status_lookup = status_lookup
+            self._dispatch_cache.load(self.decoder_map, self.device_lookup)
 
             # Store raw device mapping for unmapped entry suggestions
             self.raw_device_mapping = rvc_config.mapping_dict  # This is the device_mapping dict
@@ -368,11 +417,17 @@ class CANBusService(SafetyAware):
                     failed_interfaces,
                 )
 
-            # CAN writer task is started by the CAN service startup method
-
             # Set up CAN message listeners for each active interface
             await self._setup_can_listeners()
 
+            # Feed queued commands to the per-interface TX scheduler
+            from backend.integrations.can.manager import can_writer
+
+            self._task = asyncio.create_task(
+                can_writer(self._can_tracking_repository, self._system_state_repository),
+                name="can_writer",
+            )
+
         except ImportError:
             logger.warning(
                 "python-can package not available. CAN bus service will not start. "
@@ -437,7 +492,14 @@ class CANBusService(SafetyAware):
             logger.error("Failed to set up CAN listeners: %s", e, exc_info=True)
 
     async def _cleanup_can_listeners(self) -> None:
-        """Cleanup CAN bus listeners."""
+        """Cleanup CAN bus listeners and the CAN writer."""
+        if self._task:
+            # Cancelling the writer also stops the TX scheduler and drops pending sends
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
         for listener_info in self._listeners:
             try:
                 if isinstance(listener_info, dict):
@@ -732,13 +794,13 @@ class CANBusService(SafetyAware):
                 return
 
             # Try to decode the message using RVC decoder
-            if self.decoder_map and arbitration_id in self.decoder_map:
+            plan = self._dispatch_cache.plan(arbitration_id)
+            if plan is not None:
                 try:
-                    entry = self.decoder_map[arbitration_id]
-                    decoded_data, raw_data = decode_payload(entry, data)
+                    decoded_data, raw_data = decode_payload(plan.entry, data)
 
                     # Extract DGN and instance for device lookup
-                    dgn_hex = entry.get("dgn_hex")
+                    dgn_hex = plan.dgn_hex
                     instance = raw_data.get("instance") if isinstance(raw_data, dict) else None
 
                     logger.debug(
@@ -751,16 +813,18 @@ class CANBusService(SafetyAware):
 
                     # Check if this maps to a known device/entity
                     if dgn_hex and instance is not None:
-                        device_key = (dgn_hex.upper(), str(instance))
-                        device_config = self.device_lookup.get(device_key)
+                        route = self._dispatch_cache.route(plan, instance)
 
-                        if device_config:
-                            entity_id = device_config.get("entity_id")
-                            if entity_id:
-                                logger.debug("Mapped to entity: %s", entity_id)
+                        if route:
+                            if route.entity_id:
+                                logger.debug("Mapped to entity: %s", route.entity_id)
                                 # Update entity state with the decoded CAN message
                                 await self._update_entity_from_can_message(
-                                    entity_id, device_config, decoded_data, raw_data, msg
+                                    route.entity_id,
+                                    route.device_config,
+                                    decoded_data,
+                                    raw_data,
+                                    msg,
                                 )
                         else:
                             logger.debug("Unmapped device: %s:%s", dgn_hex, instance)
@@ -833,7 +897,7 @@ class CANBusService(SafetyAware):
                 return
 
             entity_manager = entity_manager_service.get_entity_manager()
-            entity = entity_manager.get_entity(entity_id)
+            entity = self._dispatch_cache.entity(entity_id, entity_manager)
 
             if not entity:
                 logger.warning("Entity %s not found in entity manager", entity_id)
@@ -865,13 +929,21 @@ class CANBusService(SafetyAware):
             if device_config.get("device_type") == "light":
                 await self._update_light_state(payload, decoded_data, raw_data)
 
+            # Devices rebroadcast status periodically; skip history and broadcast
+            # when the frame repeats the current state
+            if entity.is_unchanged(payload):
+                entity_manager.confirm_entity_state(entity_id, timestamp)
+                self._entity_updates_suppressed += 1
+                await self._check_pending_command_completion(entity_id, payload)
+                return
+
             # Update the entity state
             updated_entity = entity_manager.update_entity_state(entity_id, payload)
 
             if updated_entity:
+                self._entity_updates_applied += 1
                 logger.debug("Updated entity %s state from CAN message", entity_id)
 
-                # Broadcast the update via WebSocket
                 # Broadcast entity update via WebSocket
                 websocket_service = service_registry.get_service("websocket_service")
                 if websocket_service:
@@ -880,7 +952,7 @@ class CANBusService(SafetyAware):
                         "entity_id": entity_id,
                         "data": updated_entity.to_dict(),
                     }
-                    await websocket_service.broadcast_data(broadcast_data)
+                    await websocket_service.broadcast_to_data_clients(broadcast_data)
 
                 # Check if this completes a pending command (for optimistic UI updates)
                 await self._check_pending_command_completion(entity_id, payload)
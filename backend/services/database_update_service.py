@@ -8,9 +8,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from alembic.config import Config
-from alembic.runtime.migration import MigrationContext
-from alembic.script import ScriptDirectory
 from sqlalchemy import create_engine
 
 logger = logging.getLogger(__name__)
@@ -186,7 +183,11 @@ class DatabaseUpdateService:
             # Get database URL from connection repository
             db_url = await self._connection_repo.get_database_url()
 
-            # Run Alembic migration
+            # Run Alembic migration (imported here; alembic is only needed for migrations)
+            from alembic.config import Config
+            from alembic.runtime.migration import MigrationContext
+            from alembic.script import ScriptDirectory
+
             alembic_cfg = Config("backend/alembic.ini")
             alembic_cfg.set_main_option("sqlalchemy.url", db_url)
 
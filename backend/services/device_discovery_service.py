@@ -11,6 +11,7 @@ into the config, logging, persistence, and WebSocket systems.
 import asyncio
 import contextlib
 import logging
+import random
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -20,11 +21,20 @@ import can
 
 from backend.core.config import get_settings
 from backend.integrations.can.manager import can_tx_queue
+from backend.integrations.can.tx_scheduler import TxPriority
 
 # CANService import removed - now using dependency injection
 
 logger = logging.getLogger(__name__)
 
+# PGNs used by both RV-C and J1939 (PGN Request); a PGN range match alone
+# does not identify the protocol
+SHARED_PROTOCOL_PGNS = frozenset({0xEA00})
+
+# Relative jitter applied to non-responder backoff so devices that dropped off
+# together are not re-polled together
+POLL_BACKOFF_JITTER = 0.2
+
 
 @dataclass
 class DeviceInfo:
@@ -42,6 +52,9 @@ class DeviceInfo:
     response_count: int = 0
     response_times: list[float] = field(default_factory=list)
     status: str = "discovered"  # discovered, online, offline, error
+    last_polled: float = 0.0
+    poll_failures: int = 0  # consecutive unanswered status polls
+    next_poll_at: float = 0.0  # backoff: not polled again before this time
 
 
 @dataclass
@@ -92,6 +105,8 @@ class DeviceDiscoveryService:
         # Discovery state
         self.topology = NetworkTopology()
         self.active_polls: dict[str, PollRequest] = {}
+        # (target address, PGN) -> keys of outstanding polls, in send order
+        self._polls_by_target: dict[tuple[int, int], dict[str, None]] = {}
         self.poll_schedules: dict[str, dict[str, Any]] = {}
         self.discovery_active = False
 
@@ -127,6 +142,8 @@ class DeviceDiscoveryService:
             },
         }
 
+        self._build_protocol_pgn_table()
+
         # Track detected protocols per interface
         self.detected_protocols: dict[str, set[str]] = defaultdict(set)
 
@@ -138,6 +155,21 @@ class DeviceDiscoveryService:
             "discovery_interval_seconds", 300.0
         )
 
+        # Status polls are paced to at most this many requests per second
+        self.poll_budget_per_second = getattr(self.config, "device_discovery", {}).get(
+            "poll_budget_per_second", 10.0
+        )
+        self.poll_backoff_max = getattr(self.config, "device_discovery", {}).get(
+            "poll_backoff_max_seconds", 600.0
+        )
+        self._polling_stats: dict[str, Any] = {
+            "passes": 0,
+            "requests_sent": 0,
+            "last_pass_requests": 0,
+            "last_pass_deferred": 0,
+            "last_pass_seconds": 0.0,
+        }
+
         # Protocol-specific configurations
         self.protocol_configs = {
             "rvc": {
@@ -282,6 +314,7 @@ class DeviceDiscoveryService:
                     protocol=protocol,
                     last_sent=time.time(),
                 )
+                self._polls_by_target.setdefault((source_address, pgn), {})[poll_key] = None
 
                 logger.debug(f"Sent poll request to {source_address:02X} for PGN {pgn:04X}")
 
@@ -1236,15 +1269,25 @@ class DeviceDiscoveryService:
         """Background task for periodic device polling."""
         while self.discovery_active:
             try:
+                started = time.monotonic()
                 await self._poll_known_devices()
-                await asyncio.sleep(self.polling_interval)
+                # A pass is spread over the interval; only wait out the remainder
+                elapsed = time.monotonic() - started
+                await asyncio.sleep(max(self.polling_interval - elapsed, 0.0))
 
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
                 await asyncio.sleep(5)  # Short delay on error
 
     async def _poll_known_devices(self) -> None:
-        """Poll all known devices for status updates."""
+        """
+        Poll stale devices for status updates, paced within the bus-load budget.
+
+        Requests are spread evenly over the polling interval, at most
+        ``poll_budget_per_second`` of them. Devices beyond the budget are left
+        for the next pass, longest-silent first. Devices that did not answer
+        their previous poll are backed off exponentially with jitter.
+        """
         if not self.topology.devices:
             return
 
@@ -1252,16 +1295,78 @@ class DeviceDiscoveryService:
         now = time.time()
         poll_threshold = self.polling_interval * 2
 
+        due: list[tuple[DeviceInfo, int]] = []
         for device in self.topology.devices.values():
-            if now - device.last_seen > poll_threshold:
-                # Determine appropriate PGN based on device type
-                pgn = self._get_status_pgn_for_device(device)
-                if pgn:
-                    await self.poll_device(
-                        source_address=device.source_address,
-                        pgn=pgn,
-                        protocol=device.protocol,
-                    )
+            if now - device.last_seen <= poll_threshold or now < device.next_poll_at:
+                continue
+            # Determine appropriate PGN based on device type
+            pgn = self._get_status_pgn_for_device(device)
+            if not pgn:
+                continue
+            if device.last_polled > max(device.last_seen, device.next_poll_at):
+                # Poll sent since the last response (and last backoff) went unanswered
+                device.poll_failures += 1
+                device.next_poll_at = now + self._get_poll_backoff(device.poll_failures)
+                continue
+            due.append((device, pgn))
+
+        due.sort(key=lambda item: item[0].last_seen)
+        max_requests = max(1, int(self.poll_budget_per_second * self.polling_interval))
+        batch = due[:max_requests]
+        spacing = self.polling_interval / len(batch) if batch else 0.0
+
+        started = time.monotonic()
+        sent = 0
+        for position, (device, pgn) in enumerate(batch):
+            if position:
+                await asyncio.sleep(spacing)
+            if await self.poll_device(
+                source_address=device.source_address,
+                pgn=pgn,
+                protocol=device.protocol,
+            ):
+                device.last_polled = time.time()
+                sent += 1
+
+        stats = self._polling_stats
+        stats["passes"] += 1
+        stats["requests_sent"] += sent
+        stats["last_pass_requests"] = sent
+        stats["last_pass_deferred"] = len(due) - len(batch)
+        stats["last_pass_seconds"] = time.monotonic() - started
+
+    def _get_poll_backoff(self, failures: int) -> float:
+        """
+        Get the jittered backoff before re-polling a non-responding device.
+
+        Args:
+            failures: Consecutive unanswered polls
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+        backoff = min(self.polling_interval * 2 ** (failures - 1), self.poll_backoff_max)
+        return backoff * random.uniform(1 - POLL_BACKOFF_JITTER, 1 + POLL_BACKOFF_JITTER)
+
+    def get_polling_stats(self) -> dict[str, Any]:
+        """
+        Get status polling metrics.
+
+        The duty cycle is the share of the per-interval request budget used by
+        the last pass.
+
+        Returns:
+            Dictionary containing polling budget, counters and duty cycle
+        """
+        budget = max(1, int(self.poll_budget_per_second * self.polling_interval))
+        return {
+            **self._polling_stats,
+            "budget_per_second": self.poll_budget_per_second,
+            "duty_cycle": self._polling_stats["last_pass_requests"] / budget,
+            "backed_off_devices": sum(
+                1 for device in self.topology.devices.values() if device.poll_failures
+            ),
+        }
 
     def _get_status_pgn_for_device(self, device: DeviceInfo) -> int | None:
         """
@@ -1333,8 +1438,9 @@ class DeviceDiscoveryService:
             # Create CAN message
             message = can.Message(arbitration_id=can_id, data=data, is_extended_id=True)
 
-            # Send via CAN queue
-            await can_tx_queue.put(message)
+            # Polls go on the bulk lane behind control traffic and, being
+            # requests rather than commands, are not repeated
+            await can_tx_queue.put((message, None, TxPriority.BULK, False))
 
             logger.debug(
                 f"Sent PGN request: PGN={pgn:04X}, Dest={destination:02X}, "
@@ -1377,31 +1483,70 @@ class DeviceDiscoveryService:
 
     def _process_poll_response(self, message: can.Message, source_address: int, pgn: int) -> None:
         """Process response to a poll request."""
-        now = time.time()
+        # Find the oldest outstanding poll for this address and PGN
+        target = (source_address, pgn)
+        poll_keys = self._polls_by_target.get(target)
+        if not poll_keys:
+            return
 
-        # Find matching poll request
-        for poll_key, poll_request in list(self.active_polls.items()):
-            if poll_request.target_address == source_address and poll_request.target_pgn == pgn:
-                # Calculate response time
-                response_time = now - poll_request.last_sent
-
-                # Update device response times
-                if source_address in self.topology.devices:
-                    device = self.topology.devices[source_address]
-                    device.response_times.append(response_time)
-                    # Keep only recent response times
-                    if len(device.response_times) > 10:
-                        device.response_times = device.response_times[-10:]
-                    device.response_count += 1
-
-                # Remove completed poll
-                del self.active_polls[poll_key]
-
-                logger.debug(
-                    f"Poll response received from {source_address:02X} "
-                    f"for PGN {pgn:04X} in {response_time:.3f}s"
-                )
-                break
+        poll_key = next(iter(poll_keys))
+        del poll_keys[poll_key]
+        if not poll_keys:
+            del self._polls_by_target[target]
+        poll_request = self.active_polls.pop(poll_key, None)
+        if poll_request is None:
+            return
+
+        # Calculate response time
+        response_time = time.time() - poll_request.last_sent
+
+        # Update device response times
+        if source_address in self.topology.devices:
+            device = self.topology.devices[source_address]
+            device.response_times.append(response_time)
+            # Keep only recent response times
+            if len(device.response_times) > 10:
+                device.response_times = device.response_times[-10:]
+            device.response_count += 1
+
+        logger.debug(
+            f"Poll response received from {source_address:02X} "
+            f"for PGN {pgn:04X} in {response_time:.3f}s"
+        )
+
+    def _build_protocol_pgn_table(self) -> None:
+        """
+        Precompute protocol detection into a PGN-indexed lookup table.
+
+        Each slot holds an index into ``self._table_protocols`` (0 for unknown).
+        Protocols earlier in ``protocol_pgn_ranges`` take precedence, so they
+        are written last. Call again after changing ``protocol_pgn_ranges``.
+        """
+        protocols = list(self.protocol_pgn_ranges)
+        size = 1 + max(
+            [end for info in self.protocol_pgn_ranges.values() for _, end in info["pgn_ranges"]]
+            + [
+                pgn
+                for info in self.protocol_pgn_ranges.values()
+                for pgn in info["characteristic_pgns"]
+            ],
+            default=0,
+        )
+        table = bytearray(size)
+
+        for index in range(len(protocols), 0, -1):
+            info = self.protocol_pgn_ranges[protocols[index - 1]]
+            # Shared PGNs are only attributed through characteristic_pgns
+            shared = {pgn: table[pgn] for pgn in SHARED_PROTOCOL_PGNS if pgn < size}
+            for start, end in info["pgn_ranges"]:
+                table[start : end + 1] = bytes([index]) * (end + 1 - start)
+            for pgn, slot in shared.items():
+                table[pgn] = slot
+            for pgn in info["characteristic_pgns"]:
+                table[pgn] = index
+
+        self._table_protocols: tuple[str | None, ...] = (None, *protocols)
+        self._protocol_pgn_table = table
 
     def _detect_protocol_from_pgn(self, pgn: int) -> str | None:
         """Detect protocol based on PGN.
@@ -1412,19 +1557,8 @@ class DeviceDiscoveryService:
         Returns:
             Protocol name ('rvc', 'j1939') or None if unknown
         """
-        for protocol, info in self.protocol_pgn_ranges.items():
-            # Check characteristic PGNs first (faster)
-            if pgn in info["characteristic_pgns"]:
-                return protocol
-
-            # Check PGN ranges
-            for start, end in info["pgn_ranges"]:
-                if start <= pgn <= end:
-                    # Additional check to avoid false positives on shared PGNs
-                    if pgn == 0xEA00:  # Address claimed - used by both
-                        continue
-                    return protocol
-
+        if 0 <= pgn < len(self._protocol_pgn_table):
+            return self._table_protocols[self._protocol_pgn_table[pgn]]
         return None
 
     def _update_device_info(self, message: can.Message, source_address: int, pgn: int) -> None:
@@ -1457,6 +1591,9 @@ class DeviceDiscoveryService:
         device = self.topology.devices[source_address]
         device.last_seen = now
         device.status = "online"
+        if device.poll_failures:
+            device.poll_failures = 0
+            device.next_poll_at = 0.0
 
         # Update device type based on PGN
         if pgn == 0x1FEDA:  # DC Load Status
@@ -1533,6 +1670,7 @@ class DeviceDiscoveryService:
                 "discovered_devices": device_count,
                 "enabled_protocols": self.enabled_protocols,
                 "protocol_details": protocol_details,
+                "polling": self.get_polling_stats(),
                 "uptime_seconds": int(uptime),
                 "timestamp": time.time(),
             }
@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from backend.core.entity_manager import EntityManager
+from backend.integrations.can.tx_scheduler import TxPriority
 from backend.models.entity import ControlCommand
 from backend.services.auth_manager import AuthManager
 from backend.services.config_service import ConfigService
@@ -26,6 +27,9 @@ from backend.websocket.handlers import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
+# State fields compared when matching a status frame against a commanded state
+_ACK_FIELDS = ("state", "brightness", "level", "position")
+
 
 # Safety-Critical Domain Models
 class SafetyControlCommandV2(BaseModel):
@@ -128,6 +132,11 @@ class EntityDomainService:
         self._max_concurrent_operations = 5  # Conservative for Pi hardware
         self._operation_timeout_default = 10.0  # Reasonable for local CAN bus
 
+        # Acknowledgement waiters, resolved from EntityManager state-change events
+        self._ack_waiters: dict[str, list[tuple[asyncio.Future[float], dict[str, Any]]]] = {}
+        self._ack_listener_registered = False
+        self._ack_stats = {"acknowledged": 0, "timeouts": 0, "total_ack_ms": 0.0}
+
         logger.info(
             "EntityDomainService initialized with Pi optimizations and safety interlocks enabled"
         )
@@ -166,56 +175,181 @@ class EntityDomainService:
         validation["passed"] = len(validation["issues"]) == 0
         return validation
 
+    def _get_core_entity_manager(self) -> Any:
+        """Return the core EntityManager (the injected object may be its service wrapper)."""
+        get_manager = getattr(self.entity_manager, "get_entity_manager", None)
+        return get_manager() if callable(get_manager) else self.entity_manager
+
+    def _ensure_ack_listener(self) -> Any:
+        """Register the listeners used to resolve acknowledgements."""
+        manager = self._get_core_entity_manager()
+        if not self._ack_listener_registered:
+            manager.register_state_change_listener(self._on_entity_state_change)
+            # Status frames repeating the current state are suppressed as changes
+            # but still acknowledge a command
+            manager.register_state_confirmed_listener(self._on_entity_state_change)
+            self._ack_listener_registered = True
+        return manager
+
+    def _on_entity_state_change(self, entity_id: str) -> None:
+        """
+        Resolve acknowledgement waiters for an entity whose state just changed
+        or was confirmed by a repeated status frame.
+
+        Called synchronously by the EntityManager for every state update, so
+        entities nobody is waiting on return immediately.
+        """
+        waiters = self._ack_waiters.get(entity_id)
+        if not waiters:
+            return
+
+        entity = self._get_core_entity_manager().get_entity(entity_id)
+        if entity is None:
+            return
+        current_state = self._extract_ack_fields(entity)
+
+        for future, expected_state in waiters:
+            if future.done() or not self._state_matches_expected(current_state, expected_state):
+                continue
+            loop = future.get_loop()
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                future.set_result(time.time())
+            else:
+                loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(time.time()))
+
+    def _register_ack_waiter(
+        self, entity_id: str, expected_state: dict[str, Any]
+    ) -> tuple[asyncio.Future[float], dict[str, Any]] | None:
+        """
+        Start waiting for an entity to report the expected state.
+
+        Register before the command is sent: only status frames seen after
+        registration (state-change or state-confirmed notifications) resolve
+        the waiter. The optimistic update applied when the command is sent
+        does not notify listeners, so it can never acknowledge a command.
+
+        Returns:
+            The registered waiter, or None if state changes cannot be observed
+        """
+        try:
+            self._ensure_ack_listener()
+        except Exception as e:
+            logger.warning(f"Cannot subscribe to entity state changes for {entity_id}: {e}")
+            return None
+
+        future: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        waiter = (future, expected_state)
+        self._ack_waiters.setdefault(entity_id, []).append(waiter)
+        return waiter
+
+    def _discard_ack_waiter(
+        self, entity_id: str, waiter: tuple[asyncio.Future[float], dict[str, Any]] | None
+    ) -> None:
+        """Stop tracking a waiter. Safe to call more than once."""
+        waiters = self._ack_waiters.get(entity_id)
+        if waiters is None:
+            return
+        if waiter in waiters:
+            waiters.remove(waiter)
+        if not waiters:
+            del self._ack_waiters[entity_id]
+
     async def _wait_for_acknowledgment(
-        self, operation_id: str, entity_id: str, timeout_seconds: float
+        self,
+        operation_id: str,
+        entity_id: str,
+        waiter: tuple[asyncio.Future[float], dict[str, Any]] | None,
+        timeout_seconds: float,
     ) -> tuple[bool, float | None]:
         """
         Wait for command acknowledgment from the physical RV-C system.
 
-        Simple Pi-optimized implementation that monitors local CAN interface
-        for state change confirmation from the target entity.
+        The wait resolves on the first status frame received after the waiter
+        was registered that matches the commanded state, so no polling loop
+        runs per command.
 
         Returns (acknowledged, acknowledgment_time_ms)
         """
-        start_time = time.time()
-        poll_interval = 0.1  # 100ms polls for responsive Pi performance
-
-        # Get the expected state after command execution
-        expected_state = await self._get_expected_entity_state(entity_id)
+        if waiter is None:
+            return False, None
 
-        # Monitor CAN bus for actual state change
-        while (time.time() - start_time) < timeout_seconds:
-            try:
-                # Check current entity state from CAN bus via entity manager
-                current_state = await self.entity_manager.get_entity_current_state(entity_id)
+        start_time = time.time()
+        future, _ = waiter
+        try:
+            acknowledged_at = await asyncio.wait_for(future, timeout=timeout_seconds)
+        except TimeoutError:
+            self._ack_stats["timeouts"] += 1
+            timeout_ms = timeout_seconds * 1000
+            logger.warning(f"Entity {entity_id} acknowledgment timeout after {timeout_ms:.1f}ms")
+            return False, None
+        finally:
+            self._discard_ack_waiter(entity_id, waiter)
 
-                if self._state_matches_expected(current_state, expected_state):
-                    acknowledgment_time = (time.time() - start_time) * 1000
-                    logger.info(f"Entity {entity_id} acknowledged in {acknowledgment_time:.1f}ms")
-                    return True, acknowledgment_time
+        acknowledgment_time = max(0.0, (acknowledged_at - start_time) * 1000)
+        self._ack_stats["acknowledged"] += 1
+        self._ack_stats["total_ack_ms"] += acknowledgment_time
+        logger.info(f"Entity {entity_id} acknowledged in {acknowledgment_time:.1f}ms")
+        return True, acknowledgment_time
 
-            except Exception as e:
-                logger.warning(f"Error checking entity state during ack wait: {e}")
-                # Continue polling rather than fail immediately
+    def _get_expected_entity_state(
+        self, entity_id: str, command: SafetyControlCommandV2
+    ) -> dict[str, Any]:
+        """
+        Predict the state the entity should report once it has executed a command.
 
-            await asyncio.sleep(poll_interval)
+        Must be called before the command is sent: toggle and brightness steps
+        are relative to the state the entity reports beforehand.
 
-        # Timeout reached without acknowledgment
-        timeout_ms = timeout_seconds * 1000
-        logger.warning(f"Entity {entity_id} acknowledgment timeout after {timeout_ms:.1f}ms")
-        return False, None
+        Returns:
+            Acknowledgement fields to wait for; empty if the outcome cannot be
+            predicted, in which case the command can only time out
+        """
+        if command.command == "set":
+            if command.state is False:
+                return {"state": "off"}
+            if command.state is None and command.brightness is None:
+                return {}
+            expected: dict[str, Any] = {"state": "on"}
+            if command.brightness:
+                expected["brightness"] = command.brightness
+            return expected
 
-    async def _get_expected_entity_state(self, entity_id: str) -> dict[str, Any]:
-        """Get the expected state for entity after command execution."""
-        # For Pi deployment, keep this simple - just return current state
-        # In more complex scenarios, this would predict the expected state
         try:
-            current_entities = await self.entities.list_entities()
-            entity_data = current_entities.get(entity_id, {})
-            return entity_data.get("raw", {})
+            entity = self._get_core_entity_manager().get_entity(entity_id)
         except Exception as e:
             logger.error(f"Failed to get expected state for {entity_id}: {e}")
             return {}
+        current = self._extract_ack_fields(entity) if entity is not None else {}
+
+        if command.command == "toggle":
+            return {"state": "off" if current.get("state") == "on" else "on"}
+
+        brightness = current.get("brightness")
+        if command.command in ("brightness_up", "brightness_down") and isinstance(
+            brightness, int | float
+        ):
+            step = 10 if command.command == "brightness_up" else -10
+            target = max(0, min(100, round(brightness) + step))
+            return {"state": "on" if target else "off", "brightness": target}
+        return {}
+
+    @staticmethod
+    def _extract_ack_fields(entity: Any) -> dict[str, Any]:
+        """Pull the fields compared for acknowledgement from an entity's current state."""
+        state = entity.current_state
+        value = state.value if isinstance(state.value, dict) else {}
+        fields = {}
+        for field in _ACK_FIELDS:
+            field_value = getattr(state, field, None)
+            if field_value is None:
+                field_value = value.get(field)
+            if field_value is not None:
+                fields[field] = field_value
+        return fields
 
     def _state_matches_expected(self, current_state: dict, expected_state: dict) -> bool:
         """
@@ -228,9 +362,7 @@ class EntityDomainService:
             return False
 
         # For Pi deployment, check key fields that matter for RV control
-        key_fields = ["state", "brightness", "level", "position"]
-
-        for field in key_fields:
+        for field in _ACK_FIELDS:
             if field in expected_state:
                 current_val = current_state.get(field)
                 expected_val = expected_state.get(field)
@@ -305,12 +437,14 @@ class EntityDomainService:
         entity_id: str,
         command: SafetyControlCommandV2,
         user_context: dict[str, Any] | None = None,
+        priority: TxPriority = TxPriority.SAFETY,
     ) -> SafetyOperationResultV2:
         """
         Control a single entity with safety-critical validation and acknowledgment.
 
         This method implements the command/acknowledgment pattern essential
-        for vehicle control systems.
+        for vehicle control systems. Commands are sent on the safety transmit
+        lane, ahead of normal and polling traffic, unless ``priority`` says otherwise.
         """
         operation_id = str(uuid.uuid4())
         start_time = time.time()
@@ -349,19 +483,28 @@ class EntityDomainService:
             # Step 3: Convert to legacy command format for existing service
             legacy_command = ControlCommand(
                 command=command.command,
-                state=str(command.state) if command.state is not None else None,
+                state=None if command.state is None else ("on" if command.state else "off"),
                 brightness=command.brightness,
             )
 
-            # Step 4: Execute command via existing entity service
-            result = await self.entities.control_entity(entity_id, legacy_command)
+            # Step 4: Start listening for the commanded state before anything is sent,
+            # so the status frame cannot slip past and the optimistic update never counts
+            expected_state = self._get_expected_entity_state(entity_id, command)
+            waiter = self._register_ack_waiter(entity_id, expected_state)
 
-            # Step 5: Wait for acknowledgment from physical system
+            # Step 5: Execute command via existing entity service
+            try:
+                result = await self.entities.control_entity(entity_id, legacy_command, priority)
+            except Exception:
+                self._discard_ack_waiter(entity_id, waiter)
+                raise
+
+            # Step 6: Wait for acknowledgment from physical system
             acknowledged, ack_time = await self._wait_for_acknowledgment(
-                operation_id, entity_id, command.timeout_seconds
+                operation_id, entity_id, waiter, command.timeout_seconds
             )
 
-            # Step 6: Update operation result
+            # Step 7: Update operation result
             operation.acknowledged = acknowledged
             operation.acknowledgment_time_ms = ack_time
             operation.execution_time_ms = (time.time() - start_time) * 1000
@@ -462,9 +605,16 @@ class EntityDomainService:
             f"Pi bulk operation: {len(request.entity_ids)} entities, concurrency: {pi_safe_concurrency}"
         )
 
+        # Emergency-stop bulk operations jump ahead of all other CAN traffic
+        priority = (
+            TxPriority.EMERGENCY if request.safety_mode == "emergency_stop" else TxPriority.SAFETY
+        )
+
         async def control_single_entity_safe(entity_id: str) -> SafetyOperationResultV2:
             async with semaphore:
-                return await self.control_entity_safe(entity_id, request.command, user_context)
+                return await self.control_entity_safe(
+                    entity_id, request.command, user_context, priority
+                )
 
         # Execute all operations
         operation_tasks = [
@@ -533,9 +683,22 @@ class EntityDomainService:
             "safety_interlocks_enabled": self._safety_interlocks_enabled,
             "pending_operations_count": len(self._pending_operations),
             "pending_operations": list(self._pending_operations.keys()),
+            "acknowledgments": self._get_ack_stats(),
             "timestamp": time.time(),
         }
 
+    def _get_ack_stats(self) -> dict[str, Any]:
+        """Summarize acknowledgement waits."""
+        acknowledged = self._ack_stats["acknowledged"]
+        return {
+            "waiting": sum(len(w) for w in self._ack_waiters.values()),
+            "acknowledged": acknowledged,
+            "timeouts": self._ack_stats["timeouts"],
+            "avg_ack_ms": (
+                round(self._ack_stats["total_ack_ms"] / acknowledged, 1) if acknowledged else 0.0
+            ),
+        }
+
     async def reconcile_state_with_rvc_bus(self) -> dict[str, Any]:
         """
         Reconcile application state with RV-C bus state.
@@ -174,6 +174,7 @@ class EntityManagerService:
             "entity_count": entity_count,
             "persistence_enabled": self._persistence_service is not None,
             "rvc_config_loaded": self._rvc_config_provider is not None,
+            "memory": self._entity_manager.get_memory_stats(),
         }
 
     def health_check(self) -> dict[str, Any]:
@@ -211,16 +212,4 @@ class EntityManagerService:
 
     def remove_entity(self, entity_id: str) -> bool:
         """Remove entity."""
-        if entity_id in self._entity_manager.entities:
-            entity = self._entity_manager.entities[entity_id]
-            # Remove from physical_id_map
-            physical_id = entity.config.get("physical_id")
-            if physical_id and physical_id in self._entity_manager.physical_id_map:
-                del self._entity_manager.physical_id_map[physical_id]
-            # Remove from entities dict
-            del self._entity_manager.entities[entity_id]
-            # Remove from protocol entities tracking
-            for protocol_entities in self._entity_manager.protocol_entities.values():
-                protocol_entities.discard(entity_id)
-            return True
-        return False
+        return self._entity_manager.remove_entity(entity_id) is not None
@@ -12,6 +12,7 @@ from typing import Any
 from backend.core.config import get_can_settings
 from backend.integrations.can.manager import can_tx_queue
 from backend.integrations.can.message_factory import create_light_can_message
+from backend.integrations.can.tx_scheduler import TxPriority
 from backend.models.entity import (
     ControlCommand,
     ControlEntityResponse,
@@ -93,6 +94,56 @@ class EntityService:
 
         return filtered_entities
 
+    async def list_entities_page(
+        self,
+        device_type: str | None = None,
+        area: str | None = None,
+        protocol: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[dict[str, dict[str, Any]], int]:
+        """
+        List one page of entities, resolving filters through the entity indexes.
+
+        Args:
+            device_type: Optional filter by entity device_type
+            area: Optional filter by entity suggested_area
+            protocol: Optional filter by protocol ownership (primary or secondary)
+            offset: Number of matching entities to skip
+            limit: Maximum number of entities to return
+
+        Returns:
+            Tuple of (entities on the page, total matching entities)
+        """
+        return self._entity_state_repo.get_entity_states_page(
+            device_type=device_type, area=area, protocol=protocol, offset=offset, limit=limit
+        )
+
+    async def get_entities_version(self) -> int:
+        """Get the global entity version, which changes whenever any entity changes."""
+        return self._entity_state_repo.get_version()
+
+    async def get_entities_epoch(self) -> str:
+        """Get the entity version epoch, which changes whenever the process restarts."""
+        return self._entity_state_repo.get_epoch()
+
+    async def list_entity_changes(self, since: int, epoch: str | None = None) -> dict[str, Any]:
+        """
+        List entities changed after a version for delta sync.
+
+        Args:
+            since: Version the client last saw
+            epoch: Epoch the client's version belongs to
+
+        Returns:
+            Dictionary with epoch, version, changed entities, removed IDs, and reset flag
+        """
+        return self._entity_state_repo.get_entity_changes(since, epoch)
+
+    async def get_entity_memory_stats(self) -> dict[str, Any]:
+        """Get approximate memory used by entity state history."""
+        return self._entity_state_repo.get_memory_stats()
+
     async def list_entity_ids(self) -> list[str]:
         """Return all known entity IDs."""
         return self._entity_state_repo.get_all_entity_ids()
@@ -329,7 +380,10 @@ class EntityService:
             )
 
     async def control_entity(
-        self, entity_id: str, command: ControlCommand
+        self,
+        entity_id: str,
+        command: ControlCommand,
+        priority: TxPriority = TxPriority.NORMAL,
     ) -> ControlEntityResponse:
         """
         Control an entity by routing to the appropriate device-specific control method.
@@ -337,6 +391,7 @@ class EntityService:
         Args:
             entity_id: The ID of the entity to control
             command: Control command with action details
+            priority: CAN transmit lane for the resulting command
 
         Returns:
             ControlEntityResponse: Response with status and action description
@@ -357,17 +412,23 @@ class EntityService:
         )
 
         if device_type == "light":
-            return await self.control_light(entity_id, command)
+            return await self.control_light(entity_id, command, priority)
         msg = f"Control not supported for device type '{device_type}'. Supported types: light"
         raise ValueError(msg)
 
-    async def control_light(self, entity_id: str, cmd: ControlCommand) -> ControlEntityResponse:
+    async def control_light(
+        self,
+        entity_id: str,
+        cmd: ControlCommand,
+        priority: TxPriority = TxPriority.NORMAL,
+    ) -> ControlEntityResponse:
         """
         Control a light entity.
 
         Args:
             entity_id: The ID of the light entity to control
             cmd: Control command with action details
+            priority: CAN transmit lane for the resulting command
 
         Returns:
             ControlEntityResponse: Response with status and action description
@@ -487,6 +548,7 @@ class EntityService:
             entity_id=entity_id,
             target_brightness_ui=new_brightness,
             action_description=action,
+            priority=priority,
         )
 
     async def _execute_light_command(
@@ -494,6 +556,7 @@ class EntityService:
         entity_id: str,
         target_brightness_ui: int,
         action_description: str,
+        priority: TxPriority = TxPriority.NORMAL,
     ) -> ControlEntityResponse:
         """
         Execute a light control command by sending CAN messages.
@@ -502,6 +565,7 @@ class EntityService:
             entity_id: The entity ID
             target_brightness_ui: Target brightness (0-100)
             action_description: Description of the action being taken
+            priority: CAN transmit lane for the command
 
         Returns:
             Control response with status and details
@@ -584,7 +648,7 @@ class EntityService:
                 f"Sending CAN message for {entity_id} on interface {can_interface} (logical: {logical_interface})"
             )
 
-            await can_tx_queue.put((can_message, can_interface))
+            await can_tx_queue.put((can_message, can_interface, priority))
 
             # Note: We don't have access to can_tracking_repo here for sniffer entries
             # This could be added as another dependency if needed
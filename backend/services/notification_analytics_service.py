@@ -66,8 +66,10 @@ class NotificationAnalyticsService:
         if performance_monitor is None:
             performance_monitor = PerformanceMonitor()
 
-        # Create repository
-        self._repository = NotificationAnalyticsRepository(database_manager, performance_monitor)
+        # Create repository; delivery logs are bulk-flushed on a size/time trigger
+        self._repository = NotificationAnalyticsRepository(
+            database_manager, performance_monitor, flush_batch_size=500, flush_interval=5.0
+        )
 
         # Create specialized services
         self._ingestion_service = NotificationIngestionService(
@@ -79,7 +81,7 @@ class NotificationAnalyticsService:
             performance_monitor,
             self._ingestion_service.get_queue(),
             batch_size=100,
-            flush_interval=30.0,
+            flush_interval=1.0,
         )
 
         self._reporting_service = NotificationReportingService(
@@ -101,6 +103,8 @@ class NotificationAnalyticsService:
 
         self._running = True
 
+        self._repository.start_flusher()
+
         # Schedule background tasks
         self._task_manager.schedule(
             self._processing_service.run_processor(), name="notification-processor"
@@ -127,6 +131,9 @@ class NotificationAnalyticsService:
         # Shutdown all background tasks
         await self._task_manager.shutdown()
 
+        # Write out any delivery logs still buffered
+        await self._repository.stop_flusher()
+
         logger.info("NotificationAnalyticsService stopped")
 
     # Ingestion methods (delegated to ingestion service)
@@ -244,8 +251,10 @@ class NotificationAnalyticsService:
     # Additional methods for monitoring
 
     def get_ingestion_stats(self) -> dict[str, Any]:
-        """Get current ingestion queue statistics."""
-        return self._ingestion_service.get_queue_stats()
+        """Get current ingestion queue and delivery log flush statistics."""
+        stats = self._ingestion_service.get_queue_stats()
+        stats["delivery_log_flush"] = self._repository.get_flush_stats()
+        return stats
 
     def get_background_task_status(self) -> list[dict[str, Any]]:
         """Get status of all background tasks."""
@@ -0,0 +1,340 @@
+"""
+Long-lived delivery clients for notification channels.
+
+Delivering a Pushover message used to build a throwaway ``apprise.Apprise``
+instance, and webhook deliveries opened and closed an aiohttp session around
+every call, so each notification paid for URL parsing and a fresh TCP/TLS
+handshake. :class:`NotificationChannelClients` keeps the clients for the
+dispatcher's lifetime instead: Apprise instances cached by URL and one
+keep-alive HTTP session. Every delivery goes through a per-channel
+concurrency limit and circuit breaker, and latency plus client and connection
+reuse are recorded per channel.
+
+Example:
+    >>> clients = NotificationChannelClients(max_concurrency=4)
+    >>> success = await clients.deliver("webhook", send_webhook)
+    >>> clients.get_stats()["channels"]["webhook"]["avg_latency_ms"]
+    >>> await clients.close()
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+try:
+    import apprise
+
+    APPRISE_AVAILABLE = True
+except ImportError:
+    APPRISE_AVAILABLE = False
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Apprise instances kept per distinct URL (device/priority variants); least
+# recently used instances are dropped beyond this
+MAX_APPRISE_CLIENTS = 32
+
+# Seconds an idle pooled HTTP connection is kept open for reuse
+HTTP_KEEPALIVE_TIMEOUT = 60.0
+
+
+class CircuitOpenError(Exception):
+    """Raised when a delivery is rejected because the channel's circuit is open."""
+
+    def __init__(self, channel: str, retry_after: float):
+        super().__init__(f"Circuit open for channel {channel}, retry in {retry_after:.0f}s")
+        self.channel = channel
+        self.retry_after = retry_after
+
+
+class ChannelCircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one delivery channel.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    deliveries are rejected for ``recovery_timeout`` seconds. One trial
+    delivery is then let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 60.0):
+        """
+        Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds before a trial delivery is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Seconds until the open circuit allows a trial delivery."""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Check whether a delivery may be attempted.
+
+        Returns:
+            True if the delivery may proceed
+        """
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if self.retry_after() > 0:
+                return False
+            self.state = "half_open"
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful delivery and close the circuit."""
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed delivery, opening the circuit if the threshold is hit."""
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.trips += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+class NotificationChannelClients:
+    """
+    Pooled delivery clients with per-channel concurrency limits, circuit
+    breakers and latency metrics.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 60.0,
+        max_apprise_clients: int = MAX_APPRISE_CLIENTS,
+        max_connections: int = 10,
+    ):
+        """
+        Initialize the client pool.
+
+        Args:
+            max_concurrency: Concurrent deliveries allowed per channel
+            failure_threshold: Consecutive failures that open a channel's circuit
+            recovery_timeout: Seconds an open circuit rejects deliveries
+            max_apprise_clients: Apprise instances cached by URL
+            max_connections: Connection limit of the shared HTTP session
+        """
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_apprise_clients = max_apprise_clients
+        self.max_connections = max_connections
+
+        self._apprise: OrderedDict[str, Any] = OrderedDict()
+        self._http_session: aiohttp.ClientSession | None = None
+        self._limits: dict[str, asyncio.Semaphore] = {}
+        self._breakers: dict[str, ChannelCircuitBreaker] = {}
+        self._channels: dict[str, dict[str, Any]] = {}
+
+        # [created, reused] per client kind and for pooled TCP connections
+        self._client_reuse: dict[str, list[int]] = {"apprise": [0, 0], "http_session": [0, 0]}
+        self._connection_reuse = [0, 0]
+
+    def get_apprise(self, url: str) -> Any:
+        """
+        Get the cached Apprise instance for a URL, creating it on first use.
+
+        Args:
+            url: Apprise service URL
+
+        Returns:
+            Apprise instance with the URL added, or None if Apprise is unavailable
+        """
+        if not APPRISE_AVAILABLE:
+            return None
+
+        client = self._apprise.get(url)
+        if client is not None:
+            self._apprise.move_to_end(url)
+            self._client_reuse["apprise"][1] += 1
+            return client
+
+        client = apprise.Apprise()
+        client.add(url)
+        self._apprise[url] = client
+        self._client_reuse["apprise"][0] += 1
+        if len(self._apprise) > self.max_apprise_clients:
+            self._apprise.popitem(last=False)
+        return client
+
+    async def get_http_session(
+        self, verify_ssl: bool = True, timeout: float = 30.0
+    ) -> "aiohttp.ClientSession | None":
+        """
+        Get the shared keep-alive HTTP session, creating it on first use.
+
+        Args:
+            verify_ssl: Whether to verify SSL certificates
+            timeout: Default total request timeout in seconds
+
+        Returns:
+            Client session, or None if aiohttp is unavailable
+        """
+        if not AIOHTTP_AVAILABLE:
+            return None
+
+        if self._http_session is not None and not self._http_session.closed:
+            self._client_reuse["http_session"][1] += 1
+            return self._http_session
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ssl=None if verify_ssl else False,
+        )
+        self._http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers={"User-Agent": "CoachIQ-Webhook-Client/1.0"},
+            trace_configs=[trace_config],
+        )
+        self._client_reuse["http_session"][0] += 1
+        return self._http_session
+
+    async def _on_connection_created(self, session, context, params) -> None:
+        self._connection_reuse[0] += 1
+
+    async def _on_connection_reused(self, session, context, params) -> None:
+        self._connection_reuse[1] += 1
+
+    def _channel_state(self, channel: str) -> dict[str, Any]:
+        state = self._channels.get(channel)
+        if state is None:
+            state = self._channels[channel] = {
+                "deliveries": 0,
+                "failures": 0,
+                "rejected": 0,
+                "in_flight": 0,
+                "total_latency_ms": 0.0,
+                "max_latency_ms": 0.0,
+                "last_latency_ms": 0.0,
+            }
+            self._limits[channel] = asyncio.Semaphore(self.max_concurrency)
+            self._breakers[channel] = ChannelCircuitBreaker(
+                self.failure_threshold, self.recovery_timeout
+            )
+        return state
+
+    async def deliver(self, channel: str, send: Callable[[], Awaitable[bool]]) -> bool:
+        """
+        Run one delivery through the channel's circuit breaker and concurrency limit.
+
+        Args:
+            channel: Channel name
+            send: Coroutine factory performing the delivery
+
+        Returns:
+            Whether the delivery succeeded
+
+        Raises:
+            CircuitOpenError: If the channel's circuit is open
+        """
+        state = self._channel_state(channel)
+        breaker = self._breakers[channel]
+        if not breaker.allow():
+            state["rejected"] += 1
+            raise CircuitOpenError(channel, breaker.retry_after())
+
+        async with self._limits[channel]:
+            state["in_flight"] += 1
+            started = time.perf_counter()
+            success = False
+            try:
+                success = await send()
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                state["in_flight"] -= 1
+                state["deliveries"] += 1
+                state["total_latency_ms"] += elapsed_ms
+                state["last_latency_ms"] = elapsed_ms
+                state["max_latency_ms"] = max(state["max_latency_ms"], elapsed_ms)
+                if success:
+                    breaker.record_success()
+                else:
+                    state["failures"] += 1
+                    breaker.record_failure()
+        return success
+
+    async def close(self) -> None:
+        """Close the HTTP session and drop cached clients."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        self._apprise.clear()
+
+    @staticmethod
+    def _reuse_rate(counts: list[int]) -> float:
+        total = counts[0] + counts[1]
+        return counts[1] / total if total else 0.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool metrics.
+
+        Returns:
+            Client and connection reuse rates plus latency, failure and circuit
+            state per channel
+        """
+        channels = {}
+        for channel, state in self._channels.items():
+            breaker = self._breakers[channel]
+            deliveries = state["deliveries"]
+            channels[channel] = {
+                **state,
+                "avg_latency_ms": state["total_latency_ms"] / deliveries if deliveries else 0.0,
+                "circuit_state": breaker.state,
+                "circuit_trips": breaker.trips,
+            }
+        return {
+            "clients": {
+                kind: {
+                    "created": counts[0],
+                    "reused": counts[1],
+                    "reuse_rate": self._reuse_rate(counts),
+                }
+                for kind, counts in self._client_reuse.items()
+            },
+            "connections": {
+                "created": self._connection_reuse[0],
+                "reused": self._connection_reuse[1],
+                "reuse_rate": self._reuse_rate(self._connection_reuse),
+            },
+            "cached_apprise_clients": len(self._apprise),
+            "channels": channels,
+        }
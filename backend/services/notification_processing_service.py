@@ -111,13 +111,14 @@ class NotificationProcessingService:
             else:
                 delivery_logs.append(entry)
 
-        # Save delivery logs
+        # Hand delivery logs to the repository's batched flusher
         if delivery_logs:
-            success = await self._repository.save_delivery_logs(delivery_logs)
-            if success:
-                logger.debug(f"Processed {len(delivery_logs)} delivery logs")
-            else:
-                logger.error(f"Failed to save {len(delivery_logs)} delivery logs")
+            await self._repository.buffer_delivery_logs(delivery_logs)
+            logger.debug(f"Buffered {len(delivery_logs)} delivery logs")
+
+        # Engagement updates target persisted logs, so flush anything pending first
+        if engagement_updates and self._repository.get_buffer_size():
+            await self._repository.flush_pending()
 
         # Process engagement updates
         for engagement in engagement_updates:
@@ -8,6 +8,7 @@ spam in safety-critical RV-C environments.
 Key Features:
 - Token bucket algorithm for smooth rate limiting
 - Notification debouncing with configurable time windows
+- Hierarchical timing wheel for O(1) suppression expiry
 - Per-channel rate limiting capabilities
 - Comprehensive monitoring and statistics
 - Thread-safe async implementation
@@ -25,13 +26,18 @@ Example:
 import asyncio
 import hashlib
 import logging
+import math
 import time
-from collections import deque
+from collections import OrderedDict, deque
+from collections.abc import Hashable, Iterator
 from datetime import datetime, timedelta
 from typing import Any
 
 from backend.models.notification import RateLimitStatus
 
+# Context fields that change per occurrence and must not affect message identity
+VOLATILE_CONTEXT_KEYS = frozenset({"timestamp", "id", "created_at", "correlation_id"})
+
 
 class TokenBucketRateLimiter:
     """
@@ -76,12 +82,12 @@ class TokenBucketRateLimiter:
         self.logger = logging.getLogger(f"{__name__}.TokenBucketRateLimiter")
         self._lock = asyncio.Lock()
 
-    async def allow(self, identifier: str | None = None) -> bool:
+    async def allow(self, identifier: Hashable | None = None) -> bool:
         """
         Check if request should be allowed.
 
         Args:
-            identifier: Optional identifier for tracking (message content hash)
+            identifier: Optional identifier for tracking (message content key)
 
         Returns:
             bool: True if request is allowed
@@ -114,7 +120,7 @@ class TokenBucketRateLimiter:
                 return True
             self.blocked_requests += 1
             if identifier:
-                self.logger.debug(f"Rate limited request: {identifier[:50]}...")
+                self.logger.debug(f"Rate limited request: {str(identifier)[:50]}...")
             return False
 
     async def _refill_tokens(self, current_time: float) -> None:
@@ -128,7 +134,11 @@ class TokenBucketRateLimiter:
 
     def get_status(self) -> RateLimitStatus:
         """Get current rate limiter status."""
-        requests_last_minute = len([ts for ts in self.request_timestamps if time.time() - ts <= 60])
+        # Timestamps are appended in order, so the window is the deque's tail
+        cutoff_time = time.time() - 60
+        while self.request_timestamps and self.request_timestamps[0] < cutoff_time:
+            self.request_timestamps.popleft()
+        requests_last_minute = len(self.request_timestamps)
 
         return RateLimitStatus(
             current_tokens=int(self.current_tokens),
@@ -155,6 +165,157 @@ class TokenBucketRateLimiter:
             self.logger.info("Rate limiter reset")
 
 
+class TimingWheel:
+    """
+    Hierarchical timing wheel for expiring keys.
+
+    Keys are bucketed by deadline tick into levels of 64 slots, each level
+    covering 64 times the span of the one below. Scheduling, rescheduling and
+    cancelling a key are O(1); advancing the wheel touches only the slot for
+    each elapsed tick, cascading higher-level slots down as their range comes
+    due. Ticks on which no slot can come due are skipped, so an idle wheel
+    holding only long deadlines advances in a few steps. Keys expire at most
+    one tick late and never early.
+    """
+
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    SLOT_MASK = SLOTS - 1
+
+    def __init__(self, tick_seconds: float = 1.0, levels: int = 4, start: float | None = None):
+        """
+        Initialize an empty wheel.
+
+        Args:
+            tick_seconds: Expiry resolution in seconds
+            levels: Wheel levels; the wheel spans ``64 ** levels`` ticks
+            start: Current time in seconds (defaults to ``time.monotonic()``)
+        """
+        self.tick_seconds = tick_seconds
+        self.levels = levels
+        self._wheels: list[list[dict[Hashable, int]]] = [
+            [{} for _ in range(self.SLOTS)] for _ in range(levels)
+        ]
+        # key -> (level, slot) so a key can be moved or cancelled without a search
+        self._locations: dict[Hashable, tuple[int, int]] = {}
+        self._level_counts = [0] * levels
+        self._current = self._tick_for(time.monotonic() if start is None else start)
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._locations
+
+    def _tick_for(self, seconds: float) -> int:
+        return math.floor(seconds / self.tick_seconds)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """
+        Schedule a key to expire at a deadline, replacing any earlier schedule.
+
+        Args:
+            key: Key to expire
+            deadline: Expiry time in seconds on the wheel's clock
+        """
+        self.cancel(key)
+        self._insert(key, math.ceil(deadline / self.tick_seconds))
+
+    def _insert(self, key: Hashable, deadline_tick: int) -> None:
+        # The level is the highest 6-bit group in which the deadline differs
+        # from the current tick; the slot comes due exactly when the current
+        # tick reaches the deadline's prefix at that level.
+        deadline_tick = max(deadline_tick, self._current)
+        level = max(0, ((deadline_tick ^ self._current).bit_length() - 1) // self.SLOT_BITS)
+        level = min(level, self.levels - 1)
+        slot = (deadline_tick >> (level * self.SLOT_BITS)) & self.SLOT_MASK
+        self._wheels[level][slot][key] = deadline_tick
+        self._locations[key] = (level, slot)
+        self._level_counts[level] += 1
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Remove a key from the wheel.
+
+        Args:
+            key: Key to remove
+
+        Returns:
+            True if the key was scheduled
+        """
+        location = self._locations.pop(key, None)
+        if location is None:
+            return False
+        level, slot = location
+        del self._wheels[level][slot][key]
+        self._level_counts[level] -= 1
+        return True
+
+    def advance(self, now: float | None = None) -> Iterator[Hashable]:
+        """
+        Advance the wheel to ``now`` and yield keys whose deadline has passed.
+
+        Args:
+            now: Current time in seconds (defaults to ``time.monotonic()``)
+
+        Yields:
+            Expired keys
+        """
+        target = self._tick_for(time.monotonic() if now is None else now)
+        if not self._locations:
+            self._current = max(self._current, target)
+            return
+
+        while self._current < target:
+            # With every level below L empty, nothing can happen before the
+            # next tick on which level L's slot changes
+            lowest = 0
+            while lowest < self.levels - 1 and not self._level_counts[lowest]:
+                lowest += 1
+            if lowest:
+                span = 1 << (lowest * self.SLOT_BITS)
+                next_tick = (self._current // span + 1) * span
+                if next_tick > target:
+                    self._current = target
+                    return
+                self._current = next_tick
+            else:
+                self._current += 1
+            tick = self._current
+
+            # Cascade higher levels whose lower-level bits just wrapped to zero
+            level = 1
+            while level < self.levels and not (tick & ((1 << (level * self.SLOT_BITS)) - 1)):
+                slot = (tick >> (level * self.SLOT_BITS)) & self.SLOT_MASK
+                entries = self._wheels[level][slot]
+                if entries:
+                    self._wheels[level][slot] = {}
+                    self._level_counts[level] -= len(entries)
+                    for key, deadline_tick in entries.items():
+                        self._insert(key, deadline_tick)
+                level += 1
+
+            slot = tick & self.SLOT_MASK
+            entries = self._wheels[0][slot]
+            if entries:
+                self._wheels[0][slot] = {}
+                self._level_counts[0] -= len(entries)
+                for key in entries:
+                    del self._locations[key]
+                    yield key
+                if not self._locations:
+                    self._current = target
+                    return
+
+    def clear(self) -> None:
+        """Remove every key."""
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._locations.clear()
+        self._level_counts = [0] * self.levels
+
+
 class NotificationDebouncer:
     """
     Notification debouncing to prevent spam and duplicate alerts.
@@ -176,99 +337,96 @@ class NotificationDebouncer:
         Args:
             suppress_window_minutes: Time window for suppressing duplicates
             max_tracked_items: Maximum items to track (memory protection)
-            cleanup_interval_minutes: How often to clean up old entries
+            cleanup_interval_minutes: How often to expire entries while idle
         """
         self.suppress_window = timedelta(minutes=suppress_window_minutes)
         self.max_tracked_items = max_tracked_items
         self.cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
+        self._window_seconds = self.suppress_window.total_seconds()
 
-        # Track: {(content_hash, level): last_sent_time}
-        self.suppressed_notifications: dict[tuple[str, str], datetime] = {}
+        # Track: {(content_key, level): last_sent_monotonic}, oldest first
+        self.suppressed_notifications: OrderedDict[tuple[Hashable, str], float] = OrderedDict()
+        # Expires tracked keys once their window has passed
+        self._expiry_wheel = TimingWheel()
 
         # Statistics
         self.total_checks = 0
         self.suppressed_count = 0
+        self.evicted_count = 0
         self.last_cleanup = datetime.utcnow()
 
         self.logger = logging.getLogger(f"{__name__}.NotificationDebouncer")
-        self._lock = asyncio.Lock()
 
         # Start background cleanup task
         asyncio.create_task(self._cleanup_loop())
 
-    async def allow(self, message: str, level: str = "info", custom_key: str | None = None) -> bool:
+    async def allow(
+        self, message: str, level: str = "info", custom_key: Hashable | None = None
+    ) -> bool:
         """
         Check if notification should be allowed (not suppressed).
 
+        The check never awaits, so it is atomic on the event loop and needs
+        no lock.
+
         Args:
             message: Notification message content
             level: Notification level (info, warning, error, etc.)
-            custom_key: Optional custom key for grouping
+            custom_key: Optional hashable key for grouping, such as the
+                tuple from :func:`create_message_key`
 
         Returns:
             bool: True if notification should be sent
         """
-        async with self._lock:
-            self.total_checks += 1
+        self.total_checks += 1
+        current_time = time.monotonic()
+        self._expire_entries(current_time)
+
+        suppression_key = (custom_key or message, level.lower())
+
+        # Check if this notification was recently sent
+        last_sent = self.suppressed_notifications.get(suppression_key)
+        if last_sent is not None and current_time - last_sent < self._window_seconds:
+            self.suppressed_count += 1
+            self.logger.debug(
+                f"Suppressed duplicate notification: {message[:50]}... (level: {level})"
+            )
+            return False
 
-            # Create suppression key
-            if custom_key:
-                content_hash = custom_key
-            else:
-                # Hash message content for consistent key generation
-                content_hash = hashlib.md5(
-                    message.encode("utf-8"), usedforsecurity=False
-                ).hexdigest()
-
-            suppression_key = (content_hash, level.lower())
-            current_time = datetime.utcnow()
-
-            # Check if this notification was recently sent
-            if suppression_key in self.suppressed_notifications:
-                last_sent = self.suppressed_notifications[suppression_key]
-                if current_time - last_sent < self.suppress_window:
-                    self.suppressed_count += 1
-                    self.logger.debug(
-                        f"Suppressed duplicate notification: {message[:50]}... (level: {level})"
-                    )
-                    return False
-
-            # Allow notification and update tracking
-            self.suppressed_notifications[suppression_key] = current_time
-
-            # Trigger cleanup if needed
-            if len(self.suppressed_notifications) > self.max_tracked_items:
-                await self._cleanup_old_entries()
+        # Allow notification and move the key to the newest position
+        self.suppressed_notifications[suppression_key] = current_time
+        self.suppressed_notifications.move_to_end(suppression_key)
+        self._expiry_wheel.schedule(suppression_key, current_time + self._window_seconds)
 
-            return True
+        # Memory protection: drop the oldest suppressions
+        while len(self.suppressed_notifications) > self.max_tracked_items:
+            oldest, _ = self.suppressed_notifications.popitem(last=False)
+            self._expiry_wheel.cancel(oldest)
+            self.evicted_count += 1
 
-    async def _cleanup_old_entries(self) -> None:
-        """Clean up old suppression entries."""
-        current_time = datetime.utcnow()
-        cutoff_time = current_time - self.suppress_window
-
-        # Remove entries older than suppression window
-        old_keys = [
-            key
-            for key, timestamp in self.suppressed_notifications.items()
-            if timestamp < cutoff_time
-        ]
+        return True
 
-        for key in old_keys:
-            del self.suppressed_notifications[key]
+    def _expire_entries(self, current_time: float) -> int:
+        """Remove entries whose suppression window has passed."""
+        expired = 0
+        for key in self._expiry_wheel.advance(current_time):
+            self.suppressed_notifications.pop(key, None)
+            expired += 1
+        return expired
 
-        if old_keys:
-            self.logger.debug(f"Cleaned up {len(old_keys)} old debounce entries")
+    async def _cleanup_old_entries(self) -> None:
+        """Clean up old suppression entries."""
+        expired = self._expire_entries(time.monotonic())
+        if expired:
+            self.logger.debug(f"Cleaned up {expired} old debounce entries")
 
     async def _cleanup_loop(self) -> None:
-        """Background cleanup loop."""
+        """Background cleanup loop, so idle entries are released without new checks."""
         while True:
             try:
                 await asyncio.sleep(self.cleanup_interval.total_seconds())
-
-                async with self._lock:
-                    await self._cleanup_old_entries()
-                    self.last_cleanup = datetime.utcnow()
+                await self._cleanup_old_entries()
+                self.last_cleanup = datetime.utcnow()
 
             except asyncio.CancelledError:
                 break
@@ -282,6 +440,7 @@ class NotificationDebouncer:
             "suppressed_count": self.suppressed_count,
             "suppression_rate": self.suppressed_count / max(1, self.total_checks),
             "active_suppressions": len(self.suppressed_notifications),
+            "evicted_count": self.evicted_count,
             "suppress_window_minutes": self.suppress_window.total_seconds() / 60,
             "last_cleanup": self.last_cleanup.isoformat(),
             "memory_usage_items": len(self.suppressed_notifications),
@@ -292,32 +451,30 @@ class NotificationDebouncer:
         Clear suppression entries, optionally matching a pattern.
 
         Args:
-            pattern: Optional pattern to match against message content
+            pattern: Optional message content (or custom key) to clear
 
         Returns:
             int: Number of suppressions cleared
         """
-        async with self._lock:
-            if pattern is None:
-                # Clear all
-                count = len(self.suppressed_notifications)
-                self.suppressed_notifications.clear()
-                self.logger.info(f"Cleared all {count} debounce suppressions")
-                return count
-            # Clear matching pattern
-            pattern_hash = hashlib.md5(pattern.encode("utf-8"), usedforsecurity=False).hexdigest()
-            keys_to_remove = [
-                key for key in self.suppressed_notifications if key[0] == pattern_hash
-            ]
-
-            for key in keys_to_remove:
-                del self.suppressed_notifications[key]
-
-            count = len(keys_to_remove)
-            if count > 0:
-                self.logger.info(f"Cleared {count} debounce suppressions matching pattern")
-
+        if pattern is None:
+            # Clear all
+            count = len(self.suppressed_notifications)
+            self.suppressed_notifications.clear()
+            self._expiry_wheel.clear()
+            self.logger.info(f"Cleared all {count} debounce suppressions")
             return count
+        # Clear matching pattern (one key per level)
+        keys_to_remove = [key for key in self.suppressed_notifications if key[0] == pattern]
+
+        for key in keys_to_remove:
+            del self.suppressed_notifications[key]
+            self._expiry_wheel.cancel(key)
+
+        count = len(keys_to_remove)
+        if count > 0:
+            self.logger.info(f"Cleared {count} debounce suppressions matching pattern")
+
+        return count
 
 
 class ChannelSpecificRateLimiter:
@@ -351,7 +508,7 @@ class ChannelSpecificRateLimiter:
 
         self.logger = logging.getLogger(f"{__name__}.ChannelSpecificRateLimiter")
 
-    async def allow(self, channel: str, identifier: str | None = None) -> bool:
+    async def allow(self, channel: str, identifier: Hashable | None = None) -> bool:
         """
         Check if request is allowed for specific channel.
 
@@ -439,7 +596,7 @@ class AdaptiveRateLimiter:
         # Start health monitoring
         asyncio.create_task(self._health_monitoring_loop())
 
-    async def allow(self, identifier: str | None = None) -> bool:
+    async def allow(self, identifier: Hashable | None = None) -> bool:
         """Check if request is allowed with adaptive limiting."""
         return await self.base_limiter.allow(identifier)
 
@@ -532,26 +689,54 @@ class AdaptiveRateLimiter:
 # Utility functions
 
 
+def create_message_key(message: str, context: dict[str, Any] | None = None) -> tuple:
+    """
+    Build a structural identity key for message content and context.
+
+    The key is a tuple of the message and a frozenset of the stable context
+    items, so equality and hashing reuse Python's cached string hashes instead
+    of serializing and digesting the content. Unhashable context values are
+    represented by their ``repr``.
+
+    Args:
+        message: Notification message
+        context: Optional context data
+
+    Returns:
+        tuple: Hashable key, equal for equal content
+    """
+    if not context:
+        return (message,)
+
+    items = [(k, v) for k, v in context.items() if k not in VOLATILE_CONTEXT_KEYS]
+    try:
+        key = (message, frozenset(items))
+        hash(key)
+    except TypeError:
+        key = (message, frozenset((k, v if isinstance(v, str) else repr(v)) for k, v in items))
+    return key
+
+
 def create_message_hash(message: str, context: dict[str, Any] | None = None) -> str:
     """
-    Create consistent hash for message content and context.
+    Create a fixed-width digest of message content and context.
+
+    For callers that need a string identifier. The digest is stable across
+    processes and platforms, unlike the builtin ``hash()``, which is only
+    32 bits wide on some targets. In-process rate limiting and debouncing
+    should key on :func:`create_message_key` directly.
 
     Args:
         message: Notification message
         context: Optional context data
 
     Returns:
-        str: Consistent hash for deduplication
+        str: 16 hex character digest for deduplication
     """
+    key = create_message_key(message, context)
     content = message
-    if context:
-        # Include relevant context in hash (exclude timestamps, IDs)
-        stable_context = {
-            k: v
-            for k, v in context.items()
-            if k not in ["timestamp", "id", "created_at", "correlation_id"]
-        }
-        content += str(sorted(stable_context.items()))
+    if len(key) > 1:
+        content += repr(sorted(key[1], key=lambda item: item[0]))
 
     return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
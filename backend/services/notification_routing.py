@@ -13,6 +13,7 @@ Key Features:
 - Geographic and context-aware routing
 - A/B testing support for notification strategies
 - Emergency override capabilities
+- Rules compiled into a per-level index with cached per-key decisions
 
 Example:
     >>> router = NotificationRouter()
@@ -25,14 +26,30 @@ Example:
 
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, time
 from enum import Enum
+from time import perf_counter
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from backend.models.notification import NotificationChannel, NotificationPayload, NotificationType
 
+# Numeric rank of each level for "at least this priority" conditions
+PRIORITY_LEVELS = {
+    NotificationType.INFO.value: 1,
+    NotificationType.SUCCESS.value: 1,
+    NotificationType.WARNING.value: 2,
+    NotificationType.ERROR.value: 3,
+    NotificationType.CRITICAL.value: 4,
+}
+
+# Compiled routes kept per (level, source, tag-set); the cache is cleared when full
+MAX_ROUTE_CACHE_ENTRIES = 1024
+
+_NO_TAGS: frozenset[str] = frozenset()
+
 
 class RoutingConditionType(str, Enum):
     """Types of routing conditions."""
@@ -144,6 +161,48 @@ class SystemContext(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+def _seconds_of_day(moment: time) -> float:
+    return moment.hour * 3600 + moment.minute * 60 + moment.second + moment.microsecond / 1e6
+
+
+@dataclass(frozen=True)
+class QuietHoursWindow:
+    """Quiet hours precomputed as seconds since midnight."""
+
+    start: float
+    end: float
+
+    @classmethod
+    def from_preferences(cls, prefs: "UserNotificationPreferences") -> "QuietHoursWindow | None":
+        """Build the window for a user's preferences, or None if quiet hours are unset."""
+        if not (prefs.quiet_hours_start and prefs.quiet_hours_end):
+            return None
+        return cls(_seconds_of_day(prefs.quiet_hours_start), _seconds_of_day(prefs.quiet_hours_end))
+
+    def contains(self, moment: time) -> bool:
+        """Check whether a time of day falls within quiet hours (inclusive)."""
+        seconds = _seconds_of_day(moment)
+        if self.start <= self.end:
+            # Same day range
+            return self.start <= seconds <= self.end
+        # Overnight range
+        return seconds >= self.start or seconds <= self.end
+
+
+@dataclass(frozen=True)
+class CompiledRoute:
+    """
+    Rules that can match one (level, source, tag-set) key, in priority order.
+
+    ``contextual_rules`` depend on the message, user or system state and are
+    evaluated per notification; ``static_rule`` is the first rule that matches
+    on the key alone and applies if none of them match.
+    """
+
+    contextual_rules: tuple["RoutingRule", ...]
+    static_rule: "RoutingRule | None"
+
+
 class RoutingDecision(BaseModel):
     """Result of routing decision process."""
 
@@ -198,6 +257,14 @@ class NotificationRouter:
             RoutingConditionType.CUSTOM: self._evaluate_custom_condition,
         }
 
+        # Compiled rule index, rebuilt whenever rules change
+        self._rules_by_level: dict[str, tuple[RoutingRule, ...]] = {}
+        self._route_cache: dict[tuple[str, str | None, frozenset[str]], CompiledRoute] = {}
+        # user_id -> (preferences, precomputed quiet hours)
+        self._quiet_windows: dict[
+            str, tuple[UserNotificationPreferences, QuietHoursWindow | None]
+        ] = {}
+
         # Statistics
         self.stats = {
             "total_routings": 0,
@@ -206,6 +273,11 @@ class NotificationRouter:
             "emergency_overrides": 0,
             "default_routings": 0,
             "avg_evaluation_time_ms": 0.0,
+            "max_evaluation_time_ms": 0.0,
+            "last_evaluation_time_ms": 0.0,
+            "route_cache_hits": 0,
+            "route_cache_misses": 0,
+            "rule_index_rebuilds": 0,
         }
 
         self._initialized = False
@@ -243,11 +315,10 @@ class NotificationRouter:
         if not self._initialized:
             await self.initialize()
 
-        start_time = datetime.utcnow()
+        start_time = perf_counter()
+        self.stats["total_routings"] += 1
 
         try:
-            self.stats["total_routings"] += 1
-
             # Get user preferences
             user_prefs = None
             if user_id:
@@ -259,37 +330,37 @@ class NotificationRouter:
 
             # Check for emergency override
             if self._is_emergency_notification(notification, system_context):
-                return self._create_emergency_routing(notification, user_prefs)
-
-            # Evaluate routing rules
-            decision = await self._evaluate_routing_rules(notification, user_prefs, system_context)
-
-            # Apply user preferences
-            decision = self._apply_user_preferences(decision, user_prefs, notification)
-
-            # Create escalation plan if needed
-            if self._should_create_escalation_plan(notification, decision):
-                decision.escalation_plan = self._create_escalation_plan(
+                decision = self._create_emergency_routing(notification, user_prefs)
+            else:
+                # Evaluate routing rules
+                decision = await self._evaluate_routing_rules(
                     notification, user_prefs, system_context
                 )
 
-            # Calculate timing
-            evaluation_time = (datetime.utcnow() - start_time).total_seconds() * 1000
-            decision.rule_evaluation_time_ms = evaluation_time
-
-            # Update statistics
-            self._update_statistics(decision, evaluation_time)
-
-            self.logger.debug(
-                f"Routed notification {notification.id} to {len(decision.target_channels)} channels "
-                f"in {evaluation_time:.2f}ms"
-            )
+                # Apply user preferences
+                decision = self._apply_user_preferences(decision, user_prefs, notification)
 
-            return decision
+                # Create escalation plan if needed
+                if self._should_create_escalation_plan(notification, decision):
+                    decision.escalation_plan = self._create_escalation_plan(
+                        notification, user_prefs, system_context
+                    )
 
         except Exception as e:
             self.logger.error(f"Routing failed for notification {notification.id}: {e}")
-            return self._create_fallback_routing(notification)
+            decision = self._create_fallback_routing(notification)
+
+        # Calculate timing for every decision, including emergency and fallback routes
+        evaluation_time = (perf_counter() - start_time) * 1000
+        decision.rule_evaluation_time_ms = evaluation_time
+        self._update_statistics(decision, evaluation_time)
+
+        self.logger.debug(
+            f"Routed notification {notification.id} to {len(decision.target_channels)} channels "
+            f"in {evaluation_time:.2f}ms"
+        )
+
+        return decision
 
     async def add_routing_rule(self, rule: RoutingRule) -> bool:
         """Add new routing rule."""
@@ -311,6 +382,8 @@ class NotificationRouter:
             if not inserted:
                 self.routing_rules.append(rule)
 
+            self.rebuild_routing_index()
+
             self.logger.info(f"Added routing rule: {rule.name}")
             return True
 
@@ -325,6 +398,10 @@ class NotificationRouter:
         try:
             preferences.updated_at = datetime.utcnow()
             self.user_preferences[user_id] = preferences
+            self._quiet_windows[preferences.user_id] = (
+                preferences,
+                QuietHoursWindow.from_preferences(preferences),
+            )
 
             self.logger.info(f"Updated preferences for user {user_id}")
             return True
@@ -345,7 +422,23 @@ class NotificationRouter:
 
     def get_statistics(self) -> dict[str, Any]:
         """Get routing statistics."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["route_cache_size"] = len(self._route_cache)
+        return stats
+
+    def rebuild_routing_index(self) -> None:
+        """
+        Recompile the per-level rule index and drop cached routes.
+
+        Called when rules are added; call it after modifying a rule in place.
+        """
+        rules = [rule for rule in self.routing_rules if rule.enabled]
+        self._rules_by_level = {
+            level: tuple(rule for rule in rules if self._rule_may_match_level(rule, level))
+            for level in PRIORITY_LEVELS
+        }
+        self._route_cache.clear()
+        self.stats["rule_index_rebuilds"] += 1
 
     # Private implementation methods
 
@@ -478,6 +571,110 @@ class NotificationRouter:
             applied_rules=["emergency_override"],
         )
 
+    def _rule_may_match_level(self, rule: RoutingRule, level: str) -> bool:
+        """Check whether a rule can match at a level, whatever the other fields."""
+        conditions = rule.conditions
+        try:
+            if rule.condition_type == RoutingConditionType.PRIORITY_BASED:
+                min_priority = conditions.get("min_priority")
+                return not min_priority or PRIORITY_LEVELS.get(level, 1) >= PRIORITY_LEVELS.get(
+                    min_priority, 1
+                )
+            if rule.condition_type == RoutingConditionType.TIME_BASED:
+                return bool(conditions.get("quiet_hours")) and self._meets_quiet_hours_priority(
+                    conditions, level
+                )
+        except Exception as e:
+            self.logger.warning(f"Rule compilation failed for {rule.id}: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _meets_quiet_hours_priority(conditions: dict[str, Any], level: str) -> bool:
+        min_priority = NotificationType(conditions.get("min_priority_during_quiet", "error"))
+        if min_priority == NotificationType.ERROR:
+            return level in (NotificationType.ERROR.value, NotificationType.CRITICAL.value)
+        return True
+
+    def _static_match(
+        self, rule: RoutingRule, source: str | None, tags: frozenset[str]
+    ) -> bool | None:
+        """
+        Evaluate a rule on the (level, source, tag-set) key alone.
+
+        Level checks were applied when the per-level index was built.
+
+        Returns:
+            Whether the rule matches, or None if it depends on the message,
+            user preferences, system context or time of day
+        """
+        conditions = rule.conditions
+        if rule.condition_type == RoutingConditionType.PRIORITY_BASED:
+            return True
+        if rule.condition_type == RoutingConditionType.CUSTOM:
+            return bool(conditions.get("always_match", False))
+        if rule.condition_type == RoutingConditionType.CONTENT_BASED:
+            required_tags = conditions.get("tags", [])
+            if required_tags:
+                matched = any(tag in tags for tag in required_tags)
+            else:
+                component = conditions.get("source_component")
+                matched = bool(component) and source == component
+            # Keywords are checked before tags, so only a tag/source match is final
+            if conditions.get("keywords") and not matched:
+                return None
+            return matched
+        return None
+
+    def _compiled_route(self, notification: NotificationPayload) -> CompiledRoute:
+        """Look up or compile the route for a notification's level, source and tags."""
+        level = notification.level.value
+        source = notification.source_component
+        tags = frozenset(notification.tags) if notification.tags else _NO_TAGS
+        key = (level, source, tags)
+
+        route = self._route_cache.get(key)
+        if route is not None:
+            self.stats["route_cache_hits"] += 1
+            return route
+        self.stats["route_cache_misses"] += 1
+
+        contextual_rules = []
+        static_rule = None
+        for rule in self._rules_by_level.get(level, ()):
+            try:
+                match = self._static_match(rule, source, tags)
+            except Exception as e:
+                self.logger.warning(f"Rule evaluation failed for {rule.id}: {e}")
+                continue
+            if match is None:
+                contextual_rules.append(rule)
+            elif match:
+                static_rule = rule
+                break
+
+        route = CompiledRoute(tuple(contextual_rules), static_rule)
+        if len(self._route_cache) >= MAX_ROUTE_CACHE_ENTRIES:
+            self._route_cache.clear()
+        self._route_cache[key] = route
+        return route
+
+    def _create_rule_routing(
+        self, notification: NotificationPayload, rule: RoutingRule
+    ) -> RoutingDecision:
+        """Create routing decision for a matched rule."""
+        self.stats["rule_matches"] += 1
+        return RoutingDecision(
+            notification_id=notification.id,
+            target_channels=rule.target_channels.copy(),
+            channel_priorities={
+                channel.value: 100 - rule.priority for channel in rule.target_channels
+            },
+            immediate_delivery=True,
+            routing_reason=f"rule_match:{rule.id}",
+            applied_rules=[rule.id],
+        )
+
     async def _evaluate_routing_rules(
         self,
         notification: NotificationPayload,
@@ -485,39 +682,27 @@ class NotificationRouter:
         system_context: SystemContext,
     ) -> RoutingDecision:
         """Evaluate routing rules to determine best match."""
-        context = {
-            "notification": notification,
-            "user_preferences": user_prefs,
-            "system_context": system_context,
-        }
-
-        # Evaluate rules in priority order
-        for rule in self.routing_rules:
-            if not rule.enabled:
-                continue
-
-            try:
-                evaluator = self.condition_evaluators.get(rule.condition_type)
-                if not evaluator:
+        route = self._compiled_route(notification)
+
+        # Rules that depend on per-notification context, in priority order
+        if route.contextual_rules:
+            context = {
+                "notification": notification,
+                "user_preferences": user_prefs,
+                "system_context": system_context,
+            }
+            for rule in route.contextual_rules:
+                try:
+                    evaluator = self.condition_evaluators[rule.condition_type]
+                    if await evaluator(rule.conditions, context):
+                        return self._create_rule_routing(notification, rule)
+
+                except Exception as e:
+                    self.logger.warning(f"Rule evaluation failed for {rule.id}: {e}")
                     continue
 
-                if await evaluator(rule.conditions, context):
-                    self.stats["rule_matches"] += 1
-
-                    return RoutingDecision(
-                        notification_id=notification.id,
-                        target_channels=rule.target_channels.copy(),
-                        channel_priorities={
-                            channel.value: 100 - rule.priority for channel in rule.target_channels
-                        },
-                        immediate_delivery=True,
-                        routing_reason=f"rule_match:{rule.id}",
-                        applied_rules=[rule.id],
-                    )
-
-            except Exception as e:
-                self.logger.warning(f"Rule evaluation failed for {rule.id}: {e}")
-                continue
+        if route.static_rule is not None:
+            return self._create_rule_routing(notification, route.static_rule)
 
         # No rules matched - use default routing
         self.stats["default_routings"] += 1
@@ -535,36 +720,17 @@ class NotificationRouter:
         user_prefs = context.get("user_preferences")
 
         if conditions.get("quiet_hours") and user_prefs:
-            current_time = datetime.utcnow().time()
-
-            if user_prefs.quiet_hours_start and user_prefs.quiet_hours_end:
-                # Check if current time is in quiet hours
-                start = user_prefs.quiet_hours_start
-                end = user_prefs.quiet_hours_end
-
-                if start <= end:
-                    # Same day range
-                    in_quiet_hours = start <= current_time <= end
-                else:
-                    # Overnight range
-                    in_quiet_hours = current_time >= start or current_time <= end
-
-                if in_quiet_hours:
-                    # Check if notification priority meets threshold
-                    notification = context["notification"]
-                    min_priority = NotificationType(
-                        conditions.get("min_priority_during_quiet", "error")
-                    )
-
-                    return (
-                        notification.level.value
-                        in [
-                            NotificationType.ERROR.value,
-                            NotificationType.CRITICAL.value,
-                        ]
-                        if min_priority == NotificationType.ERROR
-                        else True
-                    )
+            # Use the window precomputed when the preferences were stored
+            cached = self._quiet_windows.get(user_prefs.user_id)
+            if cached is not None and cached[0] is user_prefs:
+                window = cached[1]
+            else:
+                window = QuietHoursWindow.from_preferences(user_prefs)
+
+            if window is not None and window.contains(datetime.utcnow().time()):
+                # Check if notification priority meets threshold
+                notification = context["notification"]
+                return self._meets_quiet_hours_priority(conditions, notification.level.value)
 
         return False
 
@@ -578,16 +744,8 @@ class NotificationRouter:
         if not min_priority:
             return True
 
-        priority_levels = {
-            NotificationType.INFO.value: 1,
-            NotificationType.SUCCESS.value: 1,
-            NotificationType.WARNING.value: 2,
-            NotificationType.ERROR.value: 3,
-            NotificationType.CRITICAL.value: 4,
-        }
-
-        notification_level = priority_levels.get(notification.level.value, 1)
-        required_level = priority_levels.get(min_priority, 1)
+        notification_level = PRIORITY_LEVELS.get(notification.level.value, 1)
+        required_level = PRIORITY_LEVELS.get(min_priority, 1)
 
         return notification_level >= required_level
 
@@ -811,11 +969,15 @@ class NotificationRouter:
 
     def _update_statistics(self, decision: RoutingDecision, evaluation_time_ms: float) -> None:
         """Update routing statistics."""
-        # Update average evaluation time
+        # Update routing latency
         total_time = self.stats["avg_evaluation_time_ms"] * (self.stats["total_routings"] - 1)
         self.stats["avg_evaluation_time_ms"] = (total_time + evaluation_time_ms) / self.stats[
             "total_routings"
         ]
+        self.stats["last_evaluation_time_ms"] = evaluation_time_ms
+        self.stats["max_evaluation_time_ms"] = max(
+            self.stats["max_evaluation_time_ms"], evaluation_time_ms
+        )
 
         # Count escalations
         if decision.escalation_plan:
@@ -53,7 +53,7 @@ from backend.services.notification_rate_limiting import (
     ChannelSpecificRateLimiter,
     NotificationDebouncer,
     TokenBucketRateLimiter,
-    create_message_hash,
+    create_message_key,
 )
 from backend.services.notification_routing import NotificationRouter, SystemContext
 
@@ -197,17 +197,18 @@ class SafeNotificationManager:
             if isinstance(level, str):
                 level = NotificationType(level.lower())
 
-            # Create message hash for rate limiting and deduplication
-            message_hash = create_message_hash(message, context)
+            # Structural content key for rate limiting and deduplication; a
+            # truncated hash here could collide and suppress a different alert
+            message_key = create_message_key(message, context)
 
             # Apply rate limiting
-            if self.rate_limiter and not await self.rate_limiter.allow(message_hash):
+            if self.rate_limiter and not await self.rate_limiter.allow(message_key):
                 self.stats["rate_limited_notifications"] += 1
                 self.logger.warning(f"Rate limited notification: {message[:50]}...")
                 return False
 
             # Apply debouncing
-            debounce_key = f"{level.value}:{message_hash}"
+            debounce_key = (level.value, message_key)
             if self.debouncer and not await self.debouncer.allow(
                 message, level.value, debounce_key
             ):
@@ -272,7 +273,7 @@ class SafeNotificationManager:
             allowed_channels = []
             for channel in target_channels:
                 if self.channel_rate_limiter and await self.channel_rate_limiter.allow(
-                    channel, message_hash
+                    channel, message_key
                 ):
                     allowed_channels.append(channel)
                 elif not self.channel_rate_limiter:
@@ -0,0 +1,205 @@
+"""
+Append-only on-disk journal for the safety audit trail.
+
+Entries are written as JSON lines. Appends only queue the serialized line;
+a background task writes and fsyncs queued lines in batches (every
+``flush_interval`` seconds or once ``batch_size`` lines are waiting), so a
+burst of interlock events costs one fsync instead of one per event. Callers
+that need an entry on disk before continuing (emergency stops) await
+:meth:`SafetyAuditJournal.flush_async`.
+
+The journal rotates to ``<name>.1`` once it exceeds ``max_bytes``, keeping at
+most two files on the SD card.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+
+class SafetyAuditJournal:
+    """
+    Batched, fsync'd JSON-lines journal for safety audit entries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        flush_interval: float = 1.0,
+        batch_size: int = 50,
+        max_bytes: int = 5 * 1024 * 1024,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file path
+            flush_interval: Maximum seconds an appended entry waits before fsync
+            batch_size: Queued entries that trigger an early flush
+            max_bytes: Size at which the journal is rotated
+        """
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+        self._appended = 0
+        self._written = 0
+        self._fsyncs = 0
+        self._rotations = 0
+        self._write_errors = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def rotated_path(self) -> Path:
+        """Path of the previous journal file."""
+        return self.path.with_name(self.path.name + ".1")
+
+    def load_recent(self, limit: int) -> list[dict[str, Any]]:
+        """
+        Read the most recent entries from the rotated and current journal.
+
+        A truncated final line (power loss mid-write) is skipped.
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            Entries, oldest first
+        """
+        entries: deque[dict[str, Any]] = deque(maxlen=limit)
+        for path in (self.rotated_path, self.path):
+            try:
+                with path.open(encoding="utf-8") as f:
+                    for line in f:
+                        with suppress(ValueError):
+                            entries.append(json.loads(line))
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error("Failed to read safety audit journal %s: %s", path, e)
+        return list(entries)
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """
+        Queue an entry for the next batched write.
+
+        Args:
+            entry: JSON-serializable audit entry
+        """
+        line = json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+        with self._pending_lock:
+            self._pending.append(line)
+            queued = len(self._pending)
+        self._appended += 1
+        if queued >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Write queued entries and fsync the journal (blocking).
+
+        Returns:
+            Number of entries written
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                lines, self._pending = self._pending, []
+            if not lines:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = self.path.open("a", encoding="utf-8")
+                self._file.writelines(lines)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._fsyncs += 1
+                self._written += len(lines)
+                if self._file.tell() >= self.max_bytes:
+                    self._rotate()
+            except OSError as e:
+                self._write_errors += 1
+                logger.error("Failed to write safety audit journal: %s", e)
+                # Keep the entries for the next attempt
+                with self._pending_lock:
+                    self._pending[:0] = lines
+                return 0
+            finally:
+                self._last_flush_ms = (time.perf_counter() - started) * 1000
+            return len(lines)
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.replace(self.path, self.rotated_path)
+        self._rotations += 1
+
+    async def flush_async(self) -> int:
+        """Write queued entries and fsync without blocking the event loop."""
+        return await asyncio.to_thread(self.flush)
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task, write remaining entries and close the file."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            self._wakeup = None
+        await self.flush_async()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            if self._pending:
+                await self.flush_async()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get journal metrics.
+
+        Returns:
+            Entry, fsync, rotation and error counts plus the last flush time
+        """
+        return {
+            "path": str(self.path),
+            "appended": self._appended,
+            "written": self._written,
+            "pending": len(self._pending),
+            "fsyncs": self._fsyncs,
+            "rotations": self._rotations,
+            "write_errors": self._write_errors,
+            "last_flush_ms": round(self._last_flush_ms, 3),
+        }
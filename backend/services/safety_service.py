@@ -12,13 +12,18 @@ Implements ISO 26262-inspired safety patterns including:
 import asyncio
 import logging
 import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
 from backend.core.safety_interfaces import SafeStateAction
+from backend.services.safety_audit_journal import SafetyAuditJournal
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +55,80 @@ class ModeSession:
     active_overrides: dict[str, datetime]  # interlock_name -> override_expiry
 
 
+@dataclass(frozen=True)
+class InterlockCondition:
+    """
+    Interlock condition compiled to a predicate over the system state.
+
+    ``inputs`` lists the system state keys the predicate reads, so the
+    service only re-evaluates interlocks whose inputs actually changed.
+    """
+
+    name: str
+    inputs: frozenset[str]
+    predicate: Callable[[dict[str, Any]], bool]
+
+    def __call__(self, system_state: dict[str, Any]) -> bool:
+        return bool(self.predicate(system_state))
+
+
+VEHICLE_SPEED_THRESHOLD_MPH = 0.5
+
+INTERLOCK_CONDITIONS: dict[str, InterlockCondition] = {
+    condition.name: condition
+    for condition in (
+        InterlockCondition(
+            "vehicle_not_moving",
+            frozenset({"vehicle_speed"}),
+            lambda s: s.get("vehicle_speed", 0) < VEHICLE_SPEED_THRESHOLD_MPH,
+        ),
+        InterlockCondition(
+            "parking_brake_engaged",
+            frozenset({"parking_brake"}),
+            lambda s: s.get("parking_brake", False),
+        ),
+        InterlockCondition(
+            "leveling_jacks_deployed",
+            frozenset({"leveling_jacks_down"}),
+            lambda s: s.get("leveling_jacks_down", False),
+        ),
+        InterlockCondition(
+            "engine_not_running",
+            frozenset({"engine_running"}),
+            lambda s: not s.get("engine_running", False),
+        ),
+        InterlockCondition(
+            "transmission_in_park",
+            frozenset({"transmission_gear"}),
+            lambda s: s.get("transmission_gear", "") == "PARK",
+        ),
+        InterlockCondition(
+            "slide_rooms_retracted",
+            frozenset({"all_slides_retracted"}),
+            lambda s: s.get("all_slides_retracted", True),
+        ),
+    )
+}
+
+
+def compile_condition(condition: str) -> InterlockCondition:
+    """
+    Look up the compiled predicate for a condition name.
+
+    Args:
+        condition: Condition name (e.g. ``"parking_brake_engaged"``)
+
+    Returns:
+        Compiled condition; unknown names compile to an always-false
+        predicate so the interlock fails safe
+    """
+    compiled = INTERLOCK_CONDITIONS.get(condition)
+    if compiled is None:
+        logger.warning("Unknown interlock condition: %s", condition)
+        compiled = InterlockCondition(condition, frozenset(), lambda _s: False)
+    return compiled
+
+
 class SafetyInterlock:
     """
     Safety interlock for position-critical features.
@@ -78,6 +157,15 @@ class SafetyInterlock:
         self.feature_name = feature_name
         self.interlock_conditions = interlock_conditions
         self.safe_state_action = safe_state_action
+        self._compiled_conditions = [compile_condition(c) for c in interlock_conditions]
+        self.input_keys: frozenset[str] = frozenset().union(
+            *(c.inputs for c in self._compiled_conditions)
+        )
+        # Evaluation latency (seconds)
+        self.evaluation_count = 0
+        self.last_evaluation_time = 0.0
+        self.max_evaluation_time = 0.0
+        self._total_evaluation_time = 0.0
         self.is_engaged = False
         self.engagement_time: datetime | None = None
         self.engagement_reason = ""
@@ -115,10 +203,34 @@ class SafetyInterlock:
                 return True, f"Overridden by {self._override_by}: {self._override_reason}"
 
         # Normal condition checking
-        for condition in self.interlock_conditions:
-            if not await self._evaluate_condition(condition, system_state):
-                return False, f"Interlock condition not met: {condition}"
-        return True, "All conditions satisfied"
+        started = time.perf_counter()
+        try:
+            for condition in self._compiled_conditions:
+                if not condition(system_state):
+                    return False, f"Interlock condition not met: {condition.name}"
+            return True, "All conditions satisfied"
+        finally:
+            elapsed = time.perf_counter() - started
+            self.evaluation_count += 1
+            self.last_evaluation_time = elapsed
+            self.max_evaluation_time = max(self.max_evaluation_time, elapsed)
+            self._total_evaluation_time += elapsed
+
+    def get_evaluation_stats(self) -> dict[str, Any]:
+        """
+        Get condition evaluation latency for this interlock.
+
+        Returns:
+            Evaluation count and last/average/max latency in milliseconds
+        """
+        count = self.evaluation_count
+        return {
+            "evaluations": count,
+            "last_ms": round(self.last_evaluation_time * 1000, 4),
+            "avg_ms": round(self._total_evaluation_time / count * 1000, 4) if count else 0.0,
+            "max_ms": round(self.max_evaluation_time * 1000, 4),
+            "inputs": sorted(self.input_keys),
+        }
 
     async def _evaluate_condition(self, condition: str, system_state: dict[str, Any]) -> bool:
         """
@@ -131,23 +243,7 @@ class SafetyInterlock:
         Returns:
             True if condition is met
         """
-        # Parse condition (simplified implementation)
-        if condition == "vehicle_not_moving":
-            vehicle_speed_threshold = 0.5  # mph
-            return system_state.get("vehicle_speed", 0) < vehicle_speed_threshold
-        if condition == "parking_brake_engaged":
-            return system_state.get("parking_brake", False)
-        if condition == "leveling_jacks_deployed":
-            return system_state.get("leveling_jacks_down", False)
-        if condition == "engine_not_running":
-            return not system_state.get("engine_running", False)
-        if condition == "transmission_in_park":
-            return system_state.get("transmission_gear", "") == "PARK"
-        if condition == "slide_rooms_retracted":
-            return system_state.get("all_slides_retracted", True)
-        # Unknown condition - fail safe
-        logger.warning("Unknown interlock condition: %s", condition)
-        return False
+        return compile_condition(condition)(system_state)
 
     async def engage(self, reason: str) -> None:
         """
@@ -269,6 +365,8 @@ class SafetyService:
 
     # Constants
     MULTIPLE_VIOLATION_THRESHOLD = 3  # Number of violations to trigger emergency stop
+    # Audit events fsync'd immediately instead of in the next journal batch
+    DURABLE_AUDIT_EVENT_PREFIXES = ("emergency_stop", "safe_state")
 
     def __init__(
         self,
@@ -277,6 +375,7 @@ class SafetyService:
         watchdog_timeout: float = 15.0,
         pin_manager=None,
         security_audit_service=None,
+        audit_journal_path: str | Path | None = None,
     ):
         """
         Initialize safety service with modern ServiceRegistry integration.
@@ -287,6 +386,8 @@ class SafetyService:
             watchdog_timeout: Watchdog timeout threshold (seconds)
             pin_manager: Optional PIN manager for enhanced authorization
             security_audit_service: Optional security audit service for enhanced logging
+            audit_journal_path: Optional on-disk journal that persists the audit log
+                across restarts
         """
         self.service_registry = service_registry
         self.health_check_interval = health_check_interval
@@ -309,6 +410,14 @@ class SafetyService:
 
         # Interlocks management
         self._interlocks: dict[str, SafetyInterlock] = {}
+        # Event-driven evaluation: system state key -> interlocks reading it
+        self._interlocks_by_input: dict[str, set[str]] = {}
+        self._pending_interlocks: dict[str, float] = {}  # name -> first change time
+        self._interlock_eval_task: asyncio.Task | None = None
+        self._interlock_results: dict[str, tuple[bool, str]] = {}
+        self._interlock_reaction: dict[str, dict[str, float]] = {}
+        self._event_evaluations = 0
+        self._full_evaluations = 0
         # Initialize system state with safe defaults (parked and stabilized RV)
         self._system_state: dict[str, Any] = {
             "vehicle_speed": 0.0,  # Vehicle not moving
@@ -319,9 +428,15 @@ class SafetyService:
             "all_slides_retracted": True,  # All slides in safe position
         }
 
-        # Audit logging
-        self._audit_log: list[dict[str, Any]] = []
+        # Audit logging: in-memory ring buffer, mirrored to the on-disk journal
         self._max_audit_entries = 1000
+        self._audit_log: deque[dict[str, Any]] = deque(maxlen=self._max_audit_entries)
+        self._audit_journal: SafetyAuditJournal | None = None
+        if audit_journal_path is not None:
+            self._audit_journal = SafetyAuditJournal(audit_journal_path)
+            self._audit_log.extend(self._audit_journal.load_recent(self._max_audit_entries))
+        # Background fsyncs of durable audit events, awaited once the safety action is done
+        self._journal_flush_tasks: set[asyncio.Task] = set()
 
         # Emergency stop tracking
         self._emergency_stop_reason: str | None = None
@@ -394,7 +509,13 @@ class SafetyService:
         Args:
             interlock: SafetyInterlock instance to add
         """
+        previous = self._interlocks.get(interlock.name)
+        if previous is not None:
+            for key in previous.input_keys:
+                self._interlocks_by_input.get(key, set()).discard(interlock.name)
         self._interlocks[interlock.name] = interlock
+        for key in interlock.input_keys:
+            self._interlocks_by_input.setdefault(key, set()).add(interlock.name)
         logger.info(
             "Added safety interlock: %s for feature %s", interlock.name, interlock.feature_name
         )
@@ -411,22 +532,90 @@ class SafetyService:
             Any updates should maintain consistency with the safety requirements.
             Key states include: parking_brake, leveling_jacks_down, vehicle_speed,
             transmission_gear, engine_running, and all_slides_retracted.
+
+            Interlocks reading a changed key are re-evaluated immediately (on
+            the running event loop); the monitoring loop is only a backstop.
         """
+        changed = [
+            key
+            for key, value in state_updates.items()
+            if key not in self._system_state or self._system_state[key] != value
+        ]
         self._system_state.update(state_updates)
         logger.debug("Updated system state: %s", state_updates)
 
-    async def check_safety_interlocks(self) -> dict[str, tuple[bool, str]]:
+        affected: set[str] = set()
+        for key in changed:
+            affected.update(self._interlocks_by_input.get(key, ()))
+        if affected:
+            self._schedule_interlock_evaluation(affected)
+
+    def _schedule_interlock_evaluation(self, names: Iterable[str]) -> None:
+        """Queue interlocks for evaluation and start the evaluation task if needed."""
+        if self._in_safe_state:
+            # Like the monitoring loop, stop re-evaluating once in safe state
+            return
+        now = time.perf_counter()
+        for name in names:
+            self._pending_interlocks.setdefault(name, now)
+
+        if self._interlock_eval_task and not self._interlock_eval_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller); the next full check picks these up
+            return
+        self._interlock_eval_task = loop.create_task(self._evaluate_pending_interlocks())
+
+    async def _evaluate_pending_interlocks(self) -> None:
+        """Evaluate interlocks whose inputs changed, then check for multiple violations."""
+        while self._pending_interlocks and not self._in_safe_state:
+            pending = self._pending_interlocks
+            self._pending_interlocks = {}
+            try:
+                await self.check_safety_interlocks(pending)
+            except Exception as e:
+                logger.critical("Event-driven interlock evaluation failed: %s", e)
+                return
+
+            done = time.perf_counter()
+            self._event_evaluations += 1
+            for name, changed_at in pending.items():
+                reaction = self._interlock_reaction.setdefault(
+                    name, {"last_ms": 0.0, "max_ms": 0.0}
+                )
+                reaction["last_ms"] = round((done - changed_at) * 1000, 3)
+                reaction["max_ms"] = max(reaction["max_ms"], reaction["last_ms"])
+
+            if not self._emergency_stop_active:
+                await self._check_emergency_conditions(
+                    {"failed_critical": []}, dict(self._interlock_results)
+                )
+
+    async def check_safety_interlocks(
+        self, names: Iterable[str] | None = None
+    ) -> dict[str, tuple[bool, str]]:
         """
-        Check all safety interlocks and engage/disengage as needed.
+        Check safety interlocks and engage/disengage as needed.
+
+        Args:
+            names: Interlocks to check; all interlocks if omitted
 
         Returns:
             Dictionary mapping interlock names to (satisfied, reason) tuples
         """
         results = {}
+        if names is None:
+            self._full_evaluations += 1
+            interlocks = list(self._interlocks.items())
+        else:
+            interlocks = [(n, self._interlocks[n]) for n in names if n in self._interlocks]
 
-        for interlock_name, interlock in self._interlocks.items():
+        for interlock_name, interlock in interlocks:
             conditions_met, reason = await interlock.check_conditions(self._system_state)
             results[interlock_name] = (conditions_met, reason)
+            self._interlock_results[interlock_name] = (conditions_met, reason)
 
             if not conditions_met and not interlock.is_engaged:
                 await interlock.engage(reason)
@@ -521,6 +710,9 @@ class SafetyService:
             triggered_by,
         )
 
+        # The stop has been issued; now make sure its audit trail is on disk
+        await self._wait_for_journal_flush()
+
         return True
 
     async def emergency_stop(self, reason: str = "Manual trigger") -> None:
@@ -604,6 +796,9 @@ class SafetyService:
             logger.critical("Error during emergency stop: %s", e)
             await self._audit_log_event("emergency_stop_error", {"error": str(e), "reason": reason})
 
+        # The stop has been issued; now make sure its audit trail is on disk
+        await self._wait_for_journal_flush()
+
     def _get_safety_critical_services(self) -> list[str]:
         """
         Get list of safety-critical service names from SafetyServiceRegistry.
@@ -1729,10 +1924,10 @@ class SafetyService:
             "event_type": event_type,
             "details": details,
         }
+        # The deque drops the oldest entry once full
         self._audit_log.append(audit_entry)
-
-        if len(self._audit_log) > self._max_audit_entries:
-            self._audit_log = self._audit_log[-self._max_audit_entries :]
+        if self._audit_journal is not None:
+            self._audit_journal.append(audit_entry)
 
     async def get_safety_status_async(self) -> dict[str, Any]:
         """Get comprehensive safety status (async version)."""
@@ -1750,11 +1945,20 @@ class SafetyService:
             self._watchdog_task = asyncio.create_task(self._watchdog_loop())
             logger.info("Started safety watchdog monitoring")
 
+        if self._audit_journal is not None:
+            await self._audit_journal.start()
+
         # Initialize watchdog
         self._last_watchdog_kick = time.time()
 
     async def stop_monitoring(self) -> None:
         """Stop safety monitoring tasks."""
+        if self._interlock_eval_task and not self._interlock_eval_task.done():
+            self._interlock_eval_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._interlock_eval_task
+        self._interlock_eval_task = None
+
         if self._health_monitor_task:
             self._health_monitor_task.cancel()
             with suppress(asyncio.CancelledError):
@@ -1769,8 +1973,18 @@ class SafetyService:
             self._watchdog_task = None
             logger.info("Stopped safety watchdog monitoring")
 
+        if self._audit_journal is not None:
+            await self._wait_for_journal_flush()
+            await self._audit_journal.stop()
+
     async def _health_monitoring_loop(self) -> None:
-        """ISO 26262-compliant health monitoring loop with watchdog pattern."""
+        """
+        ISO 26262-compliant health monitoring loop with watchdog pattern.
+
+        Interlocks are evaluated when their inputs change (see
+        ``update_system_state``); the full check here is a backstop that also
+        catches override expiry.
+        """
         logger.info("Starting safety health monitoring loop")
 
         while not self._in_safe_state:
@@ -1953,32 +2167,74 @@ class SafetyService:
             event_type: Type of event
             details: Event details
         """
-        audit_entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "event_type": event_type,
-            "details": details,
-        }
-
-        self._audit_log.append(audit_entry)
+        self._add_audit_log_entry(event_type, details)
 
-        # Trim audit log if it gets too large
-        if len(self._audit_log) > self._max_audit_entries:
-            self._audit_log = self._audit_log[-self._max_audit_entries :]
+        # Emergency stops and safe-state transitions are fsync'd right away in the
+        # background (everything else waits for the next batch). The flush is not
+        # awaited here so disk I/O never delays the safety action being audited.
+        if self._audit_journal is not None and event_type.startswith(
+            self.DURABLE_AUDIT_EVENT_PREFIXES
+        ):
+            task = asyncio.create_task(self._audit_journal.flush_async())
+            self._journal_flush_tasks.add(task)
+            task.add_done_callback(self._journal_flush_tasks.discard)
 
         # Log to standard logger as well
         logger.info("AUDIT: %s - %s", event_type, details)
 
-    def get_audit_log(self, max_entries: int = 100) -> list[dict[str, Any]]:
+    async def _wait_for_journal_flush(self) -> None:
+        """Wait for background fsyncs of durable audit events to finish."""
+        if self._journal_flush_tasks:
+            await asyncio.gather(*self._journal_flush_tasks, return_exceptions=True)
+
+    def get_audit_log(self, max_entries: int = 100, offset: int = 0) -> list[dict[str, Any]]:
         """
-        Get recent audit log entries.
+        Get a page of recent audit log entries.
+
+        Only the requested page is copied out of the ring buffer.
 
         Args:
             max_entries: Maximum number of entries to return
+            offset: Number of most recent entries to skip
 
         Returns:
-            List of audit log entries
+            List of audit log entries, oldest first
+        """
+        if max_entries <= 0 or offset < 0:
+            return []
+        page = list(islice(reversed(self._audit_log), offset, offset + max_entries))
+        page.reverse()
+        return page
+
+    def get_audit_journal_stats(self) -> dict[str, Any] | None:
+        """
+        Get audit journal metrics.
+
+        Returns:
+            Journal metrics, or None if the audit log is not persisted
+        """
+        return self._audit_journal.get_stats() if self._audit_journal else None
+
+    def get_interlock_evaluation_stats(self) -> dict[str, Any]:
         """
-        return self._audit_log[-max_entries:] if self._audit_log else []
+        Get interlock evaluation metrics.
+
+        Returns:
+            Event-driven vs. full evaluation counts, pending interlocks, and
+            per-interlock evaluation latency and state-change reaction time
+        """
+        return {
+            "event_evaluations": self._event_evaluations,
+            "full_evaluations": self._full_evaluations,
+            "pending": sorted(self._pending_interlocks),
+            "interlocks": {
+                name: {
+                    **interlock.get_evaluation_stats(),
+                    "reaction": dict(self._interlock_reaction.get(name, {})),
+                }
+                for name, interlock in self._interlocks.items()
+            },
+        }
 
     def get_safety_status(self) -> dict[str, Any]:
         """
@@ -2017,7 +2273,9 @@ class SafetyService:
                 for name, interlock in self._interlocks.items()
             },
             "system_state": dict(self._system_state),
+            "interlock_evaluation": self.get_interlock_evaluation_stats(),
             "audit_log_entries": len(self._audit_log),
+            "audit_journal": self.get_audit_journal_stats(),
             "emergency_stop_reason": self._emergency_stop_reason,
             "active_safety_actions": list(self._active_safety_actions),
         }
@@ -9,12 +9,16 @@ import logging
 import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, EmailStr
 
 from backend.core.config import get_settings
 from backend.services.auth_manager import AuthManager
-from backend.services.notification_manager import NotificationManager
+
+if TYPE_CHECKING:
+    # apprise/jinja2 are only needed once a notification manager is injected
+    from backend.services.notification_manager import NotificationManager
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +63,7 @@ class UserInvitationService:
     """
 
     def __init__(
-        self, auth_manager: AuthManager, notification_manager: NotificationManager | None = None
+        self, auth_manager: AuthManager, notification_manager: "NotificationManager | None" = None
     ):
         """
         Initialize the user invitation service.
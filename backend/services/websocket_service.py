@@ -18,6 +18,14 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 from backend.repositories import CANTrackingRepository, SystemStateRepository
 from backend.websocket.auth_handler import get_websocket_auth_handler
+from backend.websocket.compact_protocol import (
+    ClientEncoding,
+    encode_analyzer_batches,
+    encode_frame_batches,
+    encode_sniffer_groups,
+    negotiate_encoding,
+)
+from backend.websocket.fanout import WebSocketFanout
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +67,12 @@ class WebSocketService:
         self.can_analyzer_clients: set[WebSocket] = set()  # CAN analyzer updates
         self.can_filter_clients: set[WebSocket] = set()  # CAN filter updates
 
+        # Per-client send queues; broadcasts never await a client's socket
+        self.fanout = WebSocketFanout()
+
+        # Clients of the CAN channels that negotiated a non-JSON encoding
+        self._client_encodings: dict[WebSocket, ClientEncoding] = {}
+
         # For background task management
         self.background_tasks: set[asyncio.Task] = set()
         self._running = False
@@ -99,6 +113,8 @@ class WebSocketService:
                 await task
         self.background_tasks.clear()
 
+        await self.fanout.close()
+
         # Close all WebSocket connections
         for client_set in [
             self.data_clients,
@@ -139,6 +155,8 @@ class WebSocketService:
                 "can_analyzer": len(self.can_analyzer_clients),
                 "can_filter": len(self.can_filter_clients),
             },
+            "fanout": self.fanout.get_stats(),
+            "binary_clients": len(self._client_encodings),
         }
 
     @property
@@ -161,17 +179,13 @@ class WebSocketService:
         """
         Broadcast data to all connected data WebSocket clients.
 
+        The message is serialized once and queued per client; pending
+        ``entity_update`` messages for the same entity are coalesced.
+
         Args:
             data: The data to broadcast as JSON
         """
-        to_remove = set()
-        for client in self.data_clients:
-            try:
-                await client.send_json(data)
-            except Exception:
-                to_remove.add(client)
-        for client in to_remove:
-            self.data_clients.discard(client)
+        self.fanout.broadcast(self.data_clients, data)
 
     async def broadcast_json_to_clients(
         self, clients: set[WebSocket], data: dict[str, Any]
@@ -183,14 +197,7 @@ class WebSocketService:
             clients: Set of WebSocket clients to broadcast to
             data: The data to broadcast as JSON
         """
-        to_remove = set()
-        for client in clients:
-            try:
-                await client.send_json(data)
-            except Exception:
-                to_remove.add(client)
-        for client in to_remove:
-            clients.discard(client)
+        self.fanout.broadcast(clients, data)
 
     async def broadcast_text_to_log_clients(self, text: str) -> None:
         """
@@ -199,14 +206,63 @@ class WebSocketService:
         Args:
             text: The text to broadcast
         """
-        to_remove = set()
-        for client in self.log_clients:
-            try:
-                await client.send_text(text)
-            except Exception:
-                to_remove.add(client)
-        for client in to_remove:
-            self.log_clients.discard(client)
+        if self.log_clients:
+            self.fanout.broadcast_text(self.log_clients, text)
+
+    def _broadcast_frames(
+        self,
+        clients: set[WebSocket],
+        message: dict[str, Any],
+        records: list[dict[str, Any]],
+        encoder: Any,
+    ) -> None:
+        """
+        Send frame records as JSON or packed binary depending on each client's encoding.
+
+        Binary messages are encoded once per distinct batch size.
+
+        Args:
+            clients: Client set to deliver to
+            message: JSON message for clients using the default encoding
+            records: Frame or group records carried by the message
+            encoder: ``encode_frame_batches``, ``encode_analyzer_batches`` or
+                ``encode_sniffer_groups``
+        """
+        json_clients = []
+        binary_clients: dict[int, list[WebSocket]] = {}
+        for client in clients:
+            encoding = self._client_encodings.get(client)
+            if encoding is not None and encoding.binary:
+                binary_clients.setdefault(encoding.batch_size, []).append(client)
+            else:
+                json_clients.append(client)
+
+        if json_clients:
+            self.fanout.broadcast(json_clients, message, owner=clients)
+        for batch_size, batch_clients in binary_clients.items():
+            for payload in encoder(records, batch_size):
+                self.fanout.broadcast_text(batch_clients, payload, owner=clients)
+
+    async def _accept_encoding(self, websocket: WebSocket) -> ClientEncoding | None:
+        """
+        Record the encoding a CAN channel client asked for and acknowledge it.
+
+        Clients that do not pass ``encoding`` get plain JSON and no ack message.
+
+        Args:
+            websocket: The WebSocket connection
+
+        Returns:
+            The negotiated encoding, or None if the client did not request one
+        """
+        query_params = getattr(websocket, "query_params", None) or {}
+        if "encoding" not in query_params:
+            return None
+        encoding = negotiate_encoding(query_params)
+        if encoding.binary:
+            self._client_encodings[websocket] = encoding
+        await websocket.send_json(encoding.ack())
+        return encoding
 
     async def broadcast_can_sniffer_group(self, group: dict[str, Any]) -> None:
         """
@@ -215,7 +271,7 @@ class WebSocketService:
         Args:
             group: The CAN sniffer group to broadcast
         """
-        await self.broadcast_json_to_clients(self.can_sniffer_clients, group)
+        self._broadcast_frames(self.can_sniffer_clients, group, [group], encode_sniffer_groups)
 
     async def broadcast_network_map(self, network_map: dict[str, Any]) -> None:
         """
@@ -255,7 +311,12 @@ class WebSocketService:
             data: The update data to broadcast
         """
         message = {"type": update_type, "payload": data, "timestamp": time.time()}
-        await self.broadcast_json_to_clients(self.can_analyzer_clients, message)
+        if update_type == "messages" and isinstance(data, list):
+            self._broadcast_frames(
+                self.can_analyzer_clients, message, data, encode_analyzer_batches
+            )
+        else:
+            await self.broadcast_json_to_clients(self.can_analyzer_clients, message)
 
     async def broadcast_can_filter_update(self, update_type: str, data: dict[str, Any]) -> None:
         """
@@ -266,7 +327,10 @@ class WebSocketService:
             data: The update data to broadcast
         """
         message = {"type": update_type, "payload": data, "timestamp": time.time()}
-        await self.broadcast_json_to_clients(self.can_filter_clients, message)
+        if update_type == "captured_messages" and isinstance(data, list):
+            self._broadcast_frames(self.can_filter_clients, message, data, encode_frame_batches)
+        else:
+            await self.broadcast_json_to_clients(self.can_filter_clients, message)
 
     async def _check_token_expiry_task(self) -> None:
         """Periodically check for expired tokens and close connections."""
@@ -466,6 +530,7 @@ class WebSocketService:
             )
         finally:
             self.data_clients.discard(websocket)
+            await self.fanout.remove_client(websocket)
             auth_handler.remove_connection(websocket)
 
     async def handle_log_connection(self, websocket: WebSocket) -> None:
@@ -545,6 +610,7 @@ class WebSocketService:
             )
         finally:
             self.log_clients.discard(websocket)
+            await self.fanout.remove_client(websocket)
             if ws_handler and isinstance(ws_handler, WebSocketLogHandler):
                 ws_handler.client_filters.pop(websocket, None)
                 ws_handler.client_rate.pop(websocket, None)
@@ -569,7 +635,6 @@ class WebSocketService:
             await websocket.close(code=1008)
             return
 
-        self.can_sniffer_clients.add(websocket)
         logger.info(
             "CAN sniffer WebSocket client connected: %s:%s (user: %s)",
             websocket.client.host,
@@ -577,10 +642,18 @@ class WebSocketService:
             user_info.get("username", "unknown"),
         )
         try:
+            encoding = await self._accept_encoding(websocket)
+
             # Get initial CAN sniffer data from repository
             if self._can_tracking_repository:
-                for group in self._can_tracking_repository.get_can_sniffer_grouped():
-                    await websocket.send_json(group)
+                groups = self._can_tracking_repository.get_can_sniffer_grouped()
+                if encoding is not None and encoding.binary:
+                    for payload in encode_sniffer_groups(groups, encoding.batch_size):
+                        await websocket.send_bytes(payload)
+                else:
+                    for group in groups:
+                        await websocket.send_json(group)
+            self.can_sniffer_clients.add(websocket)
             while True:
                 await websocket.receive_text()
         except WebSocketDisconnect:
@@ -598,6 +671,8 @@ class WebSocketService:
             )
         finally:
             self.can_sniffer_clients.discard(websocket)
+            self._client_encodings.pop(websocket, None)
+            await self.fanout.remove_client(websocket)
             auth_handler.remove_connection(websocket)
 
     async def handle_network_map_connection(self, websocket: WebSocket) -> None:
@@ -634,6 +709,7 @@ class WebSocketService:
             )
         finally:
             self.network_map_clients.discard(websocket)
+            await self.fanout.remove_client(websocket)
 
     async def handle_features_status_connection(self, websocket: WebSocket) -> None:
         """
@@ -669,6 +745,7 @@ class WebSocketService:
             )
         finally:
             self.features_clients.discard(websocket)
+            await self.fanout.remove_client(websocket)
 
     async def handle_can_recorder_connection(self, websocket: WebSocket) -> None:
         """
@@ -723,6 +800,7 @@ class WebSocketService:
             )
         finally:
             self.can_recorder_clients.discard(websocket)
+            await self.fanout.remove_client(websocket)
             auth_handler.remove_connection(websocket)
 
     async def handle_can_analyzer_connection(self, websocket: WebSocket) -> None:
@@ -744,7 +822,6 @@ class WebSocketService:
             await websocket.close(code=1008)
             return
 
-        self.can_analyzer_clients.add(websocket)
         logger.info(
             "CAN analyzer WebSocket client connected: %s:%s (user: %s)",
             websocket.client.host,
@@ -752,6 +829,8 @@ class WebSocketService:
             user_info.get("username", "unknown"),
         )
         try:
+            await self._accept_encoding(websocket)
+
             # Send initial analyzer stats if available
             if hasattr(self, "_service_registry"):
                 analyzer_service = self._service_registry.get_service("can_analyzer")
@@ -761,6 +840,9 @@ class WebSocketService:
                         {"type": "statistics", "payload": initial_stats, "timestamp": time.time()}
                     )
 
+            # Join broadcasts only after the encoding ack and initial statistics are sent,
+            # so fan-out writers cannot precede or interleave with them
+            self.can_analyzer_clients.add(websocket)
             while True:
                 await websocket.receive_text()
         except WebSocketDisconnect:
@@ -778,6 +860,8 @@ class WebSocketService:
             )
         finally:
             self.can_analyzer_clients.discard(websocket)
+            self._client_encodings.pop(websocket, None)
+            await self.fanout.remove_client(websocket)
             auth_handler.remove_connection(websocket)
 
     async def handle_can_filter_connection(self, websocket: WebSocket) -> None:
@@ -799,7 +883,6 @@ class WebSocketService:
             await websocket.close(code=1008)
             return
 
-        self.can_filter_clients.add(websocket)
         logger.info(
             "CAN filter WebSocket client connected: %s:%s (user: %s)",
             websocket.client.host,
@@ -807,6 +890,8 @@ class WebSocketService:
             user_info.get("username", "unknown"),
         )
         try:
+            await self._accept_encoding(websocket)
+
             # Send initial filter status if available
             if hasattr(self, "_service_registry"):
                 filter_service = self._service_registry.get_service("can_filter")
@@ -816,6 +901,9 @@ class WebSocketService:
                         {"type": "status", "payload": initial_status, "timestamp": time.time()}
                     )
 
+            # Join broadcasts only after the encoding ack and initial status are sent,
+            # so fan-out writers cannot precede or interleave with them
+            self.can_filter_clients.add(websocket)
             while True:
                 await websocket.receive_text()
         except WebSocketDisconnect:
@@ -833,6 +921,8 @@ class WebSocketService:
             )
         finally:
             self.can_filter_clients.discard(websocket)
+            self._client_encodings.pop(websocket, None)
+            await self.fanout.remove_client(websocket)
             auth_handler.remove_connection(websocket)
 
 
@@ -0,0 +1,371 @@
+"""
+Compact binary encoding for high-rate CAN WebSocket streams.
+
+Clients of the CAN sniffer, analyzer and filter channels may connect with
+``?encoding=binary`` (optionally ``&batch_size=N``). Frame lists are then sent
+as binary WebSocket messages instead of JSON dicts with hex strings; everything
+else (statistics, status, acks) stays JSON text.
+
+Message layout (network byte order)::
+
+    header   magic "CQ" | version u8 | type u8 | record count u16 | base time f64
+    ifaces   count u8, then per interface: length u8 + UTF-8 name
+    records  type-specific, ``count`` times
+
+Frame record (``MSG_FRAME_BATCH``)::
+
+    time offset us u32 | can id u32 (bit 31 = extended) | iface index u8
+    | flags u8 (bit 0 = TX) | dlc u8 | data[dlc]
+
+Group record (``MSG_SNIFFER_GROUPS``): confidence u8 (1 = high) followed by
+the command frame record and the response frame record.
+
+Analyzer record (``MSG_ANALYZER_BATCH``) is a frame record followed by::
+
+    protocol label u8 | message type label u8 | pgn u32 | source u16
+    | destination u16 | decoded length u32 | decoded fields (UTF-8 JSON)
+
+Labels index a string table (count u8, then length u8 + UTF-8 name) that
+follows the interface table. Missing values use all-ones sentinels (0xFF,
+0xFFFFFFFF, 0xFFFF) and a decoded length of 0.
+"""
+
+import json
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+ENCODING_JSON = "json"
+ENCODING_BINARY = "binary"
+SUPPORTED_ENCODINGS = (ENCODING_JSON, ENCODING_BINARY)
+
+PROTOCOL_VERSION = 1
+MAGIC = b"CQ"
+MSG_FRAME_BATCH = 1
+MSG_SNIFFER_GROUPS = 2
+MSG_ANALYZER_BATCH = 3
+
+DEFAULT_BATCH_SIZE = 64
+MAX_BATCH_SIZE = 1024
+
+_HEADER = struct.Struct("!2sBBHd")
+_FRAME = struct.Struct("!IIBBB")
+_ANALYZER = struct.Struct("!BBIHHI")
+_EXTENDED_FLAG = 0x80000000
+_TX_FLAG = 0x01
+_NO_LABEL = 0xFF
+_NO_PGN = 0xFFFFFFFF
+_NO_ADDRESS = 0xFFFF
+
+
+@dataclass(frozen=True)
+class ClientEncoding:
+    """Encoding negotiated by a client at connect time."""
+
+    encoding: str = ENCODING_JSON
+    batch_size: int = DEFAULT_BATCH_SIZE
+
+    @property
+    def binary(self) -> bool:
+        """Whether frame lists should be sent as binary messages."""
+        return self.encoding == ENCODING_BINARY
+
+    def ack(self) -> dict[str, Any]:
+        """JSON message confirming the negotiated encoding."""
+        return {
+            "type": "encoding",
+            "encoding": self.encoding,
+            "version": PROTOCOL_VERSION,
+            "batch_size": self.batch_size,
+        }
+
+
+def negotiate_encoding(query_params: Any) -> ClientEncoding:
+    """
+    Pick the encoding requested in the connection query string.
+
+    Unknown encodings and invalid batch sizes fall back to defaults rather than
+    rejecting the connection.
+
+    Args:
+        query_params: Mapping of query parameters (e.g. ``websocket.query_params``)
+
+    Returns:
+        Negotiated client encoding
+    """
+    encoding = str(query_params.get("encoding", ENCODING_JSON)).lower()
+    if encoding not in SUPPORTED_ENCODINGS:
+        encoding = ENCODING_JSON
+
+    try:
+        batch_size = int(query_params.get("batch_size", DEFAULT_BATCH_SIZE))
+    except (TypeError, ValueError):
+        batch_size = DEFAULT_BATCH_SIZE
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+
+    return ClientEncoding(encoding=encoding, batch_size=batch_size)
+
+
+def _frame_fields(entry: dict[str, Any]) -> tuple[float, int, str, bool, bytes]:
+    """Normalize the frame dict shapes used by the sniffer, analyzer and filter."""
+    can_id = entry.get("can_id", entry.get("arbitration_id", 0))
+    if isinstance(can_id, str):
+        can_id = int(can_id, 16)
+
+    data = entry.get("data", b"")
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+    elif not isinstance(data, bytes | bytearray):
+        data = bytes(data)
+
+    extended = entry.get("is_extended", entry.get("extended"))
+    if extended is None:
+        extended = can_id > 0x7FF
+    if extended:
+        can_id |= _EXTENDED_FLAG
+
+    interface = entry.get("interface") or entry.get("iface") or ""
+    is_tx = str(entry.get("direction", "rx")).lower() == "tx"
+    return float(entry.get("timestamp") or 0.0), can_id, str(interface), is_tx, bytes(data)
+
+
+def _optional_int(value: Any, missing: int) -> int:
+    return missing if value is None else int(value) & missing
+
+
+def _string_table(names: Iterable[str]) -> list[bytes]:
+    names = list(names)
+    table = [struct.pack("!B", len(names))]
+    for name in names:
+        encoded = name.encode()[:255]
+        table.append(struct.pack("!B", len(encoded)) + encoded)
+    return table
+
+
+def _read_string_table(payload: bytes, offset: int) -> tuple[list[str], int]:
+    (count,) = struct.unpack_from("!B", payload, offset)
+    offset += 1
+    names = []
+    for _ in range(count):
+        (length,) = struct.unpack_from("!B", payload, offset)
+        names.append(payload[offset + 1 : offset + 1 + length].decode())
+        offset += 1 + length
+    return names, offset
+
+
+class _Packer:
+    """Accumulates records plus interface and label tables for one message."""
+
+    def __init__(self, base_time: float):
+        self.base_time = base_time
+        self.interfaces: dict[str, int] = {}
+        self.labels: dict[str, int] = {}
+        self.parts: list[bytes] = []
+
+    def frame(self, entry: dict[str, Any]) -> None:
+        timestamp, can_id, interface, is_tx, data = _frame_fields(entry)
+        iface_index = self.interfaces.setdefault(interface, len(self.interfaces))
+        offset_us = max(0, min(int((timestamp - self.base_time) * 1_000_000), 0xFFFFFFFF))
+        data = data[:255]
+        self.parts.append(
+            _FRAME.pack(offset_us, can_id, iface_index, _TX_FLAG if is_tx else 0, len(data))
+        )
+        self.parts.append(data)
+
+    def label(self, value: Any) -> int:
+        if value is None:
+            return _NO_LABEL
+        return self.labels.setdefault(str(value), len(self.labels))
+
+    def analyzer_frame(self, entry: dict[str, Any]) -> None:
+        self.frame(entry)
+        decoded_fields = entry.get("decoded_fields")
+        decoded = (
+            b""
+            if decoded_fields is None
+            else json.dumps(decoded_fields, separators=(",", ":"), default=str).encode()
+        )
+        self.parts.append(
+            _ANALYZER.pack(
+                self.label(entry.get("protocol")),
+                self.label(entry.get("message_type")),
+                _optional_int(entry.get("pgn"), _NO_PGN),
+                _optional_int(entry.get("source_address"), _NO_ADDRESS),
+                _optional_int(entry.get("destination_address"), _NO_ADDRESS),
+                len(decoded),
+            )
+        )
+        self.parts.append(decoded)
+
+    def finish(self, msg_type: int, count: int) -> bytes:
+        tables = _string_table(self.interfaces)
+        if msg_type == MSG_ANALYZER_BATCH:
+            tables += _string_table(self.labels)
+        header = _HEADER.pack(MAGIC, PROTOCOL_VERSION, msg_type, count, self.base_time)
+        return b"".join([header, *tables, *self.parts])
+
+
+def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _base_time(entries: Iterable[dict[str, Any]]) -> float:
+    return min((float(e.get("timestamp") or 0.0) for e in entries), default=0.0)
+
+
+def encode_frame_batches(
+    frames: list[dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[bytes]:
+    """
+    Pack CAN frame dicts into binary messages of at most ``batch_size`` frames.
+
+    Args:
+        frames: Frame dicts (``can_id``/``arbitration_id``, ``data``, ``timestamp``,
+            ``interface``/``iface``, optional ``direction`` and ``is_extended``)
+        batch_size: Maximum frames per message
+
+    Returns:
+        Encoded binary messages
+    """
+    messages = []
+    for chunk in _chunks(frames, max(1, batch_size)):
+        packer = _Packer(_base_time(chunk))
+        for frame in chunk:
+            packer.frame(frame)
+        messages.append(packer.finish(MSG_FRAME_BATCH, len(chunk)))
+    return messages
+
+
+def encode_analyzer_batches(
+    frames: list[dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[bytes]:
+    """
+    Pack CAN analyzer frame dicts, including their decode results, into binary messages.
+
+    Args:
+        frames: Frame dicts as accepted by ``encode_frame_batches`` plus ``protocol``,
+            ``message_type``, ``pgn``, ``source_address``, ``destination_address``
+            and ``decoded_fields``
+        batch_size: Maximum frames per message
+
+    Returns:
+        Encoded binary messages
+    """
+    messages = []
+    for chunk in _chunks(frames, max(1, batch_size)):
+        packer = _Packer(_base_time(chunk))
+        for frame in chunk:
+            packer.analyzer_frame(frame)
+        messages.append(packer.finish(MSG_ANALYZER_BATCH, len(chunk)))
+    return messages
+
+
+def encode_sniffer_groups(
+    groups: list[dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[bytes]:
+    """
+    Pack CAN sniffer command/response groups into binary messages.
+
+    Args:
+        groups: Groups with ``command``, ``response`` and ``confidence`` keys
+        batch_size: Maximum groups per message
+
+    Returns:
+        Encoded binary messages
+    """
+    messages = []
+    for chunk in _chunks(groups, max(1, batch_size)):
+        frames = [g["command"] for g in chunk] + [g["response"] for g in chunk]
+        packer = _Packer(_base_time(frames))
+        for group in chunk:
+            packer.parts.append(struct.pack("!B", group.get("confidence") == "high"))
+            packer.frame(group["command"])
+            packer.frame(group["response"])
+        messages.append(packer.finish(MSG_SNIFFER_GROUPS, len(chunk)))
+    return messages
+
+
+def decode_message(payload: bytes) -> dict[str, Any]:
+    """
+    Decode a binary message back into dicts (reference decoder for clients and tests).
+
+    Args:
+        payload: Binary message
+
+    Returns:
+        Dictionary with ``type`` and either ``frames`` or ``groups``; analyzer
+        batches decode to ``frames`` carrying the analyzer fields
+
+    Raises:
+        ValueError: If the payload is not a supported message
+    """
+    magic, version, msg_type, count, base_time = _HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version != PROTOCOL_VERSION:
+        msg = f"Unsupported message (magic={magic!r}, version={version})"
+        raise ValueError(msg)
+
+    interfaces, offset = _read_string_table(payload, _HEADER.size)
+    labels: list[str] = []
+    if msg_type == MSG_ANALYZER_BATCH:
+        labels, offset = _read_string_table(payload, offset)
+
+    def read_frame() -> dict[str, Any]:
+        nonlocal offset
+        offset_us, can_id, iface_index, flags, dlc = _FRAME.unpack_from(payload, offset)
+        offset += _FRAME.size
+        data = payload[offset : offset + dlc]
+        offset += dlc
+        return {
+            "timestamp": base_time + offset_us / 1_000_000,
+            "can_id": can_id & ~_EXTENDED_FLAG,
+            "is_extended": bool(can_id & _EXTENDED_FLAG),
+            "interface": interfaces[iface_index],
+            "direction": "tx" if flags & _TX_FLAG else "rx",
+            "data": data.hex().upper(),
+        }
+
+    def read_analyzer_frame() -> dict[str, Any]:
+        nonlocal offset
+        frame = read_frame()
+        protocol, message_type, pgn, source, destination, decoded_length = _ANALYZER.unpack_from(
+            payload, offset
+        )
+        offset += _ANALYZER.size
+        decoded = payload[offset : offset + decoded_length]
+        offset += decoded_length
+        frame.update(
+            {
+                "protocol": None if protocol == _NO_LABEL else labels[protocol],
+                "message_type": None if message_type == _NO_LABEL else labels[message_type],
+                "pgn": None if pgn == _NO_PGN else pgn,
+                "source_address": None if source == _NO_ADDRESS else source,
+                "destination_address": None if destination == _NO_ADDRESS else destination,
+                "decoded_fields": json.loads(decoded) if decoded else None,
+            }
+        )
+        return frame
+
+    if msg_type == MSG_FRAME_BATCH:
+        return {"type": "frames", "frames": [read_frame() for _ in range(count)]}
+    if msg_type == MSG_ANALYZER_BATCH:
+        return {"type": "analyzer_frames", "frames": [read_analyzer_frame() for _ in range(count)]}
+    if msg_type == MSG_SNIFFER_GROUPS:
+        groups = []
+        for _ in range(count):
+            (high,) = struct.unpack_from("!B", payload, offset)
+            offset += 1
+            command = read_frame()
+            response = read_frame()
+            groups.append(
+                {
+                    "confidence": "high" if high else "low",
+                    "command": command,
+                    "response": response,
+                }
+            )
+        return {"type": "sniffer_groups", "groups": groups}
+
+    msg = f"Unknown message type {msg_type}"
+    raise ValueError(msg)
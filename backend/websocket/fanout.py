@@ -0,0 +1,374 @@
+"""
+Per-client WebSocket fan-out.
+
+Broadcasts are serialized once and pushed onto a bounded send queue per client,
+which a dedicated writer task drains. A slow client therefore only delays its
+own queue instead of the producer that issued the broadcast. Messages carrying
+a coalescing key (e.g. ``entity_update`` for one entity) replace any queued,
+not-yet-sent message with the same key, so a lagging client receives the latest
+state rather than every intermediate one. Only those coalescible messages are
+held back for the coalescing window; any other message flushes the queue at once.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+# Matches the compact encoding used by Starlette's WebSocket.send_json
+_JSON_SEPARATORS = (",", ":")
+
+
+def serialize_message(data: Any) -> str:
+    """
+    Serialize a message to JSON text once for all recipients.
+
+    Args:
+        data: JSON-serializable message
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(data, separators=_JSON_SEPARATORS, ensure_ascii=False)
+
+
+def coalesce_key(data: Any) -> Hashable | None:
+    """
+    Get the key under which queued copies of a message may be merged.
+
+    Only ``entity_update`` messages are coalesced: a newer update for the same
+    entity supersedes an older one that has not been sent yet.
+
+    Args:
+        data: Message being broadcast
+
+    Returns:
+        Coalescing key, or None if the message must always be delivered
+    """
+    if not isinstance(data, dict) or data.get("type") != "entity_update":
+        return None
+    entity_id = data.get("entity_id")
+    if entity_id is None and isinstance(data.get("data"), dict):
+        # Some producers nest the ID: {"type": ..., "data": {"entity_id": ...}}
+        entity_id = data["data"].get("entity_id")
+    return None if entity_id is None else ("entity_update", entity_id)
+
+
+class ClientWriter:
+    """
+    Bounded send queue and writer task for one WebSocket client.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_close: Callable[["ClientWriter"], None],
+        max_queue_size: int = 256,
+        coalesce_window: float = 0.05,
+        lag_timeout: float = 10.0,
+    ):
+        """
+        Initialize a client writer.
+
+        Args:
+            websocket: Client connection
+            on_close: Called once when the writer gives up on the client
+            max_queue_size: Maximum queued messages before the oldest are dropped
+            coalesce_window: Seconds to hold queued entity updates so bursts can
+                be coalesced before sending; other messages are sent immediately
+            lag_timeout: Seconds a client may stay over capacity before it is
+                disconnected
+        """
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.coalesce_window = coalesce_window
+        self.lag_timeout = lag_timeout
+        self._on_close = on_close
+
+        self._pending: OrderedDict[Hashable, str | bytes] = OrderedDict()
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        # Set when a message that cannot be coalesced is queued, ending the window early
+        self._flush = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.closed = False
+
+        # Metrics
+        self.sent = 0
+        self.bytes_sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.lagging_since: float | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be sent."""
+        return len(self._pending)
+
+    @property
+    def lagging(self) -> bool:
+        """Whether the client has overflowed its queue since it last caught up."""
+        return self.lagging_since is not None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def enqueue(self, payload: str | bytes, key: Hashable | None = None) -> None:
+        """
+        Queue a serialized message for this client.
+
+        Args:
+            payload: Serialized message; bytes are sent as a binary frame
+            key: Optional coalescing key (see ``coalesce_key``)
+        """
+        if self.closed:
+            return
+
+        if key is not None and key in self._pending:
+            # Replace in place so the message keeps its position in the queue
+            self._pending[key] = payload
+            self.coalesced += 1
+            return
+
+        if len(self._pending) >= self.max_queue_size:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+            now = time.monotonic()
+            if self.lagging_since is None:
+                self.lagging_since = now
+                logger.warning(
+                    "WebSocket client %s is lagging; dropping oldest queued messages",
+                    self.client_label,
+                )
+            elif now - self.lagging_since > self.lag_timeout:
+                logger.warning(
+                    "Disconnecting WebSocket client %s after %.0fs over capacity",
+                    self.client_label,
+                    now - self.lagging_since,
+                )
+                self.close()
+                return
+
+        self._pending[key if key is not None else next(self._sequence)] = payload
+        self.max_depth = max(self.max_depth, len(self._pending))
+        if key is None:
+            self._flush.set()
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Drain the queue until the client goes away."""
+        try:
+            while not self.closed:
+                await self._wakeup.wait()
+                if self.coalesce_window > 0 and not self._flush.is_set():
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._flush.wait(), self.coalesce_window)
+                self._wakeup.clear()
+                self._flush.clear()
+
+                while self._pending and not self.closed:
+                    _, payload = self._pending.popitem(last=False)
+                    if isinstance(payload, bytes):
+                        await self.websocket.send_bytes(payload)
+                    else:
+                        await self.websocket.send_text(payload)
+                    self.sent += 1
+                    self.bytes_sent += len(payload)
+
+                self.lagging_since = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("WebSocket send to %s failed: %s", self.client_label, e)
+            self.close()
+
+    def close(self) -> None:
+        """Stop the writer and notify the owner. Safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        self._pending.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._on_close(self)
+
+    async def aclose(self) -> None:
+        """Close the writer and wait for its task to finish."""
+        task = self._task
+        self.close()
+        if task is not None and task is not asyncio.current_task():
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+    @property
+    def client_label(self) -> str:
+        """Host:port of the client, for logs and metrics."""
+        client = getattr(self.websocket, "client", None)
+        if client is None:
+            return str(id(self.websocket))
+        return f"{client.host}:{client.port}"
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue metrics for this client."""
+        return {
+            "client": self.client_label,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "lagging": self.lagging,
+        }
+
+
+class WebSocketFanout:
+    """
+    Registry of per-client writers used by WebSocketService broadcasts.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        coalesce_window: float = 0.05,
+        lag_timeout: float = 10.0,
+    ):
+        """
+        Initialize the fan-out layer.
+
+        Args:
+            max_queue_size: Per-client queue bound
+            coalesce_window: Per-client batching window for entity updates in seconds
+            lag_timeout: Seconds over capacity before a client is disconnected
+        """
+        self.max_queue_size = max_queue_size
+        self.coalesce_window = coalesce_window
+        self.lag_timeout = lag_timeout
+        self._writers: dict[WebSocket, ClientWriter] = {}
+        # Client set each websocket belongs to, so failed clients can be removed
+        self._client_sets: dict[WebSocket, set[WebSocket]] = {}
+        self.disconnected_laggards = 0
+        # Pending 1013 closes of laggards, referenced until done
+        self._close_tasks: set[asyncio.Task] = set()
+
+    def _writer_for(self, websocket: WebSocket, clients: set[WebSocket]) -> ClientWriter:
+        writer = self._writers.get(websocket)
+        if writer is None:
+            writer = ClientWriter(
+                websocket,
+                on_close=self._on_writer_closed,
+                max_queue_size=self.max_queue_size,
+                coalesce_window=self.coalesce_window,
+                lag_timeout=self.lag_timeout,
+            )
+            self._writers[websocket] = writer
+            self._client_sets[websocket] = clients
+            writer.start()
+        return writer
+
+    def _on_writer_closed(self, writer: ClientWriter) -> None:
+        websocket = writer.websocket
+        if self._writers.get(websocket) is writer:
+            del self._writers[websocket]
+        clients = self._client_sets.pop(websocket, None)
+        if clients is not None and websocket in clients:
+            clients.discard(websocket)
+            if writer.lagging:
+                self.disconnected_laggards += 1
+                with contextlib.suppress(RuntimeError):
+                    task = asyncio.get_running_loop().create_task(self._close_laggard(websocket))
+                    self._close_tasks.add(task)
+                    task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close_laggard(websocket: WebSocket) -> None:
+        """Close a lagging client with 1013 (try again later)."""
+        try:
+            await websocket.close(code=1013)
+        except Exception as e:
+            logger.debug("Closing lagging WebSocket client failed: %s", e)
+
+    def broadcast(
+        self, clients: Iterable[WebSocket], data: Any, owner: set[WebSocket] | None = None
+    ) -> None:
+        """
+        Serialize a message once and queue it for every client.
+
+        Args:
+            clients: Clients to deliver to
+            data: JSON-serializable message
+            owner: Set failed clients are removed from (defaults to ``clients``)
+        """
+        if not clients:
+            return
+        self.broadcast_text(clients, serialize_message(data), coalesce_key(data), owner)
+
+    def broadcast_text(
+        self,
+        clients: Iterable[WebSocket],
+        payload: str | bytes,
+        key: Hashable | None = None,
+        owner: set[WebSocket] | None = None,
+    ) -> None:
+        """
+        Queue a pre-serialized message for every client.
+
+        Args:
+            clients: Clients to deliver to
+            payload: Message text, or bytes for a binary frame
+            key: Optional coalescing key
+            owner: Set failed clients are removed from (defaults to ``clients``)
+        """
+        if owner is None:
+            owner = clients if isinstance(clients, set) else set(clients)
+        for websocket in list(clients):
+            self._writer_for(websocket, owner).enqueue(payload, key)
+
+    async def remove_client(self, websocket: WebSocket) -> None:
+        """
+        Stop the writer for a disconnected client.
+
+        Args:
+            websocket: Client connection
+        """
+        writer = self._writers.pop(websocket, None)
+        self._client_sets.pop(websocket, None)
+        if writer is not None:
+            await writer.aclose()
+
+    async def close(self) -> None:
+        """Stop all writers and wait for pending laggard closes."""
+        for websocket in list(self._writers):
+            await self.remove_client(websocket)
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get fan-out metrics.
+
+        Returns:
+            Totals across clients plus per-client queue metrics
+        """
+        clients = [writer.get_stats() for writer in self._writers.values()]
+        return {
+            "clients": clients,
+            "total_queue_depth": sum(c["queue_depth"] for c in clients),
+            "max_queue_depth": max((c["queue_depth"] for c in clients), default=0),
+            "lagging_clients": sum(1 for c in clients if c["lagging"]),
+            "disconnected_laggards": self.disconnected_laggards,
+            "max_queue_size": self.max_queue_size,
+            "coalesce_window": self.coalesce_window,
+        }
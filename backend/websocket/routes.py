@@ -56,7 +56,9 @@ async def can_sniffer_ws_endpoint(websocket: WebSocket, ws_service: WebSocketMan
     """
     WebSocket endpoint for CAN sniffer data.
 
-    Connect to ws://<host>/ws/can-sniffer to receive raw CAN frames.
+    Connect to ws://<host>/ws/can-sniffer to receive raw CAN frames. Add
+    ``?encoding=binary`` for packed binary messages (see
+    ``backend.websocket.compact_protocol``).
     """
     await ws_service.handle_can_sniffer_connection(websocket)
 
@@ -96,7 +98,8 @@ async def can_analyzer_ws_endpoint(websocket: WebSocket, ws_service: WebSocketMa
     """
     WebSocket endpoint for CAN analyzer updates.
 
-    Connect to ws://<host>/ws/can-analyzer to receive statistics and messages.
+    Connect to ws://<host>/ws/can-analyzer to receive statistics and messages. Add
+    ``?encoding=binary&batch_size=N`` to receive message lists as packed binary batches.
     """
     await ws_service.handle_can_analyzer_connection(websocket)
 
@@ -107,6 +110,7 @@ async def can_filter_ws_endpoint(websocket: WebSocket, ws_service: WebSocketMana
     WebSocket endpoint for CAN filter updates.
 
     Connect to ws://<host>/ws/can-filter to receive filter status and captured messages.
+    Add ``?encoding=binary`` to receive captured messages as packed binary batches.
     """
     await ws_service.handle_can_filter_connection(websocket)
 
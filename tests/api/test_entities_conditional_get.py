@@ -0,0 +1,116 @@
+"""
+Tests for ETag/If-None-Match and delta sync on the v2 entities API.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.domains.entities import create_entities_router
+from backend.core.dependencies import get_entity_service
+from backend.core.entity_manager import EntityManager
+from backend.models.entity_model import EntityConfig
+from backend.repositories.entity_state_repository import EntityStateRepository
+
+
+class _EntityService:
+    """Entity service backed by a real repository and entity manager."""
+
+    def __init__(self, repository: EntityStateRepository):
+        self._repo = repository
+
+    async def list_entities_page(self, **kwargs):
+        return self._repo.get_entity_states_page(**kwargs)
+
+    async def get_entities_version(self):
+        return self._repo.get_version()
+
+    async def get_entities_epoch(self):
+        return self._repo.get_epoch()
+
+    async def list_entity_changes(self, since, epoch=None):
+        return self._repo.get_entity_changes(since, epoch)
+
+
+@pytest.fixture
+def entity_manager():
+    manager = EntityManager()
+    for name in ("kitchen", "bedroom"):
+        manager.register_entity(
+            f"light_{name}",
+            EntityConfig(device_type="light", suggested_area=name, friendly_name=name),
+        )
+    return manager
+
+
+@pytest.fixture
+def client(entity_manager):
+    app = FastAPI()
+    app.include_router(create_entities_router(), prefix="/api/v2/entities")
+    service = _EntityService(EntityStateRepository(entity_manager))
+    app.dependency_overrides[get_entity_service] = lambda: service
+    return TestClient(app)
+
+
+def test_list_returns_etag_and_honors_if_none_match(client, entity_manager):
+    """A matching If-None-Match should get 304 until an entity changes."""
+    first = client.get("/api/v2/entities")
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    assert first.json()["total_count"] == 2
+
+    cached = client.get("/api/v2/entities", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    entity_manager.update_entity_state("light_kitchen", {"state": "on"})
+    changed = client.get("/api/v2/entities", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_changes_endpoint_returns_delta(client, entity_manager):
+    """The changes endpoint should return only entities modified since the cursor."""
+    initial = client.get("/api/v2/entities/changes").json()
+    assert initial["reset"] is False
+    assert {e["entity_id"] for e in initial["entities"]} == {"light_kitchen", "light_bedroom"}
+
+    entity_manager.update_entity_state("light_bedroom", {"state": "on"})
+    entity_manager.remove_entity("light_kitchen")
+    delta = client.get(
+        "/api/v2/entities/changes",
+        params={"since": initial["version"], "epoch": initial["epoch"]},
+    ).json()
+
+    assert [e["entity_id"] for e in delta["entities"]] == ["light_bedroom"]
+    assert delta["removed"] == ["light_kitchen"]
+    assert delta["since"] == initial["version"]
+    assert delta["version"] > initial["version"]
+    assert delta["reset"] is False
+
+    idle = client.get(
+        "/api/v2/entities/changes", params={"since": delta["version"], "epoch": delta["epoch"]}
+    ).json()
+    assert idle["entities"] == []
+    assert idle["removed"] == []
+
+
+def test_cursor_from_another_epoch_forces_resync(client, entity_manager):
+    """After a restart, old cursors and ETags must not yield a delta or a 304."""
+    initial = client.get("/api/v2/entities/changes").json()
+    etag = client.get("/api/v2/entities").headers["etag"]
+    assert initial["epoch"] in etag
+
+    # Simulate a restart that happens to reach the same version number
+    entity_manager._epoch = "restarted"
+    for params in (
+        {"since": initial["version"], "epoch": initial["epoch"]},
+        {"since": initial["version"]},
+    ):
+        stale = client.get("/api/v2/entities/changes", params=params).json()
+        assert stale["reset"] is True
+        assert stale["epoch"] == "restarted"
+        assert len(stale["entities"]) == 2
+
+    assert client.get("/api/v2/entities", headers={"If-None-Match": etag}).status_code == 200
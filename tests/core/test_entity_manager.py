@@ -597,3 +597,170 @@ class TestEdgeCases:
         entity = entity_manager.get_entity(entity_id)
         assert entity.current_state.state == "on"  # Should be preserved
         assert entity.current_state.brightness == 75  # Should be updated
+
+
+class TestSecondaryIndexes:
+    """Test index-backed filtering, paging, and versioning."""
+
+    @pytest.fixture
+    def populated_manager(self, entity_manager):
+        for i in range(10):
+            entity_manager.register_entity(
+                f"light_{i}",
+                EntityConfig(
+                    device_type="light",
+                    suggested_area="Kitchen" if i % 2 == 0 else "Bedroom",
+                ),
+            )
+        entity_manager.register_entity(
+            "lock_1", EntityConfig(device_type="lock", suggested_area="Kitchen")
+        )
+        entity_manager.register_entity(
+            "tank_1", EntityConfig(device_type="tank", suggested_area="Bay"), protocol="j1939"
+        )
+        return entity_manager
+
+    @pytest.mark.unit
+    def test_filter_matches_full_scan(self, populated_manager):
+        """Index lookups should return the same entities as a scan, in registration order."""
+        result = populated_manager.filter_entities(device_type="light", area="Kitchen")
+
+        assert list(result) == ["light_0", "light_2", "light_4", "light_6", "light_8"]
+        assert list(populated_manager.filter_entities(protocol="j1939")) == ["tank_1"]
+        assert populated_manager.filter_entities(device_type="missing") == {}
+
+    @pytest.mark.unit
+    def test_secondary_protocol_is_indexed(self, populated_manager):
+        """A deduplicated registration should make the entity visible to the new protocol."""
+        populated_manager.register_entity(
+            "tank_1_rvc", EntityConfig(physical_id="tank_1"), protocol="rvc"
+        )
+
+        assert "tank_1" in populated_manager.filter_entities(protocol="rvc")
+        assert "tank_1" in populated_manager.filter_entities(protocol="j1939")
+
+    @pytest.mark.unit
+    def test_page_only_returns_requested_slice(self, populated_manager):
+        """Paging should report the full total but only return the page."""
+        page, total = populated_manager.get_entities_page(device_type="light", offset=4, limit=3)
+
+        assert total == 10
+        assert [e.entity_id for e in page] == ["light_4", "light_5", "light_6"]
+
+        page, total = populated_manager.get_entities_page(area="Kitchen", offset=5, limit=10)
+        assert total == 6
+        assert [e.entity_id for e in page] == ["lock_1"]
+
+    @pytest.mark.unit
+    def test_remove_entity_updates_indexes(self, populated_manager):
+        """Removed entities should disappear from every index."""
+        removed = populated_manager.remove_entity("light_0")
+
+        assert removed is not None
+        assert "light_0" not in populated_manager.filter_entities(device_type="light")
+        assert "light_0" not in populated_manager.filter_entities(protocol="rvc")
+        assert "light_0" not in populated_manager.get_light_entity_ids()
+        assert "light_0" not in populated_manager.physical_id_map
+        assert populated_manager.remove_entity("light_0") is None
+
+    @pytest.mark.unit
+    def test_reregister_replaces_index_entries(self, populated_manager):
+        """Re-registering an ID should drop the old entity's index entries."""
+        populated_manager.register_entity(
+            "light_0",
+            EntityConfig(device_type="lock", suggested_area="Bay", physical_id="lock_2"),
+            protocol="j1939",
+        )
+
+        assert "light_0" not in populated_manager.filter_entities(device_type="light")
+        assert "light_0" not in populated_manager.filter_entities(area="Kitchen")
+        assert "light_0" not in populated_manager.filter_entities(protocol="rvc")
+        assert "light_0" not in populated_manager.get_light_entity_ids()
+        assert "light_0" not in populated_manager.physical_id_map
+        assert populated_manager.physical_id_map["lock_2"] == "light_0"
+        assert list(populated_manager.filter_entities(device_type="lock")) == ["light_0", "lock_1"]
+        assert list(populated_manager.filter_entities(area="Bay")) == ["light_0", "tank_1"]
+
+    @pytest.mark.unit
+    def test_version_is_monotonic(self, populated_manager):
+        """Every change should advance the global version and stamp the entity."""
+        start = populated_manager.version
+
+        populated_manager.update_entity_state("light_3", {"state": "on"})
+        after_update = populated_manager.version
+        # Direct entity updates are versioned too
+        populated_manager.get_entity("lock_1").update_state({"state": "locked"})
+
+        assert after_update > start
+        assert populated_manager.get_entity("light_3").version == after_update
+        assert populated_manager.get_entity("lock_1").version == populated_manager.version
+        assert populated_manager.version > after_update
+
+    @pytest.mark.unit
+    def test_bulk_load_resets_indexes(self, populated_manager):
+        """Bulk loading should replace the indexes along with the entities."""
+        version = populated_manager.version
+        populated_manager.bulk_load_entities({"fan_1": EntityConfig(device_type="fan")})
+
+        assert list(populated_manager.filter_entities()) == ["fan_1"]
+        assert populated_manager.filter_entities(device_type="light") == {}
+        assert populated_manager.version > version
+
+
+class TestDeltaSync:
+    """Test change tracking for delta-sync clients."""
+
+    @pytest.mark.unit
+    def test_changes_since_returns_only_newer_entities(self, entity_manager):
+        """Only entities changed after the cursor should be returned, oldest first."""
+        entity_manager.register_entity("a", EntityConfig(device_type="light"))
+        entity_manager.register_entity("b", EntityConfig(device_type="light"))
+        cursor = entity_manager.version
+
+        entity_manager.update_entity_state("b", {"state": "on"})
+        entity_manager.update_entity_state("a", {"state": "on"})
+        changed, removed, reset = entity_manager.get_changes_since(cursor)
+
+        assert [e.entity_id for e in changed] == ["b", "a"]
+        assert removed == []
+        assert reset is False
+        assert entity_manager.get_changes_since(entity_manager.version) == ([], [], False)
+
+    @pytest.mark.unit
+    def test_removed_entities_reported_as_tombstones(self, entity_manager):
+        """Removals after the cursor should be listed."""
+        entity_manager.register_entity("a", EntityConfig(device_type="light"))
+        cursor = entity_manager.version
+
+        entity_manager.remove_entity("a")
+        changed, removed, reset = entity_manager.get_changes_since(cursor)
+
+        assert changed == []
+        assert removed == ["a"]
+        assert reset is False
+
+    @pytest.mark.unit
+    def test_stale_or_future_cursor_requests_reset(self, entity_manager):
+        """Cursors from before a reload, or ahead of the counter, need a full resync."""
+        entity_manager.register_entity("a", EntityConfig(device_type="light"))
+        cursor = entity_manager.version
+        entity_manager.bulk_load_entities({"b": EntityConfig(device_type="fan")})
+
+        changed, removed, reset = entity_manager.get_changes_since(cursor)
+        assert reset is True
+        assert [e.entity_id for e in changed] == ["b"]
+
+        _, _, reset = entity_manager.get_changes_since(entity_manager.version + 100)
+        assert reset is True
+
+    @pytest.mark.unit
+    def test_cursor_from_another_epoch_requests_reset(self, entity_manager):
+        """A cursor issued by a previous process must resync even if the version fits."""
+        entity_manager.register_entity("a", EntityConfig(device_type="light"))
+        cursor = entity_manager.version
+
+        assert entity_manager.get_changes_since(cursor, entity_manager.epoch) == ([], [], False)
+        changed, _, reset = entity_manager.get_changes_since(cursor, "previous-boot")
+        assert reset is True
+        assert [e.entity_id for e in changed] == ["a"]
+        assert EntityManager().epoch != entity_manager.epoch
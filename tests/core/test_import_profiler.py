@@ -0,0 +1,116 @@
+"""
+Tests for the import-time profiler and the backend boot import budget.
+
+The budget test imports ``backend.main`` in a fresh interpreter and fails if
+boot imports exceed ``COACHIQ_BOOT_IMPORT_BUDGET_MS`` or if heavy optional
+dependencies are pulled in at boot instead of by the services that use them.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from backend.core.import_profiler import (
+    aggregate_by_package,
+    build_report,
+    parse_importtime,
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     alembic.util
+import time:       400 |        500 |   alembic
+import time:        50 |        550 | backend.services.database_update_service
+import time:       200 |        200 |   json.decoder
+import time:        30 |        230 | json
+"""
+
+# Packages that must only be imported when the feature using them runs
+DEFERRED_PACKAGES = (
+    "alembic",
+    "apprise",
+    "pyroute2",
+    "cantools",
+    "backend.services.analytics_dashboard_service",
+)
+
+DEFAULT_BOOT_IMPORT_BUDGET_MS = 10000.0
+
+
+class TestImportProfiler:
+    """Test parsing and aggregation of -X importtime output."""
+
+    def test_parse_links_children_to_parent(self):
+        """Post-order output should link nested imports to their importer."""
+        records = parse_importtime(SAMPLE_OUTPUT)
+        by_module = {r.module: r for r in records}
+
+        assert len(records) == 5
+        assert by_module["alembic.util"].parent == "alembic"
+        assert by_module["alembic"].parent == "backend.services.database_update_service"
+        assert by_module["json.decoder"].parent == "json"
+        assert by_module["json"].parent is None
+
+    def test_aggregate_attributes_package_to_backend_importer(self):
+        """Third-party packages should be summed and attributed to backend code."""
+        packages = aggregate_by_package(parse_importtime(SAMPLE_OUTPUT))
+        by_name = {p.package: p for p in packages}
+
+        assert packages[0].package == "alembic"
+        assert by_name["alembic"].self_us == 500
+        assert by_name["alembic"].module_count == 2
+        assert by_name["alembic"].imported_by == "backend.services.database_update_service"
+        assert by_name["json"].imported_by is None
+
+    def test_report_percentages(self):
+        """Report rows should carry ms and share of total."""
+        records = parse_importtime(SAMPLE_OUTPUT)
+        total_ms = sum(r.self_us for r in records) / 1000
+        report = build_report("x", total_ms, aggregate_by_package(records), top=1)
+
+        assert report["total_ms"] == 0.8
+        assert report["packages"] == [
+            {
+                "package": "alembic",
+                "self_ms": 0.5,
+                "percent": 64.1,
+                "modules": 2,
+                "imported_by": "backend.services.database_update_service",
+            }
+        ]
+
+
+class TestBootImportBudget:
+    """Regression guard for backend boot import cost."""
+
+    def test_backend_main_import_within_budget(self):
+        """Importing backend.main should stay within budget and skip deferred packages."""
+        budget_ms = float(
+            os.environ.get("COACHIQ_BOOT_IMPORT_BUDGET_MS", DEFAULT_BOOT_IMPORT_BUDGET_MS)
+        )
+        script = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import backend.main\n"
+            "elapsed = (time.perf_counter() - start) * 1000\n"
+            f"deferred = {DEFERRED_PACKAGES!r}\n"
+            "print(json.dumps({'elapsed_ms': elapsed, "
+            "'loaded': [p for p in deferred if p in sys.modules]}))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr[-2000:]
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        assert stats["loaded"] == [], f"Heavy packages imported at boot: {stats['loaded']}"
+        assert stats["elapsed_ms"] <= budget_ms, (
+            f"backend.main import took {stats['elapsed_ms']:.0f} ms (budget {budget_ms:.0f} ms); "
+            "run `python -m backend.core.import_profiler` to find the regression"
+        )
@@ -0,0 +1,230 @@
+"""
+Tests for dependency-graph startup and lazy activation in EnhancedServiceRegistry.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.core.service_dependency_resolver import DependencyType, ServiceDependency
+from backend.core.service_registry import EnhancedServiceRegistry, ServiceStatus
+
+
+def _slow_service(name: str, delay: float, started: list[str]):
+    async def init():
+        started.append(name)
+        await asyncio.sleep(delay)
+        return name
+
+    return init
+
+
+class TestDependencyGraphStartup:
+    """Test cases for DAG-driven startup."""
+
+    async def test_unrelated_service_not_blocked_by_slow_stage_peer(self):
+        """A service should start as soon as its own dependency is ready."""
+        registry = EnhancedServiceRegistry()
+        started: list[str] = []
+
+        # "slow" and "fast" share stage 0; "after_fast" depends only on "fast"
+        registry.register_service("slow", _slow_service("slow", 0.3, started))
+        registry.register_service("fast", _slow_service("fast", 0.01, started))
+        registry.register_service(
+            "after_fast", _slow_service("after_fast", 0.01, started), dependencies=["fast"]
+        )
+        registry.register_service(
+            "after_slow", _slow_service("after_slow", 0.01, started), dependencies=["slow"]
+        )
+
+        start = time.perf_counter()
+        await registry.startup_all()
+        elapsed = time.perf_counter() - start
+
+        # after_fast must start before slow finishes
+        assert started.index("after_fast") < started.index("after_slow")
+        assert elapsed < 0.45
+        assert all(registry.has_service(n) for n in ("slow", "fast", "after_fast", "after_slow"))
+
+    async def test_dependencies_injected(self):
+        """Dependency instances should be injected into init functions."""
+        registry = EnhancedServiceRegistry()
+        registry.register_service("config", lambda: {"value": 42})
+        registry.register_service(
+            "consumer", lambda config: config["value"] * 2, dependencies=["config"]
+        )
+
+        await registry.startup_all()
+
+        assert registry.get_service("consumer") == 84
+
+    async def test_optional_dependency_from_earlier_stage_is_waited_for(self):
+        """Optional dependencies in an earlier stage should still be injected."""
+        registry = EnhancedServiceRegistry()
+        started: list[str] = []
+        registry.register_service("base", _slow_service("base", 0.01, started))
+        registry.register_service(
+            "optional_dep", _slow_service("optional_dep", 0.1, started), dependencies=["base"]
+        )
+        registry.register_service(
+            "middle", _slow_service("middle", 0.01, started), dependencies=["base"]
+        )
+        registry.register_service(
+            "consumer",
+            lambda optional_dep=None: optional_dep,
+            dependencies=[
+                ServiceDependency("middle"),
+                ServiceDependency("optional_dep", type=DependencyType.OPTIONAL),
+            ],
+        )
+
+        await registry.startup_all()
+
+        assert registry.get_service("consumer") == "optional_dep"
+
+    async def test_failure_prevents_dependents_from_starting(self):
+        """A failed service should block its dependents and raise."""
+        registry = EnhancedServiceRegistry()
+
+        def broken():
+            raise ValueError("boom")
+
+        registry.register_service("broken", broken)
+        registry.register_service("dependent", lambda: "ok", dependencies=["broken"])
+
+        with pytest.raises(RuntimeError, match="broken"):
+            await registry.startup_all()
+
+        assert registry._service_status["broken"] == ServiceStatus.FAILED
+        assert "dependent" not in registry._services
+
+    async def test_critical_path_in_startup_metrics(self):
+        """Startup metrics should report the chain that determined wall time."""
+        registry = EnhancedServiceRegistry()
+        started: list[str] = []
+        registry.register_service("db", _slow_service("db", 0.1, started))
+        registry.register_service("cache", _slow_service("cache", 0.01, started))
+        registry.register_service(
+            "api", _slow_service("api", 0.05, started), dependencies=["db", "cache"]
+        )
+
+        await registry.startup_all()
+        metrics = registry.get_startup_metrics()
+
+        assert metrics["critical_path"] == ["db", "api"]
+        assert metrics["critical_path_details"][1]["waited_on"] == "db"
+        assert metrics["startup_wall_time_ms"] >= 150
+        assert metrics["startup_wall_time_ms"] < metrics["total_startup_time_ms"] + 50
+
+
+class TestLazyActivation:
+    """Test cases for lazy, on-demand service activation."""
+
+    async def test_lazy_service_not_started_at_boot(self):
+        """Lazy services should be constructed on first async access."""
+        registry = EnhancedServiceRegistry()
+        constructed: list[str] = []
+        registry.register_service("core", lambda: constructed.append("core") or "core")
+        registry.register_service(
+            "reports",
+            lambda core: constructed.append("reports") or f"reports({core})",
+            dependencies=["core"],
+            lazy=True,
+        )
+
+        await registry.startup_all()
+
+        assert constructed == ["core"]
+        assert not registry.has_service("reports")
+
+        service = await registry.get_service_async("reports")
+
+        assert service == "reports(core)"
+        assert constructed == ["core", "reports"]
+        assert registry.get_lazy_service_status()["reports"]["activation_count"] == 1
+
+    async def test_lazy_dependency_of_eager_service_starts_at_boot(self):
+        """A lazy service needed by an eager service must start at boot."""
+        registry = EnhancedServiceRegistry()
+        registry.register_service("optional_backend", lambda: "backend", lazy=True)
+        registry.register_service(
+            "eager", lambda optional_backend: optional_backend, dependencies=["optional_backend"]
+        )
+
+        await registry.startup_all()
+
+        assert registry.has_service("optional_backend")
+        assert registry.get_service("eager") == "backend"
+
+    async def test_concurrent_activation_constructs_once(self):
+        """Concurrent first requests should share a single activation."""
+        registry = EnhancedServiceRegistry()
+        calls = 0
+
+        async def init():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return object()
+
+        registry.register_service("analytics", init, lazy=True)
+        await registry.startup_all()
+
+        results = await asyncio.gather(*(registry.get_service_async("analytics") for _ in range(5)))
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    async def test_sync_get_service_schedules_activation(self):
+        """Synchronous access should kick off activation and raise until ready."""
+        registry = EnhancedServiceRegistry()
+        registry.register_service("discovery", lambda: "discovery", lazy=True)
+        await registry.startup_all()
+
+        with pytest.raises(RuntimeError, match="activating"):
+            registry.get_service("discovery")
+
+        await asyncio.sleep(0.01)
+        assert registry.get_service("discovery") == "discovery"
+
+    async def test_idle_lazy_service_is_stopped_and_reactivated(self):
+        """Idle lazy services should shut down and come back on next use."""
+        registry = EnhancedServiceRegistry()
+        shutdowns: list[str] = []
+
+        class Reporter:
+            def shutdown(self):
+                shutdowns.append("reporter")
+
+        registry.register_service("reporter", Reporter, lazy=True, idle_timeout=0.05)
+        await registry.startup_all()
+        first = await registry.get_service_async("reporter")
+
+        await asyncio.sleep(0.06)
+        stopped = await registry._stop_idle_services()
+
+        assert stopped == ["reporter"]
+        assert shutdowns == ["reporter"]
+        assert not registry.has_service("reporter")
+
+        second = await registry.get_service_async("reporter")
+        assert second is not first
+        assert registry.get_lazy_service_status()["reporter"]["activation_count"] == 2
+        await registry.shutdown()
+
+    async def test_idle_service_kept_while_dependent_active(self):
+        """A lazy service with an active dependent should not be stopped."""
+        registry = EnhancedServiceRegistry()
+        registry.register_service("store", lambda: "store", lazy=True, idle_timeout=0.01)
+        registry.register_service(
+            "consumer", lambda store: store, dependencies=["store"], lazy=True
+        )
+        await registry.startup_all()
+        await registry.get_service_async("consumer")
+
+        await asyncio.sleep(0.02)
+
+        assert await registry._stop_idle_services() == []
+        assert registry.has_service("store")
+        await registry.shutdown()
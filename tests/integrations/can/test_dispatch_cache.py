@@ -0,0 +1,89 @@
+"""
+Tests for the RV-C arbitration-ID dispatch cache.
+"""
+
+from backend.core.entity_manager import EntityManager
+from backend.integrations.can.dispatch_cache import RVCDispatchCache
+from backend.models.entity_model import EntityConfig
+
+TANK_ID = 0x19FFB780
+DECODER_MAP = {TANK_ID: {"dgn_hex": "1ffb7", "name": "TANK_STATUS"}}
+DEVICE_LOOKUP = {("1FFB7", "0"): {"entity_id": "tank_1", "device_type": "tank"}}
+
+
+def _cache() -> RVCDispatchCache:
+    cache = RVCDispatchCache()
+    cache.load(DECODER_MAP, DEVICE_LOOKUP)
+    return cache
+
+
+class TestRVCDispatchCache:
+    """Test cases for RVCDispatchCache."""
+
+    def test_plan_resolved_once_and_counted_per_dgn(self):
+        """Repeated IDs should hit the cache; the first lookup is a miss."""
+        cache = _cache()
+
+        plans = [cache.plan(TANK_ID) for _ in range(3)]
+
+        assert plans[0] is plans[1] is plans[2]
+        assert plans[0].dgn_hex == "1FFB7"
+        assert cache.get_stats()["by_dgn"]["1FFB7"] == {"hits": 2, "misses": 1}
+
+    def test_routes_and_negative_entries(self):
+        """Unmapped instances and unknown IDs are cached as negative entries."""
+        cache = _cache()
+        plan = cache.plan(TANK_ID)
+
+        route = cache.route(plan, 0)
+        assert route.entity_id == "tank_1"
+        assert cache.route(plan, 0) is route
+        assert cache.route(plan, 5) is None
+        assert plan.routes == {0: route, 5: None}
+
+        assert cache.plan(0x123) is None
+        assert cache.plan(0x123) is None
+        stats = cache.get_stats()
+        assert stats["negative_entries"] == 1
+        assert stats["by_dgn"]["unknown"] == {"hits": 1, "misses": 1}
+
+    def test_negative_cache_is_bounded(self):
+        """The unknown-ID set is cleared once it reaches its limit."""
+        cache = RVCDispatchCache(max_negative_entries=4)
+        cache.load(DECODER_MAP, DEVICE_LOOKUP)
+
+        for arbitration_id in range(10):
+            cache.plan(arbitration_id)
+
+        assert cache.get_stats()["negative_entries"] <= 4
+
+    def test_load_invalidates(self):
+        """Reloading the mapping drops plans, routes and negative entries."""
+        cache = _cache()
+        cache.route(cache.plan(TANK_ID), 0)
+        cache.plan(0x123)
+
+        cache.load({0x123: {"dgn_hex": "1FEDA"}}, {})
+
+        stats = cache.get_stats()
+        assert stats["plans"] == 0
+        assert stats["negative_entries"] == 0
+        assert stats["invalidations"] == 2
+        assert cache.plan(0x123).dgn_hex == "1FEDA"
+        assert cache.plan(TANK_ID) is None
+
+    def test_entity_handle_refreshed_after_registration_changes(self):
+        """Entity handles are reused until entities are registered or removed."""
+        cache = _cache()
+        manager = EntityManager()
+        config = EntityConfig(device_type="tank", friendly_name="Tank", suggested_area="Bay")
+        first = manager.register_entity("tank_1", config)
+
+        assert cache.entity("tank_1", manager) is first
+        manager.update_entity_state("tank_1", {"raw": {"level": 1}})
+        assert cache._entities["tank_1"][2] is first
+
+        manager.remove_entity("tank_1")
+        assert cache.entity("tank_1", manager) is None
+        second = manager.register_entity("tank_1", EntityConfig(**config))
+        assert cache.entity("tank_1", manager) is second
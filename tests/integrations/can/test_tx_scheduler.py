@@ -0,0 +1,166 @@
+"""
+Tests for the per-interface CAN transmit scheduler.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import can
+
+from backend.integrations.can.manager import _unpack_queue_item, can_tx_queue, can_writer
+from backend.integrations.can.tx_scheduler import CANTxScheduler, TxPriority
+from backend.services.device_discovery_service import DeviceDiscoveryService
+
+
+class RecordingBus:
+    """Bus stand-in that records (time, arbitration id, thread) per send."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sends: list[tuple[float, int, str]] = []
+
+    def send(self, msg: can.Message) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        self.sends.append(
+            (time.perf_counter(), msg.arbitration_id, threading.current_thread().name)
+        )
+
+
+def _msg(arbitration_id: int) -> can.Message:
+    return can.Message(arbitration_id=arbitration_id, data=[1, 2], is_extended_id=True)
+
+
+async def _drain(scheduler: CANTxScheduler, timeout: float = 1.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while scheduler.queue_depth or scheduler.get_stats()["pending_repeats"]:
+        assert time.perf_counter() < deadline
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(0.01)
+
+
+class TestCANTxScheduler:
+    """Test cases for CANTxScheduler."""
+
+    async def test_bulk_commands_not_serialized_by_repeat_delay(self):
+        """Repeats are timed, so N commands take ~one repeat delay, not N of them."""
+        bus = RecordingBus()
+        scheduler = CANTxScheduler(get_bus=lambda _: bus, repeat_delay=0.05)
+        scheduler.start()
+
+        start = time.perf_counter()
+        for i in range(20):
+            scheduler.submit(_msg(0x100 + i), "can0")
+        await _drain(scheduler)
+        elapsed = time.perf_counter() - start
+
+        assert len(bus.sends) == 40
+        assert elapsed < 0.5
+        first_sends = {aid: t for t, aid, _ in bus.sends[:20]}
+        for t, aid, _ in bus.sends[20:]:
+            assert t - first_sends[aid] >= 0.045
+        assert all(name.startswith("can-tx") for _, _, name in bus.sends)
+        await scheduler.stop()
+
+    async def test_priority_lane_sent_first(self):
+        """Emergency messages jump ahead of queued normal traffic."""
+        bus = RecordingBus(delay=0.005)
+        scheduler = CANTxScheduler(get_bus=lambda _: bus)
+        scheduler.start()
+
+        for i in range(5):
+            scheduler.submit(_msg(0x200 + i), "can0", repeat=False)
+        scheduler.submit(_msg(0x999), "can0", TxPriority.EMERGENCY, repeat=False)
+        await _drain(scheduler)
+
+        # The first normal message may already be in flight; emergency goes next
+        assert [aid for _, aid, _ in bus.sends].index(0x999) <= 1
+        assert scheduler.get_stats()["sent_by_priority"]["emergency"] == 1
+        await scheduler.stop()
+
+    async def test_interfaces_are_independent(self):
+        """A slow bus should not delay another interface."""
+        slow, fast = RecordingBus(delay=0.1), RecordingBus()
+        scheduler = CANTxScheduler(get_bus={"can0": slow, "can1": fast}.get, max_workers=2)
+        scheduler.start()
+
+        start = time.perf_counter()
+        scheduler.submit(_msg(0x1), "can0", repeat=False)
+        scheduler.submit(_msg(0x2), "can1", repeat=False)
+        await asyncio.sleep(0.05)
+
+        assert len(fast.sends) == 1
+        assert fast.sends[0][0] - start < 0.05
+        assert slow.sends == []
+        await _drain(scheduler)
+        await scheduler.stop()
+
+    async def test_stats_and_callbacks(self):
+        """Stats should report sends, repeats, failures and latency; on_sent fires once."""
+        bus = RecordingBus()
+        sent: list[tuple[int, str]] = []
+        scheduler = CANTxScheduler(
+            get_bus={"can0": bus}.get,
+            repeat_delay=0.01,
+            on_sent=lambda msg, iface: sent.append((msg.arbitration_id, iface)),
+        )
+        scheduler.start()
+
+        scheduler.submit(_msg(0x10), "can0")
+        scheduler.submit(_msg(0x11), "missing")
+        await _drain(scheduler)
+        stats = scheduler.get_stats()
+
+        assert sent == [(0x10, "can0")]
+        assert stats["interfaces"]["can0"]["sent"] == 1
+        assert stats["interfaces"]["can0"]["repeats_sent"] == 1
+        assert stats["interfaces"]["missing"]["failed"] == 1
+        assert stats["send_latency"]["max_ms"] >= 0
+        assert stats["queue_wait"]["avg_ms"] >= 0
+        await scheduler.stop()
+        assert not scheduler.running
+
+
+class TestQueueProducers:
+    """Test how can_tx_queue items map onto scheduler lanes."""
+
+    def test_unpack_queue_item_defaults(self):
+        """Missing fields default to the first interface, normal lane and a repeat."""
+        msg = _msg(0x1)
+
+        assert _unpack_queue_item(msg) == (msg, "can0", TxPriority.NORMAL, True)
+        assert _unpack_queue_item((msg, "can1")) == (msg, "can1", TxPriority.NORMAL, True)
+        assert _unpack_queue_item((msg, "can1", TxPriority.EMERGENCY)) == (
+            msg,
+            "can1",
+            TxPriority.EMERGENCY,
+            True,
+        )
+        assert _unpack_queue_item((msg, None, TxPriority.BULK, False)) == (
+            msg,
+            "can0",
+            TxPriority.BULK,
+            False,
+        )
+
+    async def test_discovery_polls_use_bulk_lane_without_repeat(self):
+        """PGN requests from discovery should be sent once on the bulk lane."""
+        bus = RecordingBus()
+        scheduler = CANTxScheduler(get_bus={"can0": bus}.get, repeat_delay=0.01)
+        writer = asyncio.create_task(can_writer(scheduler=scheduler))
+        discovery = DeviceDiscoveryService(config=SimpleNamespace(device_discovery={}))
+
+        assert await discovery._send_pgn_request(0x1FEDA, "rvc")
+        await can_tx_queue.put((_msg(0x30), "can0", TxPriority.SAFETY))
+        await can_tx_queue.join()
+        await _drain(scheduler)
+        stats = scheduler.get_stats()
+
+        assert stats["sent_by_priority"]["bulk"] == 1
+        assert stats["sent_by_priority"]["safety"] == 2
+        assert stats["interfaces"]["can0"]["repeats_sent"] == 1
+        writer.cancel()
+        await writer
+        assert not scheduler.running
@@ -0,0 +1,97 @@
+"""
+Tests for the precompiled RV-C configuration cache.
+"""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.integrations.rvc import config_cache
+from backend.integrations.rvc.decode import build_rvc_configuration, load_config_data_v2
+
+CONFIG_DIR = Path(__file__).parents[3] / "config"
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Copies of the bundled spec and default mapping."""
+    spec = tmp_path / "rvc.json"
+    mapping = tmp_path / "coach_mapping.default.yml"
+    shutil.copy(CONFIG_DIR / "rvc.json", spec)
+    shutil.copy(CONFIG_DIR / "coach_mapping.default.yml", mapping)
+    return str(spec), str(mapping)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+class TestConfigCache:
+    """Test storing and loading precompiled configurations."""
+
+    def test_round_trip(self, sources, cache_dir):
+        """A cached configuration should equal a freshly built one."""
+        built = build_rvc_configuration(*sources)
+        path = config_cache.store_config(built, *sources, cache_dir)
+
+        cached = config_cache.load_cached_config(*sources, cache_dir)
+
+        assert path is not None and path.is_file()
+        assert cached.dgn_dict == built.dgn_dict
+        assert cached.mapping_dict == built.mapping_dict
+        assert cached.entity_ids == built.entity_ids
+        assert cached.coach_info == built.coach_info
+        assert cached.spec_meta == built.spec_meta
+
+    def test_changed_source_misses(self, sources, cache_dir):
+        """Editing a source file should change the key and miss the cache."""
+        spec, mapping = sources
+        config_cache.store_config(build_rvc_configuration(spec, mapping), spec, mapping, cache_dir)
+        key = config_cache.compute_cache_key(spec, mapping)
+
+        with open(mapping, "a") as f:
+            f.write("\n# edited\n")
+
+        assert config_cache.compute_cache_key(spec, mapping) != key
+        assert config_cache.load_cached_config(spec, mapping, cache_dir) is None
+
+    def test_corrupt_cache_is_ignored(self, sources, cache_dir):
+        """A truncated or foreign file should fall back to a rebuild."""
+        key = config_cache.compute_cache_key(*sources)
+        cache_dir.mkdir()
+        path = config_cache.cache_file_path(cache_dir, key)
+
+        path.write_bytes(b"not a cache file")
+        assert config_cache.load_cached_config(*sources, cache_dir) is None
+
+        path.write_bytes(b"CQRVC" + key.encode() + b"\xff\x00")
+        assert config_cache.load_cached_config(*sources, cache_dir) is None
+
+    def test_load_config_data_v2_uses_cache(self, sources, cache_dir):
+        """The second process start should skip parsing when sources are unchanged."""
+        with patch.object(config_cache, "get_cache_dir", return_value=cache_dir):
+            load_config_data_v2.cache_clear()
+            first = load_config_data_v2(*sources)
+            load_config_data_v2.cache_clear()
+            with patch("backend.integrations.rvc.decode.build_rvc_configuration") as build:
+                second = load_config_data_v2(*sources)
+        load_config_data_v2.cache_clear()
+
+        build.assert_not_called()
+        assert second.dgn_dict == first.dgn_dict
+        assert len(list(cache_dir.glob("rvc-config-*.bin"))) == 1
+
+    def test_cli_prebuilds_cache(self, sources, cache_dir, capsys):
+        """The CLI should write a cache file that load_cached_config accepts."""
+        spec, mapping = sources
+
+        status = config_cache.main(
+            ["--spec", spec, "--mapping", mapping, "--cache-dir", str(cache_dir)]
+        )
+
+        assert status == 0
+        assert "cached load" in capsys.readouterr().out
+        assert config_cache.load_cached_config(spec, mapping, cache_dir) is not None
@@ -0,0 +1,145 @@
+"""
+Tests for compact entity history storage.
+"""
+
+import time
+
+from backend.core.entity_manager import EntityManager
+from backend.models.entity_model import Entity, EntityConfig, EntityHistory
+
+
+def _light_config() -> EntityConfig:
+    return EntityConfig(
+        device_type="light",
+        suggested_area="Kitchen",
+        friendly_name="Kitchen Light",
+        capabilities=["brightness", "on_off"],
+        groups=["kitchen"],
+    )
+
+
+class TestEntityHistory:
+    """Test the columnar EntityHistory buffer."""
+
+    def test_entries_replay_changes(self):
+        """Entries should be rebuilt exactly from stored change sets."""
+        history = EntityHistory(10)
+        history.append(1.0, "off", {"brightness": 0, "mode": "a"}, {"b": 0})
+        history.append(2.0, "on", {"brightness": 50, "mode": "a"}, {"b": 100})
+        history.append(3.0, "on", {"brightness": 50}, {"b": 100})
+
+        assert history.entries() == [
+            (1.0, "off", {"brightness": 0, "mode": "a"}, {"b": 0}),
+            (2.0, "on", {"brightness": 50, "mode": "a"}, {"b": 100}),
+            (3.0, "on", {"brightness": 50}, {"b": 100}),
+        ]
+
+    def test_eviction_folds_changes_into_base(self):
+        """Evicting old entries must not change the remaining entries."""
+        history = EntityHistory(2)
+        history.append(1.0, "off", {"x": 1, "gone": True}, {})
+        history.append(2.0, "on", {"x": 2}, {})
+        history.append(3.0, "on", {"x": 3, "new": 1}, {})
+
+        assert len(history) == 2
+        assert history.entries() == [
+            (2.0, "on", {"x": 2}, {}),
+            (3.0, "on", {"x": 3, "new": 1}, {}),
+        ]
+
+    def test_count_and_since_filters(self):
+        """count and since should select the most recent matching entries."""
+        history = EntityHistory(10)
+        for i in range(5):
+            history.append(float(i), "on", {"i": i}, {})
+
+        assert [e[0] for e in history.entries(count=2)] == [3.0, 4.0]
+        assert [e[0] for e in history.entries(since=2.0)] == [2.0, 3.0, 4.0]
+        assert [e[0] for e in history.entries(count=1, since=2.0)] == [4.0]
+
+    def test_prune_before(self):
+        """prune_before should drop entries older than the cutoff."""
+        history = EntityHistory(10)
+        for i in range(4):
+            history.append(float(i), "on", {"i": i}, {})
+
+        history.prune_before(2.0)
+
+        assert history.entries() == [(2.0, "on", {"i": 2}, {}), (3.0, "on", {"i": 3}, {})]
+
+    def test_unchanged_updates_store_no_change_sets(self):
+        """Repeated identical values should not store per-entry dictionaries."""
+        history = EntityHistory(100)
+        for i in range(50):
+            history.append(float(i), "on", {"brightness": 75}, {"b": 150})
+
+        assert all(changes is None for changes in history._value_changes)
+        assert history.memory_bytes() > 0
+
+    def test_non_dict_raw_recorded_as_replacement(self):
+        """Non-dict values (e.g. an optimistic integer raw) should replay and evict intact."""
+        history = EntityHistory(3)
+        history.append(1.0, "off", {"brightness": 0}, {"b": 0})
+        history.append(2.0, "on", {"brightness": 50}, 100)
+        history.append(3.0, "on", {"brightness": 50}, 100)
+        history.append(4.0, "on", {"brightness": 75}, {"b": 150})
+
+        assert history.entries() == [
+            (2.0, "on", {"brightness": 50}, 100),
+            (3.0, "on", {"brightness": 50}, 100),
+            (4.0, "on", {"brightness": 75}, {"b": 150}),
+        ]
+        assert history._raw_changes[1] is None
+
+
+class TestEntityHistoryIntegration:
+    """Test Entity and EntityManager history behaviour."""
+
+    def test_get_history_returns_full_states(self):
+        """get_history should return EntityState objects with config fields."""
+        entity = Entity("light_1", _light_config(), max_history_length=5)
+        entity.update_state({"state": "on", "value": {"brightness": 10}, "raw": {"b": 20}})
+        entity.update_state({"state": "off", "value": {"brightness": 0}, "raw": {"b": 0}})
+
+        history = entity.get_history()
+
+        assert [s.state for s in history] == ["unknown", "on", "off"]
+        assert history[1].value == {"brightness": 10}
+        assert history[1].friendly_name == "Kitchen Light"
+        assert history[-1].timestamp == entity.current_state.timestamp
+
+    def test_history_isolated_from_caller_mutation(self):
+        """Mutating a value dict after update should not rewrite history."""
+        entity = Entity("light_1", _light_config())
+        value = {"brightness": 10}
+        entity.update_state({"state": "on", "value": value})
+        value["brightness"] = 99
+        entity.update_state({"state": "on", "value": {"brightness": 20}})
+
+        assert [s.value["brightness"] for s in entity.get_history()[1:]] == [10, 20]
+
+    def test_age_pruning_applies_on_read(self):
+        """Expired entries should not be returned even between prune intervals."""
+        entity = Entity("light_1", _light_config(), history_duration=60)
+        entity.history = EntityHistory(10)
+        entity.history.append(time.time() - 120, "on", {}, {})
+        entity.history.append(time.time(), "off", {}, {})
+        # Next scheduled prune on the update path is still in the future
+        entity._next_prune = time.time() + 60
+
+        assert [s.state for s in entity.get_history()] == ["off"]
+
+    def test_memory_stats(self):
+        """EntityManager should report history memory usage."""
+        manager = EntityManager()
+        manager.register_entity("light_1", _light_config())
+        manager.register_entity("light_2", _light_config())
+        for i in range(10):
+            manager.update_entity_state("light_1", {"value": {"brightness": i}})
+
+        stats = manager.get_memory_stats()
+
+        assert stats["entity_count"] == 2
+        assert stats["history_entries"] == 12
+        assert stats["largest_history_entity"] == "light_1"
+        assert stats["history_bytes"] >= stats["largest_history_bytes"] > 0
@@ -0,0 +1,195 @@
+"""
+Tests for batched delivery-log ingestion in NotificationAnalyticsRepository.
+
+Uses a real in-memory SQLite database so the executemany insert and the
+rollup upsert are exercised end to end.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.models.database import Base
+from backend.models.notification import NotificationStatus
+from backend.models.notification_analytics import (
+    MetricType,
+    NotificationDeliveryLog,
+    NotificationDeliveryRollup,
+)
+from backend.repositories.notification_analytics_repository import (
+    NotificationAnalyticsRepository,
+)
+
+
+class _SQLiteDatabaseManager:
+    """Minimal database manager backed by an in-memory SQLite engine."""
+
+    def __init__(self, engine):
+        self._sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_session(self):
+        async with self._sessionmaker() as session:
+            yield session
+
+
+@pytest.fixture
+async def db_manager():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield _SQLiteDatabaseManager(engine)
+    await engine.dispose()
+
+
+def _log(status: NotificationStatus, created_at: datetime, **kwargs) -> NotificationDeliveryLog:
+    return NotificationDeliveryLog(
+        notification_id=kwargs.pop("notification_id", "n-1"),
+        channel=kwargs.pop("channel", "smtp"),
+        notification_type=kwargs.pop("notification_type", "info"),
+        status=status.value,
+        retry_count=kwargs.pop("retry_count", 0),
+        created_at=created_at,
+        **kwargs,
+    )
+
+
+class TestBatchedDeliveryLogs:
+    """Test bulk insert, rollups, and the background flusher."""
+
+    async def test_save_writes_logs_and_rollups(self, db_manager):
+        """A batch should land in the log table and fold into minute rollups."""
+        repo = NotificationAnalyticsRepository(db_manager, None)
+        minute = datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+        logs = [
+            _log(NotificationStatus.DELIVERED, minute + timedelta(seconds=5), delivery_time_ms=100),
+            _log(
+                NotificationStatus.DELIVERED, minute + timedelta(seconds=40), delivery_time_ms=300
+            ),
+            _log(NotificationStatus.FAILED, minute + timedelta(seconds=50), retry_count=2),
+            _log(NotificationStatus.DELIVERED, minute + timedelta(minutes=1), channel="slack"),
+        ]
+
+        assert await repo.save_delivery_logs(logs)
+
+        async with db_manager.get_session() as session:
+            log_count = await session.scalar(
+                select(func.count()).select_from(NotificationDeliveryLog)
+            )
+            rollups = (await session.execute(select(NotificationDeliveryRollup))).scalars().all()
+
+        assert log_count == 4
+        smtp = next(r for r in rollups if r.channel == "smtp")
+        assert len(rollups) == 2
+        assert smtp.total_count == 3
+        assert smtp.delivered_count == 2
+        assert smtp.failed_count == 1
+        assert smtp.retry_count == 2
+        assert smtp.delivery_time_total_ms == 400
+        assert smtp.delivery_time_count == 2
+
+    async def test_rollups_accumulate_across_batches(self, db_manager):
+        """Later batches for the same minute should increment the existing rollup."""
+        repo = NotificationAnalyticsRepository(db_manager, None)
+        minute = datetime(2025, 6, 1, 12, 30, tzinfo=UTC)
+
+        await repo.save_delivery_logs([_log(NotificationStatus.DELIVERED, minute)])
+        await repo.save_delivery_logs(
+            [_log(NotificationStatus.FAILED, minute + timedelta(seconds=10))]
+        )
+
+        start, end = minute, minute + timedelta(hours=1)
+        assert await repo.calculate_metric_value(MetricType.DELIVERY_COUNT, start, end) == 2.0
+        assert await repo.calculate_metric_value(MetricType.SUCCESS_RATE, start, end) == 0.5
+
+    async def test_metrics_read_from_rollups(self, db_manager):
+        """Dashboard metrics should be served from the rollup table."""
+        repo = NotificationAnalyticsRepository(db_manager, None)
+        hour = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+        await repo.save_delivery_logs(
+            [
+                _log(NotificationStatus.DELIVERED, hour, delivery_time_ms=200),
+                _log(NotificationStatus.DELIVERED, hour + timedelta(minutes=30)),
+                _log(NotificationStatus.FAILED, hour + timedelta(minutes=59)),
+                # Outside the hour
+                _log(NotificationStatus.FAILED, hour + timedelta(hours=1)),
+            ]
+        )
+
+        end = hour + timedelta(hours=1)
+        assert await repo.calculate_metric_value(MetricType.DELIVERY_COUNT, hour, end) == 3.0
+        assert await repo.calculate_metric_value(
+            MetricType.SUCCESS_RATE, hour, end
+        ) == pytest.approx(2 / 3)
+        assert (
+            await repo.calculate_metric_value(MetricType.AVERAGE_DELIVERY_TIME, hour, end) == 200.0
+        )
+
+        stats = await repo.get_channel_statistics(start_date=hour, end_date=end)
+        assert stats == [
+            {
+                "channel": "smtp",
+                "total": 3,
+                "delivered": 2,
+                "failed": 1,
+                "retries": 0,
+                "avg_delivery_time": 200.0,
+            }
+        ]
+
+    async def test_size_trigger_flushes_in_background(self, db_manager):
+        """Reaching the batch size should flush without waiting for the interval."""
+        repo = NotificationAnalyticsRepository(
+            db_manager, None, flush_batch_size=3, flush_interval=60.0
+        )
+        repo.start_flusher()
+        now = datetime.now(UTC)
+
+        await repo.buffer_delivery_logs(
+            [_log(NotificationStatus.DELIVERED, now, notification_id=f"n-{i}") for i in range(3)]
+        )
+        for _ in range(50):
+            if repo.get_flush_stats()["flushed_logs"] == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        stats = repo.get_flush_stats()
+        assert stats["flushed_logs"] == 3
+        assert stats["size_triggered_flushes"] == 1
+        assert repo.get_buffer_size() == 0
+        await repo.stop_flusher()
+
+    async def test_stop_flushes_remaining_logs(self, db_manager):
+        """Stopping the flusher should persist anything still buffered."""
+        repo = NotificationAnalyticsRepository(
+            db_manager, None, flush_batch_size=100, flush_interval=60.0
+        )
+        repo.start_flusher()
+        await repo.add_to_buffer(_log(NotificationStatus.DELIVERED, datetime.now(UTC)))
+
+        await repo.stop_flusher()
+
+        async with db_manager.get_session() as session:
+            count = await session.scalar(select(func.count()).select_from(NotificationDeliveryLog))
+        assert count == 1
+        assert repo.get_flush_stats()["flusher_running"] is False
+
+    async def test_failed_flush_requeues_logs(self, db_manager):
+        """Logs from a failed flush should stay buffered for the next attempt."""
+        repo = NotificationAnalyticsRepository(db_manager, None, flush_batch_size=10)
+
+        async def fail(_logs):
+            return False
+
+        repo.save_delivery_logs = fail
+        await repo.buffer_delivery_logs(
+            [_log(NotificationStatus.DELIVERED, datetime.now(UTC)) for _ in range(2)]
+        )
+
+        assert await repo.flush_pending() == 0
+        assert repo.get_buffer_size() == 2
+        assert repo.get_flush_stats()["failed_flushes"] == 1
@@ -0,0 +1,137 @@
+"""
+Unit tests for the bounded authentication crypto executor.
+
+Tests cover:
+- Running blocking work off the event loop
+- Concurrency cap and queue saturation
+- Queue-wait and run-time metrics
+- Saturation surfaced as 503 rather than an authentication failure
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.core.config import AuthenticationSettings
+from backend.services.auth_crypto_executor import (
+    RETRY_AFTER_SECONDS,
+    CryptoExecutor,
+    CryptoExecutorSaturatedError,
+)
+from backend.services.auth_manager import AuthenticationBusyError, AuthenticationError, AuthManager
+
+
+class TestCryptoExecutor:
+    """Test CryptoExecutor behaviour."""
+
+    async def test_runs_off_event_loop_thread(self):
+        """Work should execute in a worker thread, not the loop thread."""
+        executor = CryptoExecutor(max_workers=1)
+        loop_thread = threading.get_ident()
+
+        worker_thread = await executor.run("ident", threading.get_ident)
+
+        assert worker_thread != loop_thread
+        executor.shutdown()
+
+    async def test_event_loop_stays_responsive(self):
+        """The loop should keep ticking while a blocking job runs."""
+        executor = CryptoExecutor(max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await executor.run("sleep", time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+        executor.shutdown()
+
+    async def test_concurrency_cap_and_queue_wait_metrics(self):
+        """Jobs beyond max_workers should wait and report queue time."""
+        executor = CryptoExecutor(max_workers=1, max_pending=4)
+
+        await asyncio.gather(*(executor.run("sleep", time.sleep, 0.05) for _ in range(3)))
+
+        metrics = executor.get_metrics()
+        assert metrics["completed"] == 3
+        assert metrics["running"] == 0
+        assert metrics["waiting"] == 0
+        assert metrics["max_queue_wait_ms"] >= 50
+        assert metrics["operations"] == {"sleep": 3}
+        executor.shutdown()
+
+    async def test_rejects_when_queue_full(self):
+        """A burst beyond max_pending waiters should be rejected."""
+        executor = CryptoExecutor(max_workers=1, max_pending=1)
+
+        running = asyncio.create_task(executor.run("sleep", time.sleep, 0.1))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(executor.run("sleep", time.sleep, 0.01))
+        await asyncio.sleep(0)
+
+        with pytest.raises(CryptoExecutorSaturatedError):
+            await executor.run("sleep", time.sleep, 0.01)
+
+        await asyncio.gather(running, queued)
+        assert executor.get_metrics()["rejected"] == 1
+        executor.shutdown()
+
+    async def test_failures_are_counted_and_propagated(self):
+        """Exceptions from the job should propagate and be counted."""
+        executor = CryptoExecutor(max_workers=1)
+
+        def boom():
+            raise ValueError("bad hash")
+
+        with pytest.raises(ValueError):
+            await executor.run("verify", boom)
+
+        metrics = executor.get_metrics()
+        assert metrics["failed"] == 1
+        assert metrics["running"] == 0
+        executor.shutdown()
+
+    async def test_run_after_shutdown_raises(self):
+        """Submitting after shutdown should fail fast."""
+        executor = CryptoExecutor(max_workers=1)
+        executor.shutdown()
+
+        with pytest.raises(RuntimeError):
+            await executor.run("hash", str, "x")
+
+
+class TestSaturationHandling:
+    """Test how a saturated executor reaches callers."""
+
+    def test_busy_error_is_not_an_authentication_failure(self):
+        """Routers map AuthenticationError to 401, so busy must not be one."""
+        assert issubclass(AuthenticationBusyError, CryptoExecutorSaturatedError)
+        assert not issubclass(AuthenticationBusyError, AuthenticationError)
+
+    async def test_auth_manager_uses_shared_executor(self):
+        """An injected executor should be used but left running on shutdown."""
+        executor = CryptoExecutor(max_workers=1)
+        auth_manager = AuthManager(AuthenticationSettings(enabled=False), crypto_executor=executor)
+
+        assert auth_manager._crypto_executor is executor
+        await auth_manager.shutdown()
+        assert await executor.run("hash", str.upper, "x") == "X"
+        executor.shutdown()
+
+    async def test_saturation_maps_to_503_with_retry_after(self):
+        """The app-level handler should ask the client to retry later."""
+        from backend.main import app
+
+        handler = app.exception_handlers[CryptoExecutorSaturatedError]
+        response = await handler(None, AuthenticationBusyError("busy"))
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == str(RETRY_AFTER_SECONDS)
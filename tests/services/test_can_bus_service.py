@@ -0,0 +1,130 @@
+"""
+Tests for CANBusService entity updates from decoded CAN messages.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.entity_manager import EntityManager
+from backend.models.entity_model import EntityConfig
+from backend.services.can_bus_service import CANBusService
+
+DEVICE_CONFIG = {"device_type": "tank", "friendly_name": "Fresh Tank", "suggested_area": "Bay"}
+
+
+@pytest.fixture
+def entity_manager():
+    """EntityManager with a single tank entity."""
+    manager = EntityManager()
+    manager.register_entity("tank_1", EntityConfig(**DEVICE_CONFIG))
+    return manager
+
+
+@pytest.fixture
+def websocket_service():
+    """WebSocket service mock."""
+    service = MagicMock()
+    service.broadcast_to_data_clients = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def can_bus_service(entity_manager, websocket_service):
+    """CANBusService wired to a fake service registry."""
+    tracking_repository = MagicMock()
+    tracking_repository._pending_commands = []
+    service = CANBusService(tracking_repository, MagicMock())
+
+    entity_manager_service = MagicMock()
+    entity_manager_service.get_entity_manager.return_value = entity_manager
+    services = {"entity_manager": entity_manager_service, "websocket_service": websocket_service}
+    registry = MagicMock()
+    registry.get_service.side_effect = services.get
+
+    with patch("backend.core.dependencies.get_service_registry", return_value=registry):
+        yield service
+
+
+async def _receive(service: CANBusService, level: int, timestamp: float) -> None:
+    await service._update_entity_from_can_message(
+        "tank_1",
+        DEVICE_CONFIG,
+        {"level": level},
+        {"level": level * 2},
+        {"timestamp": timestamp},
+    )
+
+
+class TestEntityUpdateSuppression:
+    """Test suppression of repeated CAN status frames."""
+
+    async def test_repeated_frame_is_suppressed(
+        self, can_bus_service, entity_manager, websocket_service
+    ):
+        """Identical frames should confirm state without history, version bump or broadcast."""
+        confirmed = []
+        entity_manager.register_state_confirmed_listener(confirmed.append)
+        await _receive(can_bus_service, 50, 100.0)
+        entity = entity_manager.get_entity("tank_1")
+        version = entity.version
+
+        await _receive(can_bus_service, 50, 101.0)
+        await _receive(can_bus_service, 50, 102.0)
+
+        assert confirmed == ["tank_1", "tank_1"]
+        assert websocket_service.broadcast_to_data_clients.await_count == 1
+        assert len(entity.get_history(since=0)) == 2
+        assert entity.version == version
+        assert entity.current_state.timestamp == 100.0
+        assert entity.last_seen == 102.0
+        assert can_bus_service.get_entity_update_stats() == {
+            "applied": 1,
+            "suppressed": 2,
+            "suppression_ratio": 2 / 3,
+        }
+
+    async def test_changed_frame_is_applied(
+        self, can_bus_service, entity_manager, websocket_service
+    ):
+        """A frame with a new value should update state and broadcast."""
+        await _receive(can_bus_service, 50, 100.0)
+        await _receive(can_bus_service, 40, 101.0)
+
+        entity = entity_manager.get_entity("tank_1")
+        assert entity.current_state.value == {"level": 40}
+        assert entity.current_state.raw == {"level": 80}
+        assert websocket_service.broadcast_to_data_clients.await_count == 2
+        assert can_bus_service.get_entity_update_stats()["suppressed"] == 0
+
+
+class TestDispatchCache:
+    """Test arbitration-ID dispatch in _process_message."""
+
+    async def test_frames_dispatched_through_cache(
+        self, can_bus_service, entity_manager, websocket_service
+    ):
+        """Mapped frames update the entity; unknown IDs are negatively cached."""
+        tank_id = 0x19FFB780
+        can_bus_service.decoder_map = {tank_id: {"dgn_hex": "1ffb7"}}
+        can_bus_service.device_lookup = {("1FFB7", "0"): {"entity_id": "tank_1", **DEVICE_CONFIG}}
+        can_bus_service._dispatch_cache.load(
+            can_bus_service.decoder_map, can_bus_service.device_lookup
+        )
+
+        def decode(_entry, data):
+            return {"level": data[1]}, {"instance": data[0], "level": data[1] * 2}
+
+        with patch("backend.services.can_bus_service.decode_payload", side_effect=decode):
+            for level in (10, 20):
+                await can_bus_service._process_message(
+                    {"arbitration_id": tank_id, "data": bytes([0, level]), "timestamp": level}
+                )
+            await can_bus_service._process_message({"arbitration_id": 0x123, "data": b"\x00"})
+
+        assert entity_manager.get_entity("tank_1").current_state.value == {"level": 20}
+        assert websocket_service.broadcast_to_data_clients.await_count == 2
+        stats = can_bus_service.get_dispatch_stats()
+        assert stats["by_dgn"]["1FFB7"] == {"hits": 1, "misses": 1}
+        assert stats["negative_entries"] == 1
+        assert stats["entity_handles"] == 1
@@ -0,0 +1,162 @@
+"""
+Tests for poll tracking and protocol detection in DeviceDiscoveryService.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import can
+import pytest
+
+from backend.services.device_discovery_service import (
+    SHARED_PROTOCOL_PGNS,
+    DeviceDiscoveryService,
+    DeviceInfo,
+)
+
+
+@pytest.fixture
+def service():
+    """Discovery service with default settings and no CAN facade."""
+    return DeviceDiscoveryService(config=SimpleNamespace(device_discovery={}))
+
+
+def _response(source_address: int, pgn: int) -> can.Message:
+    return can.Message(
+        arbitration_id=(6 << 26) | (pgn << 8) | source_address,
+        data=[0] * 8,
+        is_extended_id=True,
+    )
+
+
+def _scan_protocol(protocol_pgn_ranges: dict, pgn: int) -> str | None:
+    """Range scan the lookup table replaces."""
+    for protocol, info in protocol_pgn_ranges.items():
+        if pgn in info["characteristic_pgns"]:
+            return protocol
+        for start, end in info["pgn_ranges"]:
+            if start <= pgn <= end and pgn not in SHARED_PROTOCOL_PGNS:
+                return protocol
+    return None
+
+
+class TestProtocolDetection:
+    """Test the precomputed PGN to protocol table."""
+
+    def test_table_matches_range_scan(self, service):
+        """Every PGN should resolve as the range scan would."""
+        for pgn in range(0x40000):
+            assert service._detect_protocol_from_pgn(pgn) == _scan_protocol(
+                service.protocol_pgn_ranges, pgn
+            ), f"PGN {pgn:05X}"
+
+    def test_shared_pgn_is_unknown(self, service):
+        """The PGN Request is used by both protocols and identifies neither."""
+        assert service._detect_protocol_from_pgn(0xEA00) is None
+        assert service._detect_protocol_from_pgn(0x1FEDA) == "rvc"
+        assert service._detect_protocol_from_pgn(0xF004) == "j1939"
+
+
+class TestPollResponseMatching:
+    """Test the (address, PGN) index of outstanding polls."""
+
+    async def test_response_completes_matching_poll_only(self, service):
+        """A response should complete its own poll and leave the others pending."""
+        with patch.object(service, "_send_pgn_request", AsyncMock(return_value=True)):
+            for address in range(0x10, 0x30):
+                await service.poll_device(address, 0xFEDA)
+            await service.poll_device(0x20, 0xFEEB)
+
+        service.process_can_message(_response(0x20, 0xFEDA))
+
+        assert len(service.active_polls) == 32
+        assert "rvc_20_FEDA" not in service.active_polls
+        assert "rvc_20_FEEB" in service.active_polls
+        assert (0x20, 0xFEDA) not in service._polls_by_target
+
+        # A repeat response has no poll left to match
+        service.process_can_message(_response(0x20, 0xFEDA))
+        assert len(service.active_polls) == 32
+
+    async def test_instance_polls_complete_in_send_order(self, service):
+        """Polls for several instances of one PGN should complete oldest first."""
+        with patch.object(service, "_send_pgn_request", AsyncMock(return_value=True)):
+            await service.poll_device(0x42, 0xFEDA, instance=1)
+            await service.poll_device(0x42, 0xFEDA, instance=2)
+
+        service.process_can_message(_response(0x42, 0xFEDA))
+        assert list(service.active_polls) == ["rvc_42_FEDA_2"]
+
+        service.process_can_message(_response(0x42, 0xFEDA))
+        assert service.active_polls == {}
+        assert service._polls_by_target == {}
+        assert service.topology.devices[0x42].response_count == 1
+
+
+class TestPollingScheduler:
+    """Test paced polling and non-responder backoff."""
+
+    @pytest.fixture
+    def paced_service(self):
+        service = DeviceDiscoveryService(
+            config=SimpleNamespace(
+                device_discovery={"polling_interval_seconds": 0.1, "poll_budget_per_second": 50}
+            )
+        )
+        stale = time.time() - 60
+        for address in range(0x10, 0x20):
+            service.topology.devices[address] = DeviceInfo(
+                source_address=address, protocol="rvc", device_type="light", last_seen=stale
+            )
+        return service
+
+    async def test_pass_is_paced_within_budget(self, paced_service):
+        """A pass should send at most the budget, spread over the interval."""
+        send = AsyncMock(return_value=True)
+        with patch.object(paced_service, "_send_pgn_request", send):
+            started = time.monotonic()
+            await paced_service._poll_known_devices()
+            elapsed = time.monotonic() - started
+
+        # 50 requests/s over a 0.1 s interval
+        assert send.await_count == 5
+        assert elapsed >= 0.08
+        stats = paced_service.get_polling_stats()
+        assert stats["last_pass_requests"] == 5
+        assert stats["last_pass_deferred"] == 11
+        assert stats["duty_cycle"] == 1.0
+
+    async def test_non_responder_backs_off_until_it_answers(self, paced_service):
+        """An unanswered device should be skipped until its backoff expires."""
+        for address in list(paced_service.topology.devices)[1:]:
+            del paced_service.topology.devices[address]
+        device = paced_service.topology.devices[0x10]
+
+        send = AsyncMock(return_value=True)
+        with patch.object(paced_service, "_send_pgn_request", send):
+            await paced_service._poll_known_devices()
+            await paced_service._poll_known_devices()
+            assert send.await_count == 1
+            assert device.poll_failures == 1
+            assert device.next_poll_at > time.time()
+
+            # Backoff expired: poll again rather than counting another failure
+            elapsed = device.next_poll_at - time.time() + 1
+            device.last_seen -= elapsed
+            device.last_polled -= elapsed
+            device.next_poll_at -= elapsed
+            await paced_service._poll_known_devices()
+            assert send.await_count == 2
+            assert device.poll_failures == 1
+
+        paced_service.process_can_message(_response(0x10, 0xFEDA))
+        assert device.poll_failures == 0
+        assert paced_service.get_polling_stats()["backed_off_devices"] == 0
+
+    async def test_health_check_reports_polling(self, paced_service):
+        """health_check should include the polling duty cycle."""
+        health = await paced_service.health_check()
+
+        assert health["polling"]["budget_per_second"] == 50
+        assert "duty_cycle" in health["polling"]
@@ -0,0 +1,229 @@
+"""
+Tests for event-driven command acknowledgement in EntityDomainService.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.core.entity_manager import EntityManager
+from backend.integrations.can.tx_scheduler import TxPriority
+from backend.models.entity_model import EntityConfig
+from backend.repositories import EntityStateRepository
+from backend.services.entity_domain_service import (
+    BulkSafetyOperationRequestV2,
+    EntityDomainService,
+    SafetyControlCommandV2,
+)
+from backend.services.entity_service import EntityService
+
+LIGHT_CONFIG = {
+    "device_type": "light",
+    "friendly_name": "Galley",
+    "suggested_area": "Galley",
+    "instance": 1,
+    "interface": "house",
+}
+
+TURN_ON = SafetyControlCommandV2(
+    command="set", state=True, safety_confirmation=True, timeout_seconds=0.1
+)
+
+
+@pytest.fixture
+def entity_manager():
+    """EntityManager with two lights that last reported "off"."""
+    manager = EntityManager()
+    for entity_id in ("light_1", "light_2"):
+        manager.register_entity(entity_id, EntityConfig(**LIGHT_CONFIG))
+        manager.get_entity(entity_id).update_state({"state": "off", "raw": {"level": 0}})
+    return manager
+
+
+@pytest.fixture
+def domain_service(entity_manager):
+    """Domain service wired to the EntityManager and a real EntityService."""
+    repository = EntityStateRepository(entity_manager)
+    for entity_id in ("light_1", "light_2"):
+        repository.set_entity(entity_id, entity_manager.get_entity(entity_id))
+    websocket_manager = MagicMock()
+    websocket_manager.broadcast_to_data_clients = AsyncMock()
+    entity_service = EntityService(
+        websocket_manager=websocket_manager,
+        entity_state_repository=repository,
+        rvc_config_repository=MagicMock(),
+        diagnostics_repository=MagicMock(),
+    )
+    entity_manager_service = MagicMock()
+    entity_manager_service.get_entity_manager.return_value = entity_manager
+    return EntityDomainService(
+        MagicMock(), MagicMock(), entity_service, websocket_manager, entity_manager_service
+    )
+
+
+@pytest.fixture
+def tx_queue():
+    """CAN transmit queue that captures commands instead of sending them."""
+    queue = asyncio.Queue()
+    with patch("backend.services.entity_service.can_tx_queue", queue):
+        yield queue
+
+
+def _start_wait(service, entity_id, timeout=5.0, command=TURN_ON):
+    """Register a waiter for the command's expected state and start waiting on it."""
+    waiter = service._register_ack_waiter(
+        entity_id, service._get_expected_entity_state(entity_id, command)
+    )
+    return asyncio.create_task(service._wait_for_acknowledgment("op", entity_id, waiter, timeout))
+
+
+class TestAcknowledgementWait:
+    """Test acknowledgement waits driven by state-change notifications."""
+
+    async def test_status_frame_resolves_wait(self, domain_service, entity_manager):
+        """The wait should resolve as soon as a matching status update arrives."""
+        wait = _start_wait(domain_service, "light_1")
+        await asyncio.sleep(0)
+
+        entity_manager.update_entity_state("light_1", {"state": "on", "raw": {"level": 200}})
+        acknowledged, ack_ms = await asyncio.wait_for(wait, 0.5)
+
+        assert acknowledged
+        assert ack_ms is not None and ack_ms < 100
+        assert domain_service._ack_waiters == {}
+        stats = domain_service._get_ack_stats()
+        assert stats["acknowledged"] == 1
+        assert stats["waiting"] == 0
+
+    async def test_non_matching_update_does_not_acknowledge(self, domain_service, entity_manager):
+        """A status frame reporting a different state should time out, not acknowledge."""
+        wait = _start_wait(domain_service, "light_1", timeout=0.05)
+        await asyncio.sleep(0)
+
+        entity_manager.update_entity_state("light_1", {"state": "off", "raw": {"level": 0}})
+
+        assert await wait == (False, None)
+        assert domain_service._ack_waiters == {}
+        assert domain_service._get_ack_stats()["timeouts"] == 1
+
+    async def test_concurrent_waits_share_one_listener(self, domain_service, entity_manager):
+        """Bulk waits register one listener and resolve per entity."""
+        waits = [_start_wait(domain_service, entity_id) for entity_id in ("light_1", "light_2")]
+        await asyncio.sleep(0)
+        assert domain_service._get_ack_stats()["waiting"] == 2
+        assert entity_manager._state_change_listeners == [domain_service._on_entity_state_change]
+
+        entity_manager.update_entity_state("light_2", {"state": "on", "raw": {"level": 200}})
+        acknowledged, _ = await asyncio.wait_for(waits[1], 0.5)
+        assert acknowledged
+        assert not waits[0].done()
+
+        entity_manager.update_entity_state("light_1", {"state": "on", "raw": {"level": 200}})
+        results = await asyncio.wait_for(asyncio.gather(*waits), 0.5)
+        assert all(acknowledged for acknowledged, _ in results)
+
+    async def test_state_before_registration_does_not_acknowledge(
+        self, domain_service, entity_manager
+    ):
+        """Only status frames received after the waiter is registered count."""
+        entity_manager.update_entity_state("light_1", {"state": "on", "raw": {"level": 200}})
+
+        assert await _start_wait(domain_service, "light_1", timeout=0.05) == (False, None)
+
+    async def test_confirmed_state_resolves_wait(self, domain_service, entity_manager):
+        """A repeated status frame (no state change) should still acknowledge the command."""
+        wait = _start_wait(domain_service, "light_1")
+        await asyncio.sleep(0)
+
+        # Optimistic update applied without notifying listeners, then the device
+        # rebroadcasts the same state
+        entity_manager.get_entity("light_1").update_state({"state": "on"})
+        await asyncio.sleep(0.01)
+        assert not wait.done()
+        entity_manager.confirm_entity_state("light_1")
+        acknowledged, _ = await asyncio.wait_for(wait, 0.5)
+
+        assert acknowledged
+        assert entity_manager._state_confirmed_listeners == [domain_service._on_entity_state_change]
+
+    def test_expected_state_follows_command_target(self, domain_service, entity_manager):
+        """The expected state comes from the command, relative to the reported state."""
+        entity_manager.update_entity_state("light_1", {"state": "on", "brightness": 40})
+
+        def expected(**command):
+            return domain_service._get_expected_entity_state(
+                "light_1", SafetyControlCommandV2(**command)
+            )
+
+        assert expected(command="set", state=False) == {"state": "off"}
+        assert expected(command="set", state=True, brightness=60) == {
+            "state": "on",
+            "brightness": 60,
+        }
+        assert expected(command="toggle") == {"state": "off"}
+        assert expected(command="brightness_down") == {"state": "on", "brightness": 30}
+
+
+class TestSafeControlAcknowledgement:
+    """Test control_entity_safe end to end against the optimistic update."""
+
+    async def test_optimistic_update_alone_times_out(
+        self, domain_service, entity_manager, tx_queue
+    ):
+        """With no status frame from the device, the command must not be acknowledged."""
+        result = await domain_service.control_entity_safe("light_1", TURN_ON)
+
+        assert entity_manager.get_entity("light_1").current_state.state == "on"
+        assert tx_queue.qsize() == 1
+        assert not result.acknowledged
+        assert result.error_code == "ACKNOWLEDGMENT_TIMEOUT"
+        assert domain_service._ack_waiters == {}
+
+    async def test_later_status_frame_acknowledges(self, domain_service, entity_manager, tx_queue):
+        """A status frame reporting the commanded state after the send acknowledges it."""
+        loop = asyncio.get_running_loop()
+        loop.call_later(
+            0.02,
+            entity_manager.update_entity_state,
+            "light_1",
+            {"state": "on", "brightness": 100, "raw": {"operating_status": 200}},
+        )
+
+        result = await domain_service.control_entity_safe("light_1", TURN_ON)
+
+        assert result.acknowledged
+        assert result.status == "success"
+        assert result.acknowledgment_time_ms is not None
+
+
+class TestTransmitPriority:
+    """Test the CAN transmit lane chosen for safety-controlled commands."""
+
+    @staticmethod
+    def _command() -> SafetyControlCommandV2:
+        return SafetyControlCommandV2(
+            command="set", state=False, safety_confirmation=True, timeout_seconds=0.1
+        )
+
+    async def test_safe_control_uses_safety_lane(self, domain_service):
+        """Single safety-validated commands should be sent on the safety lane."""
+        domain_service.entities.control_entity = AsyncMock()
+
+        await domain_service.control_entity_safe("light_1", self._command())
+
+        assert domain_service.entities.control_entity.await_args.args[2] == TxPriority.SAFETY
+
+    async def test_emergency_bulk_uses_emergency_lane(self, domain_service):
+        """Bulk operations in emergency_stop mode should be sent on the emergency lane."""
+        domain_service.entities.control_entity = AsyncMock()
+        request = BulkSafetyOperationRequestV2(
+            entity_ids=["light_1", "light_2"], command=self._command(), safety_mode="emergency_stop"
+        )
+
+        await domain_service.bulk_control_entities_safe(request)
+
+        priorities = [
+            call.args[2] for call in domain_service.entities.control_entity.await_args_list
+        ]
+        assert priorities == [TxPriority.EMERGENCY, TxPriority.EMERGENCY]
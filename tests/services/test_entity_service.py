@@ -8,13 +8,16 @@ Tests the entity service business logic, including:
 - WebSocket integration
 """
 
-from unittest.mock import AsyncMock, Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from backend.core.entity_manager import EntityManager
+from backend.integrations.can.tx_scheduler import TxPriority
 from backend.models.entity import ControlCommand
-from backend.models.entity_model import Entity
+from backend.models.entity_model import Entity, EntityConfig
+from backend.repositories import EntityStateRepository
 from backend.services.entity_service import EntityService
 
 # ================================
@@ -288,3 +291,63 @@ class TestEntityService:
         # Act & Assert
         with pytest.raises(ValueError, match="Entity 'nonexistent.light' not found"):
             await entity_service.control_light(entity_id, command)
+
+
+@pytest.mark.unit
+class TestLightCommandExecution:
+    """Test light commands against a real entity state repository."""
+
+    @pytest.fixture
+    def light_service(self):
+        entity_manager = EntityManager()
+        entity_manager.register_entity(
+            "light.kitchen",
+            EntityConfig(
+                device_type="light",
+                suggested_area="Kitchen",
+                friendly_name="Kitchen Light",
+                capabilities=["brightness", "on_off"],
+                instance=1,
+                interface="house",
+            ),
+        )
+        repository = EntityStateRepository(entity_manager)
+        repository.set_entity("light.kitchen", entity_manager.get_entity("light.kitchen"))
+        websocket_manager = Mock()
+        websocket_manager.broadcast_to_data_clients = AsyncMock()
+        service = EntityService(
+            websocket_manager=websocket_manager,
+            entity_state_repository=repository,
+            rvc_config_repository=Mock(),
+            diagnostics_repository=Mock(),
+        )
+        return service, entity_manager
+
+    async def test_optimistic_integer_raw_is_recorded(self, light_service):
+        """Optimistic payloads carry an integer raw; history must accept it on every command."""
+        service, entity_manager = light_service
+        tx_queue = asyncio.Queue()
+
+        with patch("backend.services.entity_service.can_tx_queue", tx_queue):
+            first = await service._execute_light_command("light.kitchen", 50, "Set ON to 50%")
+            second = await service._execute_light_command("light.kitchen", 0, "Set OFF")
+
+        assert first.status == "success"
+        assert second.status == "success"
+        assert [tx_queue.get_nowait()[2] for _ in range(2)] == [TxPriority.NORMAL] * 2
+        history = entity_manager.get_entity("light.kitchen").get_history()
+        assert [(state.state, state.raw) for state in history[-2:]] == [("on", 100), ("off", 0)]
+
+    async def test_priority_selects_transmit_lane(self, light_service):
+        """The requested priority should be queued with the CAN command."""
+        service, _ = light_service
+        tx_queue = asyncio.Queue()
+
+        with patch("backend.services.entity_service.can_tx_queue", tx_queue):
+            await service.control_light(
+                "light.kitchen", ControlCommand(command="set", state="off"), TxPriority.EMERGENCY
+            )
+
+        _message, interface, priority = tx_queue.get_nowait()
+        assert interface == "can0"
+        assert priority == TxPriority.EMERGENCY
@@ -0,0 +1,131 @@
+"""
+Tests for pooled notification channel clients.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.notification_channel_clients import (
+    APPRISE_AVAILABLE,
+    ChannelCircuitBreaker,
+    CircuitOpenError,
+    NotificationChannelClients,
+)
+
+
+async def _succeed() -> bool:
+    return True
+
+
+async def _fail() -> bool:
+    return False
+
+
+class TestChannelCircuitBreaker:
+    """Test circuit state transitions."""
+
+    def test_opens_after_threshold_and_allows_one_trial(self):
+        """Consecutive failures should open the circuit; recovery allows a single trial."""
+        breaker = ChannelCircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.trips == 1
+
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        """A failed trial delivery should reopen the circuit."""
+        breaker = ChannelCircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+        breaker.record_failure()
+        assert not breaker.allow()
+        assert breaker.retry_after() > 0
+
+        breaker._opened_at -= 60.0
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.trips == 2
+
+
+class TestNotificationChannelClients:
+    """Test delivery wrapping, pooling and metrics."""
+
+    async def test_deliver_records_latency(self):
+        """Each delivery should be counted with its latency."""
+        clients = NotificationChannelClients()
+        assert await clients.deliver("webhook", _succeed)
+        assert not await clients.deliver("webhook", _fail)
+
+        stats = clients.get_stats()["channels"]["webhook"]
+        assert stats["deliveries"] == 2
+        assert stats["failures"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["avg_latency_ms"] >= 0.0
+        assert stats["circuit_state"] == "closed"
+
+    async def test_open_circuit_rejects_only_that_channel(self):
+        """A failing channel should be short-circuited without affecting others."""
+        clients = NotificationChannelClients(failure_threshold=2, recovery_timeout=60.0)
+        await clients.deliver("webhook", _fail)
+        await clients.deliver("webhook", _fail)
+
+        with pytest.raises(CircuitOpenError):
+            await clients.deliver("webhook", _succeed)
+        assert await clients.deliver("smtp", _succeed)
+
+        stats = clients.get_stats()["channels"]
+        assert stats["webhook"]["rejected"] == 1
+        assert stats["webhook"]["circuit_state"] == "open"
+        assert stats["smtp"]["circuit_state"] == "closed"
+
+    async def test_concurrency_limit_per_channel(self):
+        """No more than max_concurrency deliveries should run at once on a channel."""
+        clients = NotificationChannelClients(max_concurrency=2)
+        running = peak = 0
+
+        async def slow_send() -> bool:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        await asyncio.gather(*(clients.deliver("pushover", slow_send) for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.skipif(not APPRISE_AVAILABLE, reason="apprise not installed")
+    def test_apprise_clients_reused_per_url(self):
+        """The same URL should reuse one Apprise instance; the cache is bounded."""
+        clients = NotificationChannelClients(max_apprise_clients=2)
+        first = clients.get_apprise("json://localhost/a")
+        assert clients.get_apprise("json://localhost/a") is first
+        clients.get_apprise("json://localhost/b")
+        clients.get_apprise("json://localhost/c")
+
+        stats = clients.get_stats()
+        assert stats["cached_apprise_clients"] == 2
+        assert stats["clients"]["apprise"] == {"created": 3, "reused": 1, "reuse_rate": 0.25}
+
+    async def test_http_session_is_shared_until_closed(self):
+        """The HTTP session should stay open across calls and be closed by close()."""
+        clients = NotificationChannelClients()
+        session = await clients.get_http_session()
+        if session is None:
+            pytest.skip("aiohttp not installed")
+
+        assert await clients.get_http_session() is session
+        assert clients.get_stats()["clients"]["http_session"]["reuse_rate"] == 0.5
+
+        await clients.close()
+        assert session.closed
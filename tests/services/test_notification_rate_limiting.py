@@ -4,6 +4,7 @@ Unit tests for notification rate limiting and debouncing.
 Tests cover:
 - TokenBucketRateLimiter with token refill and burst detection
 - NotificationDebouncer with message suppression
+- TimingWheel expiry across levels
 - ChannelSpecificRateLimiter with per-channel limits
 - AdaptiveRateLimiter with health-based adjustments
 - Rate limiting statistics and monitoring
@@ -22,9 +23,11 @@ from backend.services.notification_rate_limiting import (
     AdaptiveRateLimiter,
     ChannelSpecificRateLimiter,
     NotificationDebouncer,
+    TimingWheel,
     TokenBucketRateLimiter,
     calculate_backoff_delay,
     create_message_hash,
+    create_message_key,
 )
 
 
@@ -169,6 +172,16 @@ class TestNotificationDebouncer:
         second = await debouncer.allow("Message 2", "info", custom_key)
         assert not second
 
+    async def test_structural_key_distinguishes_hash_collisions(self, debouncer):
+        """Keys with equal builtin hashes but different content are not merged."""
+        key1 = create_message_key("Pump fault", {"code": -1})
+        key2 = create_message_key("Pump fault", {"code": -2})
+        assert hash(-1) == hash(-2)
+
+        assert await debouncer.allow("Pump fault", "error", key1)
+        assert await debouncer.allow("Pump fault", "error", key2)
+        assert not await debouncer.allow("Pump fault", "error", key1)
+
     async def test_suppression_window_expiry(self, debouncer):
         """Test that suppression window expires correctly."""
         message = "Window expiry test"
@@ -226,6 +239,63 @@ class TestNotificationDebouncer:
         stats = debouncer.get_statistics()
         assert stats["memory_usage_items"] <= 10  # May be slightly over limit temporarily
 
+    async def test_window_expiry_releases_entry(self, debouncer):
+        """An entry should be allowed again and released once its window passes."""
+        with patch("backend.services.notification_rate_limiting.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            debouncer._expiry_wheel = TimingWheel(start=1000.0)
+            assert await debouncer.allow("Tank level low", "warning")
+
+            clock.return_value = 1059.0
+            assert not await debouncer.allow("Tank level low", "warning")
+
+            clock.return_value = 1061.0
+            await debouncer._cleanup_old_entries()
+            assert debouncer.get_statistics()["active_suppressions"] == 0
+            assert await debouncer.allow("Tank level low", "warning")
+
+    async def test_oldest_entries_evicted_at_capacity(self):
+        """Exceeding max_tracked_items should evict the oldest suppression."""
+        debouncer = NotificationDebouncer(suppress_window_minutes=60, max_tracked_items=3)
+        for i in range(4):
+            await debouncer.allow(f"Evict test {i}", "info")
+
+        stats = debouncer.get_statistics()
+        assert stats["active_suppressions"] == 3
+        assert stats["evicted_count"] == 1
+        assert len(debouncer._expiry_wheel) == 3
+        assert await debouncer.allow("Evict test 0", "info")
+        assert not await debouncer.allow("Evict test 3", "info")
+
+
+class TestTimingWheel:
+    """Test hierarchical timing wheel expiry."""
+
+    def test_keys_expire_in_order_across_levels(self):
+        """Deadlines on every level should expire on time, never early."""
+        wheel = TimingWheel(tick_seconds=1.0, start=0.0)
+        deadlines = {"short": 5, "minute": 70, "hour": 3700, "day": 90000}
+        for key, deadline in deadlines.items():
+            wheel.schedule(key, deadline)
+
+        for key, deadline in deadlines.items():
+            assert list(wheel.advance(deadline - 1)) == []
+            assert list(wheel.advance(deadline)) == [key]
+        assert len(wheel) == 0
+
+    def test_reschedule_and_cancel(self):
+        """Rescheduling should move a key; cancelled keys should never expire."""
+        wheel = TimingWheel(tick_seconds=1.0, start=0.0)
+        wheel.schedule("a", 10)
+        wheel.schedule("b", 10)
+        wheel.schedule("a", 200)
+        assert wheel.cancel("b")
+        assert not wheel.cancel("b")
+
+        assert list(wheel.advance(100)) == []
+        assert "a" in wheel
+        assert list(wheel.advance(200)) == ["a"]
+
 
 class TestChannelSpecificRateLimiter:
     """Test per-channel rate limiting."""
@@ -434,6 +504,22 @@ class TestUtilityFunctions:
         # Should be same because volatile fields are excluded
         assert hash1 == hash2
 
+    def test_create_message_hash_is_fixed_width_and_stable(self):
+        """The digest is 64 bits wide and independent of the process hash seed."""
+        digest = create_message_hash("Test message", {"key": "value", "number": 42, "id": "1"})
+
+        assert digest == "25362728695bd82a"
+        assert create_message_hash("Test message") == "c0719e9a8d5d838d"
+
+    def test_create_message_key_is_order_independent(self):
+        """Context order should not matter and unhashable values should be accepted."""
+        key1 = create_message_key("Test", {"a": 1, "tags": ["x"], "id": "1"})
+        key2 = create_message_key("Test", {"tags": ["x"], "a": 1, "id": "2"})
+
+        assert key1 == key2
+        assert hash(key1) == hash(key2)
+        assert create_message_key("Test", {"tags": ["y"]}) != key1
+
     def test_calculate_backoff_delay_exponential(self):
         """Test exponential backoff delay calculation."""
         delays = []
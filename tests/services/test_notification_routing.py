@@ -0,0 +1,175 @@
+"""
+Tests for the compiled notification routing index.
+"""
+
+import itertools
+from datetime import time
+
+import pytest
+
+from backend.models.notification import NotificationChannel, NotificationPayload, NotificationType
+from backend.services.notification_routing import (
+    NotificationRouter,
+    QuietHoursWindow,
+    RoutingConditionType,
+    RoutingRule,
+    SystemContext,
+    UserNotificationPreferences,
+)
+
+
+@pytest.fixture
+async def router():
+    router = NotificationRouter()
+    await router.initialize()
+    return router
+
+
+def _notification(level=NotificationType.INFO, message="Tank level 40%", **kwargs):
+    return NotificationPayload(message=message, level=level, channels=[], **kwargs)
+
+
+async def _reference_rule(router, notification, user_prefs, system_context):
+    """First matching rule by evaluating every rule in order, as before compilation."""
+    context = {
+        "notification": notification,
+        "user_preferences": user_prefs,
+        "system_context": system_context,
+    }
+    for rule in router.routing_rules:
+        if not rule.enabled:
+            continue
+        try:
+            if await router.condition_evaluators[rule.condition_type](rule.conditions, context):
+                return rule.id
+        except Exception:
+            continue
+    return None
+
+
+class TestCompiledRouting:
+    """Test the per-level index and route cache."""
+
+    async def test_routes_cached_per_level_source_and_tags(self, router):
+        """Repeated keys should reuse the compiled route; new keys should compile once."""
+        await router.determine_route(_notification(tags=["tank", "water"]))
+        await router.determine_route(
+            _notification(message="Tank level 35%", tags=["water", "tank"])
+        )
+        await router.determine_route(_notification(level=NotificationType.WARNING))
+
+        stats = router.get_statistics()
+        assert stats["route_cache_misses"] == 2
+        assert stats["route_cache_hits"] == 1
+        assert stats["route_cache_size"] == 2
+        assert stats["last_evaluation_time_ms"] > 0
+        assert stats["max_evaluation_time_ms"] >= stats["avg_evaluation_time_ms"]
+
+    async def test_adding_rule_rebuilds_index(self, router):
+        """A new rule should take effect for keys that were already cached."""
+        decision = await router.determine_route(_notification(source_component="tank_monitor"))
+        assert decision.applied_rules == ["default"]
+
+        await router.add_routing_rule(
+            RoutingRule(
+                id="tank_source",
+                name="Tank Monitor",
+                priority=50,
+                condition_type=RoutingConditionType.CONTENT_BASED,
+                conditions={"source_component": "tank_monitor"},
+                target_channels=[NotificationChannel.SYSTEM],
+            )
+        )
+
+        decision = await router.determine_route(_notification(source_component="tank_monitor"))
+        assert decision.applied_rules == ["tank_source"]
+        other = await router.determine_route(_notification(source_component="generator"))
+        assert other.applied_rules == ["default"]
+
+    async def test_keyword_rule_evaluated_per_message(self, router):
+        """Keyword rules depend on the message, so a shared key must not cache their result."""
+        await router.add_routing_rule(
+            RoutingRule(
+                id="maintenance",
+                name="Maintenance",
+                priority=50,
+                condition_type=RoutingConditionType.CONTENT_BASED,
+                conditions={"keywords": ["maintenance"]},
+                target_channels=[NotificationChannel.SYSTEM],
+            )
+        )
+
+        first = await router.determine_route(_notification(message="Maintenance due"))
+        second = await router.determine_route(_notification(message="Tank level 40%"))
+
+        assert first.applied_rules == ["maintenance"]
+        assert second.applied_rules == ["default"]
+        assert router.get_statistics()["route_cache_hits"] == 1
+
+    async def test_quiet_hours_use_precomputed_window(self, router):
+        """Errors during a user's quiet hours should take the quiet-hours rule."""
+        prefs = UserNotificationPreferences(
+            user_id="owner",
+            quiet_hours_start=time(0, 0),
+            quiet_hours_end=time(23, 59, 59, 999999),
+        )
+        await router.update_user_preferences("owner", prefs)
+
+        quiet = await router.determine_route(
+            _notification(level=NotificationType.ERROR, message="Generator fault"), "owner"
+        )
+        normal = await router.determine_route(
+            _notification(level=NotificationType.ERROR, message="Generator fault")
+        )
+
+        assert quiet.applied_rules == ["quiet_hours"]
+        assert normal.applied_rules == ["high_priority"]
+
+    def test_overnight_quiet_hours_window(self):
+        """An overnight window should wrap around midnight."""
+        window = QuietHoursWindow(start=22 * 3600, end=6 * 3600)
+
+        assert window.contains(time(23, 30))
+        assert window.contains(time(5, 59))
+        assert not window.contains(time(12, 0))
+
+    async def test_compiled_routing_matches_rule_evaluation(self, router):
+        """The compiled index should pick the same rule as evaluating every rule in order."""
+        await router.add_routing_rule(
+            RoutingRule(
+                id="tagged",
+                name="Tagged",
+                priority=15,
+                condition_type=RoutingConditionType.CONTENT_BASED,
+                conditions={"keywords": ["pump"], "tags": ["water"]},
+                target_channels=[NotificationChannel.SYSTEM],
+            )
+        )
+        prefs = UserNotificationPreferences(
+            user_id="owner",
+            quiet_hours_start=time(0, 0),
+            quiet_hours_end=time(23, 59, 59, 999999),
+        )
+        await router.update_user_preferences("owner", prefs)
+
+        levels = [NotificationType.INFO, NotificationType.WARNING, NotificationType.ERROR]
+        messages = ["Tank level 40%", "Water pump running"]
+        tag_sets = [[], ["water"]]
+        users = [None, "owner"]
+        contexts = [SystemContext(), SystemContext(maintenance_mode=True)]
+
+        for level, message, tags, user_id, system_context in itertools.product(
+            levels, messages, tag_sets, users, contexts
+        ):
+            notification = _notification(level=level, message=message, tags=tags)
+            expected = await _reference_rule(
+                router, notification, router.get_user_preferences(user_id or ""), system_context
+            )
+            decision = await router.determine_route(notification, user_id, system_context)
+            assert decision.applied_rules == ([expected] if expected else []), (
+                level,
+                message,
+                tags,
+                user_id,
+                system_context.maintenance_mode,
+            )
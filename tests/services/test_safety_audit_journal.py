@@ -0,0 +1,131 @@
+"""
+Tests for the persistent safety audit journal and the paged audit log.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.safety_audit_journal import SafetyAuditJournal
+from backend.services.safety_service import SafetyService
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "logs" / "safety_audit.jsonl"
+
+
+class TestSafetyAuditJournal:
+    """Test batched writes, rotation and recovery."""
+
+    def test_flush_writes_batch_with_one_fsync(self, journal_path):
+        """Queued entries should be written together and counted as one fsync."""
+        journal = SafetyAuditJournal(journal_path)
+        for i in range(3):
+            journal.append({"event_type": "test", "details": {"index": i}})
+
+        assert not journal_path.exists()
+        assert journal.flush() == 3
+
+        lines = journal_path.read_text().splitlines()
+        assert [json.loads(line)["details"]["index"] for line in lines] == [0, 1, 2]
+        stats = journal.get_stats()
+        assert stats["fsyncs"] == 1
+        assert stats["pending"] == 0
+
+    def test_load_recent_skips_truncated_line(self, journal_path):
+        """A line cut short by power loss should not prevent recovery."""
+        journal = SafetyAuditJournal(journal_path)
+        for i in range(5):
+            journal.append({"event_type": "test", "details": {"index": i}})
+        journal.flush()
+        with journal_path.open("a") as f:
+            f.write('{"event_type": "tru')
+
+        recovered = SafetyAuditJournal(journal_path).load_recent(3)
+
+        assert [e["details"]["index"] for e in recovered] == [2, 3, 4]
+
+    def test_rotation_keeps_previous_file(self, journal_path):
+        """Entries from the rotated file should still be recovered."""
+        journal = SafetyAuditJournal(journal_path, max_bytes=200)
+        for i in range(10):
+            journal.append({"event_type": "test", "details": {"index": i}})
+            journal.flush()
+
+        assert journal.get_stats()["rotations"] >= 1
+        assert journal.rotated_path.exists()
+        indexes = [e["details"]["index"] for e in journal.load_recent(3)]
+        assert indexes == [7, 8, 9]
+
+    async def test_stop_flushes_pending_entries(self, journal_path):
+        """Stopping the flush task should not lose queued entries."""
+        journal = SafetyAuditJournal(journal_path, flush_interval=60.0)
+        await journal.start()
+        journal.append({"event_type": "test", "details": {}})
+        await journal.stop()
+
+        assert len(journal_path.read_text().splitlines()) == 1
+
+
+class TestSafetyServiceAuditLog:
+    """Test the ring buffer and journal wiring in SafetyService."""
+
+    def test_ring_buffer_is_bounded(self):
+        """Old entries should be dropped without copying the buffer."""
+        service = SafetyService()
+        for i in range(service._max_audit_entries + 10):
+            service._add_audit_log_entry("test", {"index": i})
+
+        assert len(service._audit_log) == service._max_audit_entries
+        assert service.get_audit_log(1)[0]["details"]["index"] == service._max_audit_entries + 9
+
+    def test_paged_retrieval(self):
+        """Pages should walk back from the newest entry, each oldest first."""
+        service = SafetyService()
+        for i in range(10):
+            service._add_audit_log_entry("test", {"index": i})
+
+        first = service.get_audit_log(max_entries=3)
+        second = service.get_audit_log(max_entries=3, offset=3)
+        last = service.get_audit_log(max_entries=3, offset=9)
+
+        assert [e["details"]["index"] for e in first] == [7, 8, 9]
+        assert [e["details"]["index"] for e in second] == [4, 5, 6]
+        assert [e["details"]["index"] for e in last] == [0]
+        assert service.get_audit_log(max_entries=3, offset=10) == []
+
+    async def test_audit_log_survives_restart(self, journal_path):
+        """Emergency stops should be on disk immediately and reloaded on startup."""
+        service = SafetyService(audit_journal_path=journal_path)
+        await service.emergency_stop("Test emergency")
+
+        # Durable event: written without waiting for the batch interval
+        assert "emergency_stop_activated" in journal_path.read_text()
+
+        restarted = SafetyService(audit_journal_path=journal_path)
+        event_types = [e["event_type"] for e in restarted.get_audit_log()]
+        assert "emergency_stop_activated" in event_types
+        assert restarted.get_safety_status()["audit_journal"]["path"] == str(journal_path)
+
+    async def test_emergency_stop_not_delayed_by_journal_fsync(self, journal_path):
+        """Stop commands should go out before the durable flush, which finishes before return."""
+        order = []
+        registry = MagicMock()
+
+        async def execute_emergency_stop(**kwargs):
+            order.append("stop")
+            return {"hydraulics": True}
+
+        registry.execute_emergency_stop = execute_emergency_stop
+        service = SafetyService(service_registry=registry, audit_journal_path=journal_path)
+        flush = service._audit_journal.flush
+        service._audit_journal.flush = lambda: order.append("flush") or flush()
+
+        await service.emergency_stop("Test emergency")
+
+        assert order[0] == "stop"
+        assert "flush" in order
+        assert "emergency_stop_activated" in journal_path.read_text()
+        assert service._journal_flush_tasks == set()
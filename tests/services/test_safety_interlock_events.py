@@ -0,0 +1,119 @@
+"""
+Tests for event-driven safety interlock evaluation.
+"""
+
+import asyncio
+
+from backend.services.safety_service import (
+    INTERLOCK_CONDITIONS,
+    SafetyInterlock,
+    SafetyService,
+    compile_condition,
+)
+
+
+async def _settle(service: SafetyService) -> None:
+    if service._interlock_eval_task:
+        await service._interlock_eval_task
+
+
+class TestCompiledConditions:
+    """Test compiled interlock conditions."""
+
+    def test_conditions_declare_inputs(self):
+        """Each interlock exposes the union of its conditions' inputs."""
+        interlock = SafetyInterlock(
+            "test", "firefly", ["vehicle_not_moving", "parking_brake_engaged"]
+        )
+
+        assert interlock.input_keys == {"vehicle_speed", "parking_brake"}
+        assert INTERLOCK_CONDITIONS["transmission_in_park"]({"transmission_gear": "PARK"})
+        assert not INTERLOCK_CONDITIONS["vehicle_not_moving"]({"vehicle_speed": 3})
+
+    def test_unknown_condition_fails_safe(self):
+        """Unknown conditions compile to a predicate that is never satisfied."""
+        condition = compile_condition("moon_is_full")
+
+        assert condition.inputs == frozenset()
+        assert condition({}) is False
+
+    async def test_evaluation_latency_recorded(self):
+        """check_conditions records evaluation count and latency."""
+        interlock = SafetyInterlock("test", "firefly", ["engine_not_running"])
+
+        assert await interlock.check_conditions({"engine_running": True}) == (
+            False,
+            "Interlock condition not met: engine_not_running",
+        )
+        stats = interlock.get_evaluation_stats()
+        assert stats["evaluations"] == 1
+        assert stats["max_ms"] >= stats["last_ms"] >= 0
+
+
+class TestEventDrivenEvaluation:
+    """Test re-evaluation triggered by system state updates."""
+
+    async def test_state_change_engages_and_disengages_interlocks(self):
+        """Shifting out of park engages interlocks without the monitoring loop."""
+        service = SafetyService(health_check_interval=3600)
+
+        service.update_system_state({"transmission_gear": "DRIVE"})
+        await _settle(service)
+
+        engaged = {name for name, i in service._interlocks.items() if i.is_engaged}
+        assert engaged == {"slide_room_safety", "leveling_jack_safety"}
+        assert not service._emergency_stop_active
+        stats = service.get_interlock_evaluation_stats()
+        assert stats["event_evaluations"] == 1
+        assert stats["full_evaluations"] == 0
+        assert stats["interlocks"]["slide_room_safety"]["reaction"]["last_ms"] >= 0
+        assert stats["interlocks"]["awning_safety"]["evaluations"] == 0
+
+        service.update_system_state({"transmission_gear": "PARK"})
+        await _settle(service)
+        assert not any(i.is_engaged for i in service._interlocks.values())
+
+    async def test_unrelated_or_unchanged_keys_do_not_evaluate(self):
+        """Keys no interlock reads, or values that did not change, trigger nothing."""
+        service = SafetyService(health_check_interval=3600)
+
+        service.update_system_state({"cabin_temperature": 72, "parking_brake": True})
+        await _settle(service)
+
+        assert service._interlock_eval_task is None
+        assert all(i.evaluation_count == 0 for i in service._interlocks.values())
+
+    async def test_engine_start_evaluates_leveling_only(self):
+        """Only interlocks reading engine_running are re-evaluated."""
+        service = SafetyService(health_check_interval=3600)
+
+        service.update_system_state({"engine_running": True})
+        await _settle(service)
+
+        counts = {name: i.evaluation_count for name, i in service._interlocks.items()}
+        assert counts == {"slide_room_safety": 0, "awning_safety": 0, "leveling_jack_safety": 1}
+        assert service._interlocks["leveling_jack_safety"].is_engaged
+
+    async def test_multiple_violations_trigger_emergency_stop(self):
+        """Event-driven evaluation applies the multiple-violation emergency stop."""
+        service = SafetyService(health_check_interval=3600)
+
+        service.update_system_state({"vehicle_speed": 30})
+        await _settle(service)
+
+        assert service._emergency_stop_active
+        assert service._in_safe_state
+
+    def test_sync_caller_defers_to_full_check(self):
+        """Without a running loop, changes stay pending until the next full check."""
+        service = SafetyService(health_check_interval=3600)
+
+        service.update_system_state({"parking_brake": False})
+        assert service.get_interlock_evaluation_stats()["pending"] == [
+            "awning_safety",
+            "leveling_jack_safety",
+            "slide_room_safety",
+        ]
+
+        results = asyncio.run(service.check_safety_interlocks())
+        assert not results["awning_safety"][0]
@@ -0,0 +1,201 @@
+"""
+Tests for the compact binary WebSocket encoding of CAN streams.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from backend.services.websocket_service import WebSocketService
+from backend.websocket.compact_protocol import (
+    ENCODING_BINARY,
+    ENCODING_JSON,
+    ClientEncoding,
+    decode_message,
+    encode_analyzer_batches,
+    encode_frame_batches,
+    encode_sniffer_groups,
+    negotiate_encoding,
+)
+from backend.websocket.fanout import WebSocketFanout
+
+ANALYZER_FRAMES = [
+    {
+        "timestamp": 1000.0 + i / 100,
+        "can_id": 0x19FEDA80 + i,
+        "data": "0102030405060708",
+        "interface": "can0",
+        "protocol": "rvc",
+        "message_type": "broadcast",
+        "source_address": 0x80,
+        "destination_address": None,
+        "pgn": 0x1FEDA,
+        "decoded_fields": None,
+    }
+    for i in range(5)
+]
+
+
+class RecordingWebSocket:
+    """WebSocket stand-in that records text and binary sends."""
+
+    def __init__(self, port: int):
+        self.client = SimpleNamespace(host="127.0.0.1", port=port)
+        self.text: list[dict] = []
+        self.binary: list[bytes] = []
+
+    async def send_text(self, text: str) -> None:
+        self.text.append(json.loads(text))
+
+    async def send_bytes(self, payload: bytes) -> None:
+        self.binary.append(payload)
+
+
+class TestEncoding:
+    """Test encoding negotiation and round trips."""
+
+    def test_negotiate_encoding(self):
+        """Query parameters should select the encoding and clamp batch size."""
+        assert negotiate_encoding({"encoding": "BINARY", "batch_size": "16"}) == ClientEncoding(
+            ENCODING_BINARY, 16
+        )
+        assert negotiate_encoding({"encoding": "xml"}).encoding == ENCODING_JSON
+        assert negotiate_encoding({"encoding": "binary", "batch_size": "0"}).batch_size == 1
+        assert negotiate_encoding({"encoding": "binary", "batch_size": "x"}).batch_size == 64
+
+    def test_frame_batch_round_trip(self):
+        """Frames should survive encode/decode and be split into batches."""
+        messages = encode_frame_batches(ANALYZER_FRAMES, batch_size=2)
+
+        assert len(messages) == 3
+        frames = [f for m in messages for f in decode_message(m)["frames"]]
+        assert [f["can_id"] for f in frames] == [f["can_id"] for f in ANALYZER_FRAMES]
+        assert all(f["is_extended"] for f in frames)
+        assert frames[0]["data"] == "0102030405060708"
+        assert frames[0]["interface"] == "can0"
+        assert abs(frames[4]["timestamp"] - 1000.04) < 1e-6
+
+    def test_analyzer_batch_keeps_decode_results(self):
+        """Analyzer metadata and decoded fields should survive the binary encoding."""
+        decoded_fields = [{"name": "level", "value": 42.5, "unit": "%", "valid": True}]
+        frames = [*ANALYZER_FRAMES[:2], {**ANALYZER_FRAMES[2], "decoded_fields": decoded_fields}]
+
+        (message,) = encode_analyzer_batches(frames)
+        decoded = decode_message(message)
+
+        assert decoded["type"] == "analyzer_frames"
+        first, _, third = decoded["frames"]
+        assert first["protocol"] == "rvc"
+        assert first["message_type"] == "broadcast"
+        assert first["pgn"] == 0x1FEDA
+        assert first["source_address"] == 0x80
+        assert first["destination_address"] is None
+        assert first["decoded_fields"] is None
+        assert third["decoded_fields"] == decoded_fields
+        assert third["can_id"] == ANALYZER_FRAMES[2]["can_id"]
+
+    def test_binary_is_smaller_than_json(self):
+        """A packed batch should be much smaller than the JSON payload."""
+        (binary,) = encode_analyzer_batches(ANALYZER_FRAMES)
+        as_json = json.dumps({"type": "messages", "payload": ANALYZER_FRAMES})
+
+        assert len(binary) * 4 < len(as_json)
+
+    def test_sniffer_group_round_trip(self):
+        """Sniffer groups keep confidence, direction and both frames."""
+        group = {
+            "command": {
+                "timestamp": 5.0,
+                "direction": "tx",
+                "arbitration_id": 0x19FEDB7F,
+                "data": "01FF",
+                "iface": "can1",
+            },
+            "response": {
+                "timestamp": 5.2,
+                "arbitration_id": 0x19FEDA80,
+                "data": "01C8",
+                "iface": "can1",
+            },
+            "confidence": "high",
+            "reason": "mapping",
+        }
+
+        (decoded,) = [decode_message(m) for m in encode_sniffer_groups([group])]
+        (result,) = decoded["groups"]
+
+        assert result["confidence"] == "high"
+        assert result["command"]["direction"] == "tx"
+        assert result["command"]["can_id"] == 0x19FEDB7F
+        assert result["response"]["direction"] == "rx"
+        assert result["response"]["data"] == "01C8"
+
+
+class TestWebSocketServiceEncoding:
+    """Test per-client encodings in WebSocketService broadcasts."""
+
+    async def test_analyzer_messages_sent_per_client_encoding(self):
+        """JSON clients get JSON; binary clients get packed batches."""
+        service = WebSocketService()
+        service.fanout = WebSocketFanout(coalesce_window=0)
+        json_client, binary_client = RecordingWebSocket(1), RecordingWebSocket(2)
+        service.can_analyzer_clients.update({json_client, binary_client})
+        service._client_encodings[binary_client] = ClientEncoding(ENCODING_BINARY, 4)
+
+        await service.broadcast_can_analyzer_update("messages", ANALYZER_FRAMES)
+        await service.broadcast_can_analyzer_update("statistics", {"total": 5})
+        await asyncio.sleep(0.01)
+
+        assert [m["type"] for m in json_client.text] == ["messages", "statistics"]
+        assert [m["type"] for m in binary_client.text] == ["statistics"]
+        assert len(binary_client.binary) == 2
+        frames = [f for m in binary_client.binary for f in decode_message(m)["frames"]]
+        assert len(frames) == 5
+        assert all(f["pgn"] == 0x1FEDA and f["protocol"] == "rvc" for f in frames)
+        await service.fanout.close()
+
+    @pytest.mark.parametrize(
+        ("handler", "clients", "service_name"),
+        [
+            ("handle_can_analyzer_connection", "can_analyzer_clients", "can_analyzer"),
+            ("handle_can_filter_connection", "can_filter_clients", "can_filter"),
+        ],
+    )
+    async def test_client_joins_broadcasts_after_initial_messages(
+        self, handler, clients, service_name
+    ):
+        """Broadcasts must not reach a client before its encoding ack and initial status."""
+        service = WebSocketService()
+        service._service_registry = MagicMock()
+        joined_before_send = []
+
+        class ConnectingWebSocket(RecordingWebSocket):
+            query_params = {"encoding": "binary"}
+
+            async def send_json(self, data: dict) -> None:
+                joined_before_send.append(self in getattr(service, clients))
+                self.text.append(data)
+
+            async def receive_text(self) -> str:
+                assert self in getattr(service, clients)
+                raise WebSocketDisconnect()
+
+        websocket = ConnectingWebSocket(1)
+        auth_handler = MagicMock()
+        auth_handler.authenticate_connection = AsyncMock(return_value={"username": "test"})
+        auth_handler.require_permission = AsyncMock(return_value=True)
+
+        with patch(
+            "backend.services.websocket_service.get_websocket_auth_handler",
+            return_value=auth_handler,
+        ):
+            await getattr(service, handler)(websocket)
+
+        assert websocket.text[0]["type"] == "encoding"
+        assert joined_before_send == [False, False]
+        assert websocket not in getattr(service, clients)
+        assert service_name in service._service_registry.get_service.call_args.args
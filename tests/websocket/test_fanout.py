@@ -0,0 +1,134 @@
+"""
+Tests for per-client WebSocket fan-out.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from backend.services.websocket_service import WebSocketService
+from backend.websocket.fanout import WebSocketFanout, coalesce_key
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records sent text."""
+
+    def __init__(self, port: int, delay: float = 0.0, fail: bool = False):
+        self.client = SimpleNamespace(host="127.0.0.1", port=port)
+        self.delay = delay
+        self.fail = fail
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+
+    async def send_text(self, text: str) -> None:
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+class TestWebSocketFanout:
+    """Test the fan-out layer."""
+
+    async def test_slow_client_does_not_block_broadcast(self):
+        """Broadcast should return immediately even if a client is slow."""
+        service = WebSocketService()
+        service.fanout = WebSocketFanout(coalesce_window=0)
+        fast, slow = FakeWebSocket(1), FakeWebSocket(2, delay=0.5)
+        service.data_clients.update({fast, slow})
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await service.broadcast_to_data_clients({"type": "can_message", "id": 1})
+        assert loop.time() - start < 0.05
+
+        await asyncio.sleep(0.01)
+        assert fast.sent == [{"type": "can_message", "id": 1}]
+        assert slow.sent == []
+        await service.fanout.close()
+
+    async def test_entity_updates_are_coalesced(self):
+        """Queued updates for the same entity should collapse to the latest."""
+        fanout = WebSocketFanout(coalesce_window=0.02)
+        client = FakeWebSocket(1)
+        clients = {client}
+
+        for level in range(5):
+            fanout.broadcast(clients, {"type": "entity_update", "entity_id": "tank", "v": level})
+        fanout.broadcast(clients, {"type": "entity_update", "entity_id": "light", "v": 1})
+        await asyncio.sleep(0.05)
+
+        assert client.sent == [
+            {"type": "entity_update", "entity_id": "tank", "v": 4},
+            {"type": "entity_update", "entity_id": "light", "v": 1},
+        ]
+        stats = fanout.get_stats()["clients"][0]
+        assert stats["coalesced"] == 4
+        assert stats["sent"] == 2
+        await fanout.close()
+
+    async def test_lagging_client_drops_oldest_and_is_disconnected(self):
+        """A client stuck over capacity should be marked, then disconnected."""
+        fanout = WebSocketFanout(max_queue_size=2, coalesce_window=0, lag_timeout=0.01)
+        client = FakeWebSocket(1, delay=10)
+        clients = {client}
+
+        for i in range(3):
+            fanout.broadcast(clients, {"type": "log", "i": i})
+        stats = fanout.get_stats()
+        assert stats["lagging_clients"] == 1
+        assert stats["clients"][0]["dropped"] == 1
+        assert stats["clients"][0]["queue_depth"] == 2
+
+        # The writer is now stuck sending the first message
+        await asyncio.sleep(0.02)
+        for i in range(3, 5):
+            fanout.broadcast(clients, {"type": "log", "i": i})
+        await fanout.close()
+
+        assert client not in clients
+        assert client.closed_with == 1013
+        assert fanout.get_stats()["disconnected_laggards"] == 1
+
+    async def test_only_entity_updates_wait_for_coalesce_window(self):
+        """Messages that cannot be coalesced should be sent without the window delay."""
+        fanout = WebSocketFanout(coalesce_window=10)
+        client = FakeWebSocket(1)
+        clients = {client}
+
+        fanout.broadcast(clients, {"type": "entity_update", "entity_id": "tank", "v": 1})
+        await asyncio.sleep(0.01)
+        assert client.sent == []
+
+        fanout.broadcast(clients, {"type": "can_message", "id": 1})
+        await asyncio.sleep(0.01)
+        assert client.sent == [
+            {"type": "entity_update", "entity_id": "tank", "v": 1},
+            {"type": "can_message", "id": 1},
+        ]
+        await fanout.close()
+
+    async def test_failed_client_removed_from_set(self):
+        """A send error should remove the client like the old broadcast loop did."""
+        fanout = WebSocketFanout(coalesce_window=0)
+        client = FakeWebSocket(1, fail=True)
+        clients = {client}
+
+        fanout.broadcast(clients, {"type": "ping"})
+        await asyncio.sleep(0.01)
+
+        assert clients == set()
+        assert fanout.get_stats()["clients"] == []
+
+    def test_coalesce_key_handles_nested_entity_id(self):
+        """Both top-level and nested entity IDs should be recognized."""
+        assert coalesce_key({"type": "entity_update", "entity_id": "a"}) == ("entity_update", "a")
+        assert coalesce_key({"type": "entity_update", "data": {"entity_id": "b"}}) == (
+            "entity_update",
+            "b",
+        )
+        assert coalesce_key({"type": "can_message"}) is None